@@ -20,6 +20,7 @@ from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.events import HummingbotUIEvent
+from hummingbot.core.metrics_server import MetricsHttpServer
 from hummingbot.core.utils import detect_available_port
 from hummingbot.core.utils.async_utils import safe_gather
 
@@ -63,6 +64,11 @@ async def main_async(client_config_map: ClientConfigAdapter):
     start_listener: UIStartListener = UIStartListener(hb)
     hb.app.add_listener(HummingbotUIEvent.Start, start_listener)
 
+    if client_config_map.metrics.metrics_http_enabled:
+        hb.metrics_server = MetricsHttpServer(client_config_map.metrics.metrics_http_host,
+                                              client_config_map.metrics.metrics_http_port)
+        await hb.metrics_server.start()
+
     tasks: List[Coroutine] = [hb.run()]
     if client_config_map.debug_console:
         if not hasattr(__builtins__, "help"):
@@ -30,7 +30,9 @@ from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.management.console import start_management_console
+from hummingbot.core.metrics_server import MetricsHttpServer
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -78,11 +80,14 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
     if args.auto_set_permissions is not None:
         autofix_permissions(args.auto_set_permissions)
 
+    # The trading pairs are only fetched for the autocompletion of the interactive client
+    TradingPairFetcher.get_instance(client_config_map).disable_fetching()
+
     if not Security.login(secrets_manager):
         logging.getLogger().error("Invalid password.")
         return
 
-    await Security.wait_til_decryption_done()
+    # The start command waits for the configs of the strategy connectors to be decrypted
     await create_yml_files_legacy()
     init_logging("hummingbot_logs.yml", client_config_map)
     await read_system_configs_from_yml()
@@ -119,6 +124,11 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
     start_listener: UIStartListener = UIStartListener(hb, is_script=is_script, is_quickstart=True)
     hb.app.add_listener(HummingbotUIEvent.Start, start_listener)
 
+    if client_config_map.metrics.metrics_http_enabled:
+        hb.metrics_server = MetricsHttpServer(client_config_map.metrics.metrics_http_host,
+                                              client_config_map.metrics.metrics_http_port)
+        await hb.metrics_server.start()
+
     tasks: List[Coroutine] = [hb.run()]
     if client_config_map.debug_console:
         management_port: int = detect_available_port(8211)
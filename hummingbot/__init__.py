@@ -138,6 +138,7 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.log_queue import DEFAULT_LOG_QUEUE_SIZE, queue_loggers, stop_log_queue
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
@@ -161,7 +162,13 @@ def init_logging(conf_filename: str,
             for logger in config_dict["loggers"]:
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        log_queue_config: Dict = config_dict.pop("log_queue", None) or {}
+        # The queued records are handled before the handlers are replaced
+        stop_log_queue()
         logging.config.dictConfig(config_dict)
+        if log_queue_config.get("enabled", False):
+            queue_loggers(logger_names=[""] + list(config_dict.get("loggers", {})),
+                          max_size=log_queue_config.get("max_size", DEFAULT_LOG_QUEUE_SIZE))
 
 
 def get_strategy_list() -> List[str]:
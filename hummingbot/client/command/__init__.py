@@ -12,6 +12,7 @@ from .mqtt_command import MQTTCommand
 from .order_book_command import OrderBookCommand
 from .pmm_script_command import PMMScriptCommand
 from .previous_strategy_command import PreviousCommand
+from .profile_command import ProfileCommand
 from .rate_command import RateCommand
 from .silly_commands import SillyCommands
 from .start_command import StartCommand
@@ -33,6 +34,7 @@ __all__ = [
     OrderBookCommand,
     PMMScriptCommand,
     PreviousCommand,
+    ProfileCommand,
     RateCommand,
     SillyCommands,
     StartCommand,
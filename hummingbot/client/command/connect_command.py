@@ -40,7 +40,7 @@ class ConnectCommand:
             self.notify("Reminder: Please ensure your Kraken API Key Nonce Window is at least 10.")
         connector_config = ClientConfigAdapter(AllConnectorSettings.get_connector_config_keys(connector_name))
         if Security.connector_config_file_exists(connector_name):
-            await Security.wait_til_decryption_done()
+            await Security.wait_til_decryption_done(connector_name)
             api_key_config = [
                 c.printable_value for c in connector_config.traverse(secure=False) if "api_key" in c.attr
             ]
@@ -114,7 +114,7 @@ class ConnectCommand:
         self,  # type: HummingbotApplication
         connector_name: str,
     ) -> Optional[str]:
-        await Security.wait_til_decryption_done()
+        await Security.wait_til_decryption_done(connector_name)
         api_keys = Security.api_keys(connector_name)
         network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
         try:
@@ -35,5 +35,12 @@ class ExitCommand:
         for notifier in self.notifiers:
             notifier.stop()
 
+        if self.markets_recorder is not None:
+            # Writes the records still queued for the database
+            self.markets_recorder.stop()
+
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+
         self.app.exit()
         self.mqtt_stop()
@@ -1,4 +1,5 @@
 import os
+from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
 import pandas as pd
@@ -6,6 +7,7 @@ from sqlalchemy.orm import Query, Session
 
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+from hummingbot.connector.order_latency_recorder import write_order_latency_trace
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
 
@@ -16,13 +18,15 @@ if TYPE_CHECKING:
 class ExportCommand:
     def export(self,  # type: HummingbotApplication
                option):
-        if option is None or option not in ("keys", "trades"):
+        if option is None or option not in ("keys", "trades", "latency"):
             self.notify("Invalid export option.")
             return
         elif option == "keys":
             safe_ensure_future(self.export_keys())
         elif option == "trades":
             safe_ensure_future(self.export_trades())
+        elif option == "latency":
+            self.export_order_latency()
 
     async def export_keys(self,  # type: HummingbotApplication
                           ):
@@ -63,31 +67,61 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
+        self.flush_recorded_trades()
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(self.init_time * 1e3),
-                session=session)
-            if len(trades) == 0:
-                self.notify("No past trades to export.")
-                return
-            self.placeholder_mode = True
-            self.app.hide_input = True
-            path = self.client_config_map.log_file_path
-            if path is None:
-                path = str(DEFAULT_LOG_FILE_PATH)
-            file_name = await self.prompt_new_export_file_name(path)
-            if file_name is None:
-                return
-            file_path = os.path.join(path, file_name)
-            try:
-                df: pd.DataFrame = TradeFill.to_pandas(trades)
-                df.to_csv(file_path, header=True)
-                self.notify(f"Successfully exported trades to {file_path}")
-            except Exception as e:
-                self.notify(f"Error exporting trades to {path}: {e}")
-            self.app.change_prompt(prompt=">>> ")
-            self.placeholder_mode = False
-            self.app.hide_input = False
+            trades: pd.DataFrame = TradeFill.get_trades_frame(session, start_time=int(self.init_time * 1e3))
+        if len(trades) == 0:
+            self.notify("No past trades to export.")
+            return
+        self.placeholder_mode = True
+        self.app.hide_input = True
+        path = self.client_config_map.log_file_path
+        if path is None:
+            path = str(DEFAULT_LOG_FILE_PATH)
+        file_name = await self.prompt_new_export_file_name(path)
+        if file_name is None:
+            return
+        file_path = os.path.join(path, file_name)
+        try:
+            df: pd.DataFrame = TradeFill.trades_frame_to_pandas(trades)
+            df.to_csv(file_path, header=True)
+            self.notify(f"Successfully exported trades to {file_path}")
+        except Exception as e:
+            self.notify(f"Error exporting trades to {path}: {e}")
+        self.app.change_prompt(prompt=">>> ")
+        self.placeholder_mode = False
+        self.app.hide_input = False
+
+    def export_order_latency(self,  # type: HummingbotApplication
+                             ):
+        """
+        Shows the percentiles of the latency of the creation of the last orders of each connector and writes their
+        latency spans to a trace file in the logs folder.
+        """
+        spans_by_connector = {}
+        rows = []
+        for connector_name, connector in self.markets.items():
+            recorder = getattr(connector, "order_latency_recorder", None)
+            if recorder is None or len(recorder.spans) == 0:
+                continue
+            spans_by_connector[connector_name] = recorder.spans
+            for stage, percentiles in recorder.percentiles().items():
+                rows.append([connector_name, stage.value] + [f"{value * 1e3:.1f}" for value in percentiles.values()])
+        if len(spans_by_connector) == 0:
+            self.notify("No order latency to export.")
+            return
+        df = pd.DataFrame(rows, columns=["Connector", "Stage", "p50 (ms)", "p90 (ms)", "p99 (ms)"])
+        self.notify("\nTime from the order submission to each stage:\n" + df.to_string(index=False))
+
+        path = self.client_config_map.log_file_path
+        if path is None:
+            path = str(DEFAULT_LOG_FILE_PATH)
+        file_path = os.path.join(path, f"order_latency_{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+        try:
+            write_order_latency_trace(file_path, spans_by_connector)
+            self.notify(f"Successfully exported the order latency trace to {file_path}")
+        except Exception as e:
+            self.notify(f"Error exporting the order latency trace to {path}: {e}")
 
     def _get_trades_from_session(self,  # type: HummingbotApplication
                                  start_timestamp: int,
@@ -3,11 +3,12 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 
 from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -40,23 +41,48 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
+        performance_tracker = self.performance_tracker
+        if days == 0 and performance_tracker is not None:
+            # The performance of the session is kept up to date by the tracker
+            if performance_tracker.num_trades == 0:
                 self.notify("\n  No past trades to report.")
                 return
             if verbose:
                 self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            safe_ensure_future(self.history_report(start_time, None, precision))
+            return
+        self.flush_recorded_trades()
+        with self.trade_fill_db.get_new_session() as session:
+            trades: pd.DataFrame = TradeFill.get_trades_frame(
+                session,
+                start_time=int(start_time * 1e3),
+                config_file_path=self.strategy_file_name)
+        if len(trades) == 0:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        safe_ensure_future(self.history_report(start_time, trades, precision))
+
+    @property
+    def performance_tracker(self,  # type: HummingbotApplication
+                            ) -> Optional[PerformanceTracker]:
+        return self.markets_recorder.performance_tracker if self.markets_recorder is not None else None
+
+    def flush_recorded_trades(self,  # type: HummingbotApplication
+                              ):
+        """
+        Writes the trades queued by the markets recorder to the database, to be read by the commands.
+        """
+        if self.markets_recorder is not None:
+            self.markets_recorder.write_queue.flush()
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
         if self.strategy_file_name is None:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        self.flush_recorded_trades()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -66,15 +92,26 @@ class HistoryCommand:
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[Union[List[TradeFill], pd.DataFrame]],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        """
+        Reports the performance per market of the given trades, either TradeFill objects or a trades frame
+        (see `TradeFill.get_trades_frame`). When trades is None, the performance of the current session is served by
+        the performance tracker instead.
+        """
+        market_totals = None
+        if trades is None:
+            market_info: Set[Tuple[str, str]] = set(self.performance_tracker.markets)
+        elif isinstance(trades, pd.DataFrame):
+            market_totals = PerformanceMetrics.totals_by_market(trades)
+            market_info: Set[Tuple[str, str]] = set(market_totals.keys())
+        else:
+            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -83,7 +120,13 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            if trades is None:
+                perf = await self.performance_tracker.performance_metrics(market, symbol, cur_balances)
+            elif market_totals is not None:
+                perf = await PerformanceMetrics.create_from_totals(symbol, market_totals[(market, symbol)], cur_balances)
+            else:
+                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -203,12 +246,15 @@ class HistoryCommand:
 
         start_time = self.init_time
 
+        if self.performance_tracker is not None:
+            return await self.history_report(start_time, None, display_report=False)
+
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
+            trades: pd.DataFrame = TradeFill.get_trades_frame(
+                session,
+                start_time=int(start_time * 1e3),
                 config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        avg_return = await self.history_report(start_time, trades, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -219,13 +265,14 @@ class HistoryCommand:
 
         lines = []
 
+        self.flush_recorded_trades()
         with self.trade_fill_db.get_new_session() as session:
-            queried_trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                number_of_rows=MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1,
-                config_file_path=self.strategy_file_name)
-            df: pd.DataFrame = TradeFill.to_pandas(queried_trades)
+            queried_trades: pd.DataFrame = TradeFill.get_trades_frame(
+                session,
+                start_time=int(start_time * 1e3),
+                config_file_path=self.strategy_file_name,
+                number_of_rows=MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1)
+        df: pd.DataFrame = TradeFill.trades_frame_to_pandas(queried_trades)
 
         if len(df) > 0:
             # Check if number of trades exceed maximum number of trades to display
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import pandas as pd
+
+from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.sampling_profiler import SamplingProfiler, asyncio_task_states, measure_event_loop_lag
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class ProfileCommand:
+    _profiling: bool = False
+
+    def profile(self,  # type: HummingbotApplication
+                duration: float = 10.0,
+                interval: float = 5.0,
+                trace_calls: bool = False):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.profile, duration, interval, trace_calls)
+            return
+        safe_ensure_future(self.profile_bot(duration, interval, trace_calls))
+
+    async def profile_bot(self,  # type: HummingbotApplication
+                          duration: float = 10.0,
+                          interval: float = 5.0,
+                          trace_calls: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Samples the stacks of the event loop thread for the duration (in seconds) every interval (in milliseconds)
+        while measuring the event loop lag, then writes the samples in the collapsed stacks format and the states of
+        the asyncio tasks to the logs folder.
+
+        :return: the report of the profile, None if a profile is already running
+        """
+        if self._profiling:
+            self.notify("A profile is already running.")
+            return None
+        if duration <= 0 or interval <= 0:
+            self.notify("The duration and the interval of the profile must be positive.")
+            return None
+        self._profiling = True
+        self.notify(f"Profiling the bot for {duration} seconds...")
+        profiler = SamplingProfiler(interval=interval / 1e3, trace_calls=trace_calls)
+        try:
+            profiler.start()
+            event_loop_lag = await measure_event_loop_lag(duration)
+        finally:
+            profiler.stop()
+            self._profiling = False
+        task_states = asyncio_task_states(asyncio.get_running_loop())
+
+        path = self.client_config_map.log_file_path
+        if path is None:
+            path = str(DEFAULT_LOG_FILE_PATH)
+        file_prefix = os.path.join(path, f"profile_{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+        stacks_file_path = f"{file_prefix}.collapsed"
+        tasks_file_path = f"{file_prefix}_tasks.txt"
+        profiler.write_collapsed_stacks(stacks_file_path)
+        with open(tasks_file_path, "w") as tasks_file:
+            for task_state in task_states:
+                tasks_file.write(f"{task_state['state']:<10}{task_state['name']:<20}{task_state['coroutine']}"
+                                 f"  {task_state['location']}\n")
+
+        report = {
+            "samples": profiler.sample_count,
+            "top_frames": profiler.top_frames(),
+            "event_loop_lag": event_loop_lag,
+            "task_states": dict(Counter(task_state["state"] for task_state in task_states)),
+            "stacks_file": stacks_file_path,
+            "tasks_file": tasks_file_path,
+        }
+        self.notify(self._format_profile_report(report))
+        return report
+
+    def _format_profile_report(self,  # type: HummingbotApplication
+                               report: Dict[str, Any]) -> str:
+        lines = [f"\n  Samples: {report['samples']}"]
+        if len(report["top_frames"]) > 0:
+            frames_df = pd.DataFrame(
+                data=[[frame["frame"], frame["samples"], f"{frame['pct']:.1f}"] for frame in report["top_frames"]],
+                columns=["Frame", "Samples", "%"])
+            lines.extend(["", "  Top frames (self time):"]
+                         + ["    " + line for line in format_df_for_printout(
+                             frames_df, self.client_config_map.tables_format).split("\n")])
+        lag = report["event_loop_lag"]
+        lines.extend([
+            "",
+            f"  Event loop lag: mean {lag['mean_ms']:.1f} ms, p99 {lag['p99_ms']:.1f} ms, max {lag['max_ms']:.1f} ms",
+            "  Asyncio tasks: " + ", ".join(f"{count} {state}" for state, count in report["task_states"].items()),
+            "",
+            f"  Stacks written to {report['stacks_file']} (collapsed format, for flamegraph.pl or speedscope)",
+            f"  Task states written to {report['tasks_file']}",
+        ])
+        return "\n".join(lines)
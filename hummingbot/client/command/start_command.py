@@ -1,6 +1,7 @@
 import asyncio
 import importlib
 import inspect
+import json
 import platform
 import sys
 import threading
@@ -15,6 +16,7 @@ from hummingbot.client.command.gateway_api_manager import GatewayChainApiManager
 from hummingbot.client.config.config_helpers import get_strategy_starter_file
 from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.security import Security
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.connector.connector_status import get_connector_status, warning_messages
 from hummingbot.core.clock import Clock, ClockMode
@@ -96,6 +98,14 @@ class StartCommand(GatewayChainApiManager):
                     self.strategy_file_name = None
                     raise
 
+        if Security.secrets_manager is not None:
+            # The connectors can be created as soon as their own configs are decrypted, this is also checked by the
+            # status checks. The markets of the scripts are only known once they are initialized.
+            if script:
+                await Security.wait_til_decryption_done()
+            for connector_name in settings.required_exchanges:
+                await Security.wait_til_decryption_done(connector_name)
+
         if script:
             file_name = script.split(".")[0]
             self.strategy_file_name = file_name
@@ -235,6 +245,10 @@ class StartCommand(GatewayChainApiManager):
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
             self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            if self.client_config_map.tick_profiling_enabled:
+                tick_profiler = self.clock.enable_tick_profiling()
+                if self._mqtt is not None:
+                    tick_profiler.add_overrun_listener(self._broadcast_tick_overrun)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -264,6 +278,11 @@ class StartCommand(GatewayChainApiManager):
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
+    def _broadcast_tick_overrun(self,  # type: HummingbotApplication
+                                overrun: Dict[str, Any]):
+        if self._mqtt is not None:
+            self._mqtt.broadcast_status_update(json.dumps(overrun), msg_type="tick_overrun")
+
     def _initialize_strategy(self, strategy_name: str):
         if self.is_current_strategy_script_strategy():
             self.start_script_strategy()
@@ -2,6 +2,7 @@ import asyncio
 import threading
 import time
 from collections import OrderedDict, deque
+from decimal import Decimal
 from typing import TYPE_CHECKING, Dict, List
 
 import pandas as pd
@@ -76,6 +77,8 @@ class StatusCommand:
         else:
             st_status = self.strategy.format_status()
         status = paper_trade + "\n" + st_status
+        if self.clock is not None and self.clock.tick_profiler is not None:
+            status += "\n\n" + self.clock.tick_profiler.format_status()
         if self._pmm_script_iterator is not None and live is False:
             self._pmm_script_iterator.request_status()
         return status
@@ -136,12 +139,23 @@ class StatusCommand:
             if live:
                 await self.stop_live_update()
                 self.app.live_updates = True
-                while self.app.live_updates and self.strategy:
-                    script_status = '\n Status from PMM script would not appear here. ' \
-                                    'Simply run the status command without "--live" to see PMM script status.'
-                    await self.cls_display_delay(
-                        await self.strategy_status(live=True) + script_status + "\n\n Press escape key to stop update.", 0.1
-                    )
+                live_status = self.client_config_map.live_status
+                # The strategies publishing their status sections only format them again when their inputs change
+                status_sections = getattr(self.strategy, "status_sections", None)
+                if status_sections is not None:
+                    status_sections.price_tolerance = live_status.live_status_price_tolerance_pct / Decimal("100")
+                try:
+                    while self.app.live_updates and self.strategy:
+                        script_status = '\n Status from PMM script would not appear here. ' \
+                                        'Simply run the status command without "--live" to see PMM script status.'
+                        await self.cls_display_delay(
+                            await self.strategy_status(live=True) + script_status + "\n\n Press escape key to stop update.",
+                            live_status.live_status_refresh_interval
+                        )
+                finally:
+                    if status_sections is not None:
+                        status_sections.price_tolerance = 0
+                        status_sections.mark_dirty()
                 self.app.live_updates = False
                 self.notify("Stopped live status display update.")
             else:
@@ -154,7 +168,7 @@ class StatusCommand:
             self.notify('  - Strategy check: Please import or create a strategy.')
             return False
 
-        if not Security.is_decryption_done():
+        if not all(Security.is_decryption_done(connector_name) for connector_name in required_exchanges):
             self.notify('  - Security check: Encrypted files are being processed. Please wait and try again later.')
             return False
 
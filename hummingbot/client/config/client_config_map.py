@@ -6,7 +6,7 @@ from abc import ABC, abstractmethod
 from decimal import Decimal
 from os.path import dirname
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, root_validator, validator
 from tabulate import tabulate_formats
@@ -32,6 +32,12 @@ from hummingbot.connector.exchange.gate_io.gate_io_utils import GateIOConfigMap
 from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
+from hummingbot.core.rate_oracle.sources.composite_rate_source import (
+    CompositeRateSource,
+    CompositeRateSourceEntry,
+    parse_rate_sources,
+)
+from hummingbot.core.rate_oracle.sources.order_book_rate_source import OrderBookRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
@@ -146,10 +152,66 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_batching: bool = Field(
+        default=False,
+        description="Publishes the forwarded events and logs in periodic frames on the frames topic, instead of one"
+                    "\nmessage per event and log record.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable batching of the MQTT events and logs into frames"
+            ),
+        ),
+    )
+    mqtt_batch_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Maximum number of seconds an event or log record waits before its frame is published",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the MQTT frames publishing interval in seconds (Default=1.0)"
+            ),
+        ),
+    )
+    mqtt_batch_max_size: int = Field(
+        default=500,
+        gt=0,
+        description="Number of events and log records after which a frame is published before its interval ends",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of events and log records of an MQTT frame (Default=500)"
+            ),
+        ),
+    )
+    mqtt_batch_max_pending: int = Field(
+        default=10000,
+        gt=0,
+        description="Number of events and log records kept while the broker is disconnected, the oldest are dropped"
+                    "\nbeyond it.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of events and log records waiting to be published (Default=10000)"
+            ),
+        ),
+    )
+    mqtt_batch_encoding: str = Field(
+        default="msgpack",
+        description="Encoding of the MQTT frames (msgpack/json)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the MQTT frames encoding (msgpack/json)"
+            ),
+        ),
+    )
 
     class Config:
         title = "mqtt_bridge"
 
+    @validator("mqtt_batch_encoding", pre=True)
+    def validate_mqtt_batch_encoding(cls, v: str):
+        if v not in ("msgpack", "json"):
+            raise ValueError("The MQTT frames encoding must be one of msgpack or json.")
+        return v
+
 
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
@@ -178,10 +240,62 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_downsampling: str = Field(
+        default="1d:5m,7d:1h",
+        description="Comma separated age:resolution pairs. The market data snapshots older than the age are downsampled"
+                    "\nto one per resolution (e.g. 1d:5m keeps one snapshot every 5 minutes after a day).",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the market data downsampling tiers as age:resolution pairs (Default=1d:5m,7d:1h)"
+            ),
+        ),
+    )
+    market_data_retention_days: int = Field(
+        default=30,
+        ge=0,
+        description="Number of days the market data snapshots are kept, 0 to keep them forever",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of days the market data snapshots are kept, 0 to keep them forever (Default=30)"
+            ),
+        ),
+    )
+    market_data_log_enabled: bool = Field(
+        default=False,
+        description="Records every order book snapshot, diff and trade to compact binary files under data/market_data,"
+                    "\nwhich can be replayed by the backtesting clock.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the binary market data log"
+            ),
+        ),
+    )
+    market_data_log_compression: str = Field(
+        default="zstd",
+        description="Compression applied to the binary market data log chunks (none/zlib/zstd)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the market data log compression (none/zlib/zstd)"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
+    @validator("market_data_downsampling", pre=True)
+    def validate_market_data_downsampling(cls, v: str):
+        from hummingbot.model.market_data_store import parse_downsampling_tiers  # avoids circular import
+
+        parse_downsampling_tiers(v)
+        return v
+
+    @validator("market_data_log_compression", pre=True)
+    def validate_market_data_log_compression(cls, v: str):
+        if v not in ("none", "zlib", "zstd"):
+            raise ValueError("The market data log compression must be one of none, zlib or zstd.")
+        return v
+
 
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
@@ -328,12 +442,57 @@ class PaperTradeConfigMap(BaseClientModel):
         ),
     )
 
+    paper_trade_queue_position_fill_model: bool = Field(
+        default=False,
+        description="Fill paper trade limit orders according to their estimated position in the order book queue",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want paper trade limit orders to wait for the volume queued ahead of them to trade before "
+                "being filled, with partial fills? (Yes/No)"
+            ),
+        ),
+    )
+
+    paper_trade_latencies: Dict[str, Dict[str, Any]] = Field(
+        default={},
+        description="Simulated latencies in seconds of paper trade order creations, cancellations and fill"
+                    "\nnotifications, per connector (or \"default\" for all connectors). Each latency is a number"
+                    "\nor a distribution: constant (value), uniform (min, max), normal (mean, stdev) or"
+                    "\nlognormal (median, sigma).",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter paper trade latency settings (Input must be valid json — e.g. "
+                "{\"default\": {\"create\": 0.05, \"cancel\": 0.05, "
+                "\"fill\": {\"distribution\": \"lognormal\", \"median\": 0.02, \"sigma\": 0.5}}})"
+            ),
+        ),
+    )
+    paper_trade_rate_limits_enabled: bool = Field(
+        default=False,
+        description="Delays paper trade order creations and cancellations exceeding the rate limits of the connector",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want paper trade orders to be subject to the connector API rate limits? (Yes/No)"
+            ),
+        ),
+    )
+
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
         if isinstance(v, str):
             v = json.loads(v)
         return v
 
+    @validator("paper_trade_latencies", pre=True)
+    def validate_paper_trade_latencies(cls, v: Union[str, Dict[str, Dict[str, Any]]]):
+        from hummingbot.connector.exchange.paper_trade.latency_model import PaperTradeLatencyModel  # avoids circular import
+
+        if isinstance(v, str):
+            v = json.loads(v)
+        for connector_latencies in v.values():
+            PaperTradeLatencyModel.from_config(connector_latencies)
+        return v
+
 
 class KillSwitchMode(BaseClientModel, ABC):
     @abstractmethod
@@ -633,6 +792,83 @@ class GlobalTokenConfigMap(BaseClientModel):
         RateOracle.get_instance().quote_token = values["global_token_name"]
 
 
+class MetricsConfigMap(BaseClientModel):
+    metrics_http_enabled: bool = Field(
+        default=False,
+        description="Serves the client metrics (order book, throttler, REST and order latencies, clock ticks) in the"
+                    "\nPrometheus text format on http://<metrics_http_host>:<metrics_http_port>/metrics.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the metrics HTTP endpoint"
+            ),
+        ),
+    )
+    metrics_http_host: str = Field(
+        default="127.0.0.1",
+        description="Address the metrics HTTP endpoint listens on",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the address the metrics HTTP endpoint listens on (Default=127.0.0.1)"
+            ),
+        ),
+    )
+    metrics_http_port: int = Field(
+        default=9108,
+        gt=0,
+        description="Port of the metrics HTTP endpoint",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the port of the metrics HTTP endpoint (Default=9108)"
+            ),
+        ),
+    )
+    metrics_mqtt_interval: float = Field(
+        default=10.0,
+        ge=0,
+        description="Number of seconds between two publications of the metrics by the MQTT bridge, 0 to disable them",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the MQTT metrics publishing interval in seconds, 0 to disable it (Default=10)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "metrics"
+
+
+class LiveStatusConfigMap(BaseClientModel):
+    live_status_refresh_interval: float = Field(
+        default=0.1,
+        gt=0,
+        description="Number of seconds between two refreshes of the status --live display",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the status --live refresh interval in seconds (Default=0.1)"
+            ),
+        ),
+    )
+    live_status_price_tolerance_pct: Decimal = Field(
+        default=Decimal("0"),
+        ge=Decimal("0"),
+        description="Price change (in percentage) below which the status --live display reuses the formatted tables"
+                    "\nof the strategy, 0 to show every price change.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the price change (in percentage) refreshing the status --live tables (Default=0)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "live_status"
+
+    @validator("live_status_price_tolerance_pct", pre=True)
+    def validate_decimals(cls, v: str, field: Field):
+        """Used for client-friendly error output."""
+        return super().validate_decimal(v, field)
+
+
 class CommandsTimeoutConfigMap(BaseClientModel):
     create_command_timeout: Decimal = Field(
         default=Decimal("10"),
@@ -738,6 +974,25 @@ class RateSourceModeBase(BaseClientModel, ABC):
     def build_rate_source(self) -> RateSourceBase:
         ...
 
+    def rate_source_settings_changed(self, rate_source: RateSourceBase) -> bool:
+        """
+        :param rate_source: a rate source built by this mode
+        :return: True if the rate source was built with other settings than the ones of this mode
+        """
+        return False
+
+    @classmethod
+    def update_rate_oracle_source(cls, values: Dict):
+        """
+        Rebuilds the rate oracle source when it was built by this mode with other settings, e.g. when they are changed
+        with the config command while the bot runs.
+        """
+        rate_oracle = RateOracle.get_instance()
+        if rate_oracle.source.name == cls.Config.title:
+            rate_source_mode = cls.construct(**values)
+            if rate_source_mode.rate_source_settings_changed(rate_oracle.source):
+                rate_oracle.source = rate_source_mode.build_rate_source()
+
 
 class ExchangeRateSourceModeBase(RateSourceModeBase):
     def build_rate_source(self) -> RateSourceBase:
@@ -827,12 +1082,137 @@ class GateIoRateSourceMode(ExchangeRateSourceModeBase):
         title: str = "gate_io"
 
 
+class OrderBookRateSourceMode(RateSourceModeBase):
+    name: str = Field(
+        default="order_book",
+        const=True,
+        client_data=None,
+    )
+    fallback_source: str = Field(
+        default="binance",
+        description="The rate source of the pairs without order book in the connectors, none to disable it",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Which rate source do you want to use for the pairs without order book in the connectors?"
+                " (binance/kucoin/gate_io/ascend_ex/coin_gecko/none)"
+            ),
+            prompt_on_new=True,
+        ),
+    )
+    fallback_update_interval: int = Field(
+        default=60,
+        ge=1,
+        description="Number of seconds between two updates of the fallback source prices",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the number of seconds between two updates of the fallback source prices (Default=60)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "order_book"
+
+    def build_rate_source(self) -> RateSourceBase:
+        fallback_source = (
+            None if self.fallback_source == "none"
+            else RATE_SOURCE_MODES[self.fallback_source].construct().build_rate_source()
+        )
+        return OrderBookRateSource(fallback_source=fallback_source,
+                                   fallback_update_interval=self.fallback_update_interval)
+
+    def rate_source_settings_changed(self, rate_source: RateSourceBase) -> bool:
+        built_fallback_source = "none" if rate_source.fallback_source is None else rate_source.fallback_source.name
+        return (built_fallback_source != self.fallback_source
+                or rate_source.fallback_update_interval != self.fallback_update_interval)
+
+    @validator("fallback_source", pre=True)
+    def validate_fallback_source(cls, value: str):
+        fallback_sources = [name for name, mode in RATE_SOURCE_MODES.items()
+                            if name not in (cls.Config.title, CompositeRateSourceMode.Config.title)]
+        if value != "none" and value not in fallback_sources:
+            raise ValueError(f"Invalid fallback source, please choose a value from {fallback_sources + ['none']}.")
+        return value
+
+    @root_validator(skip_on_failure=True)
+    def post_validations(cls, values: Dict):
+        cls.update_rate_oracle_source(values)
+        return values
+
+
+class CompositeRateSourceMode(RateSourceModeBase):
+    name: str = Field(
+        default="composite",
+        const=True,
+        client_data=None,
+    )
+    sources: str = Field(
+        default="order_book:1,binance:10,kucoin:30,gate_io:30,ascend_ex:30,coin_gecko:60",
+        description="The rate sources by decreasing priority, each one with the number of seconds between its updates",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the rate sources by decreasing priority, each one with the number of seconds between its"
+                " updates (e.g. order_book:1,binance:10,coin_gecko:60)"
+            ),
+            prompt_on_new=True,
+        ),
+    )
+    price_ttl: int = Field(
+        default=120,
+        ge=1,
+        description="Number of seconds during which a price fetched from a source is used",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the number of seconds during which a price fetched from a source is used (Default=120)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "composite"
+
+    def build_rate_source(self) -> RateSourceBase:
+        entries = []
+        for name, update_interval in parse_rate_sources(self.sources):
+            if name == OrderBookRateSourceMode.Config.title:
+                # The other sources already cover the pairs without order book
+                source_mode = OrderBookRateSourceMode.construct(fallback_source="none")
+            else:
+                source_mode = RATE_SOURCE_MODES[name].construct()
+            entries.append(CompositeRateSourceEntry(source=source_mode.build_rate_source(),
+                                                    update_interval=update_interval,
+                                                    ttl=self.price_ttl))
+        return CompositeRateSource(sources=entries)
+
+    def rate_source_settings_changed(self, rate_source: RateSourceBase) -> bool:
+        built_entries = [(entry.source.name, entry.update_interval, entry.ttl) for entry in rate_source.entries]
+        entries = [(name, update_interval, self.price_ttl) for name, update_interval in parse_rate_sources(self.sources)]
+        return built_entries != entries
+
+    @validator("sources", pre=True)
+    def validate_sources(cls, value: str):
+        for name, _ in parse_rate_sources(value):
+            if name not in RATE_SOURCE_MODES or name == cls.Config.title:
+                raise ValueError(
+                    f"Invalid rate source {name}, please choose sources from "
+                    f"{[source for source in RATE_SOURCE_MODES.keys() if source != cls.Config.title]}."
+                )
+        return value
+
+    @root_validator(skip_on_failure=True)
+    def post_validations(cls, values: Dict):
+        cls.update_rate_oracle_source(values)
+        return values
+
+
 RATE_SOURCE_MODES = {
     AscendExRateSourceMode.Config.title: AscendExRateSourceMode,
     BinanceRateSourceMode.Config.title: BinanceRateSourceMode,
     CoinGeckoRateSourceMode.Config.title: CoinGeckoRateSourceMode,
     KuCoinRateSourceMode.Config.title: KuCoinRateSourceMode,
     GateIoRateSourceMode.Config.title: GateIoRateSourceMode,
+    OrderBookRateSourceMode.Config.title: OrderBookRateSourceMode,
+    CompositeRateSourceMode.Config.title: CompositeRateSourceMode,
 }
 
 
@@ -910,6 +1290,17 @@ class ClientConfigMap(BaseClientModel):
             prompt=lambda cm: f"Select the desired db mode ({'/'.join(list(DB_MODES.keys()))})",
         ),
     )
+    db_write_interval_ms: int = Field(
+        default=100,
+        ge=0,
+        description="Orders, trades and market states are queued and written to the database in batches by a"
+                    "\nbackground thread at this interval (in milliseconds). 0 writes them as the events arrive.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "At what interval (in milliseconds) should the trade records be written to the database?"
+            ),
+        ),
+    )
     pmm_script_mode: Union[tuple(PMM_SCRIPT_MODES.values())] = Field(
         default=PMMScriptDisabledMode(),
         client_data=ClientFieldData(
@@ -1027,7 +1418,19 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    tick_profiling_enabled: bool = Field(
+        default=False,
+        description="Records the time spent by each clock iterator on every tick and reports tick overruns"
+                    "\n(ticks that took longer than the tick size) in the status command and MQTT status updates.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Would you like to enable the clock tick profiler? (Yes/No)"
+            ),
+        ),
+    )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    live_status: LiveStatusConfigMap = Field(default=LiveStatusConfigMap())
+    metrics: MetricsConfigMap = Field(default=MetricsConfigMap())
 
     class Config:
         title = "client_config_map"
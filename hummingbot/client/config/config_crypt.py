@@ -1,8 +1,9 @@
 import binascii
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from eth_account import Account
 from eth_keyfile.keyfile import (
     DKLEN,
     SCRYPT_P,
@@ -11,14 +12,18 @@ from eth_keyfile.keyfile import (
     _pbkdf2_hash,
     _scrypt_hash,
     big_endian_to_int,
+    decode_hex,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
     int_to_big_endian,
     keccak,
+    normalize_keys,
 )
 from pydantic import SecretStr
 
+from hummingbot.client.config.key_derivation import derive_keyfile_key
 from hummingbot.client.settings import CONF_DIR_PATH
 
 PASSWORD_VERIFICATION_WORD = "HummingBot"
@@ -41,8 +46,27 @@ class BaseSecretsManager(ABC):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         pass
 
+    def derive_keys(self, values: Iterable[str], executor: Optional[Executor] = None) -> List[Future]:
+        """
+        Starts the derivation of the keys needed to decrypt the values, for the secrets managers deriving keys from the
+        password. The derived keys are used by the decryption of the values once the futures are done.
+        :param values: the encrypted values
+        :param executor: the executor running the derivations, they are run in the calling thread if None
+        :return: the futures of the derivations
+        """
+        return []
+
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
+    """
+    Stores every secret value as a v3 keyfile encrypted with the password. The keys derived from the password are
+    cached per salt and KDF parameters, so each value is derived once per session.
+    """
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._derived_keys: Dict[Tuple[str, str], bytes] = {}
+        self._derivations: Dict[Tuple[str, str], Future] = {}
+
     def encrypt_secret_value(self, attr: str, value: str):
         if self._password is None:
             raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
@@ -56,10 +80,43 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
-        value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        crypto = _keyfile_crypto(value)
+        derived_key = self._derived_key(crypto)
+        ciphertext = decode_hex(crypto["ciphertext"])
+        if keccak(derived_key[16:32] + ciphertext) != decode_hex(crypto["mac"]):
+            raise ValueError("MAC mismatch")
+        iv = big_endian_to_int(decode_hex(crypto["cipherparams"]["iv"]))
+        decrypted_value = decrypt_aes_ctr(ciphertext, derived_key[:16], iv).decode()
         return decrypted_value
 
+    def derive_keys(self, values: Iterable[str], executor: Optional[Executor] = None) -> List[Future]:
+        futures = []
+        for value in values:
+            crypto = _keyfile_crypto(value)
+            kdf_key = _kdf_key(crypto)
+            if kdf_key not in self._derived_keys and kdf_key not in self._derivations:
+                if executor is None:
+                    future = Future()
+                    future.set_result(derive_keyfile_key(crypto, self._password.encode()))
+                else:
+                    future = executor.submit(derive_keyfile_key, crypto, self._password.encode())
+                future.add_done_callback(lambda done_future, key=kdf_key: self._store_derived_key(key, done_future))
+                self._derivations[kdf_key] = future
+            if kdf_key in self._derivations:
+                futures.append(self._derivations[kdf_key])
+        return futures
+
+    def _derived_key(self, crypto: Dict[str, Any]) -> bytes:
+        kdf_key = _kdf_key(crypto)
+        if kdf_key not in self._derived_keys:
+            self._derived_keys[kdf_key] = derive_keyfile_key(crypto, self._password.encode())
+        return self._derived_keys[kdf_key]
+
+    def _store_derived_key(self, kdf_key: Tuple[str, str], future: Future):
+        self._derivations.pop(kdf_key, None)
+        if not future.cancelled() and future.exception() is None:
+            self._derived_keys[kdf_key] = future.result()
+
 
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
@@ -80,6 +137,18 @@ def validate_password(secrets_manager: BaseSecretsManager) -> bool:
     return valid
 
 
+def _keyfile_crypto(value: str) -> Dict[str, Any]:
+    keyfile_json = normalize_keys(json.loads(binascii.unhexlify(value).decode()))
+    if keyfile_json["version"] != 3:
+        raise NotImplementedError("Not yet implemented")
+    return keyfile_json["crypto"]
+
+
+def _kdf_key(crypto: Dict[str, Any]) -> Tuple[str, str]:
+    # The KDF parameters include the salt
+    return crypto["kdf"], json.dumps(crypto["kdfparams"], sort_keys=True)
+
+
 def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
     """
     Encrypt message by a given password.
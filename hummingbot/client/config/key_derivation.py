@@ -0,0 +1,32 @@
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict
+
+from eth_keyfile.keyfile import _derive_pbkdf_key, _derive_scrypt_key
+
+
+def derive_keyfile_key(crypto: Dict[str, Any], password: bytes) -> bytes:
+    """
+    Derives the key of a v3 keyfile from the password. Defined at the module level to be run in a process pool.
+    """
+    kdf = crypto["kdf"]
+    if kdf == "pbkdf2":
+        return _derive_pbkdf_key(crypto, password)
+    elif kdf == "scrypt":
+        return _derive_scrypt_key(crypto, password)
+    raise TypeError(f"Unsupported key derivation function: {kdf}")
+
+
+@contextmanager
+def key_derivation_workers_main_module():
+    """
+    Spawned processes import the main module of their parent before running anything, i.e. the whole application
+    when it's started from the bin scripts. The processes started in this context import this module instead, which
+    only imports what the key derivation needs.
+    """
+    main_module = sys.modules["__main__"]
+    sys.modules["__main__"] = sys.modules[__name__]
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main_module
@@ -1,6 +1,11 @@
 import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+from pydantic import SecretStr
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -8,21 +13,28 @@ from hummingbot.client.config.config_helpers import (
     api_keys_from_connector_config_map,
     connector_name_from_file,
     get_connector_config_yml_path,
+    get_connector_hb_config,
     list_connector_configs,
     load_connector_config_map_from_file,
+    read_yml_file,
     reset_connector_hb_config,
     save_to_yml,
     update_connector_hb_config,
 )
+from hummingbot.client.config.key_derivation import key_derivation_workers_main_module
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
+# Below this number of secret values, the keys are derived in the decryption thread
+KEY_DERIVATION_PROCESSES_MIN_VALUES = 4
+
 
 class Security:
     __instance = None
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
     _decryption_done = asyncio.Event()
+    _connector_decryption_done: Dict[str, asyncio.Event] = {}
 
     @staticmethod
     def new_password_required() -> bool:
@@ -48,17 +60,63 @@ class Security:
 
     @classmethod
     def decrypt_all(cls):
+        """
+        Decrypts the configs of all the connectors. The keys of the secret values are derived from the password in a
+        process pool, and each connector config is available as soon as its own keys are derived.
+        """
         cls._secure_configs.clear()
         cls._decryption_done.clear()
+        for connector_decryption_done in cls._connector_decryption_done.values():
+            connector_decryption_done.clear()
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        encrypted_values = {file: cls._encrypted_values(file) for file in encrypted_files}
+        num_values = sum(len(values) for values in encrypted_values.values())
+        executor = cls._key_derivation_executor(num_values)
+        try:
+            # The workers are started when the derivations are submitted
+            with key_derivation_workers_main_module():
+                derivations = {
+                    file: cls.secrets_manager.derive_keys(values, executor) for file, values in encrypted_values.items()
+                }
+            for file in encrypted_files:
+                wait(derivations[file])
+                cls.decrypt_connector_config(file)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
         cls._decryption_done.set()
 
+    @staticmethod
+    def _key_derivation_executor(num_values: int) -> Optional[Executor]:
+        # Starting the workers takes longer than deriving a few keys, and than deriving them all with a single CPU
+        cpu_count = os.cpu_count() or 1
+        if cpu_count <= 1 or num_values < KEY_DERIVATION_PROCESSES_MIN_VALUES:
+            return None
+        # The decryption runs in a thread of the AsyncCallScheduler while the event loop runs in the main thread.
+        # Forking a process with running threads is unsafe, the workers are spawned instead.
+        return ProcessPoolExecutor(max_workers=min(num_values, cpu_count),
+                                   mp_context=multiprocessing.get_context("spawn"))
+
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
         connector_name = connector_name_from_file(file_path)
         cls._secure_configs[connector_name] = load_connector_config_map_from_file(file_path)
+        cls._connector_decryption_event(connector_name).set()
+
+    @staticmethod
+    def _encrypted_values(file_path: Path) -> List[str]:
+        config_data = read_yml_file(file_path)
+        hb_config = get_connector_hb_config(config_data["connector"])
+        return [
+            value for attr, value in config_data.items()
+            if attr in hb_config.__fields__ and hb_config.__fields__[attr].type_ == SecretStr and value
+        ]
+
+    @classmethod
+    def _connector_decryption_event(cls, connector_name: str) -> asyncio.Event:
+        if connector_name not in cls._connector_decryption_done:
+            cls._connector_decryption_done[connector_name] = asyncio.Event()
+        return cls._connector_decryption_done[connector_name]
 
     @classmethod
     def update_secure_config(cls, connector_config: ClientConfigAdapter):
@@ -67,6 +125,7 @@ class Security:
         save_to_yml(file_path, connector_config)
         update_connector_hb_config(connector_config)
         cls._secure_configs[connector_name] = connector_config
+        cls._connector_decryption_event(connector_name).set()
 
     @classmethod
     def remove_secure_config(cls, connector_name: str):
@@ -76,7 +135,12 @@ class Security:
         cls._secure_configs.pop(connector_name)
 
     @classmethod
-    def is_decryption_done(cls):
+    def is_decryption_done(cls, connector_name: Optional[str] = None):
+        """
+        :param connector_name: when given, whether the config of this connector is decrypted
+        """
+        if connector_name is not None and cls._connector_decryption_event(connector_name).is_set():
+            return True
         return cls._decryption_done.is_set()
 
     @classmethod
@@ -88,8 +152,20 @@ class Security:
         return cls._secure_configs.copy()
 
     @classmethod
-    async def wait_til_decryption_done(cls):
-        await cls._decryption_done.wait()
+    async def wait_til_decryption_done(cls, connector_name: Optional[str] = None):
+        """
+        :param connector_name: when given, only waits until the config of this connector is decrypted
+        """
+        if connector_name is None or cls._decryption_done.is_set():
+            await cls._decryption_done.wait()
+            return
+        waits = [asyncio.ensure_future(cls._decryption_done.wait()),
+                 asyncio.ensure_future(cls._connector_decryption_event(connector_name).wait())]
+        try:
+            await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for pending_wait in waits:
+                pending_wait.cancel()
 
     @classmethod
     def api_keys(cls, connector_name: str) -> Dict[str, Optional[str]]:
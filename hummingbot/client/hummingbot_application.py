@@ -6,6 +6,8 @@ import time
 from collections import deque
 from typing import Deque, Dict, List, Optional, Tuple, Union
 
+import pandas as pd
+
 from hummingbot.client.command import __all__ as commands
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import (
@@ -20,6 +22,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.gateway_ssl_config_map import SSLConfigMap
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
@@ -32,13 +35,15 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
+from hummingbot.core.metrics_server import MetricsHttpServer
+from hummingbot.core.rate_oracle.sources.order_book_rate_source import OrderBookRateSource
 from hummingbot.core.utils.kill_switch import KillSwitch
-from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.exceptions import ArgumentParserError
 from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.mqtt import MQTTGateway
 from hummingbot.strategy.maker_taker_market_pair import MakerTakerMarketPair
@@ -65,7 +70,10 @@ class HummingbotApplication(*commands):
     @classmethod
     def main_application(cls, client_config_map: Optional[ClientConfigAdapter] = None) -> "HummingbotApplication":
         if cls._main_app is None:
-            cls._main_app = HummingbotApplication(client_config_map)
+            app = HummingbotApplication(client_config_map)
+            cls._main_app = app
+            # The order book rate source uses the order books of the connectors of the application
+            OrderBookRateSource.set_default_connectors_provider(lambda: app.markets)
         return cls._main_app
 
     def __init__(self, client_config_map: Optional[ClientConfigAdapter] = None):
@@ -75,8 +83,6 @@ class HummingbotApplication(*commands):
         self.ssl_config_map: SSLConfigMap = (  # type-hint enables IDE auto-complete
             load_ssl_config_map_from_file()
         )
-        # This is to start fetching trading pairs for auto-complete
-        TradingPairFetcher.get_instance(self.client_config_map)
         self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
         self.markets: Dict[str, ExchangeBase] = {}
         # strategy file name and name get assigned value after import or create command
@@ -108,6 +114,8 @@ class HummingbotApplication(*commands):
         self._binance_connector = None
         self._shared_client = None
         self._mqtt: MQTTGateway = None
+        # Started by the bin scripts when the metrics endpoint is enabled
+        self.metrics_server: Optional[MetricsHttpServer] = None
 
         # gateway variables and monitor
         self._gateway_monitor = GatewayStatusMonitor(self)
@@ -316,12 +324,20 @@ class HummingbotApplication(*commands):
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
 
+        with self.trade_fill_db.get_new_session() as session:
+            trades: pd.DataFrame = TradeFill.get_trades_frame(
+                session,
+                start_time=int(self.init_time * 1e3),
+                config_file_path=self.strategy_file_name)
+        performance_tracker = PerformanceTracker.from_trades_frame(trades)
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            performance_tracker,
+            self.client_config_map.db_write_interval_ms / 1e3,
         )
         self.markets_recorder.start()
         if self._mqtt is not None:
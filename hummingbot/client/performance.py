@@ -1,8 +1,12 @@
+import json
 import logging
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
@@ -11,10 +15,39 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
 
+if TYPE_CHECKING:
+    from hummingbot.client.performance_tracker import MarketPerformanceAccumulator
+
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
 
+def _to_decimal(value: float) -> Decimal:
+    return Decimal(str(float(value)))
+
+
+@dataclass
+class TradeTotals:
+    """
+    Totals of the trades of one market, computed in bulk from a trades frame by `PerformanceMetrics.totals_by_market`
+    """
+    num_buys: int = 0
+    num_sells: int = 0
+    b_vol_base: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+    start_price: Decimal = s_decimal_0
+    last_price: Decimal = s_decimal_0
+    fees: Dict[str, Decimal] = field(default_factory=lambda: defaultdict(lambda: s_decimal_0))
+    realized_pnl: Decimal = s_decimal_0
+    is_derivative: bool = False
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+
 @dataclass
 class PerformanceMetrics:
     _logger = None
@@ -71,6 +104,155 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_accumulator(cls,
+                                      trading_pair: str,
+                                      accumulator: "MarketPerformanceAccumulator",
+                                      current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_totals(trading_pair, accumulator, current_balances)
+        return performance
+
+    @classmethod
+    async def create_from_totals(cls,
+                                 trading_pair: str,
+                                 totals: TradeTotals,
+                                 current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_totals(trading_pair, totals, current_balances)
+        return performance
+
+    @staticmethod
+    def totals_by_market(trades: pd.DataFrame) -> Dict[Tuple[str, str], TradeTotals]:
+        """
+        Computes the trade totals of every market (connector and trading pair) of a trades frame with vectorized
+        group-bys, giving the same results as processing the trade fills one by one.
+        :param trades: trade fills in ascending timestamp order, as returned by `TradeFill.get_trades_frame`
+        :return: the totals keyed by (market, trading pair), in order of the first trade of each market
+        """
+        if len(trades) == 0:
+            return {}
+        group_codes, group_keys = pd.factorize(pd.MultiIndex.from_arrays([trades["market"], trades["symbol"]]))
+        num_groups = len(group_keys)
+
+        def group_sum(weights: np.ndarray) -> np.ndarray:
+            return np.bincount(group_codes, weights=weights, minlength=num_groups)
+
+        def group_count(mask: np.ndarray) -> np.ndarray:
+            return np.bincount(group_codes[mask], minlength=num_groups)
+
+        type_codes, trade_types = pd.factorize(trades["trade_type"])
+        is_buy = np.array([t.upper() == TradeType.BUY.name for t in trade_types], dtype=bool)[type_codes]
+        is_sell = np.array([t.upper() == TradeType.SELL.name for t in trade_types], dtype=bool)[type_codes]
+        positions = trades["position"].fillna(PositionAction.NIL.value).to_numpy()
+        is_nil = positions == PositionAction.NIL.value
+        prices = trades["price"].to_numpy(dtype="float64")
+        amounts = trades["amount"].to_numpy(dtype="float64")
+        quote_amounts = prices * amounts
+
+        # The fees are parsed once per distinct JSON value
+        fee_codes, fee_jsons = pd.factorize(trades["trade_fee"])
+        fee_percents = np.zeros(len(fee_jsons))
+        fee_has_percent = np.zeros(len(fee_jsons), dtype=bool)
+        fee_is_deducted = np.zeros(len(fee_jsons), dtype=bool)
+        fee_flat_fees: List[List[Tuple[str, Decimal]]] = []
+        for index, fee_json in enumerate(fee_jsons):
+            trade_fee = json.loads(fee_json)
+            if trade_fee.get("percent") is not None:
+                fee_percents[index] = float(trade_fee["percent"])
+                fee_has_percent[index] = True
+                fee_is_deducted[index] = (trade_fee.get("fee_type")
+                                          == DeductedFromReturnsTradeFee.type_descriptor_for_json())
+            fee_flat_fees.append([(flat_fee["token"], Decimal(str(flat_fee["amount"])))
+                                  for flat_fee in trade_fee.get("flat_fees", [])])
+        percent_fees = quote_amounts * fee_percents[fee_codes]
+
+        num_buys = group_count(is_buy)
+        num_sells = group_count(is_sell)
+        b_vol_base = group_sum(amounts * is_buy)
+        s_vol_base = -group_sum(amounts * is_sell)
+        b_vol_quote = -group_sum(quote_amounts * is_buy)
+        s_vol_quote = group_sum(quote_amounts * is_sell) - group_sum(percent_fees * fee_is_deducted[fee_codes])
+        quote_fees = group_sum(percent_fees)
+        num_percent_fees = group_count(fee_has_percent[fee_codes])
+        spot_buys = group_count(is_buy & is_nil)
+        spot_sells = group_count(is_sell & is_nil)
+        is_derivative = ((num_buys > 0) & (spot_buys == 0)) | ((num_sells > 0) & (spot_sells == 0))
+        _, first_rows = np.unique(group_codes, return_index=True)
+        _, last_rows_reversed = np.unique(group_codes[::-1], return_index=True)
+        last_rows = len(group_codes) - 1 - last_rows_reversed
+        realized_pnl = PerformanceMetrics._realized_pnl_by_group(
+            trades["order_id"].to_numpy(), group_codes, num_groups, is_buy, is_sell, positions, prices, amounts)
+
+        totals: Dict[Tuple[str, str], TradeTotals] = {}
+        for group, (market, trading_pair) in enumerate(group_keys):
+            _, quote = split_hb_trading_pair(trading_pair)
+            group_totals = TradeTotals(num_buys=int(num_buys[group]),
+                                       num_sells=int(num_sells[group]),
+                                       b_vol_base=_to_decimal(b_vol_base[group]),
+                                       s_vol_base=_to_decimal(s_vol_base[group]),
+                                       b_vol_quote=_to_decimal(b_vol_quote[group]),
+                                       s_vol_quote=_to_decimal(s_vol_quote[group]),
+                                       start_price=_to_decimal(prices[first_rows[group]]),
+                                       last_price=_to_decimal(prices[last_rows[group]]),
+                                       realized_pnl=_to_decimal(realized_pnl[group]),
+                                       is_derivative=bool(is_derivative[group]))
+            if num_percent_fees[group] > 0:
+                group_totals.fees[quote] += _to_decimal(quote_fees[group])
+            totals[(market, trading_pair)] = group_totals
+
+        # Flat fees are exact amounts, they are added up as decimals per distinct fee
+        flat_fee_rows = np.array([len(flat_fees) > 0 for flat_fees in fee_flat_fees], dtype=bool)[fee_codes]
+        if flat_fee_rows.any():
+            group_fee_pairs, counts = np.unique(
+                np.stack([group_codes[flat_fee_rows], fee_codes[flat_fee_rows]], axis=1), axis=0, return_counts=True)
+            for (group, fee_code), count in zip(group_fee_pairs, counts):
+                group_fees = totals[tuple(group_keys[group])].fees
+                for token, amount in fee_flat_fees[fee_code]:
+                    group_fees[token] += amount * int(count)
+
+        return totals
+
+    @staticmethod
+    def _realized_pnl_by_group(order_ids: np.ndarray,
+                               group_codes: np.ndarray,
+                               num_groups: int,
+                               is_buy: np.ndarray,
+                               is_sell: np.ndarray,
+                               positions: np.ndarray,
+                               prices: np.ndarray,
+                               amounts: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of the position pairing of `_calculate_trade_pnl`: the fills are aggregated per order, and
+        the n-th order opening a long (short) position is paired with the n-th order closing one.
+        """
+        mask = is_buy | is_sell
+        fills = pd.DataFrame({
+            "group": group_codes[mask],
+            "is_buy": is_buy[mask],
+            "order_id": order_ids[mask],
+            "price": prices[mask],
+            "amount": amounts[mask],
+            "position": positions[mask],
+        })
+        orders = (fills
+                  .groupby(["group", "is_buy", "order_id"], sort=False)
+                  .agg(price=("price", "mean"), amount=("amount", "sum"), position=("position", "first"))
+                  .reset_index())
+        orders["is_open"] = orders["position"] == PositionAction.OPEN.value
+        orders = orders[orders["is_open"] | (orders["position"] == PositionAction.CLOSE.value)]
+        # Long positions are opened with buys and closed with sells, short positions the other way around
+        orders = orders.assign(is_long=orders["is_buy"] == orders["is_open"])
+        orders = orders.assign(rank=orders.groupby(["group", "is_long", "is_open"]).cumcount())
+        pairs = pd.merge(orders[orders["is_open"]], orders[~orders["is_open"]],
+                         on=["group", "is_long", "rank"], suffixes=("_open", "_close"))
+        price_change = np.where(pairs["is_long"],
+                                pairs["price_close"] - pairs["price_open"],
+                                pairs["price_open"] - pairs["price_close"])
+        return np.bincount(pairs["group"].to_numpy(dtype="int64"),
+                           weights=price_change * pairs["amount_close"].to_numpy(dtype="float64"),
+                           minlength=num_groups)
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,6 +378,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_volume_totals()
+
+        return buys, sells
+
+    def _calculate_volume_totals(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +393,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,6 +433,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -295,22 +483,70 @@ class PerformanceMetrics:
         :param current_balances: current user account balance
         """
 
-        base, quote = split_hb_trading_pair(trading_pair)
+        _, quote = split_hb_trading_pair(trading_pair)
         buys, sells = self._preprocess_trades_and_group_by_type(trades)
 
         self.num_buys = len(buys)
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        start_price = Decimal(str(trades[0].price))
+        last_price = Decimal(str(trades[-1].price))
+        await self._calculate_portfolio_values(trading_pair, current_balances, start_price, last_price)
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self._calculate_total_pnl()
+
+    async def _initialize_metrics_from_totals(self,
+                                              trading_pair: str,
+                                              accumulator: Union["MarketPerformanceAccumulator", TradeTotals],
+                                              current_balances: Dict[str, Decimal]):
+        """
+        Calculates PnL, fees, Return % and etc... from the totals of the trades of the market, without going through
+        the individual trades
+        :param trading_pair: the trading market to get performance metrics
+        :param accumulator: the running totals of a performance accumulator, or the totals computed in bulk
+        :param current_balances: current user account balance
+        """
+        _, quote = split_hb_trading_pair(trading_pair)
+
+        self.num_buys = accumulator.num_buys
+        self.num_sells = accumulator.num_sells
+        self.num_trades = self.num_buys + self.num_sells
+        self.b_vol_base = accumulator.b_vol_base
+        self.s_vol_base = accumulator.s_vol_base
+        self.b_vol_quote = accumulator.b_vol_quote
+        self.s_vol_quote = accumulator.s_vol_quote
+        self._calculate_volume_totals()
+
+        await self._calculate_portfolio_values(
+            trading_pair, current_balances, accumulator.start_price, accumulator.last_price)
+        self.trade_pnl = (accumulator.realized_pnl
+                          if accumulator.is_derivative
+                          else self.cur_value - self.hold_value)
+
+        self.fees.update(accumulator.fees)
+        await self._calculate_fee_in_quote(quote)
+
+        self._calculate_total_pnl()
+
+    async def _calculate_portfolio_values(self,
+                                          trading_pair: str,
+                                          current_balances: Dict[str, Decimal],
+                                          start_price: Decimal,
+                                          last_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +554,7 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
 
+    def _calculate_total_pnl(self):
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
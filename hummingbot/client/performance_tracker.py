@@ -0,0 +1,274 @@
+import json
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+
+class _PositionOrder:
+    """
+    Fills of a derivative order aggregated in the same way as `PerformanceMetrics.aggregate_orders`: the price is the
+    simple average of the fill prices and the amount is the total filled amount.
+    """
+
+    __slots__ = ("price_sum", "num_fills", "amount", "is_open", "is_long", "index")
+
+    def __init__(self, is_open: bool, is_long: bool, index: int):
+        self.price_sum: Decimal = s_decimal_0
+        self.num_fills: int = 0
+        self.amount: Decimal = s_decimal_0
+        self.is_open = is_open
+        self.is_long = is_long
+        # Position of the order in its open or close queue, it is paired with the order at the same index of the
+        # opposite queue
+        self.index = index
+
+    @property
+    def price(self) -> Decimal:
+        return self.price_sum / self.num_fills
+
+
+class MarketPerformanceAccumulator:
+    """
+    Running totals of the trades of one market (connector and trading pair), updated in constant time per fill. They
+    hold everything `PerformanceMetrics` needs apart from the balances and prices, which are read when the metrics
+    are requested.
+    """
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair = trading_pair
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.start_price: Decimal = s_decimal_0
+        self.last_price: Decimal = s_decimal_0
+        # fees is a dictionary of token and total fee amount paid in that token.
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        # Realized PnL of the closed derivative positions
+        self.realized_pnl: Decimal = s_decimal_0
+
+        _, self._quote = split_hb_trading_pair(trading_pair)
+        self._num_spot_buys: int = 0
+        self._num_spot_sells: int = 0
+        self._position_orders: Dict[Tuple[bool, str], _PositionOrder] = {}
+        # Open and close orders of the long and the short positions, in arrival order
+        self._position_queues: Dict[Tuple[bool, bool], List[_PositionOrder]] = {
+            (is_long, is_open): [] for is_long in (True, False) for is_open in (True, False)
+        }
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def is_derivative(self) -> bool:
+        """
+        True when all the buys or all the sells open or close positions, in which case the trade PnL is the realized
+        PnL of the closed positions (see `PerformanceMetrics._calculate_trade_pnl`)
+        """
+        return ((self.num_buys > 0 and self._num_spot_buys == 0)
+                or (self.num_sells > 0 and self._num_spot_sells == 0))
+
+    def add_fill(self,
+                 order_id: str,
+                 trade_type: str,
+                 price: Decimal,
+                 amount: Decimal,
+                 trade_fee: Dict[str, Any],
+                 position: str):
+        """
+        :param order_id: client order id of the filled order
+        :param trade_type: "BUY" or "SELL"
+        :param price: fill price
+        :param amount: fill amount in base asset
+        :param trade_fee: the fill fee, in its JSON representation (`TradeFeeBase.to_json`)
+        :param position: the position action of the fill ("OPEN", "CLOSE" or "NIL")
+        """
+        is_buy = trade_type.upper() == TradeType.BUY.name
+        quote_amount = price * amount
+        if self.num_trades == 0:
+            self.start_price = price
+        self.last_price = price
+
+        if is_buy:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote -= quote_amount
+        else:
+            self.num_sells += 1
+            self.s_vol_base -= amount
+            self.s_vol_quote += quote_amount
+
+        fee_percent = trade_fee.get("percent")
+        if fee_percent is not None:
+            fee_percent = Decimal(str(fee_percent))
+            self.fees[self._quote] += quote_amount * fee_percent
+            if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote -= quote_amount * fee_percent
+        for flat_fee in trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] += Decimal(str(flat_fee["amount"]))
+
+        if position == PositionAction.NIL.value:
+            if is_buy:
+                self._num_spot_buys += 1
+            else:
+                self._num_spot_sells += 1
+        else:
+            self._add_position_fill(order_id, is_buy, price, amount, position)
+
+    def _add_position_fill(self, order_id: str, is_buy: bool, price: Decimal, amount: Decimal, position: str):
+        order = self._position_orders.get((is_buy, order_id))
+        if order is None:
+            is_open = position == PositionAction.OPEN.value
+            if not is_open and position != PositionAction.CLOSE.value:
+                return
+            # Long positions are opened with buys and closed with sells, short positions the other way around
+            is_long = is_buy == is_open
+            queue = self._position_queues[(is_long, is_open)]
+            order = _PositionOrder(is_open, is_long, len(queue))
+            queue.append(order)
+            self._position_orders[(is_buy, order_id)] = order
+
+        pair = self._position_pair(order)
+        if pair is not None:
+            self.realized_pnl -= self._pair_pnl(*pair)
+        order.price_sum += price
+        order.num_fills += 1
+        order.amount += amount
+        pair = self._position_pair(order)
+        if pair is not None:
+            self.realized_pnl += self._pair_pnl(*pair)
+
+    def _position_pair(self, order: _PositionOrder) -> Optional[Tuple[_PositionOrder, _PositionOrder]]:
+        if order.num_fills == 0:
+            return None
+        opposite_queue = self._position_queues[(order.is_long, not order.is_open)]
+        if order.index >= len(opposite_queue):
+            return None
+        return (order, opposite_queue[order.index]) if order.is_open else (opposite_queue[order.index], order)
+
+    @staticmethod
+    def _pair_pnl(open_order: _PositionOrder, close_order: _PositionOrder) -> Decimal:
+        if open_order.is_long:
+            return (close_order.price - open_order.price) * close_order.amount
+        return (open_order.price - close_order.price) * close_order.amount
+
+
+class PerformanceTracker:
+    """
+    Keeps the performance of the trades of the running strategy up to date as fills arrive, so reporting the
+    performance (`history`, the status bar and the kill switch) does not need to read and process all the trade fills
+    of the session again.
+
+    The tracker is seeded once with the trades stored in the database, and then receives every `OrderFilledEvent`
+    recorded by the markets recorder.
+    """
+
+    def __init__(self):
+        self._accumulators: Dict[Tuple[str, str], MarketPerformanceAccumulator] = {}
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[TradeFill]) -> "PerformanceTracker":
+        tracker = cls()
+        for trade in trades:
+            tracker.add_trade_fill(trade)
+        return tracker
+
+    @classmethod
+    def from_trades_frame(cls, trades: pd.DataFrame) -> "PerformanceTracker":
+        """
+        :param trades: trade fills in ascending timestamp order, as returned by `TradeFill.get_trades_frame`
+        """
+        tracker = cls()
+        # The fees are parsed once per distinct JSON value
+        trade_fees = {fee_json: json.loads(fee_json) for fee_json in trades["trade_fee"].unique()}
+        for market, symbol, order_id, trade_type, price, amount, fee_json, position in zip(
+                trades["market"], trades["symbol"], trades["order_id"], trades["trade_type"], trades["price"],
+                trades["amount"], trades["trade_fee"], trades["position"].fillna(PositionAction.NIL.value)):
+            tracker._add_fill(market=market,
+                              trading_pair=symbol,
+                              order_id=order_id,
+                              trade_type=trade_type,
+                              price=Decimal(str(price)),
+                              amount=Decimal(str(amount)),
+                              trade_fee=trade_fees[fee_json],
+                              position=position)
+        return tracker
+
+    @property
+    def markets(self) -> List[Tuple[str, str]]:
+        """
+        The (market, trading pair) tuples with trades
+        """
+        return list(self._accumulators.keys())
+
+    @property
+    def num_trades(self) -> int:
+        return sum(accumulator.num_trades for accumulator in self._accumulators.values())
+
+    def accumulator(self, market: str, trading_pair: str) -> Optional[MarketPerformanceAccumulator]:
+        return self._accumulators.get((market, trading_pair))
+
+    def add_trade_fill(self, trade: TradeFill):
+        self._add_fill(market=trade.market,
+                       trading_pair=trade.symbol,
+                       order_id=trade.order_id,
+                       trade_type=trade.trade_type,
+                       price=Decimal(str(trade.price)),
+                       amount=Decimal(str(trade.amount)),
+                       trade_fee=trade.trade_fee,
+                       position=trade.position or PositionAction.NIL.value)
+
+    def process_order_filled_event(self, market: str, event: OrderFilledEvent):
+        """
+        :param market: display name of the connector, as stored in the trade fills
+        :param event: the fill event
+        """
+        self._add_fill(market=market,
+                       trading_pair=event.trading_pair,
+                       order_id=event.order_id,
+                       trade_type=event.trade_type.name,
+                       price=Decimal(str(event.price)),
+                       amount=Decimal(str(event.amount)),
+                       trade_fee=event.trade_fee.to_json(),
+                       position=event.position or PositionAction.NIL.value)
+
+    async def performance_metrics(self,
+                                  market: str,
+                                  trading_pair: str,
+                                  current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        return await PerformanceMetrics.create_from_accumulator(
+            trading_pair, self._accumulators[(market, trading_pair)], current_balances)
+
+    def _add_fill(self,
+                  market: str,
+                  trading_pair: str,
+                  order_id: str,
+                  trade_type: str,
+                  price: Decimal,
+                  amount: Decimal,
+                  trade_fee: Dict[str, Any],
+                  position: str):
+        accumulator = self._accumulators.get((market, trading_pair))
+        if accumulator is None:
+            accumulator = MarketPerformanceAccumulator(trading_pair)
+            self._accumulators[(market, trading_pair)] = accumulator
+        accumulator.add_fill(order_id=order_id,
+                             trade_type=trade_type,
+                             price=price,
+                             amount=amount,
+                             trade_fee=trade_fee,
+                             position=position)
@@ -1,15 +1,19 @@
+import hashlib
 import importlib
 import json
+import logging
+import os
+import sys
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
+from hummingbot import data_path, get_strategy_list, root_path
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
@@ -63,6 +67,9 @@ PAPER_TRADE_EXCHANGES = [  # todo: fix after global config map refactor
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
 
+CONNECTOR_MANIFEST_FILE_NAME = "connector_manifest.json"
+CONNECTOR_MANIFEST_VERSION = 1
+
 
 class ConnectorType(Enum):
     """
@@ -171,7 +178,22 @@ class GatewayConnectionSetting:
         GatewayConnectionSetting.save(connectors_conf)
 
 
-class ConnectorSetting(NamedTuple):
+class ConnectorConfigKeysLoader(NamedTuple):
+    """
+    Reference to the config keys of a connector in its utils module, which is imported when the keys are first used.
+    """
+    utils_module: str
+    attribute: str = "KEYS"
+    domain: Optional[str] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = getattr(importlib.import_module(self.utils_module), self.attribute, None)
+        if config_keys is not None and self.domain is not None:
+            config_keys = config_keys[self.domain]
+        return config_keys
+
+
+class ConnectorSettingFields(NamedTuple):
     name: str
     type: ConnectorType
     example_pair: str
@@ -183,10 +205,23 @@ class ConnectorSetting(NamedTuple):
     parent_name: Optional[str]
     domain_parameter: Optional[str]
     use_eth_gas_lookup: bool
+
+
+class ConnectorSetting(ConnectorSettingFields):
     """
     This class has metadata data about Exchange connections. The name of the connection and the file path location of
     the connector file.
+    The config keys can be given as a ConnectorConfigKeysLoader, so the connector utils module is only imported when
+    they are used.
     """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = super().config_keys
+        if isinstance(config_keys, ConnectorConfigKeysLoader):
+            config_keys = config_keys.load()
+        return config_keys
 
     def uses_gateway_generic_connector(self) -> bool:
         non_gateway_connectors_types = [ConnectorType.Exchange, ConnectorType.Derivative, ConnectorType.Connector]
@@ -360,10 +395,56 @@ class AllConnectorSettings:
     @classmethod
     def create_connector_settings(cls):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Creates a dictionary of exchange names to ConnectorSetting, from the connector manifest if it's up to date.
+        Otherwise, iterate over files in specific Python directories to create the settings, and save the manifest.
         """
         cls.all_connector_settings = {}  # reset
+        utils_modules = cls._find_connector_utils_modules()
+        fingerprint = cls._connector_manifest_fingerprint(utils_modules)
+        manifest_entries = cls._load_connector_manifest(fingerprint)
+        if manifest_entries is not None:
+            for entry in manifest_entries:
+                connector_setting = cls._connector_setting_from_manifest_entry(entry)
+                cls.all_connector_settings[connector_setting.name] = connector_setting
+        else:
+            manifest_entries = cls._create_connector_settings_from_utils_modules(utils_modules)
+            cls._save_connector_manifest(fingerprint, manifest_entries)
+
+        # add gateway connectors
+        gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
+        trade_fee_settings: List[float] = [0.0, 0.0]  # we assume no swap fees for now
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema("gateway", trade_fee_settings)
+
+        for connection_spec in gateway_connections_conf:
+            market_name: str = GatewayConnectionSetting.get_market_name_from_connector_spec(connection_spec)
+            cls.all_connector_settings[market_name] = ConnectorSetting(
+                name=market_name,
+                type=ConnectorType[connection_spec["trading_type"]],
+                centralised=False,
+                example_pair="WETH-USDC",
+                use_ethereum_wallet=False,
+                trade_fee_schema=trade_fee_schema,
+                config_keys=None,
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=False,
+            )
+
+        return cls.all_connector_settings
+
+    @classmethod
+    def connector_manifest_path(cls) -> str:
+        return join(data_path(), CONNECTOR_MANIFEST_FILE_NAME)
+
+    @classmethod
+    def _find_connector_utils_modules(cls) -> List[Tuple[str, str, DirEntry]]:
+        """
+        :return: the connector type directory name, connector name and connector directory of every connector
+        """
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        utils_modules = []
+        connector_names = set()
 
         type_dirs: List[DirEntry] = [
             cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
@@ -379,91 +460,160 @@ class AllConnectorSettings:
             for connector_dir in connector_dirs:
                 if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
                     continue
-                if connector_dir.name in cls.all_connector_settings:
+                if connector_dir.name in connector_names:
                     raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+                connector_names.add(connector_dir.name)
+                utils_modules.append((type_dir.name, connector_dir.name, connector_dir))
+        return utils_modules
 
-        # add gateway connectors
-        gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
-        trade_fee_settings: List[float] = [0.0, 0.0]  # we assume no swap fees for now
-        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema("gateway", trade_fee_settings)
+    @staticmethod
+    def _connector_manifest_fingerprint(utils_modules: List[Tuple[str, str, DirEntry]]) -> str:
+        """
+        The manifest is outdated when a connector directory changes (e.g. a compiled module is added), when any Python
+        module of a connector directory is modified (the utils module imports e.g. the constants), or with another
+        Python version.
+        """
+        fingerprint = hashlib.sha256(f"{CONNECTOR_MANIFEST_VERSION} {sys.version}".encode())
+        for type_dir_name, connector_name, connector_dir in sorted(utils_modules, key=lambda module: module[:2]):
+            fingerprint.update(f"{type_dir_name}/{connector_name} {connector_dir.stat().st_mtime_ns};".encode())
+            with os.scandir(connector_dir.path) as entries:
+                module_entries = sorted((entry for entry in entries if entry.name.endswith(".py") and entry.is_file()),
+                                        key=lambda entry: entry.name)
+            for module_entry in module_entries:
+                module_stat = module_entry.stat()
+                fingerprint.update(f"{module_entry.name} {module_stat.st_mtime_ns} {module_stat.st_size};".encode())
+        return fingerprint.hexdigest()
 
-        for connection_spec in gateway_connections_conf:
-            market_name: str = GatewayConnectionSetting.get_market_name_from_connector_spec(connection_spec)
-            cls.all_connector_settings[market_name] = ConnectorSetting(
-                name=market_name,
-                type=ConnectorType[connection_spec["trading_type"]],
-                centralised=False,
-                example_pair="WETH-USDC",
-                use_ethereum_wallet=False,
+    @classmethod
+    def _load_connector_manifest(cls, fingerprint: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            with open(cls.connector_manifest_path()) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get("fingerprint") != fingerprint:
+            return None
+        return manifest["connectors"]
+
+    @classmethod
+    def _save_connector_manifest(cls, fingerprint: str, manifest_entries: List[Dict[str, Any]]):
+        manifest_path = cls.connector_manifest_path()
+        temporary_path = f"{manifest_path}.tmp"
+        try:
+            with open(temporary_path, "w") as manifest_file:
+                json.dump({"fingerprint": fingerprint, "connectors": manifest_entries}, manifest_file, indent=1)
+            os.replace(temporary_path, manifest_path)
+        except OSError:
+            # The settings are created from the connector modules at every start until the manifest can be saved
+            logging.getLogger(__name__).debug(f"Could not save the connector manifest {manifest_path}.", exc_info=True)
+
+    @classmethod
+    def _create_connector_settings_from_utils_modules(
+        cls, utils_modules: List[Tuple[str, str, DirEntry]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Imports the utils module of every connector to create its settings.
+        :return: the manifest entries of the created settings
+        """
+        manifest_entries = []
+        for type_dir_name, connector_name, _ in utils_modules:
+            try:
+                util_module_path: str = f"hummingbot.connector.{type_dir_name}." \
+                                        f"{connector_name}.{connector_name}_utils"
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_name, trade_fee_settings
+            )
+            cls.all_connector_settings[connector_name] = ConnectorSetting(
+                name=connector_name,
+                type=ConnectorType[type_dir_name.capitalize()],
+                centralised=getattr(util_module, "CENTRALIZED", True),
+                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
                 trade_fee_schema=trade_fee_schema,
-                config_keys=None,
+                config_keys=getattr(util_module, "KEYS", None),
                 is_sub_domain=False,
                 parent_name=None,
                 domain_parameter=None,
-                use_eth_gas_lookup=False,
+                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
             )
+            manifest_entries.append(cls._connector_manifest_entry(
+                cls.all_connector_settings[connector_name], ConnectorConfigKeysLoader(util_module_path)
+            ))
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                parent = cls.all_connector_settings[connector_name]
+                cls.all_connector_settings[domain] = ConnectorSetting(
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
+                    trade_fee_schema=trade_fee_schema,
+                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                )
+                manifest_entries.append(cls._connector_manifest_entry(
+                    cls.all_connector_settings[domain],
+                    ConnectorConfigKeysLoader(util_module_path, attribute="OTHER_DOMAINS_KEYS", domain=domain),
+                ))
+        return manifest_entries
 
-        return cls.all_connector_settings
+    @staticmethod
+    def _connector_manifest_entry(
+        connector_setting: ConnectorSetting, config_keys_loader: ConnectorConfigKeysLoader
+    ) -> Dict[str, Any]:
+        return {
+            "name": connector_setting.name,
+            "type": connector_setting.type.name,
+            "centralised": connector_setting.centralised,
+            "example_pair": connector_setting.example_pair,
+            "use_ethereum_wallet": connector_setting.use_ethereum_wallet,
+            "trade_fee_schema": connector_setting.trade_fee_schema.to_json(),
+            "is_sub_domain": connector_setting.is_sub_domain,
+            "parent_name": connector_setting.parent_name,
+            "domain_parameter": connector_setting.domain_parameter,
+            "use_eth_gas_lookup": connector_setting.use_eth_gas_lookup,
+            "config_keys": config_keys_loader._asdict(),
+            "module_path": connector_setting.module_path(),
+        }
+
+    @staticmethod
+    def _connector_setting_from_manifest_entry(entry: Dict[str, Any]) -> ConnectorSetting:
+        return ConnectorSetting(
+            name=entry["name"],
+            type=ConnectorType[entry["type"]],
+            centralised=entry["centralised"],
+            example_pair=entry["example_pair"],
+            use_ethereum_wallet=entry["use_ethereum_wallet"],
+            trade_fee_schema=TradeFeeSchema.from_json(entry["trade_fee_schema"]),
+            config_keys=ConnectorConfigKeysLoader(**entry["config_keys"]),
+            is_sub_domain=entry["is_sub_domain"],
+            parent_name=entry["parent_name"],
+            domain_parameter=entry["domain_parameter"],
+            use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+        )
 
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the config keys of the connector unloaded
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
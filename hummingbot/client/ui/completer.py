@@ -51,9 +51,10 @@ class HummingbotCompleter(Completer):
         self._derivative_completer = WordCompleter(AllConnectorSettings.get_derivative_names(), ignore_case=True)
         self._derivative_exchange_completer = WordCompleter(AllConnectorSettings.get_derivative_names().difference(AllConnectorSettings.get_derivative_dex_names()), ignore_case=True)
         self._connect_option_completer = WordCompleter(CONNECT_OPTIONS, ignore_case=True)
-        self._export_completer = WordCompleter(["keys", "trades"], ignore_case=True)
+        self._export_completer = WordCompleter(["keys", "trades", "latency"], ignore_case=True)
         self._balance_completer = WordCompleter(["limit", "paper"], ignore_case=True)
         self._history_completer = WordCompleter(["--days", "--verbose", "--precision"], ignore_case=True)
+        self._profile_completer = WordCompleter(["--duration", "--interval", "--trace-calls"], ignore_case=True)
         self._gateway_completer = WordCompleter(["config", "connect", "connector-tokens", "generate-certs", "test-connection", "list", "approve-tokens"], ignore_case=True)
         self._gateway_connect_completer = WordCompleter(GATEWAY_CONNECTORS, ignore_case=True)
         self._gateway_connector_tokens_completer = WordCompleter(
@@ -109,6 +110,9 @@ class HummingbotCompleter(Completer):
             if exchange in self.prompt_text:
                 market = exchange
                 break
+        if market:
+            # The trading pairs of the market are fetched in the background the first time they are needed
+            trading_pair_fetcher.request_trading_pairs(market)
         trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if trading_pair_fetcher.ready and market else []
         return WordCompleter(trading_pairs, ignore_case=True, sentence=True)
 
@@ -191,6 +195,10 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("history ")
 
+    def _complete_profile_arguments(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("profile ")
+
     def _complete_gateway_connect_arguments(self, document: Document) -> bool:
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("gateway connect ")
@@ -338,6 +346,10 @@ class HummingbotCompleter(Completer):
             for c in self._history_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_profile_arguments(document):
+            for c in self._profile_completer.get_completions(document, complete_event):
+                yield c
+
         elif self._complete_gateway_connect_arguments(document):
             for c in self._gateway_connect_completer.get_completions(document, complete_event):
                 yield c
@@ -1,8 +1,10 @@
 from __future__ import unicode_literals
 
+import asyncio
 import re
+import time
 from collections import deque
-from typing import Callable, Deque, Dict, List, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import six
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
@@ -104,7 +106,8 @@ class CustomTextArea:
                  dont_extend_height=False, dont_extend_width=False,
                  line_numbers=False, get_line_prefix=None, scrollbar=False,
                  style='', search_field=None, preview_search=True, prompt='',
-                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT):
+                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT,
+                 max_refresh_rate: float = 20):
         assert isinstance(text, six.text_type)
         assert search_field is None or isinstance(search_field, SearchToolbar)
 
@@ -182,7 +185,13 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
+        # The logged lines are rendered in the buffer at most max_refresh_rate times per second
+        self.log_lines: Deque[str] = deque(maxlen=max_line_count)
+        self._min_render_interval: float = 1 / max_refresh_rate if max_refresh_rate > 0 else 0
+        self._last_render_time: float = 0
+        self._render_handle: Optional[asyncio.Handle] = None
+        # The text rendered instead of the logged lines, for the logs that are not saved
+        self._unsaved_text: Optional[str] = None
         self.log(initial_text)
 
     @property
@@ -226,7 +235,7 @@ class CustomTextArea:
         if self.window.render_info is None:
             max_width = 100
         else:
-            max_width = self.window.render_info.window_width - 2
+            max_width = max(self.window.render_info.window_width - 2, 1)
 
         # remove simple formatting tags used by telegram
         repls = (('<b>', ''), ('</b>', ''), ('<pre>', ''), ('</pre>', ''))
@@ -238,17 +247,40 @@ class CustomTextArea:
         new_lines_raw: List[str] = str(text).split('\n')
         new_lines = []
         for line in new_lines_raw:
-            while len(line) > max_width:
-                new_lines.append(line[0:max_width])
-                line = line[max_width:]
-            new_lines.append(line)
+            new_lines.extend([line[start:start + max_width] for start in range(0, len(line), max_width)] or [""])
 
         if save_log:
             self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
+            self._unsaved_text = None
         else:
-            new_text: str = "\n".join(new_lines)
+            self._unsaved_text = "\n".join(new_lines)
         if not silent:
-            self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+            self._schedule_render()
+
+    def _schedule_render(self):
+        """
+        Renders the logs now if the last rendering is older than the minimum interval, or once the interval is over
+        otherwise, so a burst of logs is rendered once.
+        """
+        if self._render_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._render()
+            return
+        delay = self._last_render_time + self._min_render_interval - self._time()
+        if delay <= 0:
+            self._render()
+        else:
+            self._render_handle = loop.call_later(delay, self._render)
+
+    def _render(self):
+        self._render_handle = None
+        self._last_render_time = self._time()
+        new_text: str = self._unsaved_text if self._unsaved_text is not None else "\n".join(self.log_lines)
+        self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
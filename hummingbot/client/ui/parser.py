@@ -127,7 +127,7 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     exit_parser.set_defaults(func=hummingbot.exit)
 
     export_parser = subparsers.add_parser("export", help="Export secure information")
-    export_parser.add_argument("option", nargs="?", choices=("keys", "trades"), help="Export choices")
+    export_parser.add_argument("option", nargs="?", choices=("keys", "trades", "latency"), help="Export choices")
     export_parser.set_defaults(func=hummingbot.export)
 
     ticker_parser = subparsers.add_parser("ticker", help="Show market ticker of current order book")
@@ -136,6 +136,15 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    profile_parser = subparsers.add_parser("profile", help="Profile the running bot and write a flame graph file")
+    profile_parser.add_argument("-d", "--duration", type=float, default=10.0, dest="duration",
+                                help="How many seconds to profile the bot for")
+    profile_parser.add_argument("-i", "--interval", type=float, default=5.0, dest="interval",
+                                help="Sampling interval in milliseconds")
+    profile_parser.add_argument("--trace-calls", action="store_true", default=False, dest="trace_calls",
+                                help="Trace the calls to include the Cython functions built with profiling hooks")
+    profile_parser.set_defaults(func=hummingbot.profile)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
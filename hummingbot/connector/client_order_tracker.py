@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from collections import defaultdict
 from decimal import Decimal
 from itertools import chain
@@ -7,8 +8,15 @@ from typing import TYPE_CHECKING, Callable, Dict, Optional
 
 from cachetools import TTLCache
 
+from hummingbot.connector.order_latency_recorder import OrderLatencyRecorder
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.order_latency_span import (
+    CURRENT_ORDER_LATENCY_SPAN,
+    IN_USER_STREAM_CONTEXT,
+    OrderLatencySpan,
+    OrderLatencyStage,
+)
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -20,6 +28,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.metrics import MetricsRegistry
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger.logger import HummingbotLogger
 
@@ -28,6 +37,15 @@ if TYPE_CHECKING:
 
 cot_logger = None
 
+ORDER_ACK_LATENCY = MetricsRegistry.get_instance().histogram(
+    "hummingbot_order_ack_seconds",
+    "Time between the submission of an order and its creation being confirmed by the exchange",
+    ("connector",))
+ORDER_FIRST_FILL_LATENCY = MetricsRegistry.get_instance().histogram(
+    "hummingbot_order_first_fill_seconds",
+    "Time between the submission of an order and its first fill",
+    ("connector",))
+
 
 class ClientOrderTracker:
 
@@ -61,6 +79,11 @@ class ClientOrderTracker:
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
+        self._latency_recorder = OrderLatencyRecorder()
+
+    @property
+    def latency_recorder(self) -> OrderLatencyRecorder:
+        return self._latency_recorder
 
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
@@ -142,9 +165,18 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        if order.current_state == OrderState.PENDING_CREATE and order.latency_span is None:
+            # The span is started by the connector when the strategy submits the order, otherwise it starts now
+            span = CURRENT_ORDER_LATENCY_SPAN.get()
+            if span is None or span.client_order_id != order.client_order_id:
+                span = OrderLatencySpan(order.client_order_id, order.trading_pair, self._perf_counter())
+            order.latency_span = span
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
+            latency_span = self._in_flight_orders[client_order_id].latency_span
+            if latency_span is not None:
+                self._latency_recorder.record(latency_span, self._connector.name)
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
             if client_order_id in self._order_not_found_records:
@@ -198,6 +230,9 @@ class ClientOrderTracker:
         return found_order
 
     def process_order_update(self, order_update: OrderUpdate):
+        if IN_USER_STREAM_CONTEXT.get():
+            self._mark_confirmed_by_user_stream(
+                self.fetch_order(order_update.client_order_id, order_update.exchange_order_id))
         return safe_ensure_future(self._process_order_update(order_update))
 
     def process_trade_update(self, trade_update: TradeUpdate):
@@ -206,6 +241,8 @@ class ClientOrderTracker:
         tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
 
         if tracked_order:
+            if IN_USER_STREAM_CONTEXT.get():
+                self._mark_confirmed_by_user_stream(tracked_order)
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
@@ -391,6 +428,10 @@ class ClientOrderTracker:
 
     def _trigger_order_creation(self, tracked_order: InFlightOrder, previous_state: OrderState, new_state: OrderState):
         if previous_state == OrderState.PENDING_CREATE and new_state == OrderState.OPEN:
+            span = tracked_order.latency_span
+            if span is not None and span.mark(OrderLatencyStage.PROCESSED, self._perf_counter()):
+                ORDER_ACK_LATENCY.labels(self._connector.name).observe(span.elapsed(OrderLatencyStage.PROCESSED))
+                self._record_if_complete(span)
             self.logger().info(tracked_order.build_order_created_message())
             self._trigger_created_event(tracked_order)
 
@@ -403,6 +444,10 @@ class ClientOrderTracker:
                              trade_id: str,
                              exchange_order_id: str):
         if prev_executed_amount_base < tracked_order.executed_amount_base:
+            span = tracked_order.latency_span
+            if span is not None and prev_executed_amount_base == Decimal("0"):
+                ORDER_FIRST_FILL_LATENCY.labels(self._connector.name).observe(
+                    self._perf_counter() - span.submitted_time)
             self.logger().info(
                 f"The {tracked_order.trade_type.name.upper()} order {tracked_order.client_order_id} "
                 f"amounting to {tracked_order.executed_amount_base}/{tracked_order.amount} "
@@ -437,6 +482,19 @@ class ClientOrderTracker:
 
         self.stop_tracking_order(tracked_order.client_order_id)
 
+    def _mark_confirmed_by_user_stream(self, tracked_order: Optional[InFlightOrder]):
+        span = tracked_order.latency_span if tracked_order is not None else None
+        if span is not None and span.mark(OrderLatencyStage.CONFIRMED, self._perf_counter()):
+            self._record_if_complete(span)
+
+    def _record_if_complete(self, span: OrderLatencySpan):
+        if span.is_complete:
+            self._latency_recorder.record(span, self._connector.name)
+
+    @staticmethod
+    def _perf_counter() -> float:
+        return time.perf_counter()
+
     @staticmethod
     def _restore_order_from_json(serialized_order: Dict):
         order = InFlightOrder.from_json(serialized_order)
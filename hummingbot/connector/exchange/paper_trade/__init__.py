@@ -2,7 +2,9 @@ from typing import List
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.connector.exchange.paper_trade.latency_model import PaperTradeLatencyModel, SimulatedRateLimiter
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 
@@ -16,9 +18,27 @@ def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> Ord
         raise Exception(f"Connector {connector_name} OrderBookTracker class not found ({exception})")
 
 
+def get_rate_limits(connector_name: str, trading_pairs: List[str]) -> List[RateLimit]:
+    conn_setting = AllConnectorSettings.get_connector_settings()[connector_name]
+    connector_instance = conn_setting.non_trading_connector_instance_with_default_configuration(
+        trading_pairs=trading_pairs)
+    # Only the connectors based on ExchangePyBase expose their rate limits
+    return getattr(connector_instance, "rate_limits_rules", [])
+
+
 def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfigAdapter, trading_pairs: List[str]):
     tracker = get_order_book_tracker(connector_name=exchange_name, trading_pairs=trading_pairs)
-    return PaperTradeExchange(client_config_map,
-                              tracker,
-                              get_connector_class(exchange_name),
-                              exchange_name=exchange_name)
+    paper_trade_exchange = PaperTradeExchange(client_config_map,
+                                              tracker,
+                                              get_connector_class(exchange_name),
+                                              exchange_name=exchange_name)
+    paper_trade_config = client_config_map.paper_trade
+    paper_trade_exchange.enable_queue_position_fill_model(paper_trade_config.paper_trade_queue_position_fill_model)
+    paper_trade_exchange.set_latency_model(
+        PaperTradeLatencyModel.for_connector(paper_trade_config.paper_trade_latencies, exchange_name))
+    if paper_trade_config.paper_trade_rate_limits_enabled:
+        rate_limits = get_rate_limits(exchange_name, trading_pairs)
+        if len(rate_limits) > 0:
+            paper_trade_exchange.set_rate_limiter(
+                SimulatedRateLimiter(rate_limits, client_config_map.rate_limits_share_pct))
+    return paper_trade_exchange
@@ -0,0 +1,207 @@
+import math
+import random
+import re
+from collections import deque
+from decimal import Decimal
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+DEFAULT_LATENCY_CONFIG_KEY = "default"
+# Rate limit ids of order endpoints usually end with the order path (e.g. "/order", "/api/v1/orders")
+ORDER_LIMIT_ID_PATTERN = re.compile(r"orders?$", re.IGNORECASE)
+
+
+class LatencyDistribution:
+    """
+    Random latency in seconds, described by a config spec. The spec is either a number (a constant latency) or a
+    dictionary with the distribution type and its parameters:
+        {"distribution": "constant", "value": 0.05}
+        {"distribution": "uniform", "min": 0.02, "max": 0.08}
+        {"distribution": "normal", "mean": 0.05, "stdev": 0.01}
+        {"distribution": "lognormal", "median": 0.05, "sigma": 0.5}
+    Sampled values are never negative.
+    """
+
+    DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal")
+
+    def __init__(self, distribution: str = "constant", random_generator: Optional[random.Random] = None, **params):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Invalid latency distribution '{distribution}'. Valid options are "
+                             f"{', '.join(self.DISTRIBUTIONS)}.")
+        self._distribution = distribution
+        self._params: Dict[str, float] = {key: float(value) for key, value in params.items()}
+        self._random = random_generator or random.Random()
+        # Validates the parameters
+        self.sample()
+
+    @classmethod
+    def from_config(cls,
+                    spec: Union[float, int, Dict[str, Any]],
+                    random_generator: Optional[random.Random] = None) -> "LatencyDistribution":
+        if isinstance(spec, (int, float)):
+            return cls("constant", random_generator, value=spec)
+        params = dict(spec)
+        distribution = params.pop("distribution", "constant")
+        return cls(distribution, random_generator, **params)
+
+    @property
+    def distribution(self) -> str:
+        return self._distribution
+
+    def sample(self) -> float:
+        params = self._params
+        if self._distribution == "constant":
+            value = params["value"]
+        elif self._distribution == "uniform":
+            value = self._random.uniform(params["min"], params["max"])
+        elif self._distribution == "normal":
+            value = self._random.gauss(params["mean"], params["stdev"])
+        else:
+            value = self._random.lognormvariate(math.log(params["median"]), params["sigma"])
+        return max(value, 0.0)
+
+    def __repr__(self) -> str:
+        params = ", ".join(f"{key}={value}" for key, value in self._params.items())
+        return f"LatencyDistribution('{self._distribution}', {params})"
+
+
+class PaperTradeLatencyModel:
+    """
+    Latencies applied by the paper trade exchange to order creation, order cancellation and fill notifications.
+    Latencies are measured against the clock timestamps, so they apply in the same way when paper trading live and
+    when backtesting.
+    """
+
+    CREATE = "create"
+    CANCEL = "cancel"
+    FILL = "fill"
+    ACTIONS = (CREATE, CANCEL, FILL)
+
+    def __init__(self,
+                 create: Optional[LatencyDistribution] = None,
+                 cancel: Optional[LatencyDistribution] = None,
+                 fill: Optional[LatencyDistribution] = None):
+        self._distributions: Dict[str, Optional[LatencyDistribution]] = {
+            self.CREATE: create,
+            self.CANCEL: cancel,
+            self.FILL: fill,
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], seed: Optional[int] = None) -> "PaperTradeLatencyModel":
+        """
+        :param config: latency spec (see `LatencyDistribution`) per action ("create", "cancel" and "fill")
+        :param seed: seed for the random generator shared by all the actions, to make backtests reproducible
+        """
+        invalid_actions = set(config) - set(cls.ACTIONS)
+        if invalid_actions:
+            raise ValueError(f"Invalid paper trade latency actions: {', '.join(sorted(invalid_actions))}. "
+                             f"Valid actions are {', '.join(cls.ACTIONS)}.")
+        random_generator = random.Random(seed)
+        return cls(**{action: LatencyDistribution.from_config(spec, random_generator)
+                      for action, spec in config.items()})
+
+    @classmethod
+    def for_connector(cls,
+                      latencies: Dict[str, Dict[str, Any]],
+                      connector_name: str,
+                      seed: Optional[int] = None) -> Optional["PaperTradeLatencyModel"]:
+        """
+        Builds the latency model of a connector from the paper trade latencies config, falling back to the "default"
+        entry. Returns None when no latency is configured for the connector.
+        """
+        config = latencies.get(connector_name, latencies.get(DEFAULT_LATENCY_CONFIG_KEY))
+        if not config:
+            return None
+        return cls.from_config(config, seed)
+
+    def distribution(self, action: str) -> Optional[LatencyDistribution]:
+        return self._distributions[action]
+
+    def sample(self, action: str) -> float:
+        distribution = self._distributions[action]
+        return distribution.sample() if distribution is not None else 0.0
+
+
+class SimulatedRateLimiter:
+    """
+    Enforces the rate limits of a connector against the clock timestamps of the paper trade exchange.
+
+    The limits are resolved through an `AsyncThrottler` built from the connector `rate_limits_rules`, so linked
+    limits and the configured share of the limits apply as they do for the live connector. Capacity is checked
+    against simulated time instead of waiting on the event loop, which keeps it usable in backtests.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 limits_share_percentage: Decimal,
+                 order_limit_id: Optional[str] = None):
+        """
+        :param rate_limits: the connector rate limits
+        :param limits_share_percentage: percentage of the limits available to the bot
+        :param order_limit_id: limit id of the order creation and cancellation requests. When not provided, the first
+            limit id that looks like an order endpoint is used.
+        """
+        self._throttler = AsyncThrottler(rate_limits, limits_share_percentage=limits_share_percentage)
+        if order_limit_id is None:
+            # Endpoint limits (which usually link to the pool limits) are preferred over pool limits
+            candidates = sorted((rate_limit.limit_id
+                                 for rate_limit in rate_limits
+                                 if ORDER_LIMIT_ID_PATTERN.search(rate_limit.limit_id.rstrip("/"))),
+                                key=lambda limit_id: "/" not in limit_id)
+            order_limit_id = candidates[0] if len(candidates) > 0 else None
+        self._order_limit_id: Optional[str] = order_limit_id
+        # Timestamps and weights of the requests sent, per limit id
+        self._request_logs: Dict[str, Deque[Tuple[float, int]]] = {}
+
+    @property
+    def order_limit_id(self) -> Optional[str]:
+        return self._order_limit_id
+
+    def reserve(self, timestamp: float, limit_id: Optional[str] = None) -> float:
+        """
+        Registers a request and returns the earliest timestamp, not before the given one, at which it can be sent
+        without exceeding any of the related rate limits. As with `AsyncThrottler`, requests are sent in FIFO order.
+        """
+        limit_id = limit_id or self._order_limit_id
+        if limit_id is None:
+            return timestamp
+        rate_limit, related_limits = self._throttler.get_related_limits(limit_id)
+        if rate_limit is None:
+            return timestamp
+        limits = [(rate_limit, rate_limit.weight)] + related_limits
+
+        send_timestamp = timestamp
+        for limit, _ in limits:
+            request_log = self._request_logs.setdefault(limit.limit_id, deque())
+            # Drop the requests out of every window the new request can be checked against
+            while request_log and request_log[0][0] <= timestamp - limit.time_interval:
+                request_log.popleft()
+            if request_log:
+                send_timestamp = max(send_timestamp, request_log[-1][0])
+
+        while True:
+            earliest_timestamp = max(self._earliest_timestamp(limit, weight, send_timestamp)
+                                     for limit, weight in limits)
+            if earliest_timestamp <= send_timestamp:
+                break
+            send_timestamp = earliest_timestamp
+
+        for limit, weight in limits:
+            self._request_logs[limit.limit_id].append((send_timestamp, weight))
+        return send_timestamp
+
+    def _earliest_timestamp(self, rate_limit: RateLimit, weight: int, timestamp: float) -> float:
+        window_start = timestamp - rate_limit.time_interval
+        in_window = [entry for entry in self._request_logs[rate_limit.limit_id] if entry[0] > window_start]
+        excess = sum(entry_weight for _, entry_weight in in_window) + weight - rate_limit.limit
+        if excess <= 0:
+            return timestamp
+        # Wait until enough of the oldest requests leave the window
+        for entry_timestamp, entry_weight in in_window:
+            excess -= entry_weight
+            if excess <= 0:
+                return entry_timestamp + rate_limit.time_interval
+        return timestamp
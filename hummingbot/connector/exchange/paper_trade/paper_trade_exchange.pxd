@@ -2,6 +2,7 @@ from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string
 from libcpp.unordered_map cimport unordered_map
 from libcpp.utility cimport pair
+from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.LimitOrder cimport LimitOrder as CPPLimitOrder
 from hummingbot.core.data_type.OrderExpirationEntry cimport OrderExpirationEntry as CPPOrderExpirationEntry
@@ -33,17 +34,36 @@ cdef class PaperTradeExchange(ExchangeBase):
         LimitOrders _ask_limit_orders
         bint _paper_trade_market_initialized
         dict _trading_pairs
-        object _queued_orders
+        list _queued_orders
         dict _quantization_params
         object _order_book_trade_listener
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
         str _exchange_name
+        bint _queue_position_fill_model_enabled
+        dict _queue_positions
+        object _latency_model
+        object _rate_limiter
+        list _pending_actions
+        object _pending_action_sequence
+        dict _pending_limit_orders
+        double _last_fill_notification_timestamp
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
+    cdef c_queue_market_order(self, object queued_order)
     cdef c_process_market_orders(self)
+    cdef c_insert_limit_order(self,
+                              bint is_buy,
+                              str order_id,
+                              str trading_pair_str,
+                              object price,
+                              object amount)
+    cdef double c_request_timestamp(self, str action)
+    cdef c_schedule_action(self, double timestamp, object action, tuple args)
+    cdef c_process_pending_actions(self)
+    cdef c_trigger_fill_event(self, int event_tag, object event)
     cdef c_set_balance(self, str currency, object amount)
     cdef object c_get_fee(self,
                           str base_asset,
@@ -61,21 +81,36 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=*)
+    cdef c_update_limit_order_fill(self,
+                                   LimitOrdersIterator *map_it_ptr,
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object filled_quantity)
+    cdef double c_get_level_volume(self, str trading_pair, bint is_bid, double price)
+    cdef c_update_queue_positions(self)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef c_match_trade_to_queued_limit_orders(self,
+                                              bint is_maker_buy,
+                                              LimitOrders *limit_orders_map_ptr,
+                                              LimitOrdersIterator *map_it_ptr,
+                                              vector[SingleTradingPairLimitOrdersIterator] orders_its,
+                                              object trade_quantity)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
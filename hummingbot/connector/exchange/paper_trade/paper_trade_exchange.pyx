@@ -1,19 +1,24 @@
-# distutils: sources=['hummingbot/core/cpp/Utils.cpp', 'hummingbot/core/cpp/LimitOrder.cpp', 'hummingbot/core/cpp/OrderExpirationEntry.cpp']
+# distutils: sources=['hummingbot/core/cpp/Utils.cpp', 'hummingbot/core/cpp/LimitOrder.cpp', 'hummingbot/core/cpp/OrderExpirationEntry.cpp', 'hummingbot/core/cpp/OrderBookEntry.cpp']
 
 import asyncio
+import heapq
+import itertools
 import math
 import random
-from collections import defaultdict, deque
+from collections import defaultdict
 from decimal import Decimal, ROUND_DOWN
 from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from cpython cimport PyObject
 from cython.operator cimport address, dereference as deref, postincrement as inc
 from libcpp cimport bool as cppbool
+from libcpp.set cimport set as cpp_set
 from libcpp.vector cimport vector
 
 from hummingbot.connector.budget_checker import BudgetChecker
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
+from hummingbot.connector.exchange.paper_trade.latency_model import PaperTradeLatencyModel, SimulatedRateLimiter
+from hummingbot.connector.exchange.paper_trade.queue_position import QueuePosition
 from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock cimport Clock
@@ -25,6 +30,7 @@ from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.limit_order cimport c_create_limit_order_from_cpp_limit_order
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.event.event_listener cimport EventListener
@@ -167,12 +173,20 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._account_available_balances = {}
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
-        self._queued_orders = deque()
+        self._queued_orders = []
         self._quantization_params = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        self._queue_position_fill_model_enabled = False
+        self._queue_positions = {}
+        self._latency_model = None
+        self._rate_limiter = None
+        self._pending_actions = []
+        self._pending_action_sequence = itertools.count()
+        self._pending_limit_orders = {}
+        self._last_fill_notification_timestamp = 0
 
         # Trade volume metrics should never be gather for paper trade connector
         self._trade_volume_metric_collector = DummyMetricsCollector()
@@ -181,6 +195,60 @@ cdef class PaperTradeExchange(ExchangeBase):
     def budget_checker(self) -> BudgetChecker:
         return self._budget_checker
 
+    @property
+    def queue_position_fill_model_enabled(self) -> bool:
+        return self._queue_position_fill_model_enabled
+
+    @property
+    def queue_positions(self) -> Dict[str, QueuePosition]:
+        return self._queue_positions
+
+    @property
+    def latency_model(self) -> Optional[PaperTradeLatencyModel]:
+        return self._latency_model
+
+    @property
+    def rate_limiter(self) -> Optional[SimulatedRateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def next_pending_action_timestamp(self) -> float:
+        """
+        Timestamp of the next delayed order creation, cancellation, fill notification or market order execution, NaN
+        if there is none.
+        """
+        timestamps = []
+        if len(self._pending_actions) > 0:
+            timestamps.append(self._pending_actions[0][0])
+        if len(self._queued_orders) > 0:
+            timestamps.append(self._queued_orders[0][0] + self.TRADE_EXECUTION_DELAY)
+        return min(timestamps) if len(timestamps) > 0 else float("nan")
+
+    def set_latency_model(self, latency_model: Optional[PaperTradeLatencyModel]):
+        """
+        Sets the latencies applied to order creations, cancellations and fill notifications. None to process them
+        instantly.
+        """
+        self._latency_model = latency_model
+
+    def set_rate_limiter(self, rate_limiter: Optional[SimulatedRateLimiter]):
+        """
+        Sets the rate limiter that delays order creations and cancellations exceeding the connector rate limits.
+        None to disable rate limiting.
+        """
+        self._rate_limiter = rate_limiter
+
+    def enable_queue_position_fill_model(self, enabled: bool = True):
+        """
+        Switches between filling resting limit orders in full as soon as the market trades through or crosses their
+        price, and the queue position fill model. With the queue position model, a limit order only fills from trades
+        printed at its price once the volume queued ahead of it has been consumed, and it can be partially filled.
+        Prices strictly crossing the order still fill it in full.
+        """
+        self._queue_position_fill_model_enabled = enabled
+        if not enabled:
+            self._queue_positions.clear()
+
     @classmethod
     def random_order_id(cls, order_side: str, trading_pair: str) -> str:
         vals = [random.choice(range(0, 256)) for i in range(0, 13)]
@@ -196,6 +264,17 @@ cdef class PaperTradeExchange(ExchangeBase):
                 self._order_book_trade_listener
             )
 
+    def new_empty_order_book(self, trading_pair: str):
+        """
+        Creates an empty order book for the trading pair, to be populated from recorded market data when backtesting.
+        """
+        order_book = CompositeOrderBook()
+        order_book.c_add_listener(self.ORDER_BOOK_TRADE_EVENT_TAG, self._order_book_trade_listener)
+        base_asset, quote_asset = self.split_trading_pair(trading_pair)
+        self._trading_pairs[trading_pair] = TradingPair(trading_pair, base_asset, quote_asset)
+        self.order_book_tracker.add_local_order_book(trading_pair, order_book)
+        self._paper_trade_market_initialized = True
+
     def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
         return self._target_market.split_trading_pair(trading_pair)
 
@@ -240,7 +319,7 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def queued_orders(self) -> List[QueuedOrder]:
-        return self._queued_orders
+        return [queued_order for _, _, queued_order in sorted(self._queued_orders)]
 
     @property
     def limit_orders(self) -> List[LimitOrder]:
@@ -278,10 +357,17 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            remaining_quantity = limit_order.quantity - (limit_order.filled_quantity or s_decimal_0)
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += remaining_quantity * limit_order.price
+            else:
+                _on_hold_balances[limit_order.base_currency] += remaining_quantity
+        # Limit orders that have not reached the exchange yet already hold their balance
+        for is_buy, trading_pair_str, price, amount in self._pending_limit_orders.values():
+            if is_buy:
+                _on_hold_balances[self._trading_pairs[trading_pair_str].quote_asset] += amount * price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[self._trading_pairs[trading_pair_str].base_asset] += amount
         return _on_hold_balances
 
     @property
@@ -317,7 +403,10 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
+        self.c_process_pending_actions()
         self.c_process_market_orders()
+        if self._queue_position_fill_model_enabled:
+            self.c_update_queue_positions()
         self.c_process_crossed_limit_orders()
 
     cdef str c_buy(self,
@@ -331,43 +420,26 @@ cdef class PaperTradeExchange(ExchangeBase):
 
         cdef:
             str order_id = self.random_order_id("buy", trading_pair_str)
-            str quote_asset = self._trading_pairs[trading_pair_str].quote_asset
-            string cpp_order_id = order_id.encode("utf8")
-            string cpp_trading_pair_str = trading_pair_str.encode("utf8")
-            string cpp_base_asset = self._trading_pairs[trading_pair_str].base_asset.encode("utf8")
-            string cpp_quote_asset = quote_asset.encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
                            else s_decimal_0)
         quantized_amount = self.c_quantize_order_amount(trading_pair_str, amount)
         if order_type is OrderType.MARKET:
-            self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, True, trading_pair_str,
-                                                   quantized_amount))
+            self.c_queue_market_order(QueuedOrder(self.c_request_timestamp(PaperTradeLatencyModel.CREATE),
+                                                  order_id,
+                                                  True,
+                                                  trading_pair_str,
+                                                  quantized_amount))
         elif order_type is OrderType.LIMIT:
-
-            map_it = self._bid_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._bid_limit_orders.end():
-                insert_result = self._bid_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
-                cpp_order_id,
-                cpp_trading_pair_str,
-                True,
-                cpp_base_asset,
-                cpp_quote_asset,
-                <PyObject *> quantized_price,
-                <PyObject *> quantized_amount,
-                <PyObject *> None,
-                int(self._current_timestamp * 1e6),
-                0
-            ))
+            self._pending_limit_orders[order_id] = (True, trading_pair_str, quantized_price, quantized_amount)
+            if self._latency_model is not None or self._rate_limiter is not None:
+                self.c_schedule_action(self.c_request_timestamp(PaperTradeLatencyModel.CREATE),
+                                       self._accept_limit_order,
+                                       (order_id,))
+            else:
+                self._accept_limit_order(order_id)
+            return order_id
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -390,42 +462,26 @@ cdef class PaperTradeExchange(ExchangeBase):
             raise ValueError(f"Trading pair '{trading_pair_str}' does not existing in current data set.")
         cdef:
             str order_id = self.random_order_id("sell", trading_pair_str)
-            str base_asset = self._trading_pairs[trading_pair_str].base_asset
-            string cpp_order_id = order_id.encode("utf8")
-            string cpp_trading_pair_str = trading_pair_str.encode("utf8")
-            string cpp_base_asset = base_asset.encode("utf8")
-            string cpp_quote_asset = self._trading_pairs[trading_pair_str].quote_asset.encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
                            else s_decimal_0)
         quantized_amount = self.c_quantize_order_amount(trading_pair_str, amount)
         if order_type is OrderType.MARKET:
-            self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, False, trading_pair_str,
-                                                   quantized_amount))
+            self.c_queue_market_order(QueuedOrder(self.c_request_timestamp(PaperTradeLatencyModel.CREATE),
+                                                  order_id,
+                                                  False,
+                                                  trading_pair_str,
+                                                  quantized_amount))
         elif order_type is OrderType.LIMIT:
-            map_it = self._ask_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._ask_limit_orders.end():
-                insert_result = self._ask_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
-                cpp_order_id,
-                cpp_trading_pair_str,
-                False,
-                cpp_base_asset,
-                cpp_quote_asset,
-                <PyObject *> quantized_price,
-                <PyObject *> quantized_amount,
-                <PyObject *> None,
-                int(self._current_timestamp * 1e6),
-                0
-            ))
+            self._pending_limit_orders[order_id] = (False, trading_pair_str, quantized_price, quantized_amount)
+            if self._latency_model is not None or self._rate_limiter is not None:
+                self.c_schedule_action(self.c_request_timestamp(PaperTradeLatencyModel.CREATE),
+                                       self._accept_limit_order,
+                                       (order_id,))
+            else:
+                self._accept_limit_order(order_id)
+            return order_id
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -437,6 +493,78 @@ cdef class PaperTradeExchange(ExchangeBase):
                                   self._current_timestamp)))
         return order_id
 
+    cdef c_insert_limit_order(self,
+                              bint is_buy,
+                              str order_id,
+                              str trading_pair_str,
+                              object price,
+                              object amount):
+        cdef:
+            LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
+                                                 if is_buy
+                                                 else address(self._ask_limit_orders))
+            string cpp_trading_pair_str = trading_pair_str.encode("utf8")
+            LimitOrdersIterator map_it = limit_orders_map_ptr.find(cpp_trading_pair_str)
+            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
+            pair[LimitOrders.iterator, cppbool] insert_result
+
+        if map_it == limit_orders_map_ptr.end():
+            insert_result = limit_orders_map_ptr.insert(LimitOrdersPair(cpp_trading_pair_str,
+                                                                        SingleTradingPairLimitOrders()))
+            map_it = insert_result.first
+        limit_orders_collection_ptr = address(deref(map_it).second)
+        limit_orders_collection_ptr.insert(CPPLimitOrder(
+            order_id.encode("utf8"),
+            cpp_trading_pair_str,
+            is_buy,
+            self._trading_pairs[trading_pair_str].base_asset.encode("utf8"),
+            self._trading_pairs[trading_pair_str].quote_asset.encode("utf8"),
+            <PyObject *> price,
+            <PyObject *> amount,
+            <PyObject *> None,
+            int(self._current_timestamp * 1e6),
+            0
+        ))
+        if self._queue_position_fill_model_enabled:
+            self._queue_positions[order_id] = QueuePosition(
+                order_id,
+                trading_pair_str,
+                is_buy,
+                float(price),
+                self.c_get_level_volume(trading_pair_str, is_buy, float(price)))
+
+    def _accept_limit_order(self, order_id: str):
+        """
+        Adds a limit order to the book once its creation request has reached the simulated exchange.
+        The creation event is triggered asynchronously, whether or not the order was delayed.
+        """
+        pending_order = self._pending_limit_orders.pop(order_id, None)
+        if pending_order is None:
+            # The order was canceled before reaching the exchange
+            return
+        is_buy, trading_pair_str, price, amount = pending_order
+        self.c_insert_limit_order(is_buy, order_id, trading_pair_str, price, amount)
+        if is_buy:
+            safe_ensure_future(self.trigger_event_async(
+                self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
+                BuyOrderCreatedEvent(self._current_timestamp,
+                                     OrderType.LIMIT,
+                                     trading_pair_str,
+                                     amount,
+                                     price,
+                                     order_id,
+                                     self._current_timestamp)))
+        else:
+            safe_ensure_future(self.trigger_event_async(
+                self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
+                SellOrderCreatedEvent(self._current_timestamp,
+                                      OrderType.LIMIT,
+                                      trading_pair_str,
+                                      amount,
+                                      price,
+                                      order_id,
+                                      self._current_timestamp)))
+
     cdef c_execute_buy(self, str order_id, str trading_pair_str, object amount):
         cdef:
             str quote_asset = self._trading_pairs[trading_pair_str].quote_asset
@@ -507,9 +635,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         )
 
         for order_filled_event in order_filled_events:
-            self.c_trigger_event(self.ORDER_FILLED_EVENT_TAG, order_filled_event)
+            self.c_trigger_fill_event(self.ORDER_FILLED_EVENT_TAG, order_filled_event)
 
-        self.c_trigger_event(
+        self.c_trigger_fill_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(self._current_timestamp,
                                    order_id,
@@ -589,9 +717,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         )
 
         for order_filled_event in order_filled_events:
-            self.c_trigger_event(self.ORDER_FILLED_EVENT_TAG, order_filled_event)
+            self.c_trigger_fill_event(self.ORDER_FILLED_EVENT_TAG, order_filled_event)
 
-        self.c_trigger_event(
+        self.c_trigger_fill_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(self._current_timestamp,
                                     order_id,
@@ -601,22 +729,67 @@ cdef class PaperTradeExchange(ExchangeBase):
                                     acquired_amount,
                                     OrderType.MARKET))
 
+    cdef double c_request_timestamp(self, str action):
+        """
+        Returns the timestamp at which an order creation or cancellation requested now is processed by the simulated
+        exchange, after waiting for rate limit capacity and the request latency.
+        """
+        cdef:
+            double timestamp = self._current_timestamp
+        if self._rate_limiter is not None:
+            timestamp = self._rate_limiter.reserve(timestamp)
+        if self._latency_model is not None:
+            timestamp += self._latency_model.sample(action)
+        return timestamp
+
+    cdef c_schedule_action(self, double timestamp, object action, tuple args):
+        # The sequence number keeps actions with the same timestamp in scheduling order
+        heapq.heappush(self._pending_actions, (timestamp, next(self._pending_action_sequence), action, args))
+
+    cdef c_process_pending_actions(self):
+        while len(self._pending_actions) > 0 and self._pending_actions[0][0] <= self._current_timestamp:
+            _, _, action, args = heapq.heappop(self._pending_actions)
+            try:
+                action(*args)
+            except Exception:
+                self.logger().error("Error processing delayed paper trade action.", exc_info=True)
+
+    cdef c_trigger_fill_event(self, int event_tag, object event):
+        """
+        Triggers order fill and completion events, after the fill notification latency if there is one. Notifications
+        are delivered in the order they are triggered.
+        """
+        cdef:
+            double timestamp
+        if self._latency_model is None or self._latency_model.distribution(PaperTradeLatencyModel.FILL) is None:
+            self.c_trigger_event(event_tag, event)
+            return
+        timestamp = max(self._current_timestamp + self._latency_model.sample(PaperTradeLatencyModel.FILL),
+                        self._last_fill_notification_timestamp)
+        self._last_fill_notification_timestamp = timestamp
+        self.c_schedule_action(timestamp, self._deliver_event, (event_tag, event))
+
+    def _deliver_event(self, event_tag: int, event: object):
+        self.c_trigger_event(event_tag, event)
+
+    cdef c_queue_market_order(self, object queued_order):
+        # Orders are executed by creation timestamp, the sequence number keeps the ones created together in order
+        heapq.heappush(self._queued_orders,
+                       (queued_order.timestamp, next(self._pending_action_sequence), queued_order))
+
     cdef c_process_market_orders(self):
         cdef:
             QueuedOrder front_order = None
-        while len(self._queued_orders) > 0:
-            front_order = self._queued_orders[0]
-            if front_order.create_timestamp <= self._current_timestamp - self.TRADE_EXECUTION_DELAY:
-                self._queued_orders.popleft()
-                try:
-                    if front_order.is_buy:
-                        self.c_execute_buy(front_order.order_id, front_order.trading_pair, front_order.amount)
-                    else:
-                        self.c_execute_sell(front_order.order_id, front_order.trading_pair, front_order.amount)
-                except Exception as e:
-                    self.logger().error("Error executing queued order.", exc_info=True)
-            else:
-                return
+        while (len(self._queued_orders) > 0 and
+               self._queued_orders[0][0] <= self._current_timestamp - self.TRADE_EXECUTION_DELAY):
+            _, _, front_order = heapq.heappop(self._queued_orders)
+            try:
+                if front_order.is_buy:
+                    self.c_execute_buy(front_order.order_id, front_order.trading_pair, front_order.amount)
+                else:
+                    self.c_execute_sell(front_order.order_id, front_order.trading_pair, front_order.amount)
+            except Exception as e:
+                self.logger().error("Error executing queued order.", exc_info=True)
 
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
@@ -636,17 +809,23 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_quantity = <object> cpp_limit_order_ptr.getFilledQuantity() or s_decimal_0
+            object remaining_quantity = <object> cpp_limit_order_ptr.getQuantity() - filled_quantity
+            object amount = (remaining_quantity
+                             if fill_amount is None or fill_amount > remaining_quantity
+                             else fill_amount)
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            object queue_position = self._queue_positions.get(order_id)
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -672,6 +851,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                   f"{quote_balance:.8g} {quote_asset} available.")
 
             self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+            self._queue_positions.pop(order_id, None)
             self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
                                  OrderCancelledEvent(self._current_timestamp,
                                                      order_id)
@@ -697,7 +877,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         )
 
         # Emit the trade and order completed events.
-        self.c_trigger_event(
+        self.c_trigger_fill_event(
             self.ORDER_FILLED_EVENT_TAG,
             OrderFilledEvent(
                 self._current_timestamp,
@@ -705,13 +885,26 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
-        self.c_trigger_event(
+        if amount < remaining_quantity:
+            # Partial fill, the order stays in the book with the remaining quantity.
+            if queue_position is not None:
+                queue_position.filled_base += acquired_amount
+                queue_position.filled_quote += paid_amount
+            self.c_update_limit_order_fill(map_it_ptr, orders_it, filled_quantity + amount)
+            return
+
+        if queue_position is not None:
+            acquired_amount += queue_position.filled_base
+            paid_amount += queue_position.filled_quote
+            del self._queue_positions[order_id]
+
+        self.c_trigger_fill_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
                 self._current_timestamp,
@@ -727,17 +920,23 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_quantity = <object> cpp_limit_order_ptr.getFilledQuantity() or s_decimal_0
+            object remaining_quantity = <object> cpp_limit_order_ptr.getQuantity() - filled_quantity
+            object amount = (remaining_quantity
+                             if fill_amount is None or fill_amount > remaining_quantity
+                             else fill_amount)
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            object queue_position = self._queue_positions.get(order_id)
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -763,6 +962,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                   f"{sold_amount:.8g} {base_asset} needed vs. "
                                   f"{base_balance:.8g} {base_asset} available.")
             self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+            self._queue_positions.pop(order_id, None)
             self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
                                  OrderCancelledEvent(self._current_timestamp,
                                                      order_id)
@@ -788,7 +988,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         )
 
         # Emit the trade and order completed events.
-        self.c_trigger_event(
+        self.c_trigger_fill_event(
             self.ORDER_FILLED_EVENT_TAG,
             OrderFilledEvent(
                 self._current_timestamp,
@@ -796,13 +996,26 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
-        self.c_trigger_event(
+        if amount < remaining_quantity:
+            # Partial fill, the order stays in the book with the remaining quantity.
+            if queue_position is not None:
+                queue_position.filled_base += sold_amount
+                queue_position.filled_quote += acquired_amount
+            self.c_update_limit_order_fill(map_it_ptr, orders_it, filled_quantity + amount)
+            return
+
+        if queue_position is not None:
+            sold_amount += queue_position.filled_base
+            acquired_amount += queue_position.filled_quote
+            del self._queue_positions[order_id]
+
+        self.c_trigger_fill_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
                 self._current_timestamp,
@@ -819,15 +1032,65 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
+    cdef c_update_limit_order_fill(self,
+                                   LimitOrdersIterator *map_it_ptr,
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object filled_quantity):
+        """
+        Replaces a partially filled limit order with a copy holding the new filled quantity. The copy keeps the same
+        price and client order id, so it takes the same place in the limit orders set.
+        """
+        cdef:
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
+            CPPLimitOrder updated_order = CPPLimitOrder(
+                cpp_limit_order_ptr.getClientOrderID(),
+                cpp_limit_order_ptr.getTradingPair(),
+                cpp_limit_order_ptr.getIsBuy(),
+                cpp_limit_order_ptr.getBaseCurrency(),
+                cpp_limit_order_ptr.getQuoteCurrency(),
+                cpp_limit_order_ptr.getPrice(),
+                cpp_limit_order_ptr.getQuantity(),
+                <PyObject *> filled_quantity,
+                cpp_limit_order_ptr.getCreationTimestamp(),
+                cpp_limit_order_ptr.getStatus()
+            )
+        orders_collection_ptr.erase(orders_it)
+        orders_collection_ptr.insert(updated_order)
+
+    cdef double c_get_level_volume(self, str trading_pair, bint is_bid, double price):
+        """
+        Returns the volume resting at the given price level of the order book, in O(log n).
+        """
+        cdef:
+            OrderBook order_book = self.order_books.get(trading_pair)
+            cpp_set[OrderBookEntry] *book_ptr
+            cpp_set[OrderBookEntry].iterator entry_it
+
+        if order_book is None:
+            return 0
+        book_ptr = address(order_book._bid_book) if is_bid else address(order_book._ask_book)
+        entry_it = book_ptr.find(OrderBookEntry(price, 0, 0))
+        if entry_it == book_ptr.end():
+            return 0
+        return deref(entry_it).getAmount()
+
+    cdef c_update_queue_positions(self):
+        for queue_position in self._queue_positions.values():
+            queue_position.on_level_update(self.c_get_level_volume(queue_position.trading_pair,
+                                                                   queue_position.is_buy,
+                                                                   queue_position.price))
+
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
@@ -854,6 +1117,10 @@ cdef class PaperTradeExchange(ExchangeBase):
                 cpp_limit_order_ptr = address(deref(orders_rit))
                 if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
                     break
+                # With the queue position model, a book touching the order price doesn't imply the order was reached.
+                if (self._queue_position_fill_model_enabled and
+                        opposite_order_book_price == <object>cpp_limit_order_ptr.getPrice()):
+                    break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
@@ -862,6 +1129,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 cpp_limit_order_ptr = address(deref(orders_it))
                 if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
                     break
+                if (self._queue_position_fill_model_enabled and
+                        opposite_order_book_price == <object>cpp_limit_order_ptr.getPrice()):
+                    break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
@@ -906,7 +1176,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersIterator orders_it
             SingleTradingPairLimitOrdersRIterator orders_rit
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            vector[SingleTradingPairLimitOrdersIterator] queued_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            object order_price
 
         if map_it == limit_orders_map_ptr.end():
             return
@@ -916,23 +1188,92 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                order_price = <object>cpp_limit_order_ptr.getPrice()
+                if order_price < trade_price:
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                if order_price == trade_price:
+                    if not self._queue_position_fill_model_enabled:
+                        break
+                    queued_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                else:
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                order_price = <object>cpp_limit_order_ptr.getPrice()
+                if order_price > trade_price:
                     break
-                process_order_its.push_back(orders_it)
+                if order_price == trade_price:
+                    if not self._queue_position_fill_model_enabled:
+                        break
+                    queued_order_its.push_back(orders_it)
+                else:
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+        if queued_order_its.size() > 0:
+            self.c_match_trade_to_queued_limit_orders(is_maker_buy,
+                                                      limit_orders_map_ptr,
+                                                      address(map_it),
+                                                      queued_order_its,
+                                                      trade_quantity)
+
+    cdef c_match_trade_to_queued_limit_orders(self,
+                                              bint is_maker_buy,
+                                              LimitOrders *limit_orders_map_ptr,
+                                              LimitOrdersIterator *map_it_ptr,
+                                              vector[SingleTradingPairLimitOrdersIterator] orders_its,
+                                              object trade_quantity):
+        """
+        Fills the limit orders resting at the price of a trade with the part of the traded amount that goes past the
+        volume queued ahead of them.
+
+        :param is_maker_buy: are the limit orders on the bid side?
+        :param limit_orders_map_ptr: pointer to the limit orders map
+        :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
+        :param orders_its: iterators to the limit orders at the trade price
+        :param trade_quantity: traded amount
+        """
+        cdef:
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            str trading_pair
+            str order_id
+            double order_price
+            double available_quantity = float(trade_quantity)
+
+        for orders_it in orders_its:
+            if available_quantity <= 0:
+                break
+            cpp_limit_order_ptr = address(deref(orders_it))
+            order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            trading_pair = cpp_limit_order_ptr.getTradingPair().decode("utf8")
+            queue_position = self._queue_positions.get(order_id)
+            if queue_position is None:
+                # Orders placed before the model was enabled join the queue at the back of the level.
+                order_price = float(<object>cpp_limit_order_ptr.getPrice())
+                queue_position = QueuePosition(order_id,
+                                               trading_pair,
+                                               is_maker_buy,
+                                               order_price,
+                                               self.c_get_level_volume(trading_pair, is_maker_buy, order_price))
+                self._queue_positions[order_id] = queue_position
+            fill_quantity = queue_position.on_trade(available_quantity)
+            if fill_quantity <= 0:
+                continue
+            fill_amount = self.c_quantize_order_amount(trading_pair, Decimal(repr(fill_quantity)))
+            if fill_amount <= s_decimal_0:
+                continue
+            # The part of the trade that reached this order doesn't reach the ones queued behind it.
+            available_quantity -= float(fill_amount)
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
@@ -984,6 +1325,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                 limit_order_ptr = address(deref(orders_it))
                 limit_order_cid = limit_order_ptr.getClientOrderID().decode("utf8")
                 delete_success = self.c_delete_limit_order(orders_map, address(map_it), orders_it)
+                self._queue_positions.pop(limit_order_cid, None)
                 cancellation_results.append(CancellationResult(limit_order_cid,
                                                                delete_success))
                 self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
@@ -995,14 +1337,25 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error(f"Error canceling order.", exc_info=True)
 
     cdef c_cancel(self, str trading_pair_str, str client_order_id):
+        if self._latency_model is not None or self._rate_limiter is not None:
+            self.c_schedule_action(self.c_request_timestamp(PaperTradeLatencyModel.CANCEL),
+                                   self._cancel_order,
+                                   (trading_pair_str, client_order_id))
+            return
+        self._cancel_order(trading_pair_str, client_order_id)
+
+    def _cancel_order(self, trading_pair_str: str, client_order_id: str):
         cdef:
-            string cpp_trading_pair = trading_pair_str.encode("utf8")
-            string cpp_client_order_id = client_order_id.encode("utf8")
             str trade_type = client_order_id.split("://")[0]
             bint is_maker_buy = trade_type.upper() == "BUY"
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
+        if self._pending_limit_orders.pop(client_order_id, None) is not None:
+            # The cancellation reached the exchange before the order creation
+            self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
+                                 OrderCancelledEvent(self._current_timestamp, client_order_id))
+            return
         self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, False, client_order_id)
 
     cdef object c_get_fee(self,
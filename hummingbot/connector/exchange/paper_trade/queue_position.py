@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+s_decimal_0 = Decimal(0)
+
+
+class QueuePosition:
+    """
+    Estimated position of a paper trade limit order in the queue of its price level.
+
+    The order joins the queue behind the volume resting at its price level when it is placed. Trades printed at the
+    order price consume the queue ahead of it first, and only the excess volume fills the order. Volume removed from
+    the level that is not explained by trades is treated as cancellations, spread evenly over the queue, so only the
+    share in front of the order moves it forward.
+    """
+
+    __slots__ = ("order_id", "trading_pair", "is_buy", "price", "queue_ahead", "level_volume", "traded_volume",
+                 "filled_base", "filled_quote")
+
+    def __init__(self, order_id: str, trading_pair: str, is_buy: bool, price: float, level_volume: float):
+        self.order_id = order_id
+        self.trading_pair = trading_pair
+        self.is_buy = is_buy
+        self.price = price
+        self.queue_ahead: float = level_volume
+        self.level_volume: float = level_volume
+        # Volume traded at the price level since the last level update
+        self.traded_volume: float = 0.0
+        # Totals of the partial fills so far, reported when the order completes
+        self.filled_base: Decimal = s_decimal_0
+        self.filled_quote: Decimal = s_decimal_0
+
+    def on_trade(self, amount: float) -> float:
+        """
+        Registers a trade printed at the order price level.
+
+        :param amount: traded amount
+        :return: the part of the traded amount that reached the order, after consuming the queue ahead of it
+        """
+        self.traded_volume += amount
+        consumed = min(self.queue_ahead, amount)
+        self.queue_ahead -= consumed
+        return amount - consumed
+
+    def on_level_update(self, level_volume: float):
+        """
+        Registers the volume currently resting at the order price level.
+        """
+        expected_volume = self.level_volume - self.traded_volume
+        cancelled_volume = expected_volume - level_volume
+        if cancelled_volume > 0 and expected_volume > 0:
+            self.queue_ahead -= cancelled_volume * min(self.queue_ahead / expected_volume, 1.0)
+        self.queue_ahead = max(min(self.queue_ahead, level_volume), 0.0)
+        self.level_volume = level_volume
+        self.traded_volume = 0.0
+
+    def __repr__(self) -> str:
+        return (f"QueuePosition('{self.order_id}', '{self.trading_pair}', {self.is_buy}, {self.price}, "
+                f"queue_ahead={self.queue_ahead}, level_volume={self.level_volume})")
@@ -2,15 +2,17 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_latency_recorder import OrderLatencyRecorder
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -20,6 +22,12 @@ from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_latency_span import (
+    CURRENT_ORDER_LATENCY_SPAN,
+    IN_USER_STREAM_CONTEXT,
+    OrderLatencySpan,
+    OrderLatencyStage,
+)
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -76,7 +84,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            connector_name=self.name))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -310,14 +319,15 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
+        latency_span = OrderLatencySpan(order_id, trading_pair, self._perf_counter())
+        safe_ensure_future(self._run_in_order_latency_span(latency_span, self._create_order(
             trade_type=TradeType.BUY,
             order_id=order_id,
             trading_pair=trading_pair,
             amount=amount,
             order_type=order_type,
             price=price,
-            **kwargs))
+            **kwargs)))
         return order_id
 
     def sell(self,
@@ -340,14 +350,15 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
+        latency_span = OrderLatencySpan(order_id, trading_pair, self._perf_counter())
+        safe_ensure_future(self._run_in_order_latency_span(latency_span, self._create_order(
             trade_type=TradeType.SELL,
             order_id=order_id,
             trading_pair=trading_pair,
             amount=amount,
             order_type=order_type,
             price=price,
-            **kwargs))
+            **kwargs)))
         return order_id
 
     def get_fee(self,
@@ -504,6 +515,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             price=order.price,
             **kwargs,
         )
+        if order.latency_span is not None:
+            order.latency_span.mark(OrderLatencyStage.RESPONDED, self._perf_counter())
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -598,6 +611,13 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     # === Order Tracking ===
 
+    @property
+    def order_latency_recorder(self) -> OrderLatencyRecorder:
+        """
+        Returns the latency spans of the last orders created by the connector
+        """
+        return self._order_tracker.latency_recorder
+
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
         """
         Restore in-flight orders from saved tracking states, this is st the connector can pick up on where it left off
@@ -651,6 +671,28 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _sleep(self, delay: float):
         await asyncio.sleep(delay)
 
+    @staticmethod
+    def _perf_counter() -> float:
+        return time.perf_counter()
+
+    @staticmethod
+    async def _run_in_order_latency_span(latency_span: OrderLatencySpan, coroutine: Awaitable):
+        """
+        Runs the creation of an order with its latency span as the span of the current task, for the throttler and the
+        order tracker to stamp the stages the order goes through.
+        """
+        CURRENT_ORDER_LATENCY_SPAN.set(latency_span)
+        return await coroutine
+
+    @staticmethod
+    async def _run_in_user_stream_context(coroutine: Awaitable):
+        """
+        Runs the processing of the user stream events, for the order tracker to identify the order updates confirmed
+        through the user stream.
+        """
+        IN_USER_STREAM_CONTEXT.set(True)
+        return await coroutine
+
     # === Implementation-specific methods ===
 
     @abstractmethod
@@ -701,7 +743,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._trading_fees_polling_task = safe_ensure_future(self._trading_fees_polling_loop())
             self._status_polling_task = safe_ensure_future(self._status_polling_loop())
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
-            self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
+            self._user_stream_event_listener_task = safe_ensure_future(
+                self._run_in_user_stream_context(self._user_stream_event_listener()))
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
 
     async def stop_network(self):
@@ -1,20 +1,24 @@
 import asyncio
+import functools
+import itertools
 import logging
 import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
 from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.trades_csv_exporter import TradesCSVExporter
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.market_data_log import MarketDataLogWriter
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -36,6 +40,7 @@ from hummingbot.core.event.events import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_data_store import MarketDataStore, SQLMarketDataStore, parse_downsampling_tiers
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
@@ -43,10 +48,13 @@ from hummingbot.model.range_position_collected_fees import RangePositionCollecte
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.write_behind_queue import WriteBehindQueue
 
 
 class MarketsRecorder:
     _logger = None
+    # Interval (in seconds) at which the market data snapshots are downsampled and the expired ones removed
+    MARKET_DATA_MAINTENANCE_INTERVAL = 60 * 60
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -63,7 +71,15 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 performance_tracker: Optional[PerformanceTracker] = None,
+                 db_write_interval: float = 0.1,
+                 market_data_store: Optional[MarketDataStore] = None):
+        """
+        :param db_write_interval: the interval (in seconds) at which the queued records are written to the database by
+            a background thread. With 0 the records are written synchronously as the events arrive.
+        :param market_data_store: where the collected market data goes, the MarketData table of the database by default
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -74,6 +90,21 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_log_writer: Optional[MarketDataLogWriter] = None
+        self._market_data_log_recorders: List[Tuple[ConnectorBase, Callable]] = []
+        # Kept up to date with the recorded fills, the performance reports are served from it
+        self._performance_tracker: Optional[PerformanceTracker] = performance_tracker
+        self._db_write_interval: float = db_write_interval
+        self._write_queue: WriteBehindQueue = WriteBehindQueue(sql, flush_interval=db_write_interval)
+        # The markets whose tracking states changed since the last snapshot, taken once per write interval
+        self._markets_with_new_states: Dict[str, ConnectorBase] = {}
+        self._market_states_snapshot_handle: Optional[asyncio.TimerHandle] = None
+        self._market_data_store: MarketDataStore = market_data_store or SQLMarketDataStore(
+            self._write_queue,
+            downsampling_tiers=parse_downsampling_tiers(market_data_collection.market_data_downsampling),
+            retention_days=market_data_collection.market_data_retention_days)
+        self._market_data_maintenance_timestamp: float = 0
+        self._trades_csv_exporter: TradesCSVExporter = TradesCSVExporter()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -116,32 +147,57 @@ class MarketsRecorder:
     def _start_market_data_recording(self):
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
 
+    def _start_market_data_log(self):
+        self._market_data_log_writer = MarketDataLogWriter(
+            root_dir=os.path.join(data_path(), "market_data"),
+            compression=self._market_data_collection_config.market_data_log_compression,
+        )
+        self._market_data_log_writer.start()
+        for market in self._markets:
+            order_book_tracker = getattr(market, "order_book_tracker", None)
+            if order_book_tracker is None:
+                continue
+            recorder = functools.partial(self._market_data_log_writer.record, market.name)
+            order_book_tracker.add_message_recorder(recorder)
+            self._market_data_log_recorders.append((market, recorder))
+
+    def _stop_market_data_log(self):
+        for market, recorder in self._market_data_log_recorders:
+            market.order_book_tracker.remove_message_recorder(recorder)
+        self._market_data_log_recorders.clear()
+        if self._market_data_log_writer is not None:
+            self._market_data_log_writer.stop()
+            self._market_data_log_writer = None
+
     async def _record_market_data(self):
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    market_data_records: List[MarketData] = []
+                    timestamp = self.db_timestamp
+                    resolution = self._market_data_collection_config.market_data_collection_interval
+                    depth = self._market_data_collection_config.market_data_collection_depth + 1
+                    for market in self._markets:
+                        exchange = market.display_name
+                        for trading_pair in market.trading_pairs:
+                            order_book = market.get_order_book(trading_pair)
+                            market_data_records.append(MarketData(
+                                timestamp=timestamp,
+                                exchange=exchange,
+                                trading_pair=trading_pair,
+                                resolution=resolution,
+                                mid_price=float(market.get_price_by_type(trading_pair, PriceType.MidPrice)),
+                                best_bid=float(market.get_price_by_type(trading_pair, PriceType.BestBid)),
+                                best_ask=float(market.get_price_by_type(trading_pair, PriceType.BestAsk)),
+                                order_book=MarketData.encode_depth(
+                                    itertools.islice(order_book.bid_entries(), depth),
+                                    itertools.islice(order_book.ask_entries(), depth)),
+                            ))
+                    self._market_data_store.add_snapshots(market_data_records)
+                    if timestamp * 1e-3 - self._market_data_maintenance_timestamp >= \
+                            self.MARKET_DATA_MAINTENANCE_INTERVAL:
+                        self._market_data_maintenance_timestamp = timestamp * 1e-3
+                        self._market_data_store.apply_retention_policy(self._market_data_maintenance_timestamp)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -161,16 +217,29 @@ class MarketsRecorder:
     def strategy_name(self) -> str:
         return self._strategy_name
 
+    @property
+    def performance_tracker(self) -> Optional[PerformanceTracker]:
+        return self._performance_tracker
+
     @property
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_queue(self) -> WriteBehindQueue:
+        return self._write_queue
+
     def start(self):
+        if self._db_write_interval > 0:
+            self._write_queue.start()
+        self._trades_csv_exporter.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
+        if self._market_data_collection_config.market_data_log_enabled:
+            self._start_market_data_log()
 
     def stop(self):
         for market in self._markets:
@@ -178,6 +247,11 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        self._stop_market_data_log()
+        self._snapshot_market_states()
+        # Writes the queued records before returning
+        self._write_queue.stop()
+        self._trades_csv_exporter.stop()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -208,20 +282,66 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._store_market_states(session, config_file_path, market.display_name, market.tracking_states,
+                                  self.db_timestamp)
+
+    def _queue_market_states(self, market: ConnectorBase):
+        """
+        Marks the tracking states of the market as changed. While the write queue runs, the snapshot of the states is
+        taken once per write interval for all the markets marked in the meantime, instead of on every event.
+        """
+        if not self._write_queue.running:
+            self._submit_market_states(market)
+            return
+        self._markets_with_new_states[market.display_name] = market
+        if self._market_states_snapshot_handle is None:
+            self._market_states_snapshot_handle = self._ev_loop.call_later(self._db_write_interval,
+                                                                           self._snapshot_market_states)
+
+    def _snapshot_market_states(self):
+        if self._market_states_snapshot_handle is not None:
+            self._market_states_snapshot_handle.cancel()
+            self._market_states_snapshot_handle = None
+        markets, self._markets_with_new_states = self._markets_with_new_states, {}
+        for market in markets.values():
+            self._submit_market_states(market)
+
+    def _submit_market_states(self, market: ConnectorBase):
+        """
+        Queues a snapshot of the tracking states of the market. Only the latest snapshot queued for a market is
+        written in each batch.
+        """
+        write = functools.partial(self._store_market_states,
+                                  config_file_path=self._config_file_path,
+                                  market_name=market.display_name,
+                                  saved_state=market.tracking_states,
+                                  timestamp=self.db_timestamp)
+        self._write_queue.submit_coalesced((MarketState, self._config_file_path, market.display_name), write)
 
+    @staticmethod
+    def _store_market_states(session: Session,
+                             config_file_path: str,
+                             market_name: str,
+                             saved_state: Dict[str, Any],
+                             timestamp: int):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self._snapshot_market_states()
+        self._write_queue.flush()
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
 
@@ -251,31 +371,34 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_values = dict(id=evt.order_id,
+                            config_file_path=self._config_file_path,
+                            strategy=self._strategy_name,
+                            market=market.display_name,
+                            symbol=evt.trading_pair,
+                            base_asset=base_asset,
+                            quote_asset=quote_asset,
+                            creation_timestamp=timestamp,
+                            order_type=evt.type.name,
+                            amount=Decimal(evt.amount),
+                            leverage=evt.leverage if evt.leverage else 1,
+                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                            position=evt.position if evt.position else PositionAction.NIL.value,
+                            last_status=event_type.name,
+                            last_update_timestamp=timestamp,
+                            exchange_order_id=evt.exchange_order_id)
+
+        def write(session: Session):
+            order_record: Order = Order(**order_values)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        self._write_queue.submit(write)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._queue_market_states(market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -290,46 +413,55 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        trade_fill_values = dict(config_file_path=self.config_file_path,
+                                 strategy=self.strategy_name,
+                                 market=market.display_name,
+                                 symbol=evt.trading_pair,
+                                 base_asset=base_asset,
+                                 quote_asset=quote_asset,
+                                 timestamp=timestamp,
+                                 order_id=order_id,
+                                 trade_type=evt.trade_type.name,
+                                 order_type=evt.order_type.name,
+                                 price=evt.price,
+                                 amount=evt.amount,
+                                 leverage=evt.leverage if evt.leverage else 1,
+                                 trade_fee=evt.trade_fee.to_json(),
+                                 exchange_trade_id=evt.exchange_trade_id,
+                                 position=evt.position if evt.position else PositionAction.NIL.value)
+
+        csv_rows: List[Tuple[str, Tuple[str, ...], Tuple[Any, ...]]] = []
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+
+            trade_fill_record: TradeFill = TradeFill(**trade_fill_values)
+            session.add(order_status)
+            session.add(trade_fill_record)
+            # The row is exported once the fill is committed, a batch can be retried and its writes run again
+            csv_rows[:] = [self._trade_csv_row(trade_fill_record)]
+
+        def export_to_csv():
+            self._trades_csv_exporter.append(*csv_rows[0])
+
+        self._write_queue.submit(write, on_commit=export_to_csv)
+        self._queue_market_states(market)
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+
+        if self._performance_tracker is not None:
+            self._performance_tracker.process_order_filled_event(market.display_name, evt)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -341,26 +473,28 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market.display_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._write_queue.submit(write)
 
     def append_to_csv(self, trade: TradeFill):
+        self._trades_csv_exporter.append(*self._trade_csv_row(trade))
+
+    def _trade_csv_row(self, trade: TradeFill) -> Tuple[str, Tuple[str, ...], Tuple[Any, ...]]:
+        """
+        :return: the path of the trades CSV file of the trade, the names of the columns and the values of the row
+        """
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -374,14 +508,7 @@ class MarketsRecorder:
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        return csv_path, field_names, field_data
 
     def _update_order_status(self,
                              event_tag: int,
@@ -399,18 +526,19 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._write_queue.submit(write)
+        self._queue_market_states(market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -446,15 +574,16 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=evt.trade_fee.to_json())
+            session.add(rp_update)
+
+        self._write_queue.submit(write)
+        self._queue_market_states(connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -464,17 +593,18 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                             strategy=self._strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+
+        self._write_queue.submit(write)
+        self._queue_market_states(connector)
 
     @staticmethod
     async def _sleep(delay):
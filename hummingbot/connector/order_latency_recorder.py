@@ -0,0 +1,75 @@
+import json
+import math
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Tuple
+
+from hummingbot.core.data_type.order_latency_span import OrderLatencySpan, OrderLatencyStage
+from hummingbot.core.metrics import MetricsRegistry
+
+ORDER_LATENCY = MetricsRegistry.get_instance().histogram(
+    "hummingbot_order_latency_seconds",
+    "Time between the submission of an order by the strategy and each stage of its creation",
+    ("connector", "stage"))
+
+
+class OrderLatencyRecorder:
+    """
+    Keeps the latency spans of the last orders created by a connector, to estimate the percentiles of the time it
+    takes to reach each stage of the creation of an order and to export them to a trace file.
+    """
+
+    def __init__(self, max_spans: int = 1000):
+        self._spans: Deque[OrderLatencySpan] = deque(maxlen=max_spans)
+
+    @property
+    def spans(self) -> List[OrderLatencySpan]:
+        return list(self._spans)
+
+    def record(self, span: OrderLatencySpan, connector_name: str):
+        if span.recorded:
+            return
+        span.recorded = True
+        self._spans.append(span)
+        for stage in span.stage_times:
+            if stage != OrderLatencyStage.SUBMITTED:
+                ORDER_LATENCY.labels(connector_name, stage.value).observe(span.elapsed(stage))
+
+    def percentiles(self, percentiles: Tuple[int, ...] = (50, 90, 99)) -> Dict[OrderLatencyStage, Dict[int, float]]:
+        """
+        :return: for each stage reached by at least one of the recorded orders, the percentiles (nearest rank) of the
+        time (in seconds) between the submission of the orders and the stage
+        """
+        result = {}
+        for stage in OrderLatencyStage:
+            if stage == OrderLatencyStage.SUBMITTED:
+                continue
+            elapsed_times = sorted(span.elapsed(stage) for span in self._spans if stage in span.stage_times)
+            if len(elapsed_times) > 0:
+                result[stage] = {
+                    pct: elapsed_times[max(math.ceil(len(elapsed_times) * pct / 100) - 1, 0)] for pct in percentiles
+                }
+        return result
+
+
+def write_order_latency_trace(file_path: str, spans_by_connector: Dict[str, Iterable[OrderLatencySpan]]):
+    """
+    Writes the spans in the Chrome trace event format, to be opened with chrome://tracing or https://ui.perfetto.dev.
+    Each order is an async slice from its submission to its last stage, with an instant event at each stage.
+    """
+    events = []
+    for pid, (connector_name, spans) in enumerate(spans_by_connector.items(), start=1):
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": connector_name}})
+        for span in spans:
+            common = {"cat": "order", "id": span.client_order_id, "pid": pid, "tid": 0}
+            stage_times = sorted(span.stage_times.items(), key=lambda stage_time: stage_time[1])
+            events.append(dict(common, name=span.client_order_id, ph="b", ts=_to_microseconds(span.submitted_time),
+                               args={"trading_pair": span.trading_pair}))
+            for stage, stage_time in stage_times:
+                events.append(dict(common, name=stage.value, ph="n", ts=_to_microseconds(stage_time)))
+            events.append(dict(common, name=span.client_order_id, ph="e", ts=_to_microseconds(stage_times[-1][1])))
+    with open(file_path, "w") as trace_file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_file)
+
+
+def _to_microseconds(timestamp: float) -> float:
+    return round(timestamp * 1e6, 3)
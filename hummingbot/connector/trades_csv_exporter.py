@@ -0,0 +1,98 @@
+import csv
+import logging
+import os
+import threading
+from shutil import move
+from typing import IO, Any, Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from hummingbot.logger import HummingbotLogger
+
+
+class TradesCSVExporter:
+    """
+    Appends the trade fills to CSV files through file handles that stay open for the whole run.
+
+    The header of an existing file is checked only the first time a row is written to it. When it does not match, the
+    file is moved aside with an `_old_<timestamp>` suffix and a new one is started. Rows are buffered and written to
+    disk by a background thread every `flush_interval` seconds, and when the exporter stops. Rows appended while the
+    exporter is not running are flushed immediately.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, flush_interval: float = 1.0):
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._files: Dict[str, Tuple[IO, Any]] = {}
+        self._stop_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._flush_thread is not None
+
+    def start(self):
+        if self._flush_thread is not None:
+            return
+        self._stop_event.clear()
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="trades_csv_flush", daemon=True)
+        self._flush_thread.start()
+
+    def stop(self):
+        """
+        Writes the buffered rows and closes the files.
+        """
+        if self._flush_thread is not None:
+            self._stop_event.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        with self._lock:
+            for csv_file, _ in self._files.values():
+                csv_file.close()
+            self._files.clear()
+
+    def append(self, csv_path: str, header: Sequence[str], row: Sequence[Any]):
+        with self._lock:
+            csv_file, writer = self._files.get(csv_path) or self._open(csv_path, header)
+            writer.writerow(row)
+            if self._flush_thread is None:
+                csv_file.flush()
+
+    def flush(self):
+        with self._lock:
+            for csv_file, _ in self._files.values():
+                csv_file.flush()
+
+    def _open(self, csv_path: str, header: Sequence[str]) -> Tuple[IO, Any]:
+        is_new_file = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+        if not is_new_file and not self._csv_matches_header(csv_path, header):
+            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+            is_new_file = True
+        csv_file = open(csv_path, mode="a", newline="")
+        # Same line terminator as the files previously written with pandas
+        writer = csv.writer(csv_file, lineterminator=os.linesep)
+        if is_new_file:
+            writer.writerow(header)
+        self._files[csv_path] = (csv_file, writer)
+        return csv_file, writer
+
+    @staticmethod
+    def _csv_matches_header(csv_path: str, header: Sequence[str]) -> bool:
+        with open(csv_path, newline="") as csv_file:
+            first_row = next(csv.reader(csv_file), None)
+        return tuple(first_row or ()) == tuple(header)
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                self.logger().error("Unexpected error flushing the trades CSV files.", exc_info=True)
+        self.flush()
@@ -6,11 +6,18 @@ from decimal import Decimal
 from typing import List, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.data_type.order_latency_span import OrderLatencyStage, mark_current_order_stage
+from hummingbot.core.metrics import MetricsRegistry
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
 
+THROTTLER_WAIT = MetricsRegistry.get_instance().histogram(
+    "hummingbot_throttler_wait_seconds",
+    "Time a request waited for the capacity of its rate limit",
+    ("limit_id",))
+
 
 class AsyncRequestContextBase(ABC):
     """
@@ -67,6 +74,7 @@ class AsyncRequestContextBase(ABC):
         raise NotImplementedError
 
     async def acquire(self):
+        wait_start = time.perf_counter()
         while True:
             async with self._lock:
                 self.flush()
@@ -86,6 +94,9 @@ class AsyncRequestContextBase(ABC):
             # Log its related limits into the tasks log as individual tasks
             for limit, weight in self._related_limits:
                 self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+        acquired_time = time.perf_counter()
+        THROTTLER_WAIT.labels(self._rate_limit.limit_id).observe(acquired_time - wait_start)
+        mark_current_order_stage(OrderLatencyStage.THROTTLED, acquired_time)
 
     async def __aenter__(self):
         await self.acquire()
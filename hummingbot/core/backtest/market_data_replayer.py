@@ -0,0 +1,128 @@
+import heapq
+import logging
+import math
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+from hummingbot.core.backtest.market_data_source import BacktestMarketDataSource
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+
+NaN = float("nan")
+
+
+class MarketDataReplayer:
+    """
+    Merges the recorded order book message streams of several markets and applies them, in timestamp order, to the
+    order books of paper trade exchanges. It is meant to be attached to a backtesting `Clock`, which then jumps
+    straight to the next recorded event instead of ticking through periods without market activity.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, start_time: float, end_time: float = NaN):
+        """
+        :param start_time: start of the replay in UNIX timestamp (seconds)
+        :param end_time: end of the replay in UNIX timestamp (seconds). NaN to replay until the end of the data.
+        """
+        self._start_time = start_time
+        self._end_time = end_time
+        self._feeds: List[Tuple["PaperTradeExchange", BacktestMarketDataSource]] = []
+        self._stream: Optional[Iterator[Tuple[float, int, int, OrderBookMessage]]] = None
+        self._next_entry: Optional[Tuple[float, int, int, OrderBookMessage]] = None
+        self._messages_applied: int = 0
+        self._messages_skipped: int = 0
+
+    @property
+    def messages_applied(self) -> int:
+        return self._messages_applied
+
+    @property
+    def messages_skipped(self) -> int:
+        return self._messages_skipped
+
+    @property
+    def next_timestamp(self) -> float:
+        """
+        Timestamp of the next market event: the next message to be replayed or the next delayed action (order
+        creation, cancellation or fill notification) of the exchanges. NaN when all the recorded data has been
+        replayed and there are no delayed actions left.
+        """
+        if self._stream is None:
+            self._start_stream()
+        next_timestamp = self._next_entry[0] if self._next_entry is not None else NaN
+        for exchange, _ in self._feeds:
+            action_timestamp = exchange.next_pending_action_timestamp
+            if math.isnan(action_timestamp):
+                continue
+            if math.isnan(next_timestamp) or action_timestamp < next_timestamp:
+                next_timestamp = action_timestamp
+        return next_timestamp
+
+    def add_market_data_source(self, exchange: "PaperTradeExchange", source: BacktestMarketDataSource):
+        if self._stream is not None:
+            raise EnvironmentError("Market data sources can't be added once the replay has started.")
+        self._feeds.append((exchange, source))
+
+    def process_until(self, timestamp: float) -> int:
+        """
+        Applies all the messages with a timestamp lower or equal to the given one.
+
+        :return: the number of messages processed
+        """
+        processed = 0
+        if self._stream is None:
+            self._start_stream()
+        while self._next_entry is not None and self._next_entry[0] <= timestamp:
+            _, _, feed_index, message = self._next_entry
+            self._apply_message(self._feeds[feed_index][0], message)
+            processed += 1
+            self._next_entry = next(self._stream, None)
+        return processed
+
+    def _start_stream(self):
+        self._stream = heapq.merge(*[self._feed_entries(index, source) for index, (_, source) in enumerate(self._feeds)])
+        self._next_entry = next(self._stream, None)
+
+    def _feed_entries(self,
+                      feed_index: int,
+                      source: BacktestMarketDataSource) -> Iterator[Tuple[float, int, int, OrderBookMessage]]:
+        # The sequence number keeps the original order of messages with the same timestamp and prevents heapq from
+        # comparing the messages themselves.
+        for sequence, message in enumerate(source.iter_messages(self._start_time, self._end_time)):
+            yield message.timestamp, sequence, feed_index, message
+
+    def _apply_message(self, exchange: "PaperTradeExchange", message: OrderBookMessage):
+        trading_pair = message.trading_pair
+        order_book: Optional[OrderBook] = exchange.order_books.get(trading_pair)
+        if order_book is None:
+            exchange.new_empty_order_book(trading_pair)
+            order_book = exchange.order_books[trading_pair]
+
+        if message.type is OrderBookMessageType.DIFF:
+            if message.update_id < order_book.snapshot_uid:
+                self._messages_skipped += 1
+                return
+            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.TRADE:
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=trading_pair,
+                timestamp=message.timestamp,
+                price=float(message.content["price"]),
+                amount=float(message.content["amount"]),
+                type=TradeType.SELL if
+                message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+            ))
+        self._messages_applied += 1
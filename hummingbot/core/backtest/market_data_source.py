@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List
+
+from hummingbot.core.data_type.market_data_log import MarketDataLogReader
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.model.market_data import MarketData
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+
+class BacktestMarketDataSource(ABC):
+    """
+    Provides recorded order book messages (snapshots, diffs and trades) for a single market, in timestamp order.
+    Message timestamps are UNIX timestamps in seconds.
+    """
+
+    @abstractmethod
+    def iter_messages(self, start_time: float, end_time: float) -> Iterator[OrderBookMessage]:
+        """
+        :param start_time: first timestamp (inclusive) to replay
+        :param end_time: last timestamp (inclusive) to replay. NaN to replay until the end of the recording.
+        :return: an iterator over the recorded messages sorted by timestamp
+        """
+        raise NotImplementedError
+
+
+class OrderBookMessageListSource(BacktestMarketDataSource):
+    """
+    Replays an in memory collection of order book messages.
+    """
+
+    def __init__(self, messages: Iterable[OrderBookMessage]):
+        self._messages: List[OrderBookMessage] = sorted(messages, key=lambda message: message.timestamp)
+
+    def iter_messages(self, start_time: float, end_time: float) -> Iterator[OrderBookMessage]:
+        for message in self._messages:
+            if message.timestamp < start_time:
+                continue
+            if message.timestamp > end_time:
+                break
+            yield message
+
+
+class MarketDataTableSource(BacktestMarketDataSource):
+    """
+    Replays the order book snapshots stored in the `MarketData` table by the markets recorder. Each row is converted
+    into a snapshot message, so the replayed book only has the recorded depth and changes at the collection interval
+    (or the coarser resolution of the downsampled snapshots).
+    """
+
+    def __init__(self,
+                 sql_manager: SQLConnectionManager,
+                 exchange: str,
+                 trading_pair: str,
+                 chunk_size: int = 10000):
+        self._sql_manager = sql_manager
+        self._exchange = exchange
+        self._trading_pair = trading_pair
+        self._chunk_size = chunk_size
+
+    def iter_messages(self, start_time: float, end_time: float) -> Iterator[OrderBookMessage]:
+        filters = [MarketData.exchange == self._exchange,
+                   MarketData.trading_pair == self._trading_pair,
+                   MarketData.timestamp >= int(start_time * 1e3)]
+        if end_time == end_time:
+            filters.append(MarketData.timestamp <= int(end_time * 1e3))
+        with self._sql_manager.get_new_session() as session:
+            query = (session
+                     .query(MarketData.timestamp, MarketData.order_book)
+                     .filter(*filters)
+                     .order_by(MarketData.timestamp)
+                     .yield_per(self._chunk_size))
+            for timestamp, order_book in query:
+                yield self.snapshot_message_from_row(self._trading_pair, int(timestamp), order_book)
+
+    @staticmethod
+    def snapshot_message_from_row(trading_pair: str, timestamp_ms: int, order_book: bytes) -> OrderBookMessage:
+        bids, asks = MarketData.decode_depth(order_book)
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "trading_pair": trading_pair,
+                "update_id": timestamp_ms,
+                "bids": bids.tolist(),
+                "asks": asks.tolist(),
+            },
+            timestamp=timestamp_ms * 1e-3,
+        )
+
+
+class MarketDataLogSource(BacktestMarketDataSource):
+    """
+    Replays the snapshots, diffs and trades of a trading pair from the binary market data log of an exchange
+    (see `hummingbot.core.data_type.market_data_log`).
+    """
+
+    def __init__(self, log_dir: str, trading_pair: str):
+        self._reader = MarketDataLogReader(log_dir)
+        self._trading_pair = trading_pair
+
+    def iter_messages(self, start_time: float, end_time: float) -> Iterator[OrderBookMessage]:
+        return self._reader.iter_messages(self._trading_pair, start_time, end_time)
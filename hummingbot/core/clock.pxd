@@ -10,3 +10,8 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _tick_profiler
+        object _market_data_replayer
+
+    cdef c_tick_iterators(self, list iterators)
+    cdef bint c_advance_to_next_market_event(self, double timestamp)
@@ -2,16 +2,23 @@
 
 import asyncio
 import logging
+import math
 import time
-from typing import List
+from typing import List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.metrics import MetricsRegistry
+from hummingbot.core.tick_profiler import TickProfiler
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
+CLOCK_TICK_DURATION = MetricsRegistry.get_instance().histogram(
+    "hummingbot_clock_tick_seconds",
+    "Time taken to tick all the iterators of the real time clock")
+
 
 cdef class Clock:
     @classmethod
@@ -36,6 +43,8 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_profiler = None
+        self._market_data_replayer = None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +66,35 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_profiler(self) -> Optional[TickProfiler]:
+        return self._tick_profiler
+
+    def enable_tick_profiling(self, enabled: bool = True) -> Optional[TickProfiler]:
+        """
+        Turns on (or off) the per iterator tick duration instrumentation. When disabled the clock runs the child
+        iterators without taking any timing measurements.
+        """
+        if enabled and self._tick_profiler is None:
+            self._tick_profiler = TickProfiler(self._tick_size)
+        elif not enabled:
+            self._tick_profiler = None
+        return self._tick_profiler
+
+    @property
+    def market_data_replayer(self) -> Optional["MarketDataReplayer"]:
+        return self._market_data_replayer
+
+    def set_market_data_replayer(self, replayer: Optional["MarketDataReplayer"]):
+        """
+        (back testing mode only) Drives the backtest from recorded market data. The clock applies the recorded
+        messages to the exchanges' order books and jumps directly to the tick of the next recorded event, skipping
+        the ticks in between in which nothing changed.
+        """
+        if self._clock_mode is not ClockMode.BACKTEST:
+            raise EnvironmentError("A market data replayer can only be used in back testing mode.")
+        self._market_data_replayer = replayer
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -81,6 +119,57 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        if self._tick_profiler is not None:
+            self._tick_profiler.remove_iterator(iterator)
+
+    cdef c_tick_iterators(self, list iterators):
+        cdef:
+            TimeIterator child_iterator
+            double tick_start = 0
+            double iterator_start = 0
+        tick_profiler = self._tick_profiler
+
+        if tick_profiler is not None:
+            tick_start = time.perf_counter()
+        for ci in iterators:
+            child_iterator = ci
+            if tick_profiler is not None:
+                iterator_start = time.perf_counter()
+            try:
+                child_iterator.c_tick(self._current_tick)
+            except StopIteration:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+            finally:
+                if tick_profiler is not None:
+                    tick_profiler.record_iterator(child_iterator, time.perf_counter() - iterator_start)
+        if tick_profiler is not None:
+            tick_profiler.record_tick(self._current_tick, time.perf_counter() - tick_start)
+
+    cdef bint c_advance_to_next_market_event(self, double timestamp):
+        """
+        Moves the current tick to the first tick at or after the next recorded market event (but never past the
+        given timestamp), and applies all the recorded messages up to it.
+
+        :return: False if there is no more recorded data and the backtest runs until the end of data
+        """
+        cdef:
+            double next_event_timestamp = self._market_data_replayer.next_timestamp
+            double next_tick = self._current_tick + self._tick_size
+
+        if math.isnan(next_event_timestamp):
+            if math.isnan(timestamp):
+                return False
+            next_tick = timestamp
+        elif next_event_timestamp > next_tick:
+            next_tick = (self._start_time +
+                         math.ceil((next_event_timestamp - self._start_time) / self._tick_size) * self._tick_size)
+        if next_tick > timestamp:
+            next_tick = timestamp
+        self._current_tick = next_tick
+        self._market_data_replayer.process_until(next_tick)
+        return True
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +179,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+        tick_duration_metric = CLOCK_TICK_DURATION.labels()
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -111,17 +202,15 @@ cdef class Clock:
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                tick_start = time.perf_counter()
 
                 # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
-                        return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                try:
+                    self.c_tick_iterators(self._current_context)
+                except StopIteration:
+                    self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                    return
+                tick_duration_metric.observe(time.perf_counter() - tick_start)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
@@ -138,15 +227,11 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
-                for ci in self._child_iterators:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        raise
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                if self._market_data_replayer is None:
+                    self._current_tick += self._tick_size
+                elif not self.c_advance_to_next_market_event(timestamp):
+                    break
+                self.c_tick_iterators(self._child_iterators)
         except StopIteration:
             return
         finally:
@@ -10,6 +10,7 @@ from async_timeout import timeout
 
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_latency_span import OrderLatencySpan
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 
 if typing.TYPE_CHECKING:  # avoid circular import problems
@@ -120,6 +121,9 @@ class InFlightOrder:
 
         self.order_fills: Dict[str, TradeUpdate] = {}  # Dict[trade_id, TradeUpdate]
 
+        # Times the order reached each stage of its creation, set by the order tracker when it is being created
+        self.latency_span: Optional[OrderLatencySpan] = None
+
         self.exchange_order_id_update_event = asyncio.Event()
         if self.exchange_order_id:
             self.exchange_order_id_update_event.set()
@@ -0,0 +1,383 @@
+"""
+Compact, append-only binary log of order book messages.
+
+Messages are stored in a directory per exchange, with a set of files per UTC day: a `<YYYY-MM-DD>.hbmd` data file,
+a `<YYYY-MM-DD>.idx` index and a `<YYYY-MM-DD>.pairs.json` trading pair dictionary. The data file is a sequence of
+chunks, each one holding the records of a single trading pair in columnar layout (one fixed width column after the
+other):
+
+    timestamp (float64) | update_id (int64) | type (int64) | side (int64) | price (float64) | amount (float64)
+
+Every message starts with a header record (side = -1, amount = number of level records that follow). Snapshot and
+diff levels use side 0 for bids and 1 for asks. Trades are a single record with the trade type value as side and the
+numeric trade id (or -1) as update_id.
+
+The index file is a sequence of fixed width entries (pair id, first timestamp, last timestamp, chunk offset, chunk
+size, number of records) that allows readers to jump to the chunks of a trading pair and time range.
+"""
+
+import json
+import logging
+import math
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+DATA_FILE_EXTENSION = ".hbmd"
+INDEX_FILE_EXTENSION = ".idx"
+PAIRS_FILE_EXTENSION = ".pairs.json"
+
+CHUNK_MAGIC = b"HBMD"
+CHUNK_HEADER = struct.Struct("<4sB3xQQ")
+INDEX_ENTRY = struct.Struct("<qddqqq")
+
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "<f8"),
+    ("update_id", "<i8"),
+    ("type", "<i8"),
+    ("side", "<i8"),
+    ("price", "<f8"),
+    ("amount", "<f8"),
+)
+
+MESSAGE_HEADER_SIDE = -1
+BID_SIDE = 0
+ASK_SIDE = 1
+
+
+class MarketDataLogCodec:
+    NONE = 0
+    ZLIB = 1
+    ZSTD = 2
+
+    NAMES = {"none": NONE, "zlib": ZLIB, "zstd": ZSTD}
+
+    @classmethod
+    def from_name(cls, name: str) -> int:
+        codec = cls.NAMES[name]
+        if codec == cls.ZSTD and zstandard is None:
+            logging.getLogger(__name__).warning("zstandard is not installed, market data log chunks will be "
+                                                "compressed with zlib.")
+            codec = cls.ZLIB
+        return codec
+
+    @classmethod
+    def compress(cls, codec: int, payload: bytes) -> bytes:
+        if codec == cls.ZSTD:
+            return zstandard.ZstdCompressor().compress(payload)
+        if codec == cls.ZLIB:
+            return zlib.compress(payload, 1)
+        return payload
+
+    @classmethod
+    def decompress(cls, codec: int, payload: bytes) -> bytes:
+        if codec == cls.ZSTD:
+            if zstandard is None:
+                raise ImportError("zstandard is required to read zstd compressed market data logs.")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        if codec == cls.ZLIB:
+            return zlib.decompress(payload)
+        return payload
+
+
+class MarketDataLogIndexEntry(NamedTuple):
+    pair_id: int
+    first_timestamp: float
+    last_timestamp: float
+    offset: int
+    size: int
+    record_count: int
+
+
+def log_date(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def encode_message(message: OrderBookMessage, records: List[Tuple[float, int, int, int, float, float]]):
+    """
+    Appends the records representing the message to the given list.
+    """
+    timestamp = float(message.timestamp)
+    message_type = message.type.value
+    if message.type is OrderBookMessageType.TRADE:
+        content = message.content
+        trade_id = content.get("trade_id", -1)
+        try:
+            trade_id = int(trade_id)
+        except (TypeError, ValueError):
+            trade_id = -1
+        records.append((timestamp, trade_id, message_type, int(float(content["trade_type"])),
+                        float(content["price"]), float(content["amount"])))
+        return
+    update_id = int(message.update_id)
+    bids = message.bids
+    asks = message.asks
+    records.append((timestamp, update_id, message_type, MESSAGE_HEADER_SIDE, math.nan, float(len(bids) + len(asks))))
+    for row in bids:
+        records.append((timestamp, update_id, message_type, BID_SIDE, row.price, row.amount))
+    for row in asks:
+        records.append((timestamp, update_id, message_type, ASK_SIDE, row.price, row.amount))
+
+
+def encode_chunk(records: List[Tuple[float, int, int, int, float, float]], codec: int) -> bytes:
+    columns = list(zip(*records))
+    payload = b"".join(np.asarray(column, dtype=dtype).tobytes() for column, (_, dtype) in zip(columns, COLUMNS))
+    payload = MarketDataLogCodec.compress(codec, payload)
+    return CHUNK_HEADER.pack(CHUNK_MAGIC, codec, len(records), len(payload)) + payload
+
+
+def decode_chunk(data: bytes) -> Dict[str, np.ndarray]:
+    magic, codec, record_count, payload_size = CHUNK_HEADER.unpack_from(data)
+    if magic != CHUNK_MAGIC:
+        raise ValueError("Invalid market data log chunk.")
+    payload = MarketDataLogCodec.decompress(codec, data[CHUNK_HEADER.size:CHUNK_HEADER.size + payload_size])
+    columns = {}
+    offset = 0
+    for name, dtype in COLUMNS:
+        columns[name] = np.frombuffer(payload, dtype=dtype, count=record_count, offset=offset)
+        offset += record_count * 8
+    return columns
+
+
+def decode_messages(trading_pair: str, columns: Dict[str, np.ndarray]) -> Iterator[OrderBookMessage]:
+    timestamps = columns["timestamp"].tolist()
+    update_ids = columns["update_id"].tolist()
+    types = columns["type"].tolist()
+    sides = columns["side"].tolist()
+    prices = columns["price"].tolist()
+    amounts = columns["amount"].tolist()
+    index = 0
+    record_count = len(timestamps)
+    while index < record_count:
+        message_type = OrderBookMessageType(types[index])
+        if message_type is OrderBookMessageType.TRADE:
+            yield OrderBookMessage(message_type, {
+                "trading_pair": trading_pair,
+                "trade_type": float(sides[index]),
+                "trade_id": update_ids[index],
+                "update_id": update_ids[index],
+                "price": prices[index],
+                "amount": amounts[index],
+            }, timestamp=timestamps[index])
+            index += 1
+            continue
+        level_count = int(amounts[index])
+        bids = []
+        asks = []
+        for level in range(index + 1, index + 1 + level_count):
+            (bids if sides[level] == BID_SIDE else asks).append([prices[level], amounts[level]])
+        yield OrderBookMessage(message_type, {
+            "trading_pair": trading_pair,
+            "update_id": update_ids[index],
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=timestamps[index])
+        index += level_count + 1
+
+
+class MarketDataLogWriter:
+    """
+    Writes order book messages to the binary market data logs (one directory per exchange) from a dedicated thread.
+    `record` only puts the message in a thread safe queue, so it can be called from the order book tracking tasks
+    without adding latency to the order book updates.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 root_dir: str,
+                 compression: str = "zstd",
+                 chunk_size: int = 50000,
+                 flush_interval: float = 5.0):
+        self._root_dir = root_dir
+        self._codec = MarketDataLogCodec.from_name(compression)
+        self._chunk_size = chunk_size
+        self._flush_interval = flush_interval
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_marker = object()
+        self._buffers: Dict[Tuple[str, str, str], List[Tuple[float, int, int, int, float, float]]] = defaultdict(list)
+        self._pair_ids: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._records_written: int = 0
+
+    @property
+    def root_dir(self) -> str:
+        return self._root_dir
+
+    @property
+    def records_written(self) -> int:
+        return self._records_written
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def exchange_log_dir(self, exchange: str) -> str:
+        return os.path.join(self._root_dir, exchange)
+
+    def start(self):
+        if self.is_running:
+            return
+        os.makedirs(self._root_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._write_loop, name="MarketDataLogWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Writes all the pending messages and stops the writer thread.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(self._stop_marker)
+        self._thread.join()
+        self._thread = None
+
+    def record(self, exchange: str, message: OrderBookMessage):
+        self._queue.put((exchange, message))
+
+    def _write_loop(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                item = None
+            if item is self._stop_marker:
+                self._flush_all()
+                return
+            try:
+                if item is not None:
+                    exchange, message = item
+                    buffer = self._buffers[(exchange, log_date(message.timestamp), message.trading_pair)]
+                    encode_message(message, buffer)
+                    if len(buffer) >= self._chunk_size:
+                        self._flush_all()
+                        last_flush = time.monotonic()
+                if time.monotonic() - last_flush >= self._flush_interval:
+                    self._flush_all()
+                    last_flush = time.monotonic()
+            except Exception:
+                self.logger().error("Unexpected error writing market data log.", exc_info=True)
+
+    def _flush_all(self):
+        for (exchange, date, trading_pair), records in self._buffers.items():
+            if len(records) > 0:
+                self._write_chunk(exchange, date, trading_pair, records)
+        self._buffers.clear()
+
+    def _pair_id(self, log_dir: str, date: str, trading_pair: str) -> int:
+        pairs_path = os.path.join(log_dir, date + PAIRS_FILE_EXTENSION)
+        pairs = self._pair_ids.get((log_dir, date))
+        if pairs is None:
+            pairs = {}
+            if os.path.exists(pairs_path):
+                with open(pairs_path) as pairs_file:
+                    pairs = json.load(pairs_file)
+            self._pair_ids[(log_dir, date)] = pairs
+        if trading_pair not in pairs:
+            pairs[trading_pair] = len(pairs)
+            with open(pairs_path, "w") as pairs_file:
+                json.dump(pairs, pairs_file)
+        return pairs[trading_pair]
+
+    def _write_chunk(self,
+                     exchange: str,
+                     date: str,
+                     trading_pair: str,
+                     records: List[Tuple[float, int, int, int, float, float]]):
+        log_dir = self.exchange_log_dir(exchange)
+        os.makedirs(log_dir, exist_ok=True)
+        pair_id = self._pair_id(log_dir, date, trading_pair)
+        chunk = encode_chunk(records, self._codec)
+        timestamps = [record[0] for record in records]
+        with open(os.path.join(log_dir, date + DATA_FILE_EXTENSION), "ab") as data_file:
+            offset = data_file.tell()
+            data_file.write(chunk)
+        with open(os.path.join(log_dir, date + INDEX_FILE_EXTENSION), "ab") as index_file:
+            index_file.write(INDEX_ENTRY.pack(pair_id, min(timestamps), max(timestamps), offset, len(chunk), len(records)))
+        self._records_written += len(records)
+
+
+class MarketDataLogReader:
+    """
+    Reads back the order book messages of a trading pair from the binary market data log directory of an exchange.
+    """
+
+    def __init__(self, log_dir: str):
+        self._log_dir = log_dir
+
+    def dates(self) -> List[str]:
+        if not os.path.isdir(self._log_dir):
+            return []
+        return sorted(file_name[:-len(DATA_FILE_EXTENSION)] for file_name in os.listdir(self._log_dir)
+                      if file_name.endswith(DATA_FILE_EXTENSION))
+
+    def trading_pairs(self, date: str) -> Dict[str, int]:
+        pairs_path = os.path.join(self._log_dir, date + PAIRS_FILE_EXTENSION)
+        if not os.path.exists(pairs_path):
+            return {}
+        with open(pairs_path) as pairs_file:
+            return json.load(pairs_file)
+
+    def index(self, date: str) -> List[MarketDataLogIndexEntry]:
+        index_path = os.path.join(self._log_dir, date + INDEX_FILE_EXTENSION)
+        data_size = os.path.getsize(os.path.join(self._log_dir, date + DATA_FILE_EXTENSION))
+        with open(index_path, "rb") as index_file:
+            data = index_file.read()
+        entries = []
+        for position in range(0, len(data) - INDEX_ENTRY.size + 1, INDEX_ENTRY.size):
+            entry = MarketDataLogIndexEntry(*INDEX_ENTRY.unpack_from(data, position))
+            # Ignore entries of chunks that were not completely written
+            if entry.offset + entry.size <= data_size:
+                entries.append(entry)
+        return entries
+
+    def iter_messages(self,
+                      trading_pair: str,
+                      start_time: float = 0,
+                      end_time: float = math.nan) -> Iterator[OrderBookMessage]:
+        open_ended = math.isnan(end_time)
+        for date in self.dates():
+            if date < log_date(start_time) or (not open_ended and date > log_date(end_time)):
+                continue
+            pair_id = self.trading_pairs(date).get(trading_pair)
+            if pair_id is None:
+                continue
+            entries = [entry for entry in self.index(date)
+                       if entry.pair_id == pair_id
+                       and entry.last_timestamp >= start_time
+                       and (open_ended or entry.first_timestamp <= end_time)]
+            if len(entries) == 0:
+                continue
+            with open(os.path.join(self._log_dir, date + DATA_FILE_EXTENSION), "rb") as data_file:
+                for entry in entries:
+                    data_file.seek(entry.offset)
+                    columns = decode_chunk(data_file.read(entry.size))
+                    for message in decode_messages(trading_pair, columns):
+                        if message.timestamp < start_time:
+                            continue
+                        if not open_ended and message.timestamp > end_time:
+                            break
+                        yield message
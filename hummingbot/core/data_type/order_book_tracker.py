@@ -3,7 +3,7 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -12,10 +12,29 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.metrics import MetricsRegistry
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
 
+ORDER_BOOK_MESSAGES = MetricsRegistry.get_instance().counter(
+    "hummingbot_order_book_messages_total",
+    "Number of order book messages received from the exchange",
+    ("connector", "type"))
+ORDER_BOOK_MESSAGE_LAG = MetricsRegistry.get_instance().histogram(
+    "hummingbot_order_book_message_lag_seconds",
+    "Time between the exchange timestamp of an order book diff and its routing to the order book",
+    ("connector",))
+ORDER_BOOK_APPLY_LATENCY = MetricsRegistry.get_instance().histogram(
+    "hummingbot_order_book_apply_seconds",
+    "Time taken to apply an order book diff",
+    ("connector",))
+ORDER_BOOK_QUEUE_DEPTH = MetricsRegistry.get_instance().gauge(
+    "hummingbot_order_book_queue_depth",
+    "Number of order book messages waiting to be applied to the order book",
+    ("connector", "trading_pair"))
+
+
 class OrderBookTrackerDataSourceType(Enum):
     REMOTE_API = 2
     EXCHANGE_API = 3
@@ -31,7 +50,14 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 connector_name: Optional[str] = None):
+        """
+        :param connector_name: the name of the connector labelling the metrics of the tracker
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
@@ -45,6 +71,9 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._message_recorders: List[Callable[[OrderBookMessage], None]] = []
+
+        self._connector_name: Optional[str] = connector_name
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -60,6 +89,13 @@ class OrderBookTracker:
     def data_source(self) -> OrderBookTrackerDataSource:
         return self._data_source
 
+    @property
+    def exchange_name(self) -> str:
+        """
+        Name of the connector the tracker belongs to, used to label the tracker metrics
+        """
+        return self._connector_name or "unknown"
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
@@ -75,6 +111,45 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def add_local_order_book(self, trading_pair: str, order_book: OrderBook):
+        """
+        Registers an order book maintained outside of the tracker (e.g. populated from recorded market data when
+        backtesting) and marks the order books as initialized.
+        """
+        self._order_books[trading_pair] = order_book
+        self._order_books_initialized.set()
+
+    def add_message_recorder(self, recorder: Callable[[OrderBookMessage], None]):
+        """
+        Registers a callback that receives every snapshot, diff and trade message applied to the order books.
+        Recorders are called from the tracking tasks, so they should only hand the message over (e.g. to a queue).
+        """
+        self._message_recorders.append(recorder)
+        for trading_pair, order_book in self._order_books.items():
+            recorder(self._snapshot_message_from_order_book(trading_pair, order_book))
+
+    def remove_message_recorder(self, recorder: Callable[[OrderBookMessage], None]):
+        if recorder in self._message_recorders:
+            self._message_recorders.remove(recorder)
+
+    def _record_message(self, message: OrderBookMessage):
+        for recorder in self._message_recorders:
+            try:
+                recorder(message)
+            except Exception:
+                self.logger().error("Unexpected error recording order book message.", exc_info=True)
+
+    @staticmethod
+    def _snapshot_message_from_order_book(trading_pair: str,
+                                          order_book: OrderBook,
+                                          timestamp: Optional[float] = None) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": order_book.snapshot_uid,
+            "bids": [[row.price, row.amount] for row in order_book.bid_entries()],
+            "asks": [[row.price, row.amount] for row in order_book.ask_entries()],
+        }, timestamp=timestamp if timestamp is not None else time.time())
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -178,6 +253,8 @@ class OrderBookTracker:
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+            if self._message_recorders:
+                self._record_message(self._snapshot_message_from_order_book(trading_pair, self._order_books[trading_pair]))
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -193,11 +270,18 @@ class OrderBookTracker:
         messages_queued: int = 0
         messages_accepted: int = 0
         messages_rejected: int = 0
+        messages_metric = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "diff")
+        message_lag_metric = ORDER_BOOK_MESSAGE_LAG.labels(self.exchange_name)
 
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
+                messages_metric.inc()
+                message_lag: float = time.time() - ob_message.timestamp
+                if message_lag >= 0:
+                    # Skips the timestamps that are not in seconds
+                    message_lag_metric.observe(message_lag)
 
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
@@ -238,11 +322,13 @@ class OrderBookTracker:
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
+        messages_metric = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "snapshot")
         await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
                 trading_pair: str = ob_message.trading_pair
+                messages_metric.inc()
                 if trading_pair not in self._tracking_message_queues:
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
@@ -260,6 +346,8 @@ class OrderBookTracker:
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        queue_depth_metric = ORDER_BOOK_QUEUE_DEPTH.labels(self.exchange_name, trading_pair)
+        apply_latency_metric = ORDER_BOOK_APPLY_LATENCY.labels(self.exchange_name)
 
         while True:
             try:
@@ -270,10 +358,15 @@ class OrderBookTracker:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                queue_depth_metric.set(message_queue.qsize() + len(saved_messages))
 
                 if message.type is OrderBookMessageType.DIFF:
+                    apply_start = time.perf_counter()
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    apply_latency_metric.observe(time.perf_counter() - apply_start)
                     past_diffs_window.append(message)
+                    if self._message_recorders:
+                        self._record_message(message)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -285,6 +378,10 @@ class OrderBookTracker:
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if self._message_recorders:
+                        # Record the restored book, which also includes the past diffs newer than the snapshot
+                        self._record_message(self._snapshot_message_from_order_book(
+                            trading_pair, order_book, message.timestamp))
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -299,11 +396,13 @@ class OrderBookTracker:
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
+        messages_metric = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "trade")
         await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
                 trading_pair: str = trade_message.trading_pair
+                messages_metric.inc()
 
                 if trading_pair not in self._order_books:
                     messages_rejected += 1
@@ -318,6 +417,8 @@ class OrderBookTracker:
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
                 ))
+                if self._message_recorders:
+                    self._record_message(trade_message)
 
                 messages_accepted += 1
 
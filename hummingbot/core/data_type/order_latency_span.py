@@ -0,0 +1,77 @@
+import contextvars
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class OrderLatencyStage(Enum):
+    """
+    Stages of the creation of an order, in the order they are expected to happen.
+    """
+    SUBMITTED = "submitted"  # the strategy called buy or sell
+    THROTTLED = "throttled"  # the first request of the order passed the throttler
+    RESPONDED = "responded"  # the REST request creating the order returned
+    PROCESSED = "processed"  # the order tracker processed the update confirming the creation of the order
+    CONFIRMED = "confirmed"  # the first update of the order arrived through the user stream
+
+
+class OrderLatencySpan:
+    """
+    Monotonic times (`time.perf_counter`) at which an order reached each stage of its creation. Only the first time a
+    stage is reached is kept.
+    """
+
+    __slots__ = ("client_order_id", "trading_pair", "stage_times", "recorded")
+
+    def __init__(self, client_order_id: str, trading_pair: str, submitted_time: float):
+        self.client_order_id = client_order_id
+        self.trading_pair = trading_pair
+        self.stage_times: Dict[OrderLatencyStage, float] = {OrderLatencyStage.SUBMITTED: submitted_time}
+        self.recorded = False
+
+    @property
+    def submitted_time(self) -> float:
+        return self.stage_times[OrderLatencyStage.SUBMITTED]
+
+    @property
+    def is_complete(self) -> bool:
+        return len(self.stage_times) == len(OrderLatencyStage)
+
+    def mark(self, stage: OrderLatencyStage, timestamp: float) -> bool:
+        """
+        :return: True if it is the first time the order reaches the stage, False otherwise
+        """
+        if stage in self.stage_times:
+            return False
+        self.stage_times[stage] = timestamp
+        return True
+
+    def elapsed(self, stage: OrderLatencyStage) -> Optional[float]:
+        """
+        :return: the time (in seconds) between the submission of the order and the stage, None if it was not reached
+        """
+        stage_time = self.stage_times.get(stage)
+        return None if stage_time is None else stage_time - self.submitted_time
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "client_order_id": self.client_order_id,
+            "trading_pair": self.trading_pair,
+            "stage_times": {stage.value: stage_time for stage, stage_time in self.stage_times.items()},
+        }
+
+
+# The span of the order being created by the current task, set by the connector for the duration of the creation
+CURRENT_ORDER_LATENCY_SPAN: contextvars.ContextVar[Optional[OrderLatencySpan]] = contextvars.ContextVar(
+    "current_order_latency_span", default=None)
+# True in the task processing the events of the user stream of a connector
+IN_USER_STREAM_CONTEXT: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "in_user_stream_context", default=False)
+
+
+def mark_current_order_stage(stage: OrderLatencyStage, timestamp: float):
+    """
+    Stamps the stage in the span of the order being created by the current task, if any.
+    """
+    span = CURRENT_ORDER_LATENCY_SPAN.get()
+    if span is not None:
+        span.mark(stage, timestamp)
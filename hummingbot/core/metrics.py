@@ -0,0 +1,268 @@
+import math
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# Upper bounds (in seconds) of the latency histogram buckets, the +Inf bucket catches everything above the last bound
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class Counter:
+    """
+    Monotonically increasing value, e.g. the number of messages received.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: float = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+
+class Gauge:
+    """
+    Value that goes up and down, e.g. the number of messages waiting in a queue.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: float = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+
+class Histogram:
+    """
+    Distribution of observed values (e.g. durations in seconds) counted in fixed buckets, with their count and sum.
+    """
+
+    __slots__ = ("_bounds", "_bucket_counts", "count", "sum")
+
+    def __init__(self, bucket_bounds: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self._bounds = bucket_bounds
+        self._bucket_counts: List[int] = [0] * (len(bucket_bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    @property
+    def bucket_bounds(self) -> Tuple[float, ...]:
+        return self._bounds
+
+    @property
+    def bucket_counts(self) -> List[int]:
+        """
+        The number of observations of each bucket (not cumulative), the last one being the +Inf bucket.
+        """
+        return list(self._bucket_counts)
+
+    def observe(self, value: float):
+        self._bucket_counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, pct: float) -> float:
+        """
+        Estimates the given percentile (0-100) as the upper bound of the bucket that contains it, infinity if it is in
+        the +Inf bucket.
+        """
+        if self.count == 0:
+            return 0.0
+        target = self.count * pct / 100
+        cumulative = 0
+        for index, bucket_count in enumerate(self._bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count > 0:
+                return self._bounds[index] if index < len(self._bounds) else math.inf
+        return math.inf
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class MetricFamily:
+    """
+    Metrics sharing a name, one per combination of label values. The metric of the label values is created on first
+    use, the hot paths keep it (e.g. `self._apply_latency = family.labels("binance")`) to only pay for its update.
+    """
+
+    def __init__(self,
+                 name: str,
+                 documentation: str,
+                 metric_type: str,
+                 label_names: Tuple[str, ...],
+                 metric_factory: Callable[[], Metric]):
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.label_names = label_names
+        self._metric_factory = metric_factory
+        self._metrics: Dict[Tuple[str, ...], Metric] = {}
+        # The metrics by the label values as given (e.g. not converted to strings), for a single lookup per update
+        self._metrics_by_label_values: Dict[Tuple[Any, ...], Metric] = {}
+
+    def labels(self, *label_values: Any) -> Metric:
+        metric = self._metrics_by_label_values.get(label_values)
+        if metric is None:
+            metric = self._create_metric(label_values)
+        return metric
+
+    def metrics(self) -> List[Tuple[Tuple[str, ...], Metric]]:
+        return list(self._metrics.items())
+
+    def clear(self):
+        self._metrics.clear()
+        self._metrics_by_label_values.clear()
+
+    def _create_metric(self, label_values: Tuple[Any, ...]) -> Metric:
+        key = tuple(str(label_value) for label_value in label_values)
+        if len(key) != len(self.label_names):
+            raise ValueError(f"The metric {self.name} expects the labels {self.label_names}, got {key}.")
+        metric = self._metrics.get(key)
+        if metric is None:
+            metric = self._metric_factory()
+            self._metrics[key] = metric
+        self._metrics_by_label_values[label_values] = metric
+        return metric
+
+
+class MetricsRegistry:
+    """
+    In-process registry of the counters, gauges and histograms of the client, exposed in the Prometheus text format
+    (see `MetricsHttpServer`) and published over MQTT.
+
+    The metrics are meant to be updated from the event loop thread. Updating a metric is a plain attribute increment
+    (a bucket lookup for the histograms), well under a microsecond.
+    """
+    _shared_instance: Optional["MetricsRegistry"] = None
+
+    @classmethod
+    def get_instance(cls) -> "MetricsRegistry":
+        if cls._shared_instance is None:
+            cls._shared_instance = MetricsRegistry()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+
+    def counter(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()) -> MetricFamily:
+        return self._family(name, documentation, "counter", label_names, Counter)
+
+    def gauge(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()) -> MetricFamily:
+        return self._family(name, documentation, "gauge", label_names, Gauge)
+
+    def histogram(self,
+                  name: str,
+                  documentation: str,
+                  label_names: Tuple[str, ...] = (),
+                  bucket_bounds: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> MetricFamily:
+        return self._family(name, documentation, "histogram", label_names, lambda: Histogram(bucket_bounds))
+
+    def families(self) -> Iterator[MetricFamily]:
+        return iter(list(self._families.values()))
+
+    def clear(self):
+        """
+        Removes the metrics of all the families, the families themselves are kept by the modules using them.
+        """
+        for family in self._families.values():
+            family.clear()
+
+    def to_prometheus_text(self) -> str:
+        """
+        :return: the metrics in the Prometheus text exposition format (version 0.0.4)
+        """
+        lines: List[str] = []
+        for family in self.families():
+            lines.append(f"# HELP {family.name} {_escape_help(family.documentation)}")
+            lines.append(f"# TYPE {family.name} {family.metric_type}")
+            for label_values, metric in family.metrics():
+                labels = list(zip(family.label_names, label_values))
+                if isinstance(metric, Histogram):
+                    cumulative = 0
+                    for bound, bucket_count in zip(metric.bucket_bounds + (math.inf,), metric.bucket_counts):
+                        cumulative += bucket_count
+                        bucket_labels = _format_labels(labels + [("le", _format_value(bound))])
+                        lines.append(f"{family.name}_bucket{bucket_labels} {cumulative}")
+                    lines.append(f"{family.name}_sum{_format_labels(labels)} {_format_value(metric.sum)}")
+                    lines.append(f"{family.name}_count{_format_labels(labels)} {metric.count}")
+                else:
+                    lines.append(f"{family.name}{_format_labels(labels)} {_format_value(metric.value)}")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        :return: the metrics as a JSON serializable dictionary, with the count, sum and p50/p90/p99 estimates of the
+        histograms
+        """
+        result: Dict[str, Any] = {"timestamp": time.time(), "metrics": {}}
+        for family in self.families():
+            samples = []
+            for label_values, metric in family.metrics():
+                sample: Dict[str, Any] = {"labels": dict(zip(family.label_names, label_values))}
+                if isinstance(metric, Histogram):
+                    sample.update({
+                        "count": metric.count,
+                        "sum": metric.sum,
+                        "p50": _json_float(metric.percentile(50)),
+                        "p90": _json_float(metric.percentile(90)),
+                        "p99": _json_float(metric.percentile(99)),
+                    })
+                else:
+                    sample["value"] = metric.value
+                samples.append(sample)
+            result["metrics"][family.name] = {"type": family.metric_type, "samples": samples}
+        return result
+
+    def _family(self,
+                name: str,
+                documentation: str,
+                metric_type: str,
+                label_names: Tuple[str, ...],
+                metric_factory: Callable[[], Metric]) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            family = MetricFamily(name, documentation, metric_type, tuple(label_names), metric_factory)
+            self._families[name] = family
+        elif family.metric_type != metric_type or family.label_names != tuple(label_names):
+            raise ValueError(f"The metric {name} is already registered as a {family.metric_type} "
+                             f"with the labels {family.label_names}.")
+        return family
+
+
+def _format_labels(labels: List[Tuple[str, str]]) -> str:
+    if len(labels) == 0:
+        return ""
+    formatted = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels)
+    return f"{{{formatted}}}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(documentation: str) -> str:
+    return documentation.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _json_float(value: float) -> Optional[float]:
+    return None if math.isinf(value) else value
@@ -0,0 +1,58 @@
+import logging
+from typing import Optional
+
+from aiohttp import web
+
+from hummingbot.core.metrics import MetricsRegistry
+from hummingbot.logger import HummingbotLogger
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsHttpServer:
+    """
+    Local HTTP endpoint serving the metrics of the registry in the Prometheus text format on `/metrics`, to be
+    scraped by Prometheus or any OpenMetrics compatible collector.
+    """
+    _mhs_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mhs_logger is None:
+            cls._mhs_logger = logging.getLogger(__name__)
+        return cls._mhs_logger
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9108, registry: Optional[MetricsRegistry] = None):
+        self._host = host
+        self._port = port
+        self._registry = registry or MetricsRegistry.get_instance()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def started(self) -> bool:
+        return self._runner is not None
+
+    async def start(self):
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, self._host, self._port).start()
+        except OSError:
+            await runner.cleanup()
+            self.logger().error(f"Could not serve the metrics on {self._host}:{self._port}.", exc_info=True)
+            return
+        self._runner = runner
+        self.logger().info(f"Serving the metrics on http://{self._host}:{self._port}/metrics")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._registry.to_prometheus_text().encode("utf-8"),
+                            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE})
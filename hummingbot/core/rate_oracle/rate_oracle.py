@@ -10,10 +10,12 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
+from hummingbot.core.rate_oracle.sources.composite_rate_source import CompositeRateSource
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
+from hummingbot.core.rate_oracle.sources.order_book_rate_source import OrderBookRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateTable, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -23,6 +25,8 @@ RATE_ORACLE_SOURCES = {
     "kucoin": KucoinRateSource,
     "ascend_ex": AscendExRateSource,
     "gate_io": GateIoRateSource,
+    "order_book": OrderBookRateSource,
+    "composite": CompositeRateSource,
 }
 
 
@@ -30,7 +34,8 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The prices are kept in a RateTable, which resolves the rate of a given pair (directly or through other tokens) and
+    memoizes it until the next prices update.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -51,6 +56,7 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._rate_table: RateTable = RateTable(self._prices)
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -81,6 +87,8 @@ class RateOracle(NetworkBase):
 
     @source.setter
     def source(self, new_source: RateSourceBase):
+        if new_source is not self._source and self._fetch_price_task is not None:
+            safe_ensure_future(self._source.stop_network())
         self._source = new_source
 
     @property
@@ -108,6 +116,7 @@ class RateOracle(NetworkBase):
         if self._fetch_price_task is not None:
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
+        await self._source.stop_network()
         # Reset stored prices so that they are not used if they are not being updated
         self._prices = {}
 
@@ -153,7 +162,9 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        if not self._rate_table.is_built_from(self._prices):
+            self._rate_table = RateTable(self._prices, warm_pairs=self._rate_table.resolved_pairs)
+        return self._rate_table.rate(pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -184,7 +195,11 @@ class RateOracle(NetworkBase):
     async def _fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self._source.get_prices(quote_token=self._quote_token)
+                prices = await self._source.get_prices(quote_token=self._quote_token)
+                if prices is not self._prices:
+                    # The rates used since the last update are resolved ahead, so that lookups stay dictionary hits
+                    self._rate_table = RateTable(prices, warm_pairs=self._rate_table.resolved_pairs)
+                    self._prices = prices
                 if self._prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
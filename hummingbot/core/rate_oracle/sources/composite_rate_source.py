@@ -0,0 +1,151 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class CompositeRateSourceEntry(NamedTuple):
+    source: RateSourceBase
+    update_interval: float = 10  # seconds between two fetches of the source prices
+    ttl: float = 120  # seconds during which a fetched price is used
+
+
+def parse_rate_sources(value: str, default_update_interval: float = 10) -> List[Tuple[str, float]]:
+    """
+    :param value: comma separated rate source names, by decreasing priority, each one optionally followed by the
+        number of seconds between its updates, e.g. "binance:5,kucoin,coin_gecko:60"
+    :param default_update_interval: the update interval of the sources given without one
+    :return: the (source name, update interval) pairs
+    """
+    sources = []
+    for source in filter(None, (source.strip() for source in value.split(","))):
+        name, separator, interval = source.partition(":")
+        try:
+            update_interval = float(interval) if separator != "" else default_update_interval
+        except ValueError:
+            raise ValueError(f"Invalid update interval for the {name} rate source: {interval}.")
+        if update_interval <= 0:
+            raise ValueError(f"The update interval of the {name} rate source must be positive.")
+        sources.append((name.strip(), update_interval))
+    if len(sources) == 0:
+        raise ValueError("At least one rate source is required.")
+    return sources
+
+
+class CompositeRateSource(RateSourceBase):
+    """
+    Polls several rate sources concurrently, each one on its own interval, and serves their merged prices from memory,
+    so a slow or rate limited source doesn't delay the others.
+
+    The sources are given in priority order. The price of a pair is taken from the first source that fetched it less
+    than its ttl ago. The merged prices are cached until a source gets new prices or one of the merged prices expires.
+    """
+
+    def __init__(self, sources: List[CompositeRateSourceEntry], initial_prices_timeout: float = 10):
+        """
+        :param sources: the rate sources, by decreasing priority
+        :param initial_prices_timeout: maximum number of seconds get_prices waits for the first prices
+        """
+        super().__init__()
+        self._sources = sources
+        self._initial_prices_timeout = initial_prices_timeout
+        self._quote_token: Optional[str] = None
+        # For each source, pair -> (price, fetch timestamp)
+        self._source_prices: List[Dict[str, Tuple[Decimal, float]]] = [{} for _ in sources]
+        self._merged_prices: Dict[str, Decimal] = {}
+        self._merged_prices_expiration: float = 0
+        self._merged_prices_outdated = True
+        self._prices_received = asyncio.Event()
+        self._poll_tasks: List[asyncio.Task] = []
+
+    @property
+    def name(self) -> str:
+        return "composite"
+
+    @property
+    def sources(self) -> List[RateSourceBase]:
+        return [entry.source for entry in self._sources]
+
+    @property
+    def entries(self) -> List[CompositeRateSourceEntry]:
+        return list(self._sources)
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        """
+        Starts polling the sources on the first call, and waits for the first prices (up to initial_prices_timeout).
+        The returned dictionary is shared until the merged prices change, and must not be modified.
+        """
+        if quote_token != self._quote_token or len(self._poll_tasks) == 0:
+            self._start_polling(quote_token=quote_token)
+        if not self._prices_received.is_set():
+            try:
+                await asyncio.wait_for(self._prices_received.wait(), timeout=self._initial_prices_timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._get_merged_prices(timestamp=self._time())
+
+    async def stop_network(self):
+        for task in self._poll_tasks:
+            task.cancel()
+        self._poll_tasks = []
+
+    def _start_polling(self, quote_token: Optional[str]):
+        for task in self._poll_tasks:
+            task.cancel()
+        if quote_token != self._quote_token:
+            self._quote_token = quote_token
+            self._source_prices = [{} for _ in self._sources]
+            self._merged_prices_outdated = True
+            self._prices_received.clear()
+        self._poll_tasks = [safe_ensure_future(self._poll_source_loop(index)) for index in range(len(self._sources))]
+
+    async def _poll_source_loop(self, index: int):
+        entry = self._sources[index]
+        while True:
+            try:
+                prices = await entry.source.get_prices(quote_token=self._quote_token)
+                self._update_source_prices(index=index, prices=prices, timestamp=self._time())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(f"Error fetching new prices from {entry.source.name}.", exc_info=True,
+                                      app_warning_msg=f"Couldn't fetch newest prices from {entry.source.name}.")
+            await self._sleep(entry.update_interval)
+
+    def _update_source_prices(self, index: int, prices: Dict[str, Decimal], timestamp: float):
+        # Pairs missing from a partial update keep their previous price until it expires
+        self._source_prices[index].update((pair, (price, timestamp)) for pair, price in prices.items())
+        if len(prices) > 0:
+            self._merged_prices_outdated = True
+            self._prices_received.set()
+
+    def _get_merged_prices(self, timestamp: float) -> Dict[str, Decimal]:
+        if self._merged_prices_outdated or timestamp >= self._merged_prices_expiration:
+            merged_prices = {}
+            expiration = float("inf")
+            for index, entry in enumerate(self._sources):
+                fresh_prices = {
+                    pair: (price, fetch_timestamp)
+                    for pair, (price, fetch_timestamp) in self._source_prices[index].items()
+                    if fetch_timestamp + entry.ttl > timestamp
+                }
+                self._source_prices[index] = fresh_prices
+                for pair, (price, fetch_timestamp) in fresh_prices.items():
+                    if pair not in merged_prices:
+                        merged_prices[pair] = price
+                        expiration = min(expiration, fetch_timestamp + entry.ttl)
+            self._merged_prices = merged_prices
+            self._merged_prices_expiration = expiration
+            self._merged_prices_outdated = False
+        return self._merged_prices
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+    @staticmethod
+    async def _sleep(delay: float):
+        await asyncio.sleep(delay)
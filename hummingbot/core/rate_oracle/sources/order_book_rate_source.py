@@ -0,0 +1,117 @@
+import asyncio
+import math
+import time
+from decimal import Decimal
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+
+
+class OrderBookRateSource(RateSourceBase):
+    """
+    Answers rates from the mid prices of the order books already tracked by the bot's connectors, so the rates follow
+    the books tick by tick without any request.
+
+    Pairs no connector tracks are priced by an optional fallback source, fetched every fallback_update_interval seconds
+    in the background. The live mid prices take precedence over the fallback prices.
+
+    The connectors are given by a provider. The application registers the default provider, used by the sources built
+    without one (e.g. from the client config).
+    """
+
+    _default_connectors_provider: Callable[[], Dict[str, "ConnectorBase"]] = dict
+
+    def __init__(self,
+                 connectors_provider: Optional[Callable[[], Dict[str, "ConnectorBase"]]] = None,
+                 fallback_source: Optional[RateSourceBase] = None,
+                 fallback_update_interval: float = 60):
+        """
+        :param connectors_provider: returns the connectors whose order books are used, by default the provider
+            registered with set_default_connectors_provider
+        :param fallback_source: the source of the prices of the pairs without order book
+        :param fallback_update_interval: minimum number of seconds between two fetches of the fallback prices
+        """
+        super().__init__()
+        self._connectors_provider = connectors_provider
+        self._fallback_source = fallback_source
+        self._fallback_update_interval = fallback_update_interval
+        self._fallback_prices: Dict[str, Decimal] = {}
+        self._fallback_quote_token: Optional[str] = None
+        self._fallback_timestamp: float = 0
+        self._fallback_task: Optional[asyncio.Task] = None
+
+    @property
+    def name(self) -> str:
+        return "order_book"
+
+    @property
+    def fallback_source(self) -> Optional[RateSourceBase]:
+        return self._fallback_source
+
+    @property
+    def fallback_update_interval(self) -> float:
+        return self._fallback_update_interval
+
+    @classmethod
+    def set_default_connectors_provider(cls, connectors_provider: Callable[[], Dict[str, "ConnectorBase"]]):
+        cls._default_connectors_provider = connectors_provider
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        """
+        Waits for the fallback prices only when none were fetched yet for the quote token, later fetches happen in
+        the background.
+        """
+        if self._fallback_source is not None:
+            if quote_token != self._fallback_quote_token:
+                await self._update_fallback_prices(quote_token=quote_token)
+            elif (self._time() - self._fallback_timestamp >= self._fallback_update_interval
+                  and (self._fallback_task is None or self._fallback_task.done())):
+                self._fallback_task = safe_ensure_future(self._update_fallback_prices(quote_token=quote_token))
+        prices = dict(self._fallback_prices)
+        prices.update(self.order_book_prices())
+        return prices
+
+    def order_book_prices(self) -> Dict[str, Decimal]:
+        """
+        :return: the mid prices of the tracked order books that have both bids and asks
+        """
+        prices = {}
+        connectors_provider = self._connectors_provider or OrderBookRateSource._default_connectors_provider
+        for connector in connectors_provider().values():
+            for trading_pair, order_book in getattr(connector, "order_books", {}).items():
+                try:
+                    best_bid = order_book.get_price(False)
+                    best_ask = order_book.get_price(True)
+                except EnvironmentError:
+                    continue  # empty book
+                if not math.isnan(best_bid) and not math.isnan(best_ask) and 0 < best_bid <= best_ask:
+                    prices.setdefault(trading_pair, (Decimal(str(best_bid)) + Decimal(str(best_ask))) / Decimal("2"))
+        return prices
+
+    async def stop_network(self):
+        if self._fallback_task is not None:
+            self._fallback_task.cancel()
+            self._fallback_task = None
+        if self._fallback_source is not None:
+            await self._fallback_source.stop_network()
+
+    async def _update_fallback_prices(self, quote_token: Optional[str]):
+        try:
+            prices = await self._fallback_source.get_prices(quote_token=quote_token)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Error fetching new prices from {self._fallback_source.name}.", exc_info=True,
+                                  app_warning_msg=f"Couldn't fetch newest prices from {self._fallback_source.name}.")
+            prices = {} if quote_token != self._fallback_quote_token else self._fallback_prices
+        self._fallback_prices = prices
+        self._fallback_quote_token = quote_token
+        self._fallback_timestamp = self._time()
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
@@ -23,3 +23,9 @@ class RateSourceBase(ABC):
     @abstractmethod
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         ...
+
+    async def stop_network(self):
+        """
+        Stops the background price updates started by the source, if any.
+        """
+        pass
@@ -1,9 +1,121 @@
+from collections import defaultdict, deque
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
+from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
 
+# A conversion path, as the priced pairs it goes through and whether each one is used inverted (quote to base)
+RatePath = List[Tuple[str, bool]]
+
+# Maximum number of pairs a conversion path goes through
+MAX_PATH_LENGTH = 3
+
+_NOT_RESOLVED = object()
+
+
+class RateTable:
+    """
+    Resolves and memoizes conversion rates from a snapshot of prices, so repeated lookups of a pair are a dictionary
+    hit. A rate is the price of the pair when it is priced directly, or the product of the rates along the shortest
+    path between the two tokens in the graph of priced pairs. Among the shortest paths, the one going through the
+    tokens with the most priced pairs (the most liquid hubs, e.g. USDT or BTC) is preferred.
+
+    The table is built for a given prices dictionary and is meant to be replaced when new prices are fetched, not
+    updated.
+    """
+
+    def __init__(self, prices: Dict[str, Decimal], warm_pairs: Iterable[str] = ()):
+        """
+        :param prices: the prices of the trading pairs
+        :param warm_pairs: pairs whose rates are resolved right away, typically the ones requested from the previous
+            table
+        """
+        self._prices = prices
+        self._num_prices = len(prices)
+        self._rates: Dict[str, Optional[Decimal]] = {}
+        # token -> {neighbour token: (pair, inverted)}
+        self._graph: Optional[Dict[str, Dict[str, Tuple[str, bool]]]] = None
+        for pair in warm_pairs:
+            self.rate(pair)
+
+    @property
+    def resolved_pairs(self) -> List[str]:
+        return list(self._rates.keys())
+
+    def is_built_from(self, prices: Dict[str, Decimal]) -> bool:
+        return prices is self._prices and len(prices) == self._num_prices
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        rate = self._rates.get(pair, _NOT_RESOLVED)
+        if rate is _NOT_RESOLVED:
+            rate = self._resolve_rate(pair)
+            self._rates[pair] = rate
+        return rate
+
+    def path(self, base: str, quote: str) -> Optional[RatePath]:
+        """
+        :return: the pairs to go through to convert base into quote, None if the tokens are not connected
+        """
+        if self._graph is None:
+            self._graph = self._build_graph()
+        if base not in self._graph or quote not in self._graph:
+            return None
+        previous: Dict[str, Tuple[str, str, bool]] = {base: ("", "", False)}
+        queue = deque([(base, 0)])
+        while len(queue) > 0:
+            token, length = queue.popleft()
+            if length == MAX_PATH_LENGTH:
+                continue
+            for neighbour, (pair, inverted) in self._graph[token].items():
+                if neighbour in previous:
+                    continue
+                previous[neighbour] = (token, pair, inverted)
+                if neighbour == quote:
+                    path = []
+                    while neighbour != base:
+                        neighbour, pair, inverted = previous[neighbour]
+                        path.append((pair, inverted))
+                    path.reverse()
+                    return path
+                queue.append((neighbour, length + 1))
+        return None
+
+    def _resolve_rate(self, pair: str) -> Optional[Decimal]:
+        if pair in self._prices:
+            return self._prices[pair]
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1")
+        path = self.path(base, quote)
+        if path is None:
+            return None
+        rate = Decimal("1")
+        for path_pair, inverted in path:
+            rate = rate / self._prices[path_pair] if inverted else rate * self._prices[path_pair]
+        return rate
+
+    def _build_graph(self) -> Dict[str, Dict[str, Tuple[str, bool]]]:
+        edges: Dict[str, Dict[str, Tuple[str, bool]]] = defaultdict(dict)
+        for pair, price in self._prices.items():
+            if not price:
+                continue
+            base, quote = split_hb_trading_pair(pair)
+            base = unwrap_token_symbol(base)
+            quote = unwrap_token_symbol(quote)
+            if base == quote:
+                continue
+            # Pairs priced in both directions are used in their priced direction first
+            edges[base].setdefault(quote, (pair, False))
+            edges[quote].setdefault(base, (pair, True))
+        # Neighbours are explored from the most connected, so the shortest paths go through the main hubs first
+        return {
+            token: dict(sorted(neighbours.items(), key=lambda item: len(edges[item[0]]), reverse=True))
+            for token, neighbours in edges.items()
+        }
+
 
 def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     '''
@@ -13,25 +125,8 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    Use a RateTable to look up several rates from the same prices.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
-    if pair in prices:
-        return prices[pair]
-    base, quote = split_hb_trading_pair(trading_pair=pair)
-    base = unwrap_token_symbol(base)
-    quote = unwrap_token_symbol(quote)
-    if base == quote:
-        return Decimal("1")
-    reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
-    if reverse_pair in prices:
-        return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = split_hb_trading_pair(base_pair)[1]
-        link_pair = combine_to_hb_trading_pair(base=link_quote, quote=quote)
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    return RateTable(prices).rate(pair)
@@ -0,0 +1,171 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any, Dict, List, Optional
+
+
+class SamplingProfiler:
+    """
+    In-process sampling profiler. A background thread samples the stack of the profiled thread (the thread that
+    starts the profiler, i.e. the event loop thread) at a fixed interval and counts the identical stacks, which is
+    what flame graph tools expect (the "collapsed stacks" format of flamegraph.pl, also read by speedscope).
+
+    Sampling only sees Python frames. Cython functions run as part of the Python frame calling them, unless the
+    extensions are built with the profiling hooks (`make build-profiling`) and the profiler traces the calls
+    (`trace_calls=True`): a profile function then keeps a shadow stack of the Python and Cython calls of the thread,
+    which is sampled instead. Tracing the calls slows down the profiled thread, it is meant for short diagnostic runs.
+    """
+
+    def __init__(self, interval: float = 0.005, trace_calls: bool = False):
+        self._interval = interval
+        self._trace_calls = trace_calls
+        self._stack_counts: Counter = Counter()
+        self._sample_count = 0
+        self._thread_id: Optional[int] = None
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._shadow_stack: List[FrameType] = []
+        self._previous_profile_function = None
+        self._frame_names: Dict[Any, str] = {}
+
+    @property
+    def started(self) -> bool:
+        return self._sampler_thread is not None
+
+    @property
+    def sample_count(self) -> int:
+        return self._sample_count
+
+    def start(self):
+        if self._sampler_thread is not None:
+            return
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        if self._trace_calls:
+            self._shadow_stack = []
+            self._previous_profile_function = sys.getprofile()
+            sys.setprofile(self._trace_call)
+        self._sampler_thread = threading.Thread(target=self._sample_loop, name="sampling_profiler", daemon=True)
+        self._sampler_thread.start()
+
+    def stop(self):
+        """
+        Stops the sampling, to be called from the profiled thread.
+        """
+        if self._sampler_thread is None:
+            return
+        self._stopped.set()
+        self._sampler_thread.join()
+        self._sampler_thread = None
+        if self._trace_calls:
+            sys.setprofile(self._previous_profile_function)
+            self._previous_profile_function = None
+            self._shadow_stack = []
+
+    def collapsed_stacks(self) -> Dict[str, int]:
+        """
+        :return: the number of samples of each stack, the frames of a stack from the outermost to the innermost
+        separated by semicolons
+        """
+        return dict(self._stack_counts)
+
+    def top_frames(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        :return: the frames the profiled thread was running in for the most samples (self time), with the share of
+        the samples they were found in
+        """
+        self_counts: Counter = Counter()
+        for stack, count in self._stack_counts.items():
+            self_counts[stack.rsplit(";", 1)[-1]] += count
+        return [{"frame": frame, "samples": count, "pct": 100 * count / max(self._sample_count, 1)}
+                for frame, count in self_counts.most_common(limit)]
+
+    def write_collapsed_stacks(self, file_path: str):
+        with open(file_path, "w") as profile_file:
+            for stack, count in sorted(self._stack_counts.items()):
+                profile_file.write(f"{stack} {count}\n")
+
+    def _sample_loop(self):
+        while not self._stopped.wait(self._interval):
+            if self._trace_calls:
+                frames = list(self._shadow_stack)
+            else:
+                frames = []
+                frame = sys._current_frames().get(self._thread_id)
+                while frame is not None:
+                    frames.append(frame)
+                    frame = frame.f_back
+                frames.reverse()
+            # When tracing the calls, the shadow stack is empty while the event loop waits for events
+            stack = ";".join(self._frame_name(frame) for frame in frames) or "<idle>"
+            self._stack_counts[stack] += 1
+            self._sample_count += 1
+
+    def _trace_call(self, frame: FrameType, event: str, arg: Any):
+        if event == "call":
+            self._shadow_stack.append(frame)
+        elif event == "return" and len(self._shadow_stack) > 0 and self._shadow_stack[-1] is frame:
+            # The frames already running when the tracing started are not in the shadow stack
+            self._shadow_stack.pop()
+
+    def _frame_name(self, frame: FrameType) -> str:
+        code = frame.f_code
+        name = self._frame_names.get(code)
+        if name is None:
+            name = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+            self._frame_names[code] = name
+        return name
+
+
+async def measure_event_loop_lag(duration: float, interval: float = 0.05) -> Dict[str, float]:
+    """
+    Measures how late the event loop runs a callback scheduled every interval (in seconds) during the duration,
+    which is how long any ready callback or task waits behind the ones running before it.
+
+    :return: the number of measures and the mean, p99 and max lag in milliseconds
+    """
+    lags = []
+    end = time.perf_counter() + duration
+    while True:
+        expected = time.perf_counter() + interval
+        if expected > end:
+            break
+        await asyncio.sleep(interval)
+        lags.append(max(time.perf_counter() - expected, 0.0))
+    if len(lags) == 0:
+        return {"count": 0, "mean_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    lags.sort()
+    return {
+        "count": len(lags),
+        "mean_ms": 1e3 * sum(lags) / len(lags),
+        "p99_ms": 1e3 * lags[min(int(len(lags) * 0.99), len(lags) - 1)],
+        "max_ms": 1e3 * lags[-1],
+    }
+
+
+def asyncio_task_states(loop: asyncio.AbstractEventLoop) -> List[Dict[str, Any]]:
+    """
+    :return: the name, state, coroutine and current await location of the tasks of the event loop
+    """
+    states = []
+    for task in asyncio.all_tasks(loop):
+        if task.cancelled():
+            state = "cancelled"
+        elif task.done():
+            state = "done"
+        else:
+            state = "pending"
+        stack = task.get_stack(limit=1)
+        location = f"{stack[0].f_code.co_filename}:{stack[0].f_lineno}" if len(stack) > 0 else ""
+        coroutine = task.get_coro()
+        states.append({
+            "name": task.get_name(),
+            "state": state,
+            "coroutine": getattr(coroutine, "__qualname__", repr(coroutine)),
+            "location": location,
+        })
+    return sorted(states, key=lambda task_state: (task_state["coroutine"], task_state["name"]))
@@ -0,0 +1,200 @@
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from hummingbot.core.metrics import DEFAULT_LATENCY_BUCKETS, Histogram
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+
+class TickDurationStats:
+    """
+    Wall-time durations of an iterator, or of whole ticks, counted in a `Histogram`, with the last and max durations.
+    """
+
+    __slots__ = ("name", "histogram", "max", "last")
+
+    def __init__(self, name: str, bucket_bounds: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.name = name
+        self.histogram: Histogram = Histogram(bucket_bounds)
+        self.max: float = 0.0
+        self.last: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self.histogram.count
+
+    @property
+    def total(self) -> float:
+        return self.histogram.sum
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def record(self, duration: float):
+        self.histogram.observe(duration)
+        self.last = duration
+        if duration > self.max:
+            self.max = duration
+
+    def percentile(self, pct: float) -> float:
+        """
+        Estimates the given percentile (0-100) from the histogram buckets, capped by the maximum observed duration.
+        """
+        return min(self.histogram.percentile(pct), self.max)
+
+    def reset(self):
+        self.histogram = Histogram(self.histogram.bucket_bounds)
+        self.max = 0.0
+        self.last = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "mean_ms": self.mean * 1e3,
+            "p50_ms": self.percentile(50) * 1e3,
+            "p99_ms": self.percentile(99) * 1e3,
+            "max_ms": self.max * 1e3,
+            "last_ms": self.last * 1e3,
+        }
+
+
+class TickProfiler:
+    """
+    Records the wall time consumed by each child iterator of a `Clock` on every tick, and detects tick overruns
+    (ticks where the iterators took longer than the clock tick size to process).
+    """
+
+    OVERRUN_LOG_INTERVAL = 60.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, tick_size: float, bucket_bounds: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self._tick_size = tick_size
+        self._bucket_bounds = bucket_bounds
+        self._iterator_stats: Dict[int, TickDurationStats] = {}
+        self._tick_stats = TickDurationStats("total", bucket_bounds)
+        self._overrun_count: int = 0
+        self._last_overrun: Optional[Dict[str, Any]] = None
+        self._last_overrun_log_time: float = 0
+        self._overrun_listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._start_time: float = time.time()
+
+    @property
+    def tick_size(self) -> float:
+        return self._tick_size
+
+    @property
+    def overrun_count(self) -> int:
+        return self._overrun_count
+
+    @property
+    def last_overrun(self) -> Optional[Dict[str, Any]]:
+        return self._last_overrun
+
+    @property
+    def tick_stats(self) -> TickDurationStats:
+        return self._tick_stats
+
+    @property
+    def iterator_stats(self) -> List[TickDurationStats]:
+        return list(self._iterator_stats.values())
+
+    @staticmethod
+    def iterator_name(iterator: Any) -> str:
+        name = getattr(iterator, "display_name", None) or getattr(iterator, "name", None)
+        class_name = type(iterator).__name__
+        if isinstance(name, str) and name != class_name:
+            return f"{class_name}({name})"
+        return class_name
+
+    def add_overrun_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        self._overrun_listeners.append(listener)
+
+    def remove_overrun_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        if listener in self._overrun_listeners:
+            self._overrun_listeners.remove(listener)
+
+    def record_iterator(self, iterator: Any, duration: float):
+        stats = self._iterator_stats.get(id(iterator))
+        if stats is None:
+            stats = TickDurationStats(self.iterator_name(iterator), self._bucket_bounds)
+            self._iterator_stats[id(iterator)] = stats
+        stats.record(duration)
+
+    def record_tick(self, timestamp: float, duration: float):
+        self._tick_stats.record(duration)
+        if duration > self._tick_size:
+            self._on_overrun(timestamp, duration)
+
+    def remove_iterator(self, iterator: Any):
+        self._iterator_stats.pop(id(iterator), None)
+
+    def reset(self):
+        for stats in self._iterator_stats.values():
+            stats.reset()
+        self._tick_stats.reset()
+        self._overrun_count = 0
+        self._last_overrun = None
+        self._start_time = time.time()
+
+    def _on_overrun(self, timestamp: float, duration: float):
+        self._overrun_count += 1
+        slowest = max(self._iterator_stats.values(), key=lambda s: s.last, default=None)
+        self._last_overrun = {
+            "timestamp": timestamp,
+            "duration_ms": duration * 1e3,
+            "tick_size_ms": self._tick_size * 1e3,
+            "slowest_iterator": slowest.name if slowest is not None else None,
+            "slowest_iterator_ms": slowest.last * 1e3 if slowest is not None else 0.0,
+        }
+        now = time.time()
+        if now - self._last_overrun_log_time > self.OVERRUN_LOG_INTERVAL:
+            self._last_overrun_log_time = now
+            self.logger().warning(
+                f"Clock tick overrun: iterators took {duration * 1e3:.1f} ms for a {self._tick_size * 1e3:.0f} ms "
+                f"tick (slowest: {self._last_overrun['slowest_iterator']}, "
+                f"{self._last_overrun['slowest_iterator_ms']:.1f} ms). {self._overrun_count} overruns so far."
+            )
+        for listener in self._overrun_listeners:
+            try:
+                listener(self._last_overrun)
+            except Exception:
+                self.logger().error("Unexpected error notifying tick overrun listener.", exc_info=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tick_size_ms": self._tick_size * 1e3,
+            "since": self._start_time,
+            "ticks": self._tick_stats.count,
+            "overruns": self._overrun_count,
+            "last_overrun": self._last_overrun,
+            "total": self._tick_stats.to_dict(),
+            "iterators": [stats.to_dict() for stats in self._iterator_stats.values()],
+        }
+
+    def format_status(self) -> str:
+        lines = [
+            "  Clock tick profile:",
+            f"    Ticks: {self._tick_stats.count}  Overruns: {self._overrun_count}  "
+            f"Tick size: {self._tick_size * 1e3:.0f} ms",
+        ]
+        rows = [self._tick_stats] + sorted(self._iterator_stats.values(), key=lambda s: s.total, reverse=True)
+        name_width = max(len(stats.name) for stats in rows)
+        lines.append(f"    {'Iterator':<{name_width}}  {'Mean ms':>9}  {'p50 ms':>9}  {'p99 ms':>9}  {'Max ms':>9}")
+        for stats in rows:
+            lines.append(f"    {stats.name:<{name_width}}  {stats.mean * 1e3:>9.3f}  {stats.percentile(50) * 1e3:>9.3f}"
+                         f"  {stats.percentile(99) * 1e3:>9.3f}  {stats.max * 1e3:>9.3f}")
+        if self._last_overrun is not None:
+            lines.append(f"    Last overrun: {self._last_overrun['duration_ms']:.1f} ms at "
+                         f"{self._last_overrun['timestamp']:.0f} "
+                         f"(slowest: {self._last_overrun['slowest_iterator']})")
+        return "\n".join(lines)
@@ -1,14 +1,29 @@
+import asyncio
+import json
 import logging
+import os
+import time
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from hummingbot import data_path
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
+
+TRADING_PAIRS_CACHE_FILE_NAME = "trading_pairs.json"
+TRADING_PAIRS_CACHE_TTL = 60 * 60 * 24
+FAILED_FETCH_RETRY_INTERVAL = 60
 
 
 class TradingPairFetcher:
+    """
+    Provides the trading pairs of the connectors for the autocompletion and validation of the trading pairs.
+
+    The trading pairs are cached on disk, and are fetched from a connector in the background when they are first
+    requested for it (see `request_trading_pairs`), or once they are older than the cache time to live.
+    """
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
@@ -25,54 +40,126 @@ class TradingPairFetcher:
             cls._sf_shared_instance = TradingPairFetcher(client_config_map)
         return cls._sf_shared_instance
 
-    def __init__(self, client_config_map: ClientConfigAdapter):
-        self.ready = False
+    def __init__(self,
+                 client_config_map: ClientConfigAdapter,
+                 cache_path: Optional[str] = None,
+                 cache_ttl: float = TRADING_PAIRS_CACHE_TTL):
+        """
+        :param cache_path: the path of the trading pairs cache file, data/trading_pairs.json by default
+        :param cache_ttl: number of seconds after which the trading pairs of a connector are fetched again
+        """
+        self._client_config_map = client_config_map
+        self._cache_path = cache_path or os.path.join(data_path(), TRADING_PAIRS_CACHE_FILE_NAME)
+        self._cache_ttl = cache_ttl
+        self._fetching_enabled = True
+        self._fetch_tasks: Dict[str, asyncio.Task] = {}
+        self._fetch_timestamps: Dict[str, float] = {}
+        self._expiration_timestamps: Dict[str, float] = {}
         self.trading_pairs: Dict[str, Any] = {}
-        self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
-
-    def _fetch_pairs_from_connector_setting(
-            self,
-            connector_setting: ConnectorSetting,
-            connector_name: Optional[str] = None):
-        connector_name = connector_name or connector_setting.name
-        connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
-
-    async def fetch_all(self, client_config_map: ClientConfigAdapter):
-        connector_settings = self._all_connector_settings()
-        for conn_setting in connector_settings.values():
-            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
-            # data source module for them.
-            try:
-                if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-            except ModuleNotFoundError:
-                continue
-            except Exception:
-                self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
-                                        "Please check the logs")
+        self._load_cache()
+        self.ready = True
+
+    def disable_fetching(self):
+        """
+        Stops fetching trading pairs from the connectors, only the cached trading pairs are provided. Used when the
+        client runs without the autocompletion needing them (e.g. started by the quickstart script).
+        """
+        self._fetching_enabled = False
 
+    def request_trading_pairs(self, connector_name: str):
+        """
+        Fetches the trading pairs of a connector in the background if they are missing or outdated.
+        """
+        connector_setting = self._all_connector_settings().get(connector_name)
+        if (self._fetching_enabled
+                and connector_setting is not None
+                and connector_name not in self._fetch_tasks
+                and self._time() >= self._expiration_timestamps.get(connector_name, 0)):
+            self._fetch_pairs_from_connector_setting(connector_setting)
+
+    def _fetch_pairs_from_connector_setting(self, connector_setting: ConnectorSetting) -> Optional[asyncio.Task]:
+        connector_name = connector_setting.name
+        if connector_name in self._fetch_tasks:
+            return self._fetch_tasks[connector_name]
+        # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
+        # data source module for them.
+        try:
+            if connector_setting.base_name().endswith("paper_trade"):
+                connector_setting = self._all_connector_settings()[connector_setting.parent_name]
+            connector = connector_setting.non_trading_connector_instance_with_default_configuration()
+        except ModuleNotFoundError:
+            self._expiration_timestamps[connector_name] = float("inf")
+            return None
+        except Exception:
+            self.logger().exception(f"An error occurred when fetching trading pairs for {connector_name}."
+                                    "Please check the logs")
+            self._expiration_timestamps[connector_name] = self._time() + FAILED_FETCH_RETRY_INTERVAL
+            return None
+        fetch_task = safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+        self._fetch_tasks[connector_name] = fetch_task
+        return fetch_task
+
+    async def fetch_all(self, client_config_map: Optional[ClientConfigAdapter] = None):
+        """
+        Fetches the trading pairs of all the connectors.
+        """
+        fetch_tasks = [self._fetch_pairs_from_connector_setting(connector_setting)
+                       for connector_setting in self._all_connector_settings().values()]
+        await safe_gather(*[fetch_task for fetch_task in fetch_tasks if fetch_task is not None],
+                          return_exceptions=True)
         self.ready = True
 
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            self._fetch_timestamps[exchange_name] = self._time()
+            self._expiration_timestamps[exchange_name] = self._time() + self._cache_ttl
+            self._save_cache()
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            # In case of error keep the cached trading pairs or assign empty list, this is st. the bot won't stop
+            # working
+            self.trading_pairs.setdefault(exchange_name, [])
+            self._expiration_timestamps[exchange_name] = self._time() + FAILED_FETCH_RETRY_INTERVAL
+        finally:
+            self._fetch_tasks.pop(exchange_name, None)
+
+    def _load_cache(self):
+        try:
+            with open(self._cache_path) as cache_file:
+                cache = json.load(cache_file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            self.logger().warning(f"Ignoring the unreadable trading pairs cache {self._cache_path}.", exc_info=True)
+            return
+        for connector_name, cached_pairs in cache.items():
+            self.trading_pairs[connector_name] = cached_pairs["trading_pairs"]
+            self._fetch_timestamps[connector_name] = cached_pairs["timestamp"]
+            self._expiration_timestamps[connector_name] = cached_pairs["timestamp"] + self._cache_ttl
+
+    def _save_cache(self):
+        cache = {
+            connector_name: {"timestamp": timestamp, "trading_pairs": self.trading_pairs[connector_name]}
+            for connector_name, timestamp in self._fetch_timestamps.items()
+        }
+        temporary_path = f"{self._cache_path}.tmp"
+        try:
+            with open(temporary_path, "w") as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(temporary_path, self._cache_path)
+        except OSError:
+            self.logger().warning(f"Could not save the trading pairs cache {self._cache_path}.", exc_info=True)
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
         return AllConnectorSettings.get_connector_settings()
 
+    def _time(self) -> float:
+        return time.time()
+
     @staticmethod
     def _get_client_config_map() -> "ClientConfigAdapter":
         from hummingbot.client.hummingbot_application import HummingbotApplication
@@ -1,15 +1,22 @@
 import json
+import time
 from asyncio import wait_for
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.metrics import MetricsRegistry
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
+REST_REQUEST_LATENCY = MetricsRegistry.get_instance().histogram(
+    "hummingbot_rest_request_seconds",
+    "Time taken by the exchange to answer a REST request, per throttler limit ID (unknown without a limit ID)",
+    ("endpoint",))
+
 
 class RESTAssistant:
     """A helper class to contain all REST-related logic.
@@ -81,7 +88,10 @@ class RESTAssistant:
         request = deepcopy(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
+        request_start = time.perf_counter()
         resp = await wait_for(self._connection.call(request), timeout)
+        REST_REQUEST_LATENCY.labels(request.throttler_limit_id or "unknown").observe(
+            time.perf_counter() - request_start)
         resp = await self._post_process_response(resp)
         return resp
 
@@ -78,6 +78,7 @@ class BinanceSpotCandles(CandlesBase):
         return np.array(candles)[:, [0, 1, 2, 3, 4, 5, 7, 8, 9, 10]].astype(float)
 
     async def fill_historical_candles(self):
+        await self._fill_historical_candles_from_cache()
         max_request_needed = (self._candles.maxlen // 1000) + 1
         requests_executed = 0
         while not self.is_ready:
@@ -155,7 +156,6 @@ class BinanceSpotCandles(CandlesBase):
                                                    quote_asset_volume, n_trades, taker_buy_base_volume,
                                                    taker_buy_quote_volume]))
                 elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+                    self._candles.update_last(np.array([timestamp, open, high, low, close, volume,
+                                                        quote_asset_volume, n_trades, taker_buy_base_volume,
+                                                        taker_buy_quote_volume]))
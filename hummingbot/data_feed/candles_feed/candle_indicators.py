@@ -0,0 +1,231 @@
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Iterable, NamedTuple, Optional
+
+NaN = float("nan")
+
+
+class CandleIndicator(ABC):
+    """
+    Indicator updated in O(1) per candle.
+
+    The state of the indicator only includes the closed candles, and the value is computed from that state and the
+    value of the last candle, which can still change. `add` is called when a new candle starts (closing the previous
+    one), and `replace_last` when the last candle is updated.
+    """
+
+    def __init__(self):
+        self._last_input: Optional[float] = None
+        self._value: Any = self._compute(NaN)
+
+    @property
+    def value(self) -> Any:
+        """
+        The indicator value at the last candle, NaN until enough candles were added.
+        """
+        return self._value
+
+    def add(self, value: float):
+        if self._last_input is not None:
+            self._commit(self._last_input)
+        self._last_input = value
+        self._value = self._compute(value)
+
+    def replace_last(self, value: float):
+        if self._last_input is None:
+            self.add(value)
+        else:
+            self._last_input = value
+            self._value = self._compute(value)
+
+    def reset(self, values: Iterable[float] = ()):
+        """
+        Clears the indicator state, then adds the given values.
+        """
+        self._last_input = None
+        self._reset_state()
+        self._value = self._compute(NaN)
+        for value in values:
+            self.add(value)
+
+    @abstractmethod
+    def _reset_state(self):
+        ...
+
+    @abstractmethod
+    def _commit(self, value: float):
+        """
+        Updates the state with the value of a closed candle.
+        """
+        ...
+
+    @abstractmethod
+    def _compute(self, value: float) -> Any:
+        """
+        :return: the indicator value given the state and the value of the last candle, without changing the state
+        """
+        ...
+
+
+class EMA(CandleIndicator):
+    """
+    Exponential moving average, seeded with the simple average of the first `length` values (as pandas_ta does).
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self._alpha = 2 / (length + 1)
+        self._reset_state()
+        super().__init__()
+
+    def _reset_state(self):
+        self._count = 0
+        self._sum = 0.0
+        self._ema = NaN
+
+    def _commit(self, value: float):
+        self._ema = self._compute(value)
+        if self._count < self.length:
+            self._sum += value
+        self._count += 1
+
+    def _compute(self, value: float) -> float:
+        if math.isnan(value) or self._count + 1 < self.length:
+            return NaN
+        if self._count + 1 == self.length:
+            return (self._sum + value) / self.length
+        return self._ema + self._alpha * (value - self._ema)
+
+
+class RSI(CandleIndicator):
+    """
+    Relative strength index, with the gains and losses smoothed by Wilder's moving average. pandas_ta seeds the
+    average differently, so its values only match once the average has warmed up.
+    """
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self._alpha = 1 / length
+        self._reset_state()
+        super().__init__()
+
+    def _reset_state(self):
+        self._previous: Optional[float] = None
+        self._count = 0
+        self._average_gain = 0.0
+        self._average_loss = 0.0
+
+    def _commit(self, value: float):
+        if self._previous is not None:
+            self._average_gain, self._average_loss = self._averages(value)
+            self._count += 1
+        self._previous = value
+
+    def _averages(self, value: float):
+        change = value - self._previous
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        if self._count == 0:
+            return gain, loss
+        return (self._average_gain + self._alpha * (gain - self._average_gain),
+                self._average_loss + self._alpha * (loss - self._average_loss))
+
+    def _compute(self, value: float) -> float:
+        if self._previous is None or math.isnan(value) or self._count + 1 < self.length:
+            return NaN
+        average_gain, average_loss = self._averages(value)
+        if average_gain + average_loss == 0:
+            return NaN
+        return 100 * average_gain / (average_gain + average_loss)
+
+
+class MACDValue(NamedTuple):
+    macd: float
+    histogram: float
+    signal: float
+
+
+class MACD(CandleIndicator):
+    """
+    Moving average convergence divergence: the difference between a fast and a slow EMA, its EMA (the signal) and the
+    difference between both (the histogram).
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = EMA(fast)
+        self._slow = EMA(slow)
+        self._signal = EMA(signal)
+        super().__init__()
+
+    def _reset_state(self):
+        for ema in (self._fast, self._slow, self._signal):
+            ema.reset()
+
+    def _commit(self, value: float):
+        macd = self._fast._compute(value) - self._slow._compute(value)
+        self._fast._commit(value)
+        self._slow._commit(value)
+        if not math.isnan(macd):
+            self._signal._commit(macd)
+
+    def _compute(self, value: float) -> MACDValue:
+        macd = self._fast._compute(value) - self._slow._compute(value)
+        signal = self._signal._compute(macd)
+        return MACDValue(macd=macd, histogram=macd - signal, signal=signal)
+
+
+class BollingerBandsValue(NamedTuple):
+    lower: float
+    middle: float
+    upper: float
+
+
+class BollingerBands(CandleIndicator):
+    """
+    Simple moving average over `length` values, with bands `std` standard deviations away from it.
+    """
+
+    def __init__(self, length: int = 20, std: float = 2.0, ddof: int = 0):
+        self.length = length
+        self.std = std
+        self.ddof = ddof
+        self._reset_state()
+        super().__init__()
+
+    def _reset_state(self):
+        # The length - 1 last closed values, with their sum and sum of squares
+        self._window = deque(maxlen=self.length - 1)
+        self._sum = 0.0
+        self._sum_of_squares = 0.0
+        self._commits_since_resum = 0
+
+    def _commit(self, value: float):
+        if self.length == 1:
+            return
+        if len(self._window) == self._window.maxlen:
+            removed = self._window[0]
+            self._sum -= removed
+            self._sum_of_squares -= removed * removed
+        self._window.append(value)
+        self._commits_since_resum += 1
+        if self._commits_since_resum >= self.length:
+            # Recomputed once per window to stop the rounding errors of the running sums from accumulating
+            self._sum = math.fsum(self._window)
+            self._sum_of_squares = math.fsum(v * v for v in self._window)
+            self._commits_since_resum = 0
+        else:
+            self._sum += value
+            self._sum_of_squares += value * value
+
+    def _compute(self, value: float) -> BollingerBandsValue:
+        if math.isnan(value) or len(self._window) + 1 < self.length:
+            return BollingerBandsValue(lower=NaN, middle=NaN, upper=NaN)
+        mean = (self._sum + value) / self.length
+        variance = max((self._sum_of_squares + value * value) / self.length - mean * mean, 0.0)
+        if self.length - self.ddof <= 0:
+            deviation = NaN
+        else:
+            deviation = math.sqrt(variance * self.length / (self.length - self.ddof))
+        return BollingerBandsValue(lower=mean - self.std * deviation,
+                                   middle=mean,
+                                   upper=mean + self.std * deviation)
@@ -1,7 +1,7 @@
 import asyncio
-from collections import deque
-from typing import Optional
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 
@@ -11,14 +11,19 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candle_indicators import CandleIndicator
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
+    When a candles cache is set, the historical candles are taken from it, and only the candles missing since the
+    cached ones are requested from the exchange.
     """
     interval_to_seconds = bidict({
         "1s": 1,
@@ -40,12 +45,23 @@ class CandlesBase(NetworkBase):
     })
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    # Units of the candle timestamps, and of the times passed to fetch_candles, per second
+    timestamp_units_per_second = 1000
+    fetch_time_units_per_second = 1000
+    # Maximum number of candles returned by a fetch_candles request
+    fetch_candles_limit = 500
+    # The feeds of the same exchange share a throttler, so their concurrent requests respect the exchange limits
+    _throttlers: Dict[type, AsyncThrottler] = {}
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
-        async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
-        self._api_factory = WebAssistantsFactory(throttler=async_throttler)
-        self._candles = deque(maxlen=max_records)
+        if type(self) not in CandlesBase._throttlers:
+            CandlesBase._throttlers[type(self)] = AsyncThrottler(rate_limits=self.rate_limits)
+        self._api_factory = WebAssistantsFactory(throttler=CandlesBase._throttlers[type(self)])
+        self._candles_cache: Optional[CandlesCache] = None
+        self._candles = CandlesRingBuffer(maxlen=max_records, num_columns=len(self.columns))
+        self._candles_df: Optional[pd.DataFrame] = None
+        self._candles_df_version: int = -1
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -70,14 +86,23 @@ class CandlesBase(NetworkBase):
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        self._save_candles_to_cache()
 
     @property
     def is_ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
+    @property
+    def candles_cache(self) -> Optional[CandlesCache]:
+        return self._candles_cache
+
+    @candles_cache.setter
+    def candles_cache(self, candles_cache: Optional[CandlesCache]):
+        self._candles_cache = candles_cache
+
     @property
     def name(self):
         raise NotImplementedError
@@ -112,9 +137,28 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is only rebuilt when a candle is added or updated. Each access returns a copy of it, since the
+        callers usually append their indicators to it.
+        """
+        if self._candles_df is None or self._candles_df_version != self._candles.version:
+            self._candles_df = self._build_candles_df()
+            self._candles_df_version = self._candles.version
+        return self._candles_df.copy()
+
+    def _build_candles_df(self) -> pd.DataFrame:
+        return pd.DataFrame(self._candles.to_array(), columns=self.columns)
+
+    def add_indicator(self, indicator: CandleIndicator, column: str = "close") -> CandleIndicator:
+        """
+        Registers an indicator that is updated with each candle, e.g. `rsi = candles.add_indicator(RSI(length=14))`
+        and then `rsi.value` for the RSI at the last candle.
+        :param indicator: the indicator
+        :param column: the candle field the indicator is computed from
+        :return: the indicator
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        self._candles.add_indicator(indicator, column=self.columns.index(column))
+        return indicator
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -134,10 +178,95 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        This is an abstract method that must be implemented by a subclass to fill the _candles buffer with historical candles.
         """
         raise NotImplementedError
 
+    async def _fill_historical_candles_from_cache(self):
+        """
+        Prepends the cached candles older than the first candle received, after fetching the candles missing between
+        the most recent cached candle and it. Only the cached candles without gaps up to the first candle received are
+        used. The subclasses call it before fetching the historical candles, which then only fetch the candles still
+        missing, if any.
+        """
+        missing_records = self._candles.maxlen - len(self._candles)
+        if self._candles_cache is None or len(self._candles) == 0 or missing_records <= 0:
+            return
+        cached_candles = self._candles_cache.load(self.name, self.interval)
+        first_timestamp = self._candles[0][0]
+        if cached_candles is None or cached_candles.shape[1] != len(self.columns):
+            return
+        interval = self.get_seconds_from_interval(self.interval) * self.timestamp_units_per_second
+        # Only the candles fitting in the buffer are used. When the cache ends before them (e.g. after a long
+        # downtime), completing it would fetch more candles than fetching the historical candles without it.
+        cached_candles = cached_candles[(cached_candles[:, 0] >= first_timestamp - missing_records * interval)
+                                        & (cached_candles[:, 0] < first_timestamp)]
+        if len(cached_candles) == 0:
+            return
+        if cached_candles[-1, 0] + interval < first_timestamp:
+            try:
+                missing_candles = await self._fetch_candles_between(start=cached_candles[-1, 0] + interval,
+                                                                    end=first_timestamp - interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception("Unexpected error occurred when getting the klines missing from the cache.")
+                return
+            missing_candles = missing_candles[(missing_candles[:, 0] > cached_candles[-1, 0])
+                                              & (missing_candles[:, 0] < first_timestamp)]
+            cached_candles = np.concatenate((cached_candles, missing_candles))
+            if len(self._candles) == 0 or self._candles[0][0] != first_timestamp:
+                return  # the candles were reset while fetching
+            if cached_candles[-1, 0] + interval < first_timestamp:
+                self.logger().warning(f"The cached candles of {self.name} could not be completed up to the current "
+                                      f"candle, fetching all the historical candles.")
+                return
+        # The cache merges the buffers saved at different times, so only the candles following each other up to the
+        # first candle received are used. The historical candles fetched afterwards complete the older ones.
+        gaps = np.flatnonzero(np.diff(cached_candles[:, 0]) != interval)
+        if len(gaps) > 0:
+            cached_candles = cached_candles[gaps[-1] + 1:]
+        # The candles received while fetching are in the buffer too
+        missing_records = self._candles.maxlen - len(self._candles)
+        if missing_records > 0:
+            self._candles.extendleft(cached_candles[-missing_records:][::-1])
+
+    async def _fetch_candles_between(self, start: float, end: float) -> np.ndarray:
+        """
+        Fetches the candles between two timestamps (included), in as many requests as needed.
+        :param start: the timestamp of the first candle, in the candle timestamps unit
+        :param end: the timestamp of the last candle, in the candle timestamps unit
+        :return: the candles ordered by timestamp
+        """
+        interval = self.get_seconds_from_interval(self.interval) * self.timestamp_units_per_second
+        to_fetch_time = self.fetch_time_units_per_second / self.timestamp_units_per_second
+        pages = []
+        while start <= end:
+            end_page = min(end, start + (self.fetch_candles_limit - 1) * interval)
+            candles = await self.fetch_candles(start_time=int(start * to_fetch_time),
+                                               end_time=int(end_page * to_fetch_time),
+                                               limit=self.fetch_candles_limit)
+            if len(candles) == 0:
+                break
+            pages.append(candles)
+            start = max(end_page, candles[:, 0].max()) + interval
+        if len(pages) == 0:
+            return np.empty((0, len(self.columns)))
+        candles = np.concatenate(pages)
+        if candles.shape[1] < len(self.columns):
+            # Fields some exchanges don't provide (e.g. the number of trades) are left at 0
+            candles = np.pad(candles, ((0, 0), (0, len(self.columns) - candles.shape[1])))
+        _, indexes = np.unique(candles[:, 0], return_index=True)
+        return candles[indexes]
+
+    def _save_candles_to_cache(self):
+        if self._candles_cache is not None and len(self._candles) > 1:
+            try:
+                # The last candle is still open
+                self._candles_cache.save(self.name, self.interval, self._candles.to_array()[:-1])
+            except Exception:
+                self.logger().exception(f"Unexpected error occurred when saving the {self.name} candles cache.")
+
     async def listen_for_subscriptions(self):
         """
         Connects to the candlestick websocket endpoint and listens to the messages sent by the
@@ -185,6 +314,7 @@ class CandlesBase(NetworkBase):
 
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
         websocket_assistant and await websocket_assistant.disconnect()
+        self._save_candles_to_cache()
         self._candles.clear()
 
     def get_seconds_from_interval(self, interval: str) -> int:
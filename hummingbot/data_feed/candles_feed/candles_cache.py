@@ -0,0 +1,77 @@
+import logging
+import os
+from typing import Optional
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+
+class CandlesCache:
+    """
+    On-disk cache of closed candles, with one file per candles feed (exchange and trading pair) and interval.
+
+    The candles are stored column by column in a .npy file, loaded as a read-only memory map, so a feed only reads the
+    records it uses. A save merges the candles with the cached ones (the saved values win for the same timestamp) and
+    keeps the `max_records` most recent ones.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["CandlesCache"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "CandlesCache":
+        if cls._shared_instance is None:
+            cls._shared_instance = CandlesCache()
+        return cls._shared_instance
+
+    def __init__(self, directory: Optional[str] = None, max_records: int = 100000):
+        """
+        :param directory: the directory of the cache files, data/candles by default
+        :param max_records: maximum number of candles kept per file
+        """
+        self._directory = directory if directory is not None else os.path.join(data_path(), "candles")
+        self._max_records = max_records
+
+    def path(self, feed_name: str, interval: str) -> str:
+        return os.path.join(self._directory, f"{feed_name}_{interval}.npy")
+
+    def load(self, feed_name: str, interval: str) -> Optional[np.ndarray]:
+        """
+        :return: the cached candles ordered by timestamp, as a read-only (n, num_columns) array, or None
+        """
+        path = self.path(feed_name, interval)
+        if not os.path.exists(path):
+            return None
+        try:
+            candles = np.load(path, mmap_mode="r")
+        except Exception:
+            self.logger().warning(f"Ignoring the unreadable candles cache {path}.", exc_info=True)
+            return None
+        return candles if candles.ndim == 2 else None
+
+    def save(self, feed_name: str, interval: str, candles: np.ndarray):
+        """
+        :param candles: closed candles, as a (n, num_columns) array with the timestamps in the first column
+        """
+        if len(candles) == 0:
+            return
+        cached = self.load(feed_name, interval)
+        if cached is not None and cached.shape[1] == candles.shape[1]:
+            candles = np.concatenate((candles, cached))
+        # np.unique keeps the first occurrence of each timestamp, i.e. the saved candle
+        _, indexes = np.unique(candles[:, 0], return_index=True)
+        candles = candles[indexes][-self._max_records:]
+        os.makedirs(self._directory, exist_ok=True)
+        path = self.path(feed_name, interval)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as cache_file:
+            np.save(cache_file, np.asfortranarray(candles))
+        # The cache may be memory mapped by a feed, so it's replaced instead of being overwritten
+        os.replace(temporary_path, path)
@@ -1,5 +1,7 @@
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import BinancePerpetualCandles
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
 from hummingbot.data_feed.candles_feed.gate_io_perpetual_candles import GateioPerpetualCandles
 from hummingbot.data_feed.candles_feed.gate_io_spot_candles import GateioSpotCandles
 from hummingbot.data_feed.candles_feed.kucoin_spot_candles.kucoin_spot_candles import KucoinSpotCandles
@@ -11,9 +13,18 @@ class CandlesFactory:
     It has a class method, get_candle which takes in a connector, trading pair, interval, and max_records as parameters.
     Based on the connector provided, the method returns either a BinancePerpetualsCandles or a BinanceSpotCandles object.
     If an unsupported connector is provided, it raises an exception.
+    The candles are cached on disk (see CandlesCache) unless use_cache is False.
     """
     @classmethod
-    def get_candle(cls, connector: str, trading_pair: str, interval: str = "1m", max_records: int = 500):
+    def get_candle(cls, connector: str, trading_pair: str, interval: str = "1m", max_records: int = 500,
+                   use_cache: bool = True):
+        candles = cls._create_candle(connector, trading_pair, interval, max_records)
+        if use_cache:
+            candles.candles_cache = CandlesCache.get_instance()
+        return candles
+
+    @classmethod
+    def _create_candle(cls, connector: str, trading_pair: str, interval: str, max_records: int) -> CandlesBase:
         if connector == "binance_perpetual":
             return BinancePerpetualCandles(trading_pair, interval, max_records)
         elif connector == "binance":
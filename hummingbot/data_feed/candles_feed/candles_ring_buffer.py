@@ -0,0 +1,130 @@
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candle_indicators import CandleIndicator
+
+
+class CandlesRingBuffer:
+    """
+    Fixed size store of candles, in a preallocated float64 array with one row per candle and one column per candle
+    field. It supports the deque operations the candles feeds use (append, appendleft, extendleft, pop, clear and
+    indexing), with the oldest candles dropped once `maxlen` candles are stored, plus `update_last` to replace the last
+    (still open) candle.
+
+    `version` changes with every modification, so views built from the candles can be cached until it does, and the
+    registered indicators are updated as the candles are added.
+    """
+
+    def __init__(self, maxlen: int, num_columns: int):
+        self._data = np.zeros((maxlen, num_columns), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self._version = 0
+        self._indicators: List[Tuple[CandleIndicator, int]] = []
+
+    @property
+    def maxlen(self) -> int:
+        return self._data.shape[0]
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._data[self._position(index)].copy()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.to_array())
+
+    def to_array(self) -> np.ndarray:
+        """
+        :return: a copy of the candles, from the oldest to the newest, as a (len, num_columns) array
+        """
+        end = self._start + self._size
+        if end <= self.maxlen:
+            return self._data[self._start:end].copy()
+        return np.concatenate((self._data[self._start:], self._data[:end - self.maxlen]))
+
+    def append(self, candle: Iterable[float]):
+        if self.maxlen == 0:
+            return
+        if self._size == self.maxlen:
+            self._start = (self._start + 1) % self.maxlen
+        else:
+            self._size += 1
+        position = self._position(-1)
+        self._write(position, candle)
+        self._version += 1
+        for indicator, column in self._indicators:
+            indicator.add(self._data[position, column])
+
+    def update_last(self, candle: Iterable[float]):
+        position = self._position(-1)
+        self._write(position, candle)
+        self._version += 1
+        for indicator, column in self._indicators:
+            indicator.replace_last(self._data[position, column])
+
+    def appendleft(self, candle: Iterable[float]):
+        self._appendleft(candle)
+        self._candles_reordered()
+
+    def extendleft(self, candles: Iterable[Iterable[float]]):
+        for candle in candles:
+            self._appendleft(candle)
+        self._candles_reordered()
+
+    def pop(self) -> np.ndarray:
+        candle = self[-1]
+        self._size -= 1
+        self._candles_reordered()
+        return candle
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+        self._candles_reordered()
+
+    def add_indicator(self, indicator: CandleIndicator, column: int):
+        """
+        Registers an indicator fed with the given column of the candles, starting with the stored candles.
+        """
+        indicator.reset(self.to_array()[:, column])
+        self._indicators.append((indicator, column))
+
+    def _appendleft(self, candle: Iterable[float]):
+        if self.maxlen == 0:
+            return
+        if self._size < self.maxlen:
+            self._size += 1
+        # Once full, the newest candle is overwritten, as a deque with a maxlen does
+        self._start = (self._start - 1) % self.maxlen
+        self._write(self._start, candle)
+
+    def _write(self, position: int, candle: Iterable[float]):
+        values = np.asarray(candle, dtype=np.float64)
+        # Fields some exchanges don't provide (e.g. the number of trades) are left at 0
+        self._data[position, :len(values)] = values
+        self._data[position, len(values):] = 0
+
+    def _candles_reordered(self):
+        """
+        Called when candles are inserted before or removed from the end of the buffer, which the indicators can't
+        follow incrementally.
+        """
+        self._version += 1
+        if len(self._indicators) > 0:
+            candles = self.to_array()
+            for indicator, column in self._indicators:
+                indicator.reset(candles[:, column])
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("candle index out of range")
+        return (self._start + index) % self.maxlen
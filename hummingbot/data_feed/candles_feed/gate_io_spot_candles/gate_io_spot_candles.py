@@ -15,6 +15,7 @@ from hummingbot.logger import HummingbotLogger
 
 class GateioSpotCandles(CandlesBase):
     _logger: Optional[HummingbotLogger] = None
+    fetch_time_units_per_second = 1
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -94,6 +95,7 @@ class GateioSpotCandles(CandlesBase):
         return np.array(new_hb_candles).astype(float)
 
     async def fill_historical_candles(self):
+        await self._fill_historical_candles_from_cache()
         max_request_needed = (self._candles.maxlen // 1000) + 1
         requests_executed = 0
         while not self.is_ready:
@@ -171,7 +173,6 @@ class GateioSpotCandles(CandlesBase):
                                                    quote_asset_volume, n_trades, taker_buy_base_volume,
                                                    taker_buy_quote_volume]))
                 elif timestamp_ms == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp_ms, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+                    self._candles.update_last(np.array([timestamp_ms, open, high, low, close, volume,
+                                                        quote_asset_volume, n_trades, taker_buy_base_volume,
+                                                        taker_buy_quote_volume]))
@@ -17,6 +17,9 @@ from hummingbot.logger import HummingbotLogger
 
 class KucoinSpotCandles(CandlesBase):
     _logger: Optional[HummingbotLogger] = None
+    timestamp_units_per_second = 1
+    fetch_time_units_per_second = 1
+    fetch_candles_limit = 1500
     _last_ws_message_sent_timestamp = 0
     _ping_interval = 0
 
@@ -61,9 +64,8 @@ class KucoinSpotCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
-    @property
-    def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+    def _build_candles_df(self) -> pd.DataFrame:
+        df = super()._build_candles_df()
         df["timestamp"] = df["timestamp"] * 1000
         return df.sort_values(by="timestamp", ascending=True)
 
@@ -93,6 +95,7 @@ class KucoinSpotCandles(CandlesBase):
         return np.array(arr).astype(float)
 
     async def fill_historical_candles(self):
+        await self._fill_historical_candles_from_cache()
         max_request_needed = (self._candles.maxlen // 1500) + 1
         requests_executed = 0
         while not self.is_ready:
@@ -186,8 +189,7 @@ class KucoinSpotCandles(CandlesBase):
                     # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
                     self._candles.append(candles_array)
                 elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(candles_array)
+                    self._candles.update_last(candles_array)
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
         rest_assistant = await self._api_factory.get_rest_assistant()
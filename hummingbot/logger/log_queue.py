@@ -0,0 +1,167 @@
+import atexit
+import logging
+import queue
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
+_listener: Optional["LogQueueListener"] = None
+
+
+class LogQueueHandler(logging.Handler):
+    """
+    Hands the log records over to the listener thread, which passes them to the handlers of the logger (`handlers`).
+    The records are not formatted when they are queued, so the messages and their arguments are only formatted, by the
+    handlers, in the listener thread.
+
+    When the queue is full the records are dropped, and counted in `dropped_records` per level name. A warning with the
+    number of dropped records is queued with the next record that fits in the queue. The records are passed to the
+    handlers the logger had when they were logged.
+    """
+
+    def __init__(self, listener: "LogQueueListener", handlers: Iterable[logging.Handler] = ()):
+        super().__init__()
+        self._listener = listener
+        self._handlers: Tuple[logging.Handler, ...] = tuple(handlers)
+        self._pending_drops = 0
+        self.dropped_records: Dict[str, int] = defaultdict(int)
+
+    @property
+    def handlers(self) -> List[logging.Handler]:
+        return list(self._handlers)
+
+    def add_handler(self, handler: logging.Handler):
+        if handler not in self._handlers:
+            self._handlers = self._handlers + (handler,)
+
+    def remove_handler(self, handler: logging.Handler):
+        self._handlers = tuple(existing for existing in self._handlers if existing is not handler)
+
+    def emit(self, record: logging.LogRecord):
+        if not self._listener.enqueue(self, self._handlers, record):
+            self.dropped_records[record.levelname] += 1
+            self._pending_drops += 1
+        elif self._pending_drops > 0:
+            drops_record = logging.LogRecord(record.name, logging.WARNING, __file__, 0,
+                                             "%d log records were dropped, the log queue was full.",
+                                             (self._pending_drops,), None)
+            if self._listener.enqueue(self, self._handlers, drops_record):
+                self._pending_drops = 0
+
+    @staticmethod
+    def handle_queued(record: logging.LogRecord, handlers: Iterable[logging.Handler]):
+        """
+        Called by the listener thread to pass a queued record to the handlers.
+        """
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class LogQueueListener:
+    """
+    Thread passing the records queued by the `LogQueueHandler`s to their handlers, in the order they were logged.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_LOG_QUEUE_SIZE):
+        self._queue: queue.Queue = queue.Queue(max_size)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._process_records, name="LogQueueListener", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the thread once the queued records are handled.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def enqueue(self,
+                queue_handler: LogQueueHandler,
+                handlers: Tuple[logging.Handler, ...],
+                record: logging.LogRecord) -> bool:
+        """
+        :return: False if the record was dropped because the queue is full
+        """
+        try:
+            self._queue.put_nowait((queue_handler, handlers, record))
+        except queue.Full:
+            return False
+        return True
+
+    def _process_records(self):
+        while True:
+            item: Optional[Tuple[LogQueueHandler, Tuple[logging.Handler, ...], logging.LogRecord]] = self._queue.get()
+            if item is None:
+                break
+            queue_handler, handlers, record = item
+            try:
+                queue_handler.handle_queued(record, handlers)
+            except Exception:
+                queue_handler.handleError(record)
+
+
+def queue_loggers(logger_names: Iterable[str], max_size: int = DEFAULT_LOG_QUEUE_SIZE) -> LogQueueListener:
+    """
+    Replaces the handlers of the loggers (the root logger for an empty name) by a `LogQueueHandler` passing the records
+    to them from a listener thread, after stopping the previous listener.
+    """
+    global _listener
+    stop_log_queue()
+    _listener = LogQueueListener(max_size)
+    for logger_name in logger_names:
+        logger = logging.getLogger(logger_name or None)
+        handlers = [handler for handler in logger.handlers if not isinstance(handler, logging.NullHandler)]
+        if len(handlers) > 0:
+            for handler in handlers:
+                logger.removeHandler(handler)
+            logger.addHandler(LogQueueHandler(_listener, handlers))
+    _listener.start()
+    return _listener
+
+
+def stop_log_queue():
+    """
+    Handles the queued records and stops the listener thread.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def add_handler(logger: logging.Logger, handler: logging.Handler):
+    """
+    Adds a handler to a logger, behind its `LogQueueHandler` if its records are queued.
+    """
+    queue_handler = _queue_handler(logger)
+    if queue_handler is not None:
+        queue_handler.add_handler(handler)
+    else:
+        logger.addHandler(handler)
+
+
+def remove_handler(logger: logging.Logger, handler: logging.Handler):
+    queue_handler = _queue_handler(logger)
+    if queue_handler is not None:
+        queue_handler.remove_handler(handler)
+    logger.removeHandler(handler)
+
+
+def _queue_handler(logger: logging.Logger) -> Optional[LogQueueHandler]:
+    return next((handler for handler in logger.handlers if isinstance(handler, LogQueueHandler)), None)
+
+
+# Registered after the logging module's own exit handler, so it runs first and the handlers are still open
+atexit.register(stop_log_queue)
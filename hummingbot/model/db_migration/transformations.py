@@ -1,7 +1,10 @@
-from sqlalchemy import Column, Integer, Text
+import json
+
+from sqlalchemy import Column, Integer, Text, text
 
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.market_data import MarketData
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 
 
@@ -149,3 +152,72 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class ConvertMarketDataToTimeSeries(DatabaseTransformation):
+    """
+    Rebuilds the MarketData table with the (exchange, trading_pair, timestamp) primary key, integer timestamps, float
+    top of book columns and the depth as a binary blob. The migrated snapshots get a resolution of 0, so they are
+    downsampled like the raw ones.
+    """
+    create_table_query = (
+        'create table MarketData_dg_tmp'
+        '(	exchange TEXT not null,'
+        '	trading_pair TEXT not null,'
+        '	timestamp BIGINT not null,'
+        '	resolution INTEGER not null,'
+        '	mid_price FLOAT not null,'
+        '	best_bid FLOAT not null,'
+        '	best_ask FLOAT not null,'
+        '	order_book BLOB,'
+        '	constraint MarketData_pk'
+        '	primary key (exchange, trading_pair, timestamp)'
+        ');')
+    select_query = ('select timestamp, exchange, trading_pair, mid_price, best_bid, best_ask, order_book '
+                    'from MarketData;')
+    insert_query = ('insert into MarketData_dg_tmp(exchange, trading_pair, timestamp, resolution, mid_price, '
+                    'best_bid, best_ask, order_book) '
+                    'values (:exchange, :trading_pair, :timestamp, 0, :mid_price, :best_bid, :best_ask, :order_book);')
+    replace_table_queries = [
+        'drop table MarketData;',
+        'alter table MarketData_dg_tmp rename to MarketData;',
+    ]
+    # The old columns are SqliteDecimal(6) values
+    decimal_multiplier = 1000000
+
+    def __init__(self, *args, chunk_size: int = 10000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._chunk_size = chunk_size
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        with db_handle.engine.begin() as connection:
+            connection.execute(text(self.create_table_query))
+            result = connection.execute(text(self.select_query))
+            while True:
+                rows = result.fetchmany(self._chunk_size)
+                if len(rows) == 0:
+                    break
+                connection.execute(text(self.insert_query), [self._convert_row(*row) for row in rows])
+            for query in self.replace_table_queries:
+                connection.execute(text(query))
+        return db_handle
+
+    def _convert_row(self, timestamp, exchange, trading_pair, mid_price, best_bid, best_ask, order_book):
+        order_book = json.loads(order_book) if isinstance(order_book, str) else (order_book or {})
+        return {
+            "exchange": exchange,
+            "trading_pair": trading_pair,
+            "timestamp": int(timestamp) // self.decimal_multiplier,
+            "mid_price": mid_price / self.decimal_multiplier,
+            "best_bid": best_bid / self.decimal_multiplier,
+            "best_ask": best_ask / self.decimal_multiplier,
+            "order_book": MarketData.encode_depth(order_book.get("bid", []), order_book.get("ask", [])),
+        }
+
+    @property
+    def name(self):
+        return "ConvertMarketDataToTimeSeries"
+
+    @property
+    def to_version(self):
+        return 20261019
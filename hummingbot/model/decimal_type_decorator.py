@@ -9,6 +9,8 @@ class SqliteDecimal(TypeDecorator):
     stored in Sqlite database.
     """
     impl = BigInteger
+    # The scale is the only state of the type, so statements using it can be cached
+    cache_ok = True
 
     def __init__(self, scale):
         """
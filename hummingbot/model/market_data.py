@@ -1,25 +1,59 @@
 import inspect
+import struct
+import zlib
+from typing import Iterable, Tuple
 
-from sqlalchemy import JSON, Column, Index, Text
+import numpy as np
+from sqlalchemy import BigInteger, Column, Float, Integer, LargeBinary, Text
 
 from hummingbot.model import HummingbotBase
-from hummingbot.model.decimal_type_decorator import SqliteDecimal
+
+# Number of bid and ask levels, followed by the (price, amount) pairs of the bids and then of the asks as float64
+DEPTH_HEADER = struct.Struct("<II")
 
 
 class MarketData(HummingbotBase):
+    """
+    Order book snapshots collected by the markets recorder, stored as a time series per exchange and trading pair.
+
+    The primary key (exchange, trading_pair, timestamp) is the index used by the queries of a market over a time range.
+    The top of the book is kept in numeric columns, and the depth in a compressed binary blob (see `encode_depth`).
+    Old snapshots are downsampled: `resolution` is the number of seconds between consecutive snapshots of the row's
+    period.
+    """
     __tablename__ = "MarketData"
-    __table_args__ = (
-        Index("timestamp", "exchange", "trading_pair"),
-    )
-
-    timestamp = Column(SqliteDecimal(6), primary_key=True, nullable=False)
-    exchange = Column(Text, nullable=False)
-    trading_pair = Column(Text, nullable=False)
-    mid_price = Column(SqliteDecimal(6), nullable=False)
-    best_bid = Column(SqliteDecimal(6), nullable=False)
-    best_ask = Column(SqliteDecimal(6), nullable=False)
-    order_book = Column(JSON)
+
+    exchange = Column(Text, primary_key=True, nullable=False)
+    trading_pair = Column(Text, primary_key=True, nullable=False)
+    timestamp = Column(BigInteger, primary_key=True, nullable=False)
+    resolution = Column(Integer, nullable=False)
+    mid_price = Column(Float, nullable=False)
+    best_bid = Column(Float, nullable=False)
+    best_ask = Column(Float, nullable=False)
+    order_book = Column(LargeBinary)
 
     def __repr__(self) -> str:
         list_of_fields = [f"{name}: {value}" for name, value in inspect.getmembers(self) if isinstance(value, Column)]
         return ','.join(list_of_fields)
+
+    @staticmethod
+    def encode_depth(bids: Iterable, asks: Iterable) -> bytes:
+        """
+        :param bids: the bid levels, as (price, amount, ...) sequences (e.g. OrderBookRow)
+        :param asks: the ask levels, as (price, amount, ...) sequences
+        :return: the compressed binary representation of the levels
+        """
+        bid_levels = np.array([(float(level[0]), float(level[1])) for level in bids], dtype="<f8").reshape(-1, 2)
+        ask_levels = np.array([(float(level[0]), float(level[1])) for level in asks], dtype="<f8").reshape(-1, 2)
+        payload = DEPTH_HEADER.pack(len(bid_levels), len(ask_levels)) + bid_levels.tobytes() + ask_levels.tobytes()
+        return zlib.compress(payload, 1)
+
+    @staticmethod
+    def decode_depth(data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: the bid and ask levels as (n, 2) arrays of price and amount
+        """
+        payload = zlib.decompress(data)
+        num_bids, num_asks = DEPTH_HEADER.unpack_from(payload)
+        levels = np.frombuffer(payload, dtype="<f8", offset=DEPTH_HEADER.size).reshape(-1, 2)
+        return levels[:num_bids], levels[num_bids:num_bids + num_asks]
@@ -0,0 +1,145 @@
+import functools
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.market_data import MarketData
+from hummingbot.model.write_behind_queue import WriteBehindQueue
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+
+class DownsamplingTier(NamedTuple):
+    age: int  # snapshots older than this number of seconds are downsampled
+    resolution: int  # number of seconds between the snapshots kept
+
+
+def parse_duration(value: str) -> int:
+    """
+    :param value: a number of seconds, or a number followed by a unit (s, m, h or d), e.g. 5m
+    :return: the duration in seconds
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*([smhd]?)\s*", value)
+    if match is None:
+        raise ValueError(f"Invalid duration {value}. Expected a number followed by s, m, h or d (e.g. 5m).")
+    return int(match.group(1)) * DURATION_UNITS[match.group(2) or "s"]
+
+
+def parse_downsampling_tiers(value: str) -> List[DownsamplingTier]:
+    """
+    :param value: comma separated age:resolution pairs, e.g. "1d:5m,7d:1h" keeps one snapshot every 5 minutes after a
+        day and one per hour after a week. An empty value disables the downsampling.
+    :return: the tiers sorted by age
+    """
+    tiers = []
+    for tier in filter(None, (tier.strip() for tier in value.split(","))):
+        age, separator, resolution = tier.partition(":")
+        if separator == "":
+            raise ValueError(f"Invalid downsampling tier {tier}. Expected age:resolution (e.g. 1d:5m).")
+        tiers.append(DownsamplingTier(age=parse_duration(age), resolution=parse_duration(resolution)))
+    tiers.sort()
+    for previous, tier in zip(tiers, tiers[1:]):
+        if tier.resolution <= previous.resolution:
+            raise ValueError("The downsampling resolution must increase with the age of the snapshots.")
+    if any(tier.resolution <= 0 for tier in tiers):
+        raise ValueError("The downsampling resolution must be positive.")
+    return tiers
+
+
+class MarketDataStore(ABC):
+    """
+    Storage of the order book snapshots collected by the markets recorder.
+    """
+
+    @abstractmethod
+    def add_snapshots(self, snapshots: List[MarketData]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def apply_retention_policy(self, timestamp: float):
+        """
+        Downsamples the old snapshots and removes the expired ones.
+
+        :param timestamp: the current time, in seconds
+        """
+        raise NotImplementedError
+
+
+class SQLMarketDataStore(MarketDataStore):
+    """
+    Stores the snapshots in the `MarketData` table through the write-behind queue of the markets recorder, so the
+    inserts and the maintenance run on the database writer thread.
+
+    Downsampling keeps the last snapshot of each `resolution` long bucket. The buckets are aligned to the resolution,
+    and only the buckets entirely older than the tier's age are downsampled, so a bucket is never compacted while it can
+    still receive snapshots.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 write_queue: WriteBehindQueue,
+                 downsampling_tiers: Optional[List[DownsamplingTier]] = None,
+                 retention_days: int = 0,
+                 delete_chunk_size: int = 500):
+        """
+        :param write_queue: the queue the writes are submitted to
+        :param downsampling_tiers: the downsampling applied to the old snapshots
+        :param retention_days: the number of days the snapshots are kept, 0 to keep them forever
+        :param delete_chunk_size: maximum number of snapshots removed per statement
+        """
+        self._write_queue = write_queue
+        self._downsampling_tiers: List[DownsamplingTier] = sorted(downsampling_tiers or [])
+        self._retention_days = retention_days
+        self._delete_chunk_size = delete_chunk_size
+
+    def add_snapshots(self, snapshots: List[MarketData]):
+        self._write_queue.submit(functools.partial(Session.add_all, instances=snapshots))
+
+    def apply_retention_policy(self, timestamp: float):
+        self._write_queue.submit(functools.partial(self._apply_retention_policy, timestamp=timestamp))
+
+    def _apply_retention_policy(self, session: Session, timestamp: float):
+        if self._retention_days > 0:
+            expiration_ms = int((timestamp - self._retention_days * DURATION_UNITS["d"]) * 1e3)
+            session.execute(delete(MarketData).where(MarketData.timestamp < expiration_ms))
+        markets = session.execute(select(MarketData.exchange, MarketData.trading_pair).distinct()).all()
+        for tier in self._downsampling_tiers:
+            for exchange, trading_pair in markets:
+                self._downsample(session, exchange, trading_pair, tier, timestamp)
+
+    def _downsample(self, session: Session, exchange: str, trading_pair: str, tier: DownsamplingTier,
+                    timestamp: float):
+        bucket_ms = tier.resolution * 1000
+        cutoff_ms = int((timestamp - tier.age) * 1e3) // bucket_ms * bucket_ms
+        filters = [MarketData.exchange == exchange,
+                   MarketData.trading_pair == trading_pair,
+                   MarketData.timestamp < cutoff_ms,
+                   MarketData.resolution < tier.resolution]
+        timestamps = np.array(
+            session.execute(select(MarketData.timestamp).where(*filters).order_by(MarketData.timestamp)).scalars().all(),
+            dtype=np.int64)
+        if len(timestamps) == 0:
+            return
+        buckets = timestamps // bucket_ms
+        is_last_of_bucket = np.append(buckets[1:] != buckets[:-1], True)
+        removed_timestamps = timestamps[~is_last_of_bucket].tolist()
+        for start in range(0, len(removed_timestamps), self._delete_chunk_size):
+            session.execute(delete(MarketData).where(
+                MarketData.exchange == exchange,
+                MarketData.trading_pair == trading_pair,
+                MarketData.timestamp.in_(removed_timestamps[start:start + self._delete_chunk_size])))
+        session.execute(update(MarketData).where(*filters).values(resolution=tier.resolution))
+        self.logger().debug(f"Downsampled {len(timestamps)} {exchange} {trading_pair} snapshots to "
+                            f"{len(timestamps) - len(removed_timestamps)}.")
@@ -1,14 +1,32 @@
+import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import numpy
 import pandas as pd
-from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text
+from dateutil.tz import tzlocal
+from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text, select, type_coerce
 from sqlalchemy.orm import Session, relationship
 
 from hummingbot.core.event.events import PositionAction
 from hummingbot.model import HummingbotBase
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.order import Order
+
+# Columns of the DataFrames returned by TradeFill.get_trades_frame
+TRADES_FRAME_COLUMNS = ["exchange_trade_id",
+                        "market",
+                        "symbol",
+                        "timestamp",
+                        "order_id",
+                        "trade_type",
+                        "order_type",
+                        "price",
+                        "amount",
+                        "leverage",
+                        "position",
+                        "trade_fee",
+                        "order_creation_timestamp"]
 
 
 class TradeFill(HummingbotBase):
@@ -128,6 +146,98 @@ class TradeFill(HummingbotBase):
 
         return df
 
+    @staticmethod
+    def get_trades_frame(sql_session: Session,
+                         start_time: Optional[int] = None,
+                         config_file_path: Optional[str] = None,
+                         number_of_rows: Optional[int] = None,
+                         chunk_size: int = 100000) -> pd.DataFrame:
+        """
+        Reads the trade fills with a core select of only the columns needed by the reports, in chunks, without
+        creating ORM objects. The prices and amounts are read as the scaled integers stored in the database and
+        converted to floats column-wise, and the trade fee is kept as its JSON text.
+        :param sql_session: the session to run the query in
+        :param start_time: the minimum timestamp of the trades (in milliseconds)
+        :param config_file_path: only returns the trades of the configs whose file path contains this value
+        :param number_of_rows: when set, only the latest number_of_rows trades are returned
+        :param chunk_size: number of rows fetched from the database at a time
+        :return: a DataFrame with the TRADES_FRAME_COLUMNS columns, in ascending timestamp order
+        """
+        filters = []
+        if start_time is not None:
+            filters.append(TradeFill.timestamp >= start_time)
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        query = (select(TradeFill.exchange_trade_id,
+                        TradeFill.market,
+                        TradeFill.symbol,
+                        TradeFill.timestamp,
+                        TradeFill.order_id,
+                        TradeFill.trade_type,
+                        TradeFill.order_type,
+                        type_coerce(TradeFill.price, BigInteger).label("price"),
+                        type_coerce(TradeFill.amount, BigInteger).label("amount"),
+                        TradeFill.leverage,
+                        TradeFill.position,
+                        type_coerce(TradeFill.trade_fee, Text).label("trade_fee"),
+                        Order.creation_timestamp.label("order_creation_timestamp"))
+                 .select_from(TradeFill)
+                 .outerjoin(Order, Order.id == TradeFill.order_id)
+                 .where(*filters)
+                 .order_by(TradeFill.timestamp.desc()))
+        if number_of_rows is not None:
+            query = query.limit(number_of_rows)
+
+        # Executed on the connection to skip the ORM result processing
+        result = sql_session.connection().execute(query.execution_options(stream_results=True))
+        chunks = []
+        while True:
+            rows = result.fetchmany(chunk_size)
+            if len(rows) == 0:
+                break
+            chunks.append(pd.DataFrame.from_records(rows, columns=TRADES_FRAME_COLUMNS))
+        if len(chunks) == 0:
+            return pd.DataFrame(columns=TRADES_FRAME_COLUMNS)
+
+        df = pd.concat(chunks, ignore_index=True)
+        # Ascending timestamp order, as the trades returned by the ORM queries
+        df = df.iloc[::-1].reset_index(drop=True)
+        df["price"] = df["price"].to_numpy(dtype="float64") / TradeFill.price.type.multiplier_int
+        df["amount"] = df["amount"].to_numpy(dtype="float64") / TradeFill.amount.type.multiplier_int
+        df["order_creation_timestamp"] = df["order_creation_timestamp"].astype("float64")
+        if not isinstance(df["trade_fee"].iat[0], str):
+            # Database drivers with a native JSON type return the fees already parsed
+            df["trade_fee"] = df["trade_fee"].map(json.dumps)
+        return df
+
+    @classmethod
+    def trades_frame_to_pandas(cls, trades: pd.DataFrame) -> pd.DataFrame:
+        """
+        The same display table as `to_pandas`, built column-wise from a frame returned by `get_trades_frame`
+        """
+        timestamps = trades["timestamp"].to_numpy(dtype="float64")
+        # The age is zero while the order creation update has not arrived yet
+        creation_timestamps = trades["order_creation_timestamp"].fillna(trades["timestamp"]).to_numpy(dtype="float64")
+        ages = numpy.trunc(timestamps / 1e3 - creation_timestamps / 1e3).astype("int64")
+        df = pd.DataFrame({
+            "Id": trades["exchange_trade_id"].to_numpy(),
+            "Timestamp": (pd.to_datetime(numpy.trunc(timestamps / 1e3).astype("int64"), unit="s", utc=True)
+                          .tz_convert(tzlocal())
+                          .strftime("%Y-%m-%d %H:%M:%S")),
+            "Exchange": trades["market"].to_numpy(),
+            "Market": trades["symbol"].to_numpy(),
+            "Order_type": trades["order_type"].str.lower().to_numpy(),
+            "Side": trades["trade_type"].str.lower().to_numpy(),
+            "Price": trades["price"].to_numpy(),
+            "Amount": trades["amount"].to_numpy(),
+            "Leverage": trades["leverage"].to_numpy(),
+            "Position": trades["position"].to_numpy(),
+            "Age": pd.to_datetime(ages, unit="s").strftime("%H:%M:%S"),
+        })
+        df.set_index("Id", inplace=True)
+
+        return df
+
     @staticmethod
     def to_bounty_api_json(trade_fill: "TradeFill") -> Dict[str, Any]:
         return {
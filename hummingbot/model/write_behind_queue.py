@@ -0,0 +1,177 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+DBWrite = Callable[[Session], None]
+CommitCallback = Callable[[], None]
+
+
+class WriteBehindQueue:
+    """
+    Moves database writes off the event loop. Writes are queued in memory and a dedicated writer thread runs them in a
+    single transaction per batch, at most every `flush_interval` seconds.
+
+    Coalesced writes are identified by a key and only the latest one submitted for a key is run in a batch. They are
+    meant for snapshots (e.g. the saved state of a market) where intermediate versions do not need to be stored, and
+    they run after the ordered writes of the same batch.
+
+    A write can come with a callback run in the writer thread once the write is committed, for side effects that must
+    not be repeated or happen for records that are not stored (e.g. exporting them to a file).
+
+    Writes submitted while the writer thread is not running are executed immediately on the calling thread.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql_manager: SQLConnectionManager, flush_interval: float = 0.1, max_batch_size: int = 1000):
+        """
+        :param sql_manager: the database the writes go to
+        :param flush_interval: maximum time (in seconds) a write waits in the queue
+        :param max_batch_size: number of queued writes that triggers a flush before the interval elapses
+        """
+        self._sql_manager = sql_manager
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._condition = threading.Condition()
+        self._writes: List[Tuple[DBWrite, Optional[CommitCallback]]] = []
+        self._coalesced_writes: "OrderedDict[Hashable, DBWrite]" = OrderedDict()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._running = False
+        self._flush_requested = False
+        # Number of batches taken from the queue and written, to wait for the writes submitted before a flush
+        self._taken_batches = 0
+        self._written_batches = 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def pending_writes(self) -> int:
+        with self._condition:
+            return len(self._writes) + len(self._coalesced_writes)
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._writer_thread = threading.Thread(target=self._write_loop, name="db_write_behind", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self):
+        """
+        Writes everything still queued and stops the writer thread.
+        """
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._condition.notify_all()
+        self._writer_thread.join()
+        self._writer_thread = None
+
+    def submit(self, write: DBWrite, on_commit: Optional[CommitCallback] = None):
+        """
+        :param write: the database operations, run in the session of the batch
+        :param on_commit: called once the transaction including the write is committed
+        """
+        with self._condition:
+            if self._running:
+                self._writes.append((write, on_commit))
+                if len(self._writes) >= self._max_batch_size:
+                    self._condition.notify_all()
+                return
+        self._write_batch([(write, on_commit)], [])
+
+    def submit_coalesced(self, key: Hashable, write: DBWrite):
+        with self._condition:
+            if self._running:
+                self._coalesced_writes.pop(key, None)
+                self._coalesced_writes[key] = write
+                return
+        self._write_batch([], [(write, None)])
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the writes submitted so far have been written.
+
+        :return: False if the timeout elapsed before
+        """
+        with self._condition:
+            if not self._running:
+                return True
+            target_batch = self._taken_batches + 1
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._written_batches >= target_batch or not self._running,
+                                            timeout)
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: (not self._running
+                             or self._flush_requested
+                             or len(self._writes) >= self._max_batch_size),
+                    self._flush_interval)
+                running = self._running
+                self._flush_requested = False
+                writes, self._writes = self._writes, []
+                coalesced_writes = [(write, None) for write in self._coalesced_writes.values()]
+                self._coalesced_writes.clear()
+                self._taken_batches += 1
+                batch_number = self._taken_batches
+            self._write_batch(writes, coalesced_writes)
+            with self._condition:
+                self._written_batches = batch_number
+                self._condition.notify_all()
+            if not running:
+                return
+
+    def _write_batch(self,
+                     writes: List[Tuple[DBWrite, Optional[CommitCallback]]],
+                     coalesced_writes: List[Tuple[DBWrite, Optional[CommitCallback]]]):
+        all_writes = writes + coalesced_writes
+        if len(all_writes) == 0:
+            return
+        try:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    for write, _ in all_writes:
+                        write(session)
+        except Exception:
+            self.logger().warning(f"Failed to write a batch of {len(all_writes)} records. Writing them one by one.",
+                                  exc_info=True)
+            # A single bad write should not lose the rest of the batch
+            for write, on_commit in all_writes:
+                try:
+                    with self._sql_manager.get_new_session() as session:
+                        with session.begin():
+                            write(session)
+                except Exception:
+                    self.logger().error("Unexpected error writing a record to the database.", exc_info=True)
+                else:
+                    self._run_commit_callback(on_commit)
+        else:
+            for _, on_commit in all_writes:
+                self._run_commit_callback(on_commit)
+
+    def _run_commit_callback(self, on_commit: Optional[CommitCallback]):
+        if on_commit is None:
+            return
+        try:
+            on_commit()
+        except Exception:
+            self.logger().error("Unexpected error after writing a record to the database.", exc_info=True)
@@ -34,6 +34,33 @@ class LogMessage(PubSubMessage):
     logger_name: str = ''
 
 
+class EventFrameMessage(PubSubMessage):
+    """
+    Frame of the internal events and log records published on the frames topic (`{namespace}/{instance_id}/frames`)
+    when the MQTT batching is enabled, encoded with msgpack or JSON (`mqtt_batch_encoding`).
+
+    - version: version of the frame schema
+    - seq: sequence number of the frame, starting at 0 when the gateway starts
+    - timestamp: time (in seconds) the frame was published
+    - dropped: number of events and log records dropped since the previous frame, while the broker was disconnected
+    - events: the internal events in the order they were emitted, with the fields of `InternalEventMessage`
+      (timestamp, type, data)
+    - logs: the log records in the order they were logged, with the fields of `LogMessage`
+      (timestamp, msg, level_no, level_name, logger_name)
+    """
+    version: int = 1
+    seq: int = 0
+    timestamp: float = 0.0
+    dropped: int = 0
+    events: List[Dict[str, Any]] = []
+    logs: List[Dict[str, Any]] = []
+
+
+class MetricsMessage(PubSubMessage):
+    timestamp: float = 0.0
+    metrics: Dict[str, Any] = {}
+
+
 class ExternalEventMessage(PubSubMessage):
     timestamp: Optional[int] = -1
     sequence: Optional[int] = 0
@@ -116,6 +143,29 @@ class HistoryCommandMessage(RPCMessage):
         trades: Optional[List[Any]] = []
 
 
+class ProfileCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        duration: Optional[float] = 10.0
+        interval: Optional[float] = 5.0
+        trace_calls: Optional[bool] = False
+        async_backend: Optional[bool] = True
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+        data: Optional[Dict[str, Any]] = {}
+
+
+class TickProfileCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        reset: Optional[bool] = False
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+        data: Optional[Dict[str, Any]] = {}
+
+
 class BalanceLimitCommandMessage(RPCMessage):
     class Request(RPCMessage.Request):
         exchange: str
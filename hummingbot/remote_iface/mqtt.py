@@ -9,24 +9,26 @@ from collections import deque
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple, Type
 
 from hummingbot import get_logging_conf
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.connector.connector_base import ConnectorBase
-from hummingbot.logger import HummingbotLogger
+from hummingbot.logger import HummingbotLogger, log_queue
 
 if TYPE_CHECKING:  # pragma: no cover
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
     from hummingbot.core.event.event_listener import EventListener  # noqa: F401
 
 from commlib.node import Node, NodeState
+from commlib.serializer import ContentType, JSONSerializer, Serializer
 from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParameters
 
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee
 from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.metrics import MetricsRegistry
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
 from hummingbot.notifier.notifier_base import NotifierBase
@@ -36,18 +38,27 @@ from hummingbot.remote_iface.messages import (
     BalancePaperCommandMessage,
     CommandShortcutMessage,
     ConfigCommandMessage,
+    EventFrameMessage,
     ExternalEventMessage,
     HistoryCommandMessage,
     ImportCommandMessage,
     InternalEventMessage,
     LogMessage,
+    MetricsMessage,
     NotifyMessage,
+    ProfileCommandMessage,
     StartCommandMessage,
     StatusCommandMessage,
     StatusUpdateMessage,
     StopCommandMessage,
+    TickProfileCommandMessage,
 )
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
 mqtts_logger: HummingbotLogger = None
 
 
@@ -61,6 +72,8 @@ class CommandTopicSpecs:
     BALANCE_LIMIT: str = '/balance/limit'
     BALANCE_PAPER: str = '/balance/paper'
     COMMAND_SHORTCUT: str = '/command_shortcuts'
+    PROFILE: str = '/profile'
+    TICK_PROFILE: str = '/tick_profile'
 
 
 class TopicSpecs:
@@ -72,6 +85,8 @@ class TopicSpecs:
     STATUS_UPDATES: str = '/status_updates'
     HEARTBEATS: str = '/hb'
     EXTERNAL_EVENTS: str = '/external/event/*'
+    FRAMES: str = '/frames'
+    METRICS: str = '/metrics'
 
 
 class MQTTCommands:
@@ -100,6 +115,8 @@ class MQTTCommands:
         self._balance_limit_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_LIMIT}'
         self._balance_paper_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_PAPER}'
         self._shortcuts_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.COMMAND_SHORTCUT}'
+        self._profile_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.PROFILE}'
+        self._tick_profile_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.TICK_PROFILE}'
 
         self._init_commands()
 
@@ -149,6 +166,16 @@ class MQTTCommands:
             msg_type=CommandShortcutMessage,
             on_request=self._on_cmd_command_shortcut
         )
+        self._node.create_rpc(
+            rpc_name=self._profile_uri,
+            msg_type=ProfileCommandMessage,
+            on_request=self._on_cmd_profile
+        )
+        self._node.create_rpc(
+            rpc_name=self._tick_profile_uri,
+            msg_type=TickProfileCommandMessage,
+            on_request=self._on_cmd_tick_profile
+        )
 
     def _on_cmd_start(self, msg: StartCommandMessage.Request):
         response = StartCommandMessage.Response()
@@ -347,6 +374,58 @@ class MQTTCommands:
             response.msg = str(e)
         return response
 
+    def _on_cmd_profile(self, msg: ProfileCommandMessage.Request):
+        response = ProfileCommandMessage.Response()
+        timeout = msg.duration + 30  # seconds
+        try:
+            if msg.async_backend:
+                self._hb_app.profile(msg.duration, msg.interval, msg.trace_calls)
+            else:
+                res = call_sync(
+                    self._hb_app.profile_bot(msg.duration, msg.interval, msg.trace_calls),
+                    loop=self._ev_loop,
+                    timeout=timeout
+                )
+                if res is None:
+                    response.status = MQTT_STATUS_CODE.ERROR
+                    response.msg = 'The bot could not be profiled, a profile may already be running.'
+                else:
+                    response.data = res
+        except asyncio.exceptions.TimeoutError:
+            response.msg = f'Hummingbot profile command timed out after {timeout} seconds'
+            response.status = MQTT_STATUS_CODE.ERROR
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
+    def _on_cmd_tick_profile(self, msg: TickProfileCommandMessage.Request):
+        response = TickProfileCommandMessage.Response()
+        try:
+            tick_profile = self._tick_profile(reset=msg.reset)
+            if tick_profile is None:
+                response.status = MQTT_STATUS_CODE.ERROR
+                response.msg = 'Tick profiling is not enabled or no strategy is running.'
+            else:
+                response.data = tick_profile
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
+    def _tick_profile(self, reset: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        :param reset: whether to reset the tick profiler after reading it, to get the next profile from now on
+        :return: the tick profile of the running clock, None if it is not profiled
+        """
+        clock = self._hb_app.clock
+        if clock is None or clock.tick_profiler is None:
+            return None
+        tick_profile = clock.tick_profiler.to_dict()
+        if reset:
+            clock.tick_profiler.reset()
+        return tick_profile
+
     def _on_cmd_command_shortcut(self, msg: CommandShortcutMessage.Request):
         response = CommandShortcutMessage.Response()
         try:
@@ -359,6 +438,25 @@ class MQTTCommands:
 
 
 class MQTTMarketEventForwarder:
+    MARKET_EVENTS: Tuple[events.MarketEvent, ...] = (
+        events.MarketEvent.BuyOrderCreated,
+        events.MarketEvent.BuyOrderCompleted,
+        events.MarketEvent.SellOrderCreated,
+        events.MarketEvent.SellOrderCompleted,
+        events.MarketEvent.OrderFilled,
+        events.MarketEvent.OrderFailure,
+        events.MarketEvent.OrderCancelled,
+        events.MarketEvent.OrderExpired,
+        events.MarketEvent.FundingPaymentCompleted,
+        events.MarketEvent.RangePositionLiquidityAdded,
+        events.MarketEvent.RangePositionLiquidityRemoved,
+        events.MarketEvent.RangePositionUpdate,
+        events.MarketEvent.RangePositionUpdateFailure,
+        events.MarketEvent.RangePositionFeeCollected,
+        events.MarketEvent.RangePositionClosed,
+    )
+    _EVENT_TYPES: Dict[int, str] = {event.value: event.name for event in MARKET_EVENTS}
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global mqtts_logger
@@ -387,21 +485,7 @@ class MQTTMarketEventForwarder:
         self._mqtt_fowarder: SourceInfoEventForwarder = \
             SourceInfoEventForwarder(self._send_mqtt_event)
         self._market_event_pairs: List[Tuple[int, EventListener]] = [
-            (events.MarketEvent.BuyOrderCreated, self._mqtt_fowarder),
-            (events.MarketEvent.BuyOrderCompleted, self._mqtt_fowarder),
-            (events.MarketEvent.SellOrderCreated, self._mqtt_fowarder),
-            (events.MarketEvent.SellOrderCompleted, self._mqtt_fowarder),
-            (events.MarketEvent.OrderFilled, self._mqtt_fowarder),
-            (events.MarketEvent.OrderFailure, self._mqtt_fowarder),
-            (events.MarketEvent.OrderCancelled, self._mqtt_fowarder),
-            (events.MarketEvent.OrderExpired, self._mqtt_fowarder),
-            (events.MarketEvent.FundingPaymentCompleted, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionLiquidityAdded, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionLiquidityRemoved, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionUpdate, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionUpdateFailure, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionFeeCollected, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionClosed, self._mqtt_fowarder),
+            (event, self._mqtt_fowarder) for event in self.MARKET_EVENTS
         ]
 
         self.event_fw_pub = self._node.create_publisher(
@@ -418,27 +502,7 @@ class MQTTMarketEventForwarder:
                 event
             )
             return
-        try:
-            event_types = {
-                events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
-                events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
-                events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
-                events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
-                events.MarketEvent.OrderFilled.value: "OrderFilled",
-                events.MarketEvent.OrderCancelled.value: "OrderCancelled",
-                events.MarketEvent.OrderExpired.value: "OrderExpired",
-                events.MarketEvent.OrderFailure.value: "OrderFailure",
-                events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
-                events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
-                events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
-                events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
-                events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
-                events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
-                events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
-            }
-            event_type = event_types[event_tag]
-        except KeyError:
-            event_type = "Unknown"
+        event_type = self._EVENT_TYPES.get(event_tag, "Unknown")
 
         if is_dataclass(event):
             event_data = asdict(event)
@@ -457,6 +521,9 @@ class MQTTMarketEventForwarder:
 
         event_data = self._make_event_payload(event_data)
 
+        if self._node.frames is not None:
+            self._node.frames.add_event({"timestamp": int(timestamp), "type": event_type, "data": event_data})
+            return
         self.event_fw_pub.publish(
             InternalEventMessage(
                 timestamp=int(timestamp),
@@ -570,6 +637,187 @@ class MQTTStatusUpdates:
         self.status_updates_pub.stop()
 
 
+class MsgpackSerializer(Serializer):
+    CONTENT_TYPE: str = ContentType.raw_bytes
+    CONTENT_ENCODING: str = 'msgpack'
+
+    @staticmethod
+    def serialize(data: Dict[str, Any]) -> bytes:
+        # The values msgpack does not support (e.g. enums) are converted as the JSON serializer does
+        return msgpack.packb(data, use_bin_type=True, default=JSONSerializer.make_primitive_value)
+
+    @staticmethod
+    def deserialize(data: bytes) -> Dict[str, Any]:
+        return msgpack.unpackb(data, raw=False)
+
+
+class MQTTFrameBatcher:
+    """
+    Aggregates the forwarded internal events and log records into frames (see `EventFrameMessage` for their schema),
+    published on the frames topic once a frame has `max_size` entries, or `interval` seconds after its first entry.
+
+    While the broker is disconnected the frames are not published and their entries are kept, up to `max_pending`
+    entries. Beyond it the oldest entries are dropped, and counted in the `dropped` field of the next frame.
+    """
+    EVENTS = "events"
+    LOGS = "logs"
+
+    def __init__(self,
+                 hb_app: "HummingbotApplication",
+                 node: "MQTTGateway",
+                 interval: float,
+                 max_size: int,
+                 max_pending: int,
+                 encoding: str = "msgpack"):
+        self._hb_app = hb_app
+        self._node = node
+        self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
+        self._interval = interval
+        self._max_size = max_size
+        self._max_pending = max(max_pending, max_size)
+        self._pending: Deque[Tuple[str, Dict[str, Any]]] = deque()
+        self._dropped = 0
+        self._seq = 0
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+
+        topic_prefix = TopicSpecs.PREFIX.format(
+            namespace=self._node.namespace,
+            instance_id=self._hb_app.instance_id
+        )
+        self._topic = f'{topic_prefix}{TopicSpecs.FRAMES}'
+        self.frame_pub = self._node.create_publisher(topic=self._topic,
+                                                     msg_type=EventFrameMessage,
+                                                     serializer=self._serializer(encoding))
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def add_event(self, event: Dict[str, Any]):
+        self._add_entry(self.EVENTS, event)
+
+    def add_log(self, log: Dict[str, Any]):
+        self._add_entry(self.LOGS, log)
+
+    def flush(self):
+        """
+        Publishes the pending entries, in frames of at most `max_size` entries, unless the broker is disconnected.
+        """
+        self._cancel_flush_timer()
+        if len(self._pending) == 0:
+            return
+        if not self._node.health:
+            self._flush_timer = self._ev_loop.call_later(self._interval, self.flush)
+            return
+        while len(self._pending) > 0:
+            entries = {self.EVENTS: [], self.LOGS: []}
+            for _ in range(min(self._max_size, len(self._pending))):
+                kind, entry = self._pending.popleft()
+                entries[kind].append(entry)
+            self.frame_pub.publish(
+                EventFrameMessage(
+                    seq=self._seq,
+                    timestamp=self._time(),
+                    dropped=self._dropped,
+                    events=entries[self.EVENTS],
+                    logs=entries[self.LOGS],
+                )
+            )
+            self._seq += 1
+            self._dropped = 0
+
+    def stop(self):
+        """
+        Publishes the pending entries if the broker is connected, they are dropped otherwise.
+        """
+        self._cancel_flush_timer()
+        if self._node.health:
+            self.flush()
+
+    def _add_entry(self, kind: str, entry: Dict[str, Any]):
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            self._ev_loop.call_soon_threadsafe(self._add_entry, kind, entry)
+            return
+        if len(self._pending) >= self._max_pending:
+            self._pending.popleft()
+            self._dropped += 1
+        self._pending.append((kind, entry))
+        if len(self._pending) >= self._max_size:
+            if self._flush_timer is None or self._node.health:
+                self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = self._ev_loop.call_later(self._interval, self.flush)
+
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    @staticmethod
+    def _serializer(encoding: str) -> Type[Serializer]:
+        if encoding == "msgpack":
+            if msgpack is not None:
+                return MsgpackSerializer
+            logging.getLogger(__name__).warning("msgpack is not installed, the MQTT frames will be encoded with JSON.")
+        return JSONSerializer
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+class MQTTMetricsPublisher:
+    """
+    Publishes the metrics of the registry (see `MetricsRegistry.to_json`) every `interval` seconds.
+    """
+
+    def __init__(self,
+                 hb_app: "HummingbotApplication",
+                 node: "MQTTGateway",
+                 interval: float,
+                 registry: Optional[MetricsRegistry] = None):
+        self._hb_app = hb_app
+        self._node = node
+        self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
+        self._interval = interval
+        self._registry = registry or MetricsRegistry.get_instance()
+        self._publish_task: Optional[asyncio.Task] = None
+
+        topic_prefix = TopicSpecs.PREFIX.format(
+            namespace=self._node.namespace,
+            instance_id=self._hb_app.instance_id
+        )
+        self._topic = f'{topic_prefix}{TopicSpecs.METRICS}'
+        self.metrics_pub = self._node.create_publisher(topic=self._topic, msg_type=MetricsMessage)
+
+    def start(self):
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            self._ev_loop.call_soon_threadsafe(self.start)
+            return
+        if self._publish_task is None:
+            self._publish_task = safe_ensure_future(self._publish_loop(), loop=self._ev_loop)
+
+    def stop(self):
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            self._publish_task = None
+
+    def publish(self):
+        self.metrics_pub.publish(MetricsMessage(**self._registry.to_json()))
+
+    async def _publish_loop(self):
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                self.publish()
+            except Exception:
+                self._hb_app.logger().error("Unexpected error publishing the metrics.", exc_info=True)
+
+
 class MQTTGateway(Node):
     NODE_NAME: str = 'hbot.$instance_id'
     _instance: Optional["MQTTGateway"] = None
@@ -601,6 +849,8 @@ class MQTTGateway(Node):
         self._market_events: MQTTMarketEventForwarder = None
         self._commands: MQTTCommands = None
         self._logh: MQTTLogHandler = None
+        self._frames: MQTTFrameBatcher = None
+        self._metrics: MQTTMetricsPublisher = None
         self._external_events: MQTTExternalEvents = None
         self._hb_app: "HummingbotApplication" = hb_app
         self._ev_loop = self._hb_app.ev_loop
@@ -629,6 +879,13 @@ class MQTTGateway(Node):
     def health(self):
         return self._health
 
+    @property
+    def frames(self) -> Optional[MQTTFrameBatcher]:
+        """
+        The batcher of the events and logs when the MQTT batching is enabled, None otherwise.
+        """
+        return self._frames
+
     def _safe_get_log_handlers(self, max_tries=3):  # pragma: no cover
         current_try = 0
         while current_try < max_tries:
@@ -656,6 +913,32 @@ class MQTTGateway(Node):
 
         self._logh = None
 
+    def _init_frames(self):
+        mqtt_bridge = self._hb_app.client_config_map.mqtt_bridge
+        if mqtt_bridge.mqtt_batching:
+            self._frames = MQTTFrameBatcher(self._hb_app,
+                                            self,
+                                            interval=mqtt_bridge.mqtt_batch_interval,
+                                            max_size=mqtt_bridge.mqtt_batch_max_size,
+                                            max_pending=mqtt_bridge.mqtt_batch_max_pending,
+                                            encoding=mqtt_bridge.mqtt_batch_encoding)
+
+    def _remove_frames(self):
+        if self._frames is not None:
+            self._frames.stop()
+            self._frames = None
+
+    def _init_metrics(self):
+        interval = self._hb_app.client_config_map.metrics.metrics_mqtt_interval
+        if interval > 0:
+            self._metrics = MQTTMetricsPublisher(self._hb_app, self, interval)
+            self._metrics.start()
+
+    def _remove_metrics(self):
+        if self._metrics is not None:
+            self._metrics.stop()
+            self._metrics = None
+
     def _init_logger(self):
         self._logh = MQTTLogHandler(self._hb_app, self)
         self.patch_loggers()
@@ -686,10 +969,10 @@ class MQTTGateway(Node):
         return logging.getLogger()
 
     def remove_log_handler(self, logger: HummingbotLogger):
-        logger.removeHandler(self._logh)
+        log_queue.remove_handler(logger, self._logh)
 
     def add_log_handler(self, logger: HummingbotLogger):
-        logger.addHandler(self._logh)
+        log_queue.add_handler(logger, self._logh)
 
     def _init_notifier(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_notifier:
@@ -840,11 +1123,13 @@ class MQTTGateway(Node):
         self._stop_event_async.set()
 
     def start(self, with_health: bool = True) -> None:
+        self._init_frames()
         self._init_logger()
         self._init_notifier()
         self._init_status_updates()
         self._init_commands()
         self._init_external_events()
+        self._init_metrics()
 
         if with_health:
             self._start_health_monitoring_loop()
@@ -854,10 +1139,13 @@ class MQTTGateway(Node):
 
     def stop(self, with_health: bool = True):
         self.broadcast_status_update("offline", msg_type="availability")
+        # The last frame is published before the publishers are stopped
+        self._remove_frames()
         super().stop()
         if self._hb_thread:
             self._hb_thread.stop()
         self._remove_status_updates()
+        self._remove_metrics()
         self._remove_notifier()
         self._remove_log_handlers()
         self._remove_market_event_listeners()
@@ -893,10 +1181,16 @@ class MQTTLogHandler(logging.Handler):
                                                    msg_type=LogMessage)
 
     def emit(self, record: logging.LogRecord):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(self.emit, record)
-            return
         msg_str = self.format(record)
+        if self._node.frames is not None:
+            self._node.frames.add_log({
+                "timestamp": time.time(),
+                "msg": msg_str,
+                "level_no": record.levelno,
+                "level_name": record.levelname,
+                "logger_name": record.name,
+            })
+            return
         msg = LogMessage(
             timestamp=time.time(),
             msg=msg_str,
@@ -905,6 +1199,10 @@ class MQTTLogHandler(logging.Handler):
             logger_name=record.name
 
         )
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            # The record is formatted by the calling (e.g. log queue) thread, only the publishing is done by the loop
+            self._ev_loop.call_soon_threadsafe(self.log_pub.publish, msg)
+            return
         self.log_pub.publish(msg)
 
 
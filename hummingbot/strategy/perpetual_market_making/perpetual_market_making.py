@@ -2,7 +2,7 @@ import logging
 from decimal import Decimal
 from itertools import chain
 from math import ceil, floor
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -27,6 +27,7 @@ from hummingbot.strategy.perpetual_market_making.data_types import PriceSize, Pr
 from hummingbot.strategy.perpetual_market_making.perpetual_market_making_order_tracker import (
     PerpetualMarketMakingOrderTracker,
 )
+from hummingbot.strategy.status_sections import StatusSections
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.strategy.utils import order_age
 
@@ -133,10 +134,15 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
 
         self._position_mode_ready = False
         self._position_mode_not_ready_counter = 0
+        self._status_sections = StatusSections()
 
     def all_markets_ready(self):
         return all([market.ready for market in self.active_markets])
 
+    @property
+    def status_sections(self) -> StatusSections:
+        return self._status_sections
+
     @property
     def order_refresh_tolerance_pct(self) -> Decimal:
         return self._order_refresh_tolerance_pct
@@ -385,6 +391,10 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
         return pd.DataFrame(data=data, columns=columns)
 
     def market_status_data_frame(self) -> pd.DataFrame:
+        markets_columns, markets_data = self.market_status_data()
+        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+
+    def market_status_data(self) -> Tuple[List[str], List[List]]:
         markets_data = []
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"Ref Price ({self._price_type.name})"]
         if self._price_type is PriceType.LastOwnTrade and self._last_own_trade_price.is_nan():
@@ -407,7 +417,7 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
                 float(ask_price),
                 float(ref_price)
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return markets_columns, markets_data
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
@@ -415,27 +425,47 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
         lines = []
         warning_lines = []
 
-        markets_df = self.market_status_data_frame()
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+        # The sections are only formatted again when their inputs change, see StatusSections
+        markets_columns, markets_data = self.market_status_data()
+        lines.extend(["", "  Markets:", self._status_sections.render(
+            "markets",
+            lambda: self._format_markets_section(markets_columns, markets_data),
+            inputs=(markets_columns, [row[:2] for row in markets_data]),
+            prices=[price for row in markets_data for price in row[2:]],
+        )])
 
-        assets_df = map_df_to_str(self.perpetual_mm_assets_df())
-
-        first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+        market, trading_pair, base_asset, quote_asset = self._market_info
+        lines.extend(["", "  Assets:", self._status_sections.render(
+            "assets",
+            self._format_assets_section,
+            inputs=(market.get_balance(quote_asset), market.get_available_balance(quote_asset)),
+        )])
 
         # See if there're any open orders.
-        if len(self.active_orders) > 0:
-            df = self.active_orders_df()
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        active_orders = self.active_orders
+        if len(active_orders) > 0:
+            lines.extend(["", "  Orders:", self._status_sections.render(
+                "orders",
+                self._format_orders_section,
+                inputs=([(o.client_order_id, o.is_buy, o.price, o.quantity) for o in active_orders],
+                        self.current_timestamp,
+                        self._order_amount,
+                        self._order_level_amount),
+                prices=[self.get_price()],
+            )])
         else:
             lines.extend(["", "  No active maker orders."])
 
         # See if there're any active positions.
-        if len(self.active_positions) > 0:
-            df = self.active_positions_df()
-            lines.extend(["", "  Positions:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        active_positions = list(self.active_positions.values())
+        if len(active_positions) > 0:
+            lines.extend(["", "  Positions:", self._status_sections.render(
+                "positions",
+                self._format_positions_section,
+                inputs=[(p.trading_pair, p.position_side, p.entry_price, p.amount, p.leverage)
+                        for p in active_positions],
+                prices=[market.get_price(trading_pair, True), market.get_price(trading_pair, False)],
+            )])
         else:
             lines.extend(["", "  No active positions."])
 
@@ -444,6 +474,26 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
 
         return "\n".join(lines)
 
+    def _format_markets_section(self, markets_columns: List[str], markets_data: List[List]) -> str:
+        markets_df = pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return "\n".join(["    " + line for line in markets_df.to_string(index=False).split("\n")])
+
+    def _format_assets_section(self) -> str:
+        assets_df = map_df_to_str(self.perpetual_mm_assets_df())
+
+        first_col_length = max(*assets_df[0].apply(len))
+        df_lines = assets_df.to_string(index=False, header=False,
+                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
+        return "\n".join(["    " + line for line in df_lines])
+
+    def _format_orders_section(self) -> str:
+        df = self.active_orders_df()
+        return "\n".join(["    " + line for line in df.to_string(index=False).split("\n")])
+
+    def _format_positions_section(self) -> str:
+        df = self.active_positions_df()
+        return "\n".join(["    " + line for line in df.to_string(index=False).split("\n")])
+
     def tick(self, timestamp: float):
         if not self._position_mode_ready:
             self._position_mode_not_ready_counter += 1
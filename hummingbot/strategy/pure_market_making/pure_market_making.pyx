@@ -1,7 +1,7 @@
 import logging
 from decimal import Decimal
 from math import ceil, floor
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -19,6 +19,7 @@ from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 from hummingbot.strategy.hanging_orders_tracker import CreatedPairOfOrders, HangingOrdersTracker
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
+from hummingbot.strategy.status_sections import StatusSections
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.utils import order_age
 from .data_types import PriceSize, Proposal
@@ -144,6 +145,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._status_sections = StatusSections()
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -157,6 +159,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def max_order_age(self) -> float:
         return self._max_order_age
 
+    @property
+    def status_sections(self) -> StatusSections:
+        return self._status_sections
+
     @property
     def minimum_spread(self) -> Decimal:
         return self._minimum_spread
@@ -612,6 +618,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         return pd.DataFrame(data=data, columns=columns)
 
     def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+        markets_columns, markets_data = self.market_status_data(market_trading_pair_tuples)
+        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+
+    def market_status_data(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Tuple[List[str], List[List]]:
         markets_data = []
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"Ref Price ({self._price_type.name})"]
         if self._price_type is PriceType.LastOwnTrade and self._last_own_trade_price.is_nan():
@@ -643,7 +653,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 float(ask_price),
                 float(ref_price)
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return markets_columns, markets_data
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
@@ -654,24 +664,49 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         warning_lines.extend(self._ping_pong_warning_lines)
         warning_lines.extend(self.network_warning([self._market_info]))
 
-        markets_df = map_df_to_str(self.market_status_data_frame([self._market_info]))
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+        # The sections are only formatted again when their inputs change, see StatusSections
+        markets_columns, markets_data = self.market_status_data([self._market_info])
+        lines.extend(["", "  Markets:", self._status_sections.render(
+            "markets",
+            lambda: self._format_markets_section(markets_columns, markets_data),
+            inputs=(markets_columns, [row[:2] for row in markets_data]),
+            prices=[price for row in markets_data for price in row[2:]],
+        )])
 
-        assets_df = map_df_to_str(self.pure_mm_assets_df(not self._inventory_skew_enabled))
-        # append inventory skew stats.
-        if self._inventory_skew_enabled:
-            inventory_skew_df = map_df_to_str(self.inventory_skew_stats_data_frame())
-            assets_df = assets_df.append(inventory_skew_df)
-
-        first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+        market, trading_pair, base_asset, quote_asset = self._market_info
+        active_orders = self.active_orders
+        orders_inputs = [(o.client_order_id,
+                          o.is_buy,
+                          o.price,
+                          o.quantity,
+                          self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id))
+                         for o in active_orders]
+        price = self.get_price()
+        lines.extend(["", "  Assets:", self._status_sections.render(
+            "assets",
+            self._format_assets_section,
+            inputs=(self._inventory_skew_enabled,
+                    market.get_balance(base_asset),
+                    market.get_balance(quote_asset),
+                    market.get_available_balance(base_asset),
+                    market.get_available_balance(quote_asset),
+                    orders_inputs if self._inventory_skew_enabled else None,
+                    self._order_amount,
+                    self._order_level_amount,
+                    self._order_levels,
+                    self._inventory_target_base_pct,
+                    self._inventory_range_multiplier),
+            prices=[self._market_info.get_mid_price(), price],
+        )])
 
         # See if there're any open orders.
-        if len(self.active_orders) > 0:
-            df = map_df_to_str(self.active_orders_df())
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        if len(active_orders) > 0:
+            lines.extend(["", "  Orders:", self._status_sections.render(
+                "orders",
+                self._format_orders_section,
+                inputs=(orders_inputs, self._current_timestamp, self._order_amount, self._order_level_amount),
+                prices=[price],
+            )])
         else:
             lines.extend(["", "  No active maker orders."])
 
@@ -682,6 +717,27 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         return "\n".join(lines)
 
+    def _format_markets_section(self, markets_columns: List[str], markets_data: List[List]) -> str:
+        markets_df = map_df_to_str(
+            pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True))
+        return "\n".join(["    " + line for line in markets_df.to_string(index=False).split("\n")])
+
+    def _format_assets_section(self) -> str:
+        assets_df = map_df_to_str(self.pure_mm_assets_df(not self._inventory_skew_enabled))
+        # append inventory skew stats.
+        if self._inventory_skew_enabled:
+            inventory_skew_df = map_df_to_str(self.inventory_skew_stats_data_frame())
+            assets_df = assets_df.append(inventory_skew_df)
+
+        first_col_length = max(*assets_df[0].apply(len))
+        df_lines = assets_df.to_string(index=False, header=False,
+                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
+        return "\n".join(["    " + line for line in df_lines])
+
+    def _format_orders_section(self) -> str:
+        df = map_df_to_str(self.active_orders_df())
+        return "\n".join(["    " + line for line in df.to_string(index=False).split("\n")])
+
     # The following exposed Python functions are meant for unit tests
     # ---------------------------------------------------------------
     def execute_orders_proposal(self, proposal: Proposal):
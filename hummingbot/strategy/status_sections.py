@@ -0,0 +1,76 @@
+import math
+from decimal import Decimal
+from typing import Any, Callable, Dict, NamedTuple, Sequence, Tuple, Union
+
+Price = Union[Decimal, float]
+
+
+class CachedStatusSection(NamedTuple):
+    inputs: Any
+    prices: Tuple[Price, ...]
+    text: str
+
+
+class StatusSections:
+    """
+    Caches the formatted text of the sections of a strategy status (e.g. the markets, assets and orders tables), so a
+    section is only formatted again when its inputs change.
+
+    The inputs of a section (e.g. the balances and the active orders) are compared for equality, and its prices are
+    compared with a relative tolerance to the prices of the cached text. With the default 0 tolerance the status is
+    the same as when formatted on every call. A section is also formatted again once marked dirty.
+    """
+
+    def __init__(self, price_tolerance: Price = 0):
+        """
+        :param price_tolerance: relative price change (e.g. 0.001 for 0.1%) below which a cached section is reused
+        """
+        self.price_tolerance = price_tolerance
+        self._sections: Dict[str, CachedStatusSection] = {}
+
+    def render(self,
+               name: str,
+               render_fn: Callable[[], str],
+               inputs: Any = None,
+               prices: Sequence[Price] = ()) -> str:
+        """
+        :param name: the name of the section
+        :param render_fn: formats the section, only called when the cached text of the section is outdated
+        :param inputs: the values the section depends on, apart from the prices
+        :param prices: the prices the section depends on
+        :return: the formatted section
+        """
+        cached_section = self._sections.get(name)
+        if (cached_section is None
+                or cached_section.inputs != inputs
+                or not self._prices_within_tolerance(cached_section.prices, prices)):
+            cached_section = CachedStatusSection(inputs=inputs, prices=tuple(prices), text=render_fn())
+            self._sections[name] = cached_section
+        return cached_section.text
+
+    def mark_dirty(self, *names: str):
+        """
+        Makes the sections (all the sections if no name is given) be formatted again on their next rendering.
+        """
+        if len(names) == 0:
+            self._sections.clear()
+        for name in names:
+            self._sections.pop(name, None)
+
+    def _prices_within_tolerance(self, cached_prices: Sequence[Price], prices: Sequence[Price]) -> bool:
+        if len(cached_prices) != len(prices):
+            return False
+        tolerance = float(self.price_tolerance)
+        for cached_price, price in zip(cached_prices, prices):
+            if cached_price is None or price is None:
+                if cached_price is not price:
+                    return False
+                continue
+            cached_price, price = float(cached_price), float(price)
+            if math.isnan(cached_price) or math.isnan(price):
+                if math.isnan(cached_price) != math.isnan(price):
+                    return False
+            elif cached_price != price and (
+                    tolerance <= 0 or cached_price == 0 or abs(price - cached_price) / abs(cached_price) > tolerance):
+                return False
+        return True
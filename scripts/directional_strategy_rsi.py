@@ -1,5 +1,6 @@
 from decimal import Decimal
 
+from hummingbot.data_feed.candles_feed.candle_indicators import RSI as RSIIndicator
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.strategy.directional_strategy_base import DirectionalStrategyBase
 
@@ -56,6 +57,8 @@ class RSI(DirectionalStrategyBase):
     candles = [CandlesFactory.get_candle(connector=exchange,
                                          trading_pair=trading_pair,
                                          interval="1m", max_records=150)]
+    # Updated with each candle, so the signal doesn't recompute the RSI over the whole history every tick
+    rsi = candles[0].add_indicator(RSIIndicator(length=7))
     markets = {exchange: {trading_pair}}
 
     def get_signal(self):
@@ -64,8 +67,7 @@ class RSI(DirectionalStrategyBase):
         Returns:
             int: The trading signal (-1 for sell, 0 for hold, 1 for buy).
         """
-        candles_df = self.get_processed_df()
-        rsi_value = candles_df.iat[-1, -1]
+        rsi_value = self.rsi.value
         if rsi_value > 70:
             return -1
         elif rsi_value < 30:
@@ -15,6 +15,8 @@ class DownloadCandles(ScriptStrategyBase):
     CSV files in the /data directory. The script stops after it has downloaded 50,000 max_records records for each pair.
     Is important to notice that the component will fail if all the candles are not available since the idea of it is to
     use it in production based on candles needed to compute technical indicators.
+    The candles are also kept in the candles cache (data/candles), so running it again only downloads the candles
+    missing since the previous run.
     """
     exchange = os.getenv("EXCHANGE", "binance_perpetual")
     trading_pairs = os.getenv("TRADING_PAIRS", "DODO-BUSD,LTC-USDT").split(",")
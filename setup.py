@@ -122,6 +122,15 @@ def main():
     else:
         compiler_directives = {}
 
+    # Profiling builds (`make build-profiling`): the Cython functions report their calls and lines to the profilers,
+    # e.g. to the sampling profiler of the `profile --trace-calls` command. The generated sources are only updated
+    # when the .pyx files change, switching between builds requires a clean build.
+    if os.environ.get('WITH_CYTHON_PROFILING'):
+        compiler_directives.update({
+            "profile": True,
+            "linetrace": True,
+        })
+
     if is_posix:
         cython_kwargs["nthreads"] = cpu_count
 
@@ -135,6 +144,12 @@ def main():
     if len(sys.argv) > 1 and sys.argv[1] == "build_ext" and is_posix:
         sys.argv.append(f"--parallel={cpu_count}")
 
+    ext_modules = cythonize(cython_sources, compiler_directives=compiler_directives, **cython_kwargs)
+    if os.environ.get('WITH_CYTHON_PROFILING'):
+        # The line tracing is compiled out unless the macro is defined
+        for ext_module in ext_modules:
+            ext_module.define_macros.append(("CYTHON_TRACE", "1"))
+
     setup(name="hummingbot",
           version=version,
           description="Hummingbot",
@@ -145,7 +160,7 @@ def main():
           packages=packages,
           package_data=package_data,
           install_requires=install_requires,
-          ext_modules=cythonize(cython_sources, compiler_directives=compiler_directives, **cython_kwargs),
+          ext_modules=ext_modules,
           include_dirs=[
               np.get_include()
           ],
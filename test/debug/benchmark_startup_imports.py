@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Benchmarks the startup imports of bin/hummingbot_quickstart.py, the entry point of the headless docker deployments.
+
+Every run is a new Python process importing the quickstart module, which creates the connector settings, with the
+connector manifest missing (cold start, the connector utils modules are imported and the manifest is saved) and then
+saved (warm start, the settings are read from the manifest).
+
+    python -m test.debug.benchmark_startup_imports --runs 5 --slowest-imports 20
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+from hummingbot import root_path
+
+RUN_SCRIPT = """
+import json
+import sys
+import time
+
+# path_util is imported by the quickstart module as a top level module
+sys.path.append({bin_path!r})
+start = time.perf_counter()
+from hummingbot.client.settings import AllConnectorSettings
+
+settings_times = []
+create_connector_settings = AllConnectorSettings.create_connector_settings.__func__
+
+
+def timed_create_connector_settings(cls):
+    settings_start = time.perf_counter()
+    connector_settings = create_connector_settings(cls)
+    settings_times.append(time.perf_counter() - settings_start)
+    return connector_settings
+
+
+AllConnectorSettings.connector_manifest_path = classmethod(lambda cls: {manifest_path!r})
+AllConnectorSettings.create_connector_settings = classmethod(timed_create_connector_settings)
+import bin.hummingbot_quickstart  # noqa: F401
+AllConnectorSettings.get_connector_settings()
+print(json.dumps({{
+    "import_time": time.perf_counter() - start,
+    "settings_time": settings_times[0],
+    "connector_modules": len([name for name in sys.modules if name.startswith("hummingbot.connector.")]),
+}}))
+"""
+
+
+def run_quickstart_imports(manifest_path: str) -> Tuple[Dict[str, float], List[Tuple[float, str]]]:
+    """
+    :return: the measures of the run, and the cumulative import time (in seconds) of every imported module
+    """
+    script = RUN_SCRIPT.format(bin_path=str(root_path() / "bin"), manifest_path=manifest_path)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                            cwd=str(root_path()), capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"The quickstart imports failed:\n{result.stderr[-2000:]}")
+    import_times = []
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)", line)
+        if match is not None:
+            import_times.append((int(match.group(1)) * 1e-6, match.group(3)))
+    return json.loads(result.stdout.splitlines()[-1]), import_times
+
+
+def print_measures(title: str, measures: List[Dict[str, float]]):
+    print(f"{title}:")
+    for key in ["import_time", "settings_time"]:
+        values = [measure[key] for measure in measures]
+        print(f"  {key:<18} median {statistics.median(values) * 1e3:9.1f} ms   max {max(values) * 1e3:9.1f} ms")
+    print(f"  {'connector_modules':<18} {measures[-1]['connector_modules']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--slowest-imports", type=int, default=15,
+                        help="Number of the slowest imports of the warm start to list.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path = os.path.join(directory, "connector_manifest.json")
+        cold_measures = []
+        warm_measures = []
+        import_times = []
+        for _ in range(args.runs):
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            cold_measures.append(run_quickstart_imports(manifest_path)[0])
+            measures, import_times = run_quickstart_imports(manifest_path)
+            warm_measures.append(measures)
+
+    print_measures("Cold start (no connector manifest)", cold_measures)
+    print_measures("Warm start (connector manifest)", warm_measures)
+    print("Slowest imports of the warm start (cumulative):")
+    for import_time, module in sorted(import_times, reverse=True)[:args.slowest_imports]:
+        print(f"  {import_time * 1e3:9.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Benchmarks the trade history reports over a synthetic database of trade fills.
+
+Compares the ORM path (TradeFill objects processed one by one by PerformanceMetrics) with the columnar path
+(TradeFill.get_trades_frame and PerformanceMetrics.totals_by_market) used by the history and export commands.
+
+    python -m test.debug.benchmark_trade_history --fills 1000000
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+MARKETS = [("binance", "BTC-USDT"), ("binance", "ETH-USDT"), ("kucoin", "BTC-USDT"), ("binance_perpetual", "ETH-USDT")]
+TRADE_FEES = [
+    AddedToCostTradeFee(percent=Decimal("0.001")).to_json(),
+    DeductedFromReturnsTradeFee(percent=Decimal("0.001")).to_json(),
+    AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.0001"))]).to_json(),
+]
+BALANCES = {"BTC": Decimal("10"), "ETH": Decimal("100"), "USDT": Decimal("100000")}
+
+
+def create_database(db_path: str, num_fills: int, batch_size: int = 50000) -> SQLConnectionManager:
+    db = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=db_path)
+    multiplier = TradeFill.price.type.multiplier_int
+    rows = []
+    with db.engine.begin() as connection:
+        for i in range(num_fills):
+            market, symbol = MARKETS[i % len(MARKETS)]
+            base, quote = symbol.split("-")
+            is_perpetual = market.endswith("_perpetual")
+            rows.append({
+                "config_file_path": "conf_benchmark.yml",
+                "strategy": "pure_market_making",
+                "market": market,
+                "symbol": symbol,
+                "base_asset": base,
+                "quote_asset": quote,
+                "timestamp": 1640000000000 + i * 1000,
+                "order_id": f"OID{i // 2}",
+                "trade_type": "BUY" if (i // 2) % 2 == 0 else "SELL",
+                "order_type": "LIMIT",
+                "price": int(random.uniform(900, 1100) * multiplier),
+                "amount": int(random.uniform(0.01, 1) * multiplier),
+                "leverage": 1,
+                "trade_fee": TRADE_FEES[i % len(TRADE_FEES)],
+                "exchange_trade_id": f"EID{i}",
+                "position": ("OPEN" if (i // 4) % 2 == 0 else "CLOSE") if is_perpetual else "NIL",
+            })
+            if len(rows) == batch_size:
+                connection.execute(TradeFill.__table__.insert(), rows)
+                rows = []
+        if len(rows) > 0:
+            connection.execute(TradeFill.__table__.insert(), rows)
+    return db
+
+
+async def orm_report(db: SQLConnectionManager):
+    with db.get_new_session() as session:
+        trades = TradeFill.get_trades(session)
+        for market, symbol in set((t.market, t.symbol) for t in trades):
+            await PerformanceMetrics.create(
+                symbol, [t for t in trades if t.market == market and t.symbol == symbol], BALANCES)
+
+
+async def columnar_report(db: SQLConnectionManager):
+    with db.get_new_session() as session:
+        trades = TradeFill.get_trades_frame(session)
+    for (market, symbol), totals in PerformanceMetrics.totals_by_market(trades).items():
+        await PerformanceMetrics.create_from_totals(symbol, totals, BALANCES)
+
+
+def measure(name: str, report, trace_memory: bool):
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.get_event_loop().run_until_complete(report)
+    elapsed = time.perf_counter() - start
+    result = f"{name:<10} {elapsed:>10.2f} s"
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result += f" {peak / 1e6:>10.1f} MB peak"
+    print(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fills", type=int, default=1000000, help="number of trade fills in the database")
+    parser.add_argument("--skip-orm", action="store_true", help="only run the columnar path")
+    parser.add_argument("--memory", action="store_true",
+                        help="report the peak memory allocated by each path (slows down both paths)")
+    args = parser.parse_args()
+
+    rate_oracle = RateOracle()
+    rate_oracle._prices.update({"BNB-USDT": Decimal("300")})
+    RateOracle._shared_instance = rate_oracle
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        start = time.perf_counter()
+        db = create_database(os.path.join(temp_dir, "benchmark.sqlite"), args.fills)
+        print(f"Created {args.fills} trade fills in {time.perf_counter() - start:.2f} s")
+        measure("columnar", columnar_report(db), args.memory)
+        if not args.skip_orm:
+            measure("orm", orm_report(db), args.memory)
+        db.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
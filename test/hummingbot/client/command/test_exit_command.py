@@ -0,0 +1,36 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.metrics import MetricsRegistry
+from hummingbot.core.metrics_server import MetricsHttpServer
+
+
+class ExitCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.ui.hummingbot_cli.HummingbotCLI.exit")
+    def test_exit_stops_the_metrics_server(self, _: MagicMock):
+        self.app.metrics_server = MetricsHttpServer(port=0, registry=MetricsRegistry())
+        self.async_run_with_timeout(self.app.metrics_server.start())
+        self.assertTrue(self.app.metrics_server.started)
+
+        self.async_run_with_timeout(self.app.exit_loop(force=True))
+
+        self.assertFalse(self.app.metrics_server.started)
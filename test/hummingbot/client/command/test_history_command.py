@@ -37,6 +37,7 @@ class HistoryCommandTest(unittest.TestCase):
         self.cli_mock_assistant.stop()
         db_path = Path(SQLConnectionManager.create_db_path(db_name=self.mock_strategy_name))
         db_path.unlink(missing_ok=True)
+        SQLConnectionManager._scm_trade_fills_instance = None
         super().tearDown()
 
     @staticmethod
@@ -172,3 +173,25 @@ class HistoryCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_list_trades_writes_the_queued_trades_first(self, notify_mock):
+        self.client_config_map.db_mode = DBSqliteMode()
+
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+
+        def write_queued_trades():
+            with self.app.trade_fill_db.get_new_session() as session:
+                session.add_all(self.get_trades())
+                session.commit()
+
+        self.app.markets_recorder = MagicMock()
+        self.app.markets_recorder.write_queue.flush.side_effect = write_queued_trades
+
+        self.app.list_trades(start_time=0)
+
+        self.app.markets_recorder.write_queue.flush.assert_called_once()
+        self.assertEqual(1, len(captures))
+        self.assertIn("Recent trades:", captures[0])
@@ -0,0 +1,63 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class ProfileCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.client_config_map.log_file_path = self.temp_dir.name
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_profile_bot_writes_stacks_and_task_states(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        report = self.async_run_with_timeout(self.app.profile_bot(duration=0.2, interval=1.0))
+
+        self.assertGreater(report["samples"], 0)
+        self.assertGreater(report["event_loop_lag"]["count"], 0)
+        self.assertEqual(os.path.dirname(report["stacks_file"]), self.temp_dir.name)
+        with open(report["stacks_file"]) as stacks_file:
+            self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in stacks_file.read().splitlines()))
+        with open(report["tasks_file"]) as tasks_file:
+            self.assertIn("profile_bot", tasks_file.read())
+        self.assertEqual("Profiling the bot for 0.2 seconds...", captures[0])
+        self.assertIn(f"Stacks written to {report['stacks_file']}", captures[1])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_profile_bot_runs_one_profile_at_a_time(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        async def run_two_profiles():
+            return await asyncio.gather(self.app.profile_bot(duration=0.1), self.app.profile_bot(duration=0.1))
+
+        first_report, second_report = self.async_run_with_timeout(run_two_profiles())
+
+        self.assertIsNotNone(first_report)
+        self.assertIsNone(second_report)
+        self.assertIn("A profile is already running.", captures)
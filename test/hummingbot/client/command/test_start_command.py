@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+from test.mock.mock_cli import CLIMockingAssistant
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import hummingbot.client.settings as settings
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.config.security import Security
+from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class StartCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+
+        Security.secrets_manager = ETHKeyFileSecretManger("som-password")
+        Security._decryption_done = asyncio.Event()
+        Security._connector_decryption_done = {}
+
+    def tearDown(self) -> None:
+        self.cli_mock_assistant.stop()
+        Security.secrets_manager = None
+        Security._decryption_done = asyncio.Event()
+        Security._connector_decryption_done = {}
+        settings.required_exchanges.clear()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.command.status_command.StatusCommand.validate_required_connections",
+           new_callable=AsyncMock)
+    @patch("hummingbot.client.command.status_command.StatusCommand.validate_configs")
+    @patch("hummingbot.client.command.status_command.StatusCommand.missing_configurations_legacy")
+    def test_quickstart_waits_for_the_decryption_of_the_strategy_connectors(
+        self, missing_configurations_mock, validate_configs_mock, validate_required_connections_mock
+    ):
+        missing_configurations_mock.return_value = []
+        validate_configs_mock.return_value = []
+        validate_required_connections_mock.return_value = {"binance": "Invalid API key"}
+        self.app.strategy_name = "pure_market_making"
+        self.app.strategy_file_name = "pure_market_making.yml"
+        settings.required_exchanges.add("binance")
+
+        start_task = self.ev_loop.create_task(self.app.start_check(is_quickstart=True))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertFalse(start_task.done())
+        validate_required_connections_mock.assert_not_called()
+
+        # Only the config of the strategy connector is decrypted, the other configs are still being decrypted
+        Security._connector_decryption_event("binance").set()
+        self.async_run_with_timeout(start_task)
+
+        self.assertFalse(Security.is_decryption_done())
+        self.assertFalse(self.cli_mock_assistant.check_log_called_with(
+            msg="  - Security check: Encrypted files are being processed. Please wait and try again later."))
+        validate_required_connections_mock.assert_called_once()
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(msg="    binance: Invalid API key"))
@@ -1,5 +1,6 @@
 import asyncio
 import unittest
+from decimal import Decimal
 from test.mock.mock_cli import CLIMockingAssistant
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
@@ -7,6 +8,7 @@ from unittest.mock import MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.strategy.status_sections import StatusSections
 
 
 class StatusCommandTest(unittest.TestCase):
@@ -74,3 +76,28 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.cls_display_delay")
+    def test_live_status_uses_refresh_interval_and_price_tolerance(self, cls_display_delay_mock):
+        self.client_config_map.live_status.live_status_refresh_interval = 0.5
+        self.client_config_map.live_status.live_status_price_tolerance_pct = Decimal("0.1")
+        status_sections = StatusSections()
+        strategy = MagicMock()
+        strategy.format_status.return_value = "strategy status"
+        strategy.status_sections = status_sections
+        self.app.strategy = strategy
+        self.app.markets = {}
+        tolerances = []
+
+        async def display_once(text, delay):
+            tolerances.append(status_sections.price_tolerance)
+            self.app.app.live_updates = False
+
+        cls_display_delay_mock.side_effect = display_once
+
+        self.async_run_with_timeout(self.app.status_check_all(live=True))
+
+        self.assertEqual(0.5, cls_display_delay_mock.call_args.args[1])
+        self.assertIn("strategy status", cls_display_delay_mock.call_args.args[0])
+        self.assertEqual([Decimal("0.001")], tolerances)
+        self.assertEqual(0, status_sections.price_tolerance)
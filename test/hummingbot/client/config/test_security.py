@@ -1,10 +1,14 @@
 import asyncio
+import multiprocessing.spawn
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
-from hummingbot.client.config import config_crypt, config_helpers, security
+from hummingbot.client.config import config_crypt, config_helpers, key_derivation, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
@@ -12,7 +16,8 @@ from hummingbot.client.config.config_helpers import (
     get_connector_config_yml_path,
     save_to_yml,
 )
-from hummingbot.client.config.security import Security
+from hummingbot.client.config.key_derivation import key_derivation_workers_main_module
+from hummingbot.client.config.security import KEY_DERIVATION_PROCESSES_MIN_VALUES, Security
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 
@@ -78,6 +83,7 @@ class SecurityTest(unittest.TestCase):
         Security.secrets_manager = None
         Security._secure_configs = {}
         Security._decryption_done = asyncio.Event()
+        Security._connector_decryption_done = {}
 
     def test_password_process(self):
         self.assertTrue(Security.new_password_required())
@@ -150,3 +156,75 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_derived_keys_are_cached_per_salt_and_kdf_parameters(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        first_value = secrets_manager.encrypt_secret_value("attr", "first")
+        second_value = secrets_manager.encrypt_secret_value("attr", "second")
+
+        with patch("hummingbot.client.config.config_crypt.derive_keyfile_key",
+                   wraps=config_crypt.derive_keyfile_key) as derive_mock:
+            self.assertEqual("first", secrets_manager.decrypt_secret_value("attr", first_value))
+            self.assertEqual("first", secrets_manager.decrypt_secret_value("attr", first_value))
+            self.assertEqual(1, derive_mock.call_count)
+
+            with ThreadPoolExecutor() as executor:
+                futures = secrets_manager.derive_keys([first_value, second_value, second_value], executor)
+                self.assertEqual(1, len(set(futures)))
+                futures[0].result()
+            self.assertEqual(2, derive_mock.call_count)
+
+            self.assertEqual("second", secrets_manager.decrypt_secret_value("attr", second_value))
+            self.assertEqual(2, derive_mock.call_count)
+
+        with self.assertRaises(ValueError):
+            ETHKeyFileSecretManger("another-password").decrypt_secret_value("attr", first_value)
+
+    def test_wait_til_connector_decryption_done(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        self.store_binance_config()
+
+        Security.decrypt_connector_config(get_connector_config_yml_path(self.connector))
+
+        self.async_run_with_timeout(Security.wait_til_decryption_done(self.connector))
+        self.assertTrue(Security.is_decryption_done(self.connector))
+        self.assertFalse(Security.is_decryption_done())
+        self.assertFalse(Security.is_decryption_done("kucoin"))
+        self.assertEqual(self.api_key, Security.api_keys(self.connector)["binance_api_key"])
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(Security.wait_til_decryption_done("kucoin"), timeout=0.1)
+
+        Security.decrypt_all()
+
+        self.async_run_with_timeout(Security.wait_til_decryption_done("kucoin"))
+        self.assertTrue(Security.is_decryption_done("kucoin"))
+
+    @patch("hummingbot.client.config.security.os.cpu_count")
+    def test_key_derivation_workers_are_spawned(self, cpu_count_mock):
+        cpu_count_mock.return_value = 2
+        self.assertIsNone(Security._key_derivation_executor(KEY_DERIVATION_PROCESSES_MIN_VALUES - 1))
+
+        executor = Security._key_derivation_executor(KEY_DERIVATION_PROCESSES_MIN_VALUES)
+        try:
+            self.assertEqual("spawn", executor._mp_context.get_start_method())
+            self.assertEqual(2, executor._max_workers)
+        finally:
+            executor.shutdown()
+
+    @patch("hummingbot.client.config.security.os.cpu_count")
+    def test_keys_derived_in_thread_with_a_single_cpu(self, cpu_count_mock):
+        cpu_count_mock.return_value = 1
+
+        self.assertIsNone(Security._key_derivation_executor(KEY_DERIVATION_PROCESSES_MIN_VALUES * 2))
+
+    def test_key_derivation_workers_do_not_import_the_application(self):
+        main_module = sys.modules["__main__"]
+
+        with key_derivation_workers_main_module():
+            preparation_data = multiprocessing.spawn.get_preparation_data("worker")
+
+        self.assertEqual(key_derivation.__name__, preparation_data["init_main_from_name"])
+        self.assertIs(main_module, sys.modules["__main__"])
@@ -5,6 +5,8 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
@@ -12,6 +14,7 @@ from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFro
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
 trading_pair = "HBOT-USDT"
@@ -341,3 +344,108 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+
+class PerformanceMetricsFromTradesFrameUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rate_oracle = RateOracle()
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+        self.db = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                       db_path="")
+        self.num_trades = 0
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        self.db.engine.dispose()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def trade_fill(self,
+                   order_id: str,
+                   trade_type: str,
+                   price: str,
+                   amount: str,
+                   position: str = PositionAction.NIL.value,
+                   trade_fee=None,
+                   market: str = "binance") -> TradeFill:
+        self.num_trades += 1
+        trade_fee = trade_fee or AddedToCostTradeFee()
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market=market,
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=1640001112223 + self.num_trades,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"EID{self.num_trades}",
+            position=position,
+        )
+
+    def assert_same_metrics_from_trades_frame(self, trades, current_balances):
+        with self.db.get_new_session() as session:
+            with session.begin():
+                session.add_all(trades)
+        with self.db.get_new_session() as session:
+            stored_trades = TradeFill.get_trades(session)
+            trades_frame = TradeFill.get_trades_frame(session)
+            markets = sorted(set((t.market, t.symbol) for t in stored_trades))
+
+            market_totals = PerformanceMetrics.totals_by_market(trades_frame)
+            self.assertEqual(markets, sorted(market_totals.keys()))
+            for market, symbol in markets:
+                expected = self.async_run_with_timeout(PerformanceMetrics.create(
+                    symbol, [t for t in stored_trades if t.market == market], current_balances))
+                metrics = self.async_run_with_timeout(PerformanceMetrics.create_from_totals(
+                    symbol, market_totals[(market, symbol)], current_balances))
+
+                for field in ("num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "b_vol_quote",
+                              "s_vol_quote", "avg_b_price", "avg_s_price", "start_price", "cur_price",
+                              "hold_value", "cur_value", "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"):
+                    self.assertAlmostEqual(getattr(expected, field), getattr(metrics, field), places=8, msg=field)
+                self.assertEqual(dict(expected.fees).keys(), dict(metrics.fees).keys())
+                for token, amount in expected.fees.items():
+                    self.assertAlmostEqual(amount, metrics.fees[token], places=8)
+
+    def test_spot_totals_by_market(self):
+        trades = [
+            self.trade_fill("OID1", "BUY", "100", "10", trade_fee=AddedToCostTradeFee(percent=Decimal("0.001"))),
+            self.trade_fill("OID2", "SELL", "120.5", "15", trade_fee=DeductedFromReturnsTradeFee(percent=Decimal("0.002"))),
+            self.trade_fill("OID3", "BUY", "110", "2.5",
+                            trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+            self.trade_fill("OID4", "BUY", "111", "1",
+                            trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+            self.trade_fill("OID5", "SELL", "99", "3", market="kucoin"),
+        ]
+
+        self.assert_same_metrics_from_trades_frame(trades, {base: Decimal("100"), quote: Decimal("10000")})
+
+    def test_derivative_totals_by_market(self):
+        trades = [
+            self.trade_fill("OID1", "BUY", "10", "60", position="OPEN"),
+            self.trade_fill("OID1", "BUY", "11", "40", position="OPEN"),
+            self.trade_fill("OID2", "SELL", "20", "100", position="OPEN",
+                            trade_fee=AddedToCostTradeFee(percent=Decimal("0.1"))),
+            self.trade_fill("OID3", "SELL", "15", "30", position="CLOSE"),
+            self.trade_fill("OID4", "BUY", "15", "100", position="CLOSE"),
+            self.trade_fill("OID3", "SELL", "16", "70", position="CLOSE"),
+            self.trade_fill("OID5", "BUY", "12", "10", position="OPEN"),
+        ]
+
+        self.assert_same_metrics_from_trades_frame(trades, {base: Decimal("100"), quote: Decimal("10000")})
+
+    def test_totals_by_market_without_trades(self):
+        with self.db.get_new_session() as session:
+            self.assertEqual({}, PerformanceMetrics.totals_by_market(TradeFill.get_trades_frame(session)))
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import unittest
+from decimal import Decimal
+from typing import Awaitable, List
+
+import pandas as pd
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_tracker import PerformanceTracker
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.trade_fill import TRADES_FRAME_COLUMNS, TradeFill
+
+trading_pair = "HBOT-USDT"
+base, quote = trading_pair.split("-")
+
+
+class PerformanceTrackerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rate_oracle = RateOracle()
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def trade_fill(order_id: str,
+                   trade_type: str,
+                   price: float,
+                   amount: float,
+                   position: str = PositionAction.NIL.value,
+                   trade_fee=None,
+                   market: str = "binance",
+                   symbol: str = trading_pair) -> TradeFill:
+        trade_fee = trade_fee or AddedToCostTradeFee()
+        symbol_base, symbol_quote = symbol.split("-")
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market=market,
+            symbol=symbol,
+            base_asset=symbol_base,
+            quote_asset=symbol_quote,
+            timestamp=1640001112223,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"{order_id}-{price}",
+            position=position,
+        )
+
+    def assert_same_metrics(self, trades: List[TradeFill], current_balances):
+        tracker = PerformanceTracker.from_trades(trades)
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, current_balances))
+        metrics = self.async_run_with_timeout(tracker.performance_metrics("binance", trading_pair, current_balances))
+
+        for field in ("num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                      "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price",
+                      "start_base_bal", "start_quote_bal", "cur_base_bal", "cur_quote_bal", "start_price", "cur_price",
+                      "hold_value", "cur_value", "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertAlmostEqual(getattr(expected, field), getattr(metrics, field), places=10, msg=field)
+        self.assertEqual(dict(expected.fees), dict(metrics.fees))
+
+    def test_spot_metrics_match_metrics_created_from_trades(self):
+        trades = [
+            self.trade_fill("OID1", "BUY", 100, 10, trade_fee=AddedToCostTradeFee(percent=Decimal("0.001"))),
+            self.trade_fill("OID2", "SELL", 120, 15, trade_fee=DeductedFromReturnsTradeFee(percent=Decimal("0.002"))),
+            self.trade_fill("OID3", "BUY", 110, 2.5,
+                            trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+        ]
+
+        self.assert_same_metrics(trades, {base: Decimal("100"), quote: Decimal("10000")})
+
+    def test_derivative_metrics_match_metrics_created_from_trades(self):
+        trades = [
+            self.trade_fill("OID1", "BUY", 10, 60, position="OPEN"),
+            self.trade_fill("OID1", "BUY", 11, 40, position="OPEN"),
+            self.trade_fill("OID2", "SELL", 20, 100, position="OPEN",
+                            trade_fee=AddedToCostTradeFee(percent=Decimal("0.1"))),
+            self.trade_fill("OID3", "SELL", 15, 30, position="CLOSE"),
+            self.trade_fill("OID4", "BUY", 15, 100, position="CLOSE"),
+            self.trade_fill("OID3", "SELL", 16, 70, position="CLOSE"),
+            self.trade_fill("OID5", "BUY", 12, 10, position="OPEN"),
+        ]
+
+        self.assert_same_metrics(trades, {base: Decimal("100"), quote: Decimal("10000")})
+
+    def test_tracker_from_trades_frame_matches_tracker_from_trades(self):
+        trades = [
+            self.trade_fill("OID1", "BUY", 100, 10, trade_fee=AddedToCostTradeFee(percent=Decimal("0.001"))),
+            self.trade_fill("OID2", "SELL", 120, 15, trade_fee=DeductedFromReturnsTradeFee(percent=Decimal("0.002"))),
+            self.trade_fill("OID3", "SELL", 20, 10, position="OPEN", symbol="BTC-USDT"),
+            self.trade_fill("OID4", "BUY", 15, 4, position="CLOSE", symbol="BTC-USDT",
+                            trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+        ]
+        trades_frame = pd.DataFrame(
+            [(t.exchange_trade_id, t.market, t.symbol, t.timestamp, t.order_id, t.trade_type, t.order_type, t.price,
+              t.amount, t.leverage, t.position, json.dumps(t.trade_fee), None) for t in trades],
+            columns=TRADES_FRAME_COLUMNS)
+
+        expected = PerformanceTracker.from_trades(trades)
+        tracker = PerformanceTracker.from_trades_frame(trades_frame)
+
+        self.assertEqual(expected.markets, tracker.markets)
+        for market, symbol in expected.markets:
+            expected_accumulator = expected.accumulator(market, symbol)
+            accumulator = tracker.accumulator(market, symbol)
+            for field in ("num_buys", "num_sells", "b_vol_base", "s_vol_base", "b_vol_quote", "s_vol_quote",
+                          "start_price", "last_price", "realized_pnl", "is_derivative"):
+                self.assertEqual(getattr(expected_accumulator, field), getattr(accumulator, field), msg=field)
+            self.assertEqual(dict(expected_accumulator.fees), dict(accumulator.fees))
+
+    def test_realized_pnl_updated_on_each_fill(self):
+        tracker = PerformanceTracker()
+        tracker.add_trade_fill(self.trade_fill("OID1", "SELL", 20, 10, position="OPEN"))
+        accumulator = tracker.accumulator("binance", trading_pair)
+        self.assertTrue(accumulator.is_derivative)
+        self.assertEqual(Decimal("0"), accumulator.realized_pnl)
+
+        tracker.add_trade_fill(self.trade_fill("OID2", "BUY", 15, 4, position="CLOSE"))
+        self.assertEqual(Decimal("20"), accumulator.realized_pnl)
+
+        # A new fill of the closing order updates the PnL of the position with the average fill price
+        tracker.add_trade_fill(self.trade_fill("OID2", "BUY", 17, 6, position="CLOSE"))
+        self.assertEqual(Decimal("40"), accumulator.realized_pnl)
+
+    def test_spot_fill_disables_derivative_pnl(self):
+        tracker = PerformanceTracker()
+        tracker.add_trade_fill(self.trade_fill("OID1", "BUY", 20, 10))
+        tracker.add_trade_fill(self.trade_fill("OID2", "SELL", 25, 10))
+
+        self.assertFalse(tracker.accumulator("binance", trading_pair).is_derivative)
+
+    def test_process_order_filled_event(self):
+        tracker = PerformanceTracker.from_trades([self.trade_fill("OID1", "BUY", 100, 1)])
+        tracker.process_order_filled_event("binance", OrderFilledEvent(
+            timestamp=1640001112.223,
+            order_id="OID2",
+            trading_pair=trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal("105"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0.1"))]),
+        ))
+        tracker.process_order_filled_event("kucoin", OrderFilledEvent(
+            timestamp=1640001112.223,
+            order_id="OID3",
+            trading_pair="BTC-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("20000"),
+            amount=Decimal("0.1"),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+
+        self.assertEqual(3, tracker.num_trades)
+        self.assertEqual([("binance", trading_pair), ("kucoin", "BTC-USDT")], tracker.markets)
+        accumulator = tracker.accumulator("binance", trading_pair)
+        self.assertEqual(Decimal("100"), accumulator.start_price)
+        self.assertEqual(Decimal("105"), accumulator.last_price)
+        self.assertEqual(Decimal("-1"), accumulator.s_vol_base)
+        self.assertEqual(Decimal("105"), accumulator.s_vol_quote)
+        self.assertEqual({quote: Decimal("0.1")}, dict(accumulator.fees))
+        self.assertIsNone(tracker.accumulator("kucoin", trading_pair))
@@ -1,9 +1,17 @@
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import (
+    AllConnectorSettings,
+    ConnectorConfigKeysLoader,
+    ConnectorSetting,
+    ConnectorType,
+)
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.connector.gateway.clob_spot.data_sources.injective.injective_api_data_source import (
     InjectiveAPIDataSource,
@@ -150,3 +158,80 @@ class SettingsTest(unittest.TestCase):
 
         self.assertIsInstance(api_data_source, InjectiveAPIDataSource)
         self.assertEqual(expected_params_without_api_data_source, params)
+
+
+class ConnectorManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.directory.name, "connector_manifest.json")
+        manifest_path_patch = patch.object(AllConnectorSettings, "connector_manifest_path",
+                                           return_value=self.manifest_path)
+        manifest_path_patch.start()
+        self.addCleanup(manifest_path_patch.stop)
+        gateway_connections_patch = patch("hummingbot.client.settings.GatewayConnectionSetting.load", return_value=[])
+        gateway_connections_patch.start()
+        self.addCleanup(gateway_connections_patch.stop)
+        self.addCleanup(AllConnectorSettings.create_connector_settings)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_connector_settings_are_created_from_manifest_without_importing_connectors(self):
+        created_settings = dict(AllConnectorSettings.create_connector_settings())
+
+        self.assertTrue(os.path.exists(self.manifest_path))
+
+        with patch.object(AllConnectorSettings, "_create_connector_settings_from_utils_modules") as create_mock:
+            manifest_settings = AllConnectorSettings.create_connector_settings()
+
+        create_mock.assert_not_called()
+        self.assertEqual(set(created_settings), set(manifest_settings))
+        for name, connector_setting in created_settings.items():
+            manifest_setting = manifest_settings[name]
+            self.assertEqual(connector_setting.type, manifest_setting.type)
+            self.assertEqual(connector_setting.example_pair, manifest_setting.example_pair)
+            self.assertEqual(connector_setting.trade_fee_schema, manifest_setting.trade_fee_schema)
+            self.assertEqual(connector_setting.parent_name, manifest_setting.parent_name)
+            self.assertEqual(connector_setting.domain_parameter, manifest_setting.domain_parameter)
+        self.assertIsInstance(manifest_settings["binance"]._asdict()["config_keys"], ConnectorConfigKeysLoader)
+        self.assertIsInstance(manifest_settings["binance"].config_keys, BinanceConfigMap)
+        self.assertEqual(type(created_settings["binance_us"].config_keys),
+                         type(manifest_settings["binance_us"].config_keys))
+
+    def test_outdated_manifest_is_rebuilt(self):
+        with open(self.manifest_path, "w") as manifest_file:
+            json.dump({"fingerprint": "outdated", "connectors": []}, manifest_file)
+
+        connector_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", connector_settings)
+        with open(self.manifest_path) as manifest_file:
+            self.assertNotEqual("outdated", json.load(manifest_file)["fingerprint"])
+
+    def test_fingerprint_changes_with_any_connector_module(self):
+        connector_path = os.path.join(self.directory.name, "exchange", "some_exchange")
+        os.makedirs(connector_path)
+        for module_name in ("some_exchange_utils.py", "some_exchange_constants.py"):
+            with open(os.path.join(connector_path, module_name), "w") as module_file:
+                module_file.write("DOMAIN = 'com'\n")
+        connector_dir = next(entry for entry in os.scandir(os.path.dirname(connector_path)))
+        utils_modules = [("exchange", "some_exchange", connector_dir)]
+
+        fingerprint = AllConnectorSettings._connector_manifest_fingerprint(utils_modules)
+        constants_path = os.path.join(connector_path, "some_exchange_constants.py")
+        constants_stat = os.stat(constants_path)
+        os.utime(constants_path, ns=(constants_stat.st_atime_ns, constants_stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertNotEqual(fingerprint, AllConnectorSettings._connector_manifest_fingerprint(utils_modules))
+
+    def test_paper_trade_settings_keep_config_keys_unloaded(self):
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.create_connector_settings()
+
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        paper_trade_setting = AllConnectorSettings.get_connector_settings()["binance_paper_trade"]
+        self.assertEqual("binance", paper_trade_setting.parent_name)
+        self.assertIsInstance(paper_trade_setting._asdict()["config_keys"], ConnectorConfigKeysLoader)
@@ -1,12 +1,13 @@
 import asyncio
 import unittest
 from typing import Awaitable
+from unittest.mock import patch
 
 from prompt_toolkit.document import Document
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
-from hummingbot.client.ui.custom_widgets import FormattedTextLexer
+from hummingbot.client.ui.custom_widgets import CustomTextArea, FormattedTextLexer
 
 
 class CustomWidgetUnitTests(unittest.TestCase):
@@ -91,3 +92,55 @@ class CustomWidgetUnitTests(unittest.TestCase):
         line_fragments = get_line(1)
         self.assertEqual(0, len(line_fragments))
         self.assertEqual(expected_fragments, line_fragments)
+
+
+class CustomTextAreaUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.new_event_loop()
+
+    def tearDown(self) -> None:
+        self.ev_loop.close()
+        super().tearDown()
+
+    def test_log_wraps_new_lines_and_keeps_max_line_count(self):
+        text_area = CustomTextArea(max_line_count=4)
+
+        text_area.log("first\n" + "a" * 250)
+        text_area.log("<b>second</b>")
+
+        self.assertEqual(["first", "a" * 100, "a" * 100, "a" * 50, "second"][-4:], list(text_area.log_lines))
+        self.assertEqual("\n".join(text_area.log_lines), text_area.text)
+        self.assertEqual(len(text_area.text), text_area.document.cursor_position)
+
+    def test_log_not_saved_replaces_text_until_next_log(self):
+        text_area = CustomTextArea()
+        text_area.log("saved")
+
+        text_area.log("not saved", save_log=False)
+        self.assertEqual("not saved", text_area.text)
+        text_area.log("silent", silent=True)
+        self.assertEqual("not saved", text_area.text)
+        text_area.log("saved again")
+
+        self.assertEqual("\nsaved\nsilent\nsaved again", text_area.text)
+
+    @patch("hummingbot.client.ui.custom_widgets.CustomTextArea._time")
+    def test_logs_rendered_at_most_at_refresh_rate(self, time_mock):
+        time_mock.return_value = 100
+        text_area = CustomTextArea(max_refresh_rate=20)
+
+        async def log_burst():
+            time_mock.return_value = 101
+            with patch.object(CustomTextArea, "_render", autospec=True, side_effect=CustomTextArea._render) as render:
+                for i in range(100):
+                    text_area.log(f"line {i}")
+                self.assertEqual(1, render.call_count)
+                self.assertEqual("\nline 0", text_area.text)
+                time_mock.return_value = 101.05
+                await asyncio.sleep(0.06)
+                self.assertEqual(2, render.call_count)
+
+        self.ev_loop.run_until_complete(log_burst())
+
+        self.assertEqual("\n".join([""] + [f"line {i}" for i in range(100)]), text_area.text)
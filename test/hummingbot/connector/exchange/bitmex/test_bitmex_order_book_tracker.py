@@ -7,6 +7,7 @@ from typing import Deque, Optional, Union
 from hummingbot.connector.exchange.bitmex.bitmex_order_book import BitmexOrderBook
 from hummingbot.connector.exchange.bitmex.bitmex_order_book_tracker import BitmexOrderBookTracker
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import ORDER_BOOK_MESSAGES
 
 
 class BitmexOrderBookTrackerUnitTests(unittest.TestCase):
@@ -46,6 +47,24 @@ class BitmexOrderBookTrackerUnitTests(unittest.TestCase):
     def test_exchange_name(self):
         self.assertEqual("bitmex", self.tracker.exchange_name)
 
+    def test_order_book_diff_router_labels_metrics_with_exchange_name(self):
+        diff_messages_metric = ORDER_BOOK_MESSAGES.labels("bitmex", "diff")
+        initial_count = diff_messages_metric.value
+        msg: OrderBookMessage = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 1,
+                "trading_pair": self.trading_pair,
+            },
+            timestamp=time.time()
+        )
+        self._simulate_message_enqueue(self.tracker._order_book_diff_stream, msg)
+
+        self.tracking_task = self.ev_loop.create_task(self.tracker._order_book_diff_router())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertEqual(initial_count + 1, diff_messages_metric.value)
+
     def test_order_book_diff_router_trading_pair_not_found_append_to_saved_message_queue(self):
         expected_msg: OrderBookMessage = OrderBookMessage(
             message_type=OrderBookMessageType.DIFF,
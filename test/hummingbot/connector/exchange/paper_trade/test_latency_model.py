@@ -0,0 +1,96 @@
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.connector.exchange.paper_trade.latency_model import (
+    LatencyDistribution,
+    PaperTradeLatencyModel,
+    SimulatedRateLimiter,
+)
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+
+
+class LatencyDistributionTests(TestCase):
+
+    def test_constant_from_number(self):
+        distribution = LatencyDistribution.from_config(0.05)
+
+        self.assertEqual("constant", distribution.distribution)
+        self.assertEqual(0.05, distribution.sample())
+
+    def test_random_distributions_are_never_negative(self):
+        for spec in ({"distribution": "uniform", "min": 0.01, "max": 0.02},
+                     {"distribution": "normal", "mean": 0.0, "stdev": 1.0},
+                     {"distribution": "lognormal", "median": 0.05, "sigma": 0.5}):
+            distribution = LatencyDistribution.from_config(spec)
+            for _ in range(100):
+                self.assertGreaterEqual(distribution.sample(), 0.0)
+
+    def test_invalid_distribution_raises_error(self):
+        with self.assertRaises(ValueError):
+            LatencyDistribution.from_config({"distribution": "poisson", "mean": 1})
+
+    def test_missing_parameter_raises_error(self):
+        with self.assertRaises(KeyError):
+            LatencyDistribution.from_config({"distribution": "normal", "mean": 1})
+
+
+class PaperTradeLatencyModelTests(TestCase):
+
+    def test_missing_actions_have_no_latency(self):
+        model = PaperTradeLatencyModel.from_config({"create": 0.1})
+
+        self.assertEqual(0.1, model.sample(PaperTradeLatencyModel.CREATE))
+        self.assertEqual(0.0, model.sample(PaperTradeLatencyModel.CANCEL))
+        self.assertIsNone(model.distribution(PaperTradeLatencyModel.FILL))
+
+    def test_invalid_action_raises_error(self):
+        with self.assertRaises(ValueError):
+            PaperTradeLatencyModel.from_config({"amend": 0.1})
+
+    def test_seed_makes_samples_reproducible(self):
+        config = {"create": {"distribution": "lognormal", "median": 0.05, "sigma": 0.5}}
+        first = PaperTradeLatencyModel.from_config(config, seed=7)
+        second = PaperTradeLatencyModel.from_config(config, seed=7)
+
+        self.assertEqual([first.sample("create") for _ in range(5)], [second.sample("create") for _ in range(5)])
+
+    def test_for_connector_falls_back_to_default(self):
+        latencies = {"binance": {"create": 0.1}, "default": {"create": 0.2}}
+
+        self.assertEqual(0.1, PaperTradeLatencyModel.for_connector(latencies, "binance").sample("create"))
+        self.assertEqual(0.2, PaperTradeLatencyModel.for_connector(latencies, "kucoin").sample("create"))
+        self.assertIsNone(PaperTradeLatencyModel.for_connector({}, "kucoin"))
+
+
+class SimulatedRateLimiterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.rate_limits = [
+            RateLimit(limit_id="ORDERS", limit=3, time_interval=10),
+            RateLimit(limit_id="/api/v3/order", limit=100, time_interval=1,
+                      linked_limits=[LinkedLimitWeightPair("ORDERS", 1)]),
+        ]
+        self.limiter = SimulatedRateLimiter(self.rate_limits, limits_share_percentage=Decimal("100"))
+
+    def test_order_limit_id_prefers_endpoint_limits(self):
+        self.assertEqual("/api/v3/order", self.limiter.order_limit_id)
+
+    def test_requests_within_capacity_are_not_delayed(self):
+        self.assertEqual(1000.0, self.limiter.reserve(1000.0))
+        self.assertEqual(1001.0, self.limiter.reserve(1001.0))
+        self.assertEqual(1002.0, self.limiter.reserve(1002.0))
+
+    def test_requests_exceeding_linked_limit_wait_for_capacity(self):
+        for _ in range(3):
+            self.limiter.reserve(1000.0)
+
+        self.assertEqual(1010.0, self.limiter.reserve(1001.0))
+        # Requests are sent in FIFO order
+        self.assertEqual(1010.0, self.limiter.reserve(1002.0))
+
+    def test_unknown_limit_id_is_not_limited(self):
+        limiter = SimulatedRateLimiter(self.rate_limits, Decimal("100"), order_limit_id="/unknown")
+
+        for _ in range(10):
+            self.assertEqual(1000.0, limiter.reserve(1000.0))
@@ -1,3 +1,6 @@
+import asyncio
+from decimal import Decimal
+from typing import Awaitable
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -5,7 +8,15 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.latency_model import PaperTradeLatencyModel, SimulatedRateLimiter
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -23,9 +34,248 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(BinanceAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+        self.assertFalse(paper_exchange.queue_position_fill_model_enabled)
+        self.assertIsNone(paper_exchange.latency_model)
+        self.assertIsNone(paper_exchange.rate_limiter)
 
         paper_exchange = create_paper_trade_market(
             exchange_name="kucoin",
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def test_new_empty_order_book_is_registered_in_the_tracker(self):
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.new_empty_order_book("COINALPHA-HBOT")
+
+        self.assertTrue(exchange.order_book_tracker.ready)
+        self.assertIs(exchange.order_books["COINALPHA-HBOT"], exchange.order_book_tracker.order_books["COINALPHA-HBOT"])
+        self.assertIn("COINALPHA-HBOT", exchange.trading_pairs)
+
+
+class PaperTradeExchangeQueuePositionFillModelTests(TestCase):
+    start_timestamp: float = 1640995200.0
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.exchange.set_balance("COINALPHA", Decimal("100"))
+        self.exchange.set_balance("HBOT", Decimal("10000"))
+        self.exchange.new_empty_order_book(self.trading_pair)
+        self.order_book = self.exchange.order_books[self.trading_pair]
+        self.order_book.apply_snapshot([OrderBookRow(100.0, 10.0, 1)], [OrderBookRow(101.0, 10.0, 1)], 1)
+        self.exchange.enable_queue_position_fill_model()
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        self.clock.add_iterator(self.exchange)
+        self.clock.backtest_til(self.start_timestamp)
+
+        self.fill_logger = EventLogger()
+        self.complete_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.exchange.add_listener(MarketEvent.BuyOrderCompleted, self.complete_logger)
+
+    def apply_trade(self, trade_type: TradeType, price: float, amount: float):
+        self.order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=self.trading_pair,
+            timestamp=self.start_timestamp,
+            price=price,
+            amount=amount,
+            type=trade_type,
+        ))
+
+    def test_order_joins_queue_behind_level_volume(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("100"))
+
+        self.assertEqual(10.0, self.exchange.queue_positions[order_id].queue_ahead)
+
+    def test_trades_at_order_price_fill_after_queue_ahead(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("100"))
+
+        self.apply_trade(TradeType.SELL, 100.0, 5.0)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.apply_trade(TradeType.SELL, 100.0, 6.0)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("1"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(0, len(self.complete_logger.event_log))
+        self.assertEqual(Decimal("1"), self.exchange.limit_orders[0].filled_quantity)
+        self.assertEqual(Decimal("100"), self.exchange.on_hold_balances["HBOT"])
+
+        self.apply_trade(TradeType.SELL, 100.0, 3.0)
+        self.assertEqual(2, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("1"), self.fill_logger.event_log[1].amount)
+        self.assertEqual(1, len(self.complete_logger.event_log))
+        self.assertEqual(order_id, self.complete_logger.event_log[0].order_id)
+        self.assertEqual(Decimal("2"), self.complete_logger.event_log[0].base_asset_amount)
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertNotIn(order_id, self.exchange.queue_positions)
+        self.assertEqual(Decimal("102"), self.exchange.get_balance("COINALPHA"))
+
+    def test_trade_through_order_price_fills_in_full(self):
+        self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("100"))
+
+        self.apply_trade(TradeType.SELL, 99.0, 1.0)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("2"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(1, len(self.complete_logger.event_log))
+
+    def test_cancellations_at_level_move_order_forward(self):
+        self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("100"))
+
+        self.order_book.apply_diffs([OrderBookRow(100.0, 1.0, 2)], [], 2)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.apply_trade(TradeType.SELL, 100.0, 2.0)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("1"), self.fill_logger.event_log[0].amount)
+
+    def test_book_touching_order_price_does_not_fill(self):
+        self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("100"))
+
+        self.order_book.apply_diffs([], [OrderBookRow(100.0, 5.0, 2)], 2)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.order_book.apply_diffs([], [OrderBookRow(99.5, 5.0, 3)], 3)
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+
+    def test_cancel_removes_queue_position(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("100"))
+
+        self.exchange.cancel(self.trading_pair, order_id)
+
+        self.assertNotIn(order_id, self.exchange.queue_positions)
+
+
+class PaperTradeExchangeLatencyTests(TestCase):
+    start_timestamp: float = 1640995200.0
+    trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.exchange.set_balance("COINALPHA", Decimal("100"))
+        self.exchange.set_balance("HBOT", Decimal("10000"))
+        self.exchange.new_empty_order_book(self.trading_pair)
+        self.order_book = self.exchange.order_books[self.trading_pair]
+        self.order_book.apply_snapshot([OrderBookRow(100.0, 10.0, 1)], [OrderBookRow(101.0, 10.0, 1)], 1)
+        self.exchange.set_latency_model(PaperTradeLatencyModel.from_config({"create": 2, "cancel": 3, "fill": 1}))
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 100)
+        self.clock.add_iterator(self.exchange)
+        self.clock.backtest_til(self.start_timestamp)
+
+        self.created_logger = EventLogger()
+        self.fill_logger = EventLogger()
+        self.cancel_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.BuyOrderCreated, self.created_logger)
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.exchange.add_listener(MarketEvent.OrderCancelled, self.cancel_logger)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_limit_order_reaches_book_after_create_latency(self):
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertEqual(self.start_timestamp + 2, self.exchange.next_pending_action_timestamp)
+
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(0, len(self.exchange.limit_orders))
+
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(1, len(self.exchange.limit_orders))
+        self.assertEqual(0, len(self.created_logger.event_log))
+
+        self.async_run_with_timeout(self.created_logger.wait_for(BuyOrderCreatedEvent))
+        self.assertEqual(1, len(self.created_logger.event_log))
+        self.assertEqual(self.start_timestamp + 2, self.created_logger.event_log[0].timestamp)
+
+    def test_limit_order_holds_balance_before_reaching_exchange(self):
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        self.exchange.sell(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("102"))
+
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertEqual(Decimal("9901"), self.exchange.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("98"), self.exchange.get_available_balance("COINALPHA"))
+
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(2, len(self.exchange.limit_orders))
+        self.assertEqual(Decimal("9901"), self.exchange.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("98"), self.exchange.get_available_balance("COINALPHA"))
+
+    def test_limit_order_created_event_is_triggered_asynchronously_without_latency(self):
+        self.exchange.set_latency_model(None)
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+
+        self.assertEqual(1, len(self.exchange.limit_orders))
+        self.assertEqual(0, len(self.created_logger.event_log))
+
+        self.async_run_with_timeout(self.created_logger.wait_for(BuyOrderCreatedEvent))
+        self.assertEqual(1, len(self.created_logger.event_log))
+
+    def test_order_can_fill_before_cancel_reaches_exchange(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        self.clock.backtest_til(self.start_timestamp + 2)
+
+        self.exchange.cancel(self.trading_pair, order_id)
+        self.order_book.apply_diffs([], [OrderBookRow(98.0, 5.0, 2)], 2)
+        self.clock.backtest_til(self.start_timestamp + 3)
+
+        # The fill happened, but its notification is delayed
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(self.start_timestamp + 3, self.fill_logger.event_log[0].timestamp)
+        self.assertEqual(0, len(self.cancel_logger.event_log))
+
+    def test_cancel_before_order_reaches_exchange(self):
+        self.exchange.set_latency_model(PaperTradeLatencyModel.from_config({"create": 5, "cancel": 1}))
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        self.exchange.cancel(self.trading_pair, order_id)
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+
+        self.assertEqual(1, len(self.cancel_logger.event_log))
+        self.assertEqual(0, len(self.created_logger.event_log))
+        self.assertEqual(0, len(self.exchange.limit_orders))
+
+    def test_rate_limits_delay_order_creation(self):
+        self.exchange.set_latency_model(None)
+        self.exchange.set_rate_limiter(SimulatedRateLimiter(
+            [RateLimit(limit_id="/order", limit=1, time_interval=10)], limits_share_percentage=Decimal("100")))
+
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("97"))
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("98"))
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(1, len(self.exchange.limit_orders))
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+        self.assertEqual(2, len(self.exchange.limit_orders))
+
+    def test_market_orders_are_executed_by_creation_timestamp(self):
+        self.exchange.set_latency_model(PaperTradeLatencyModel.from_config({"create": 10}))
+        delayed_order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.MARKET)
+        self.exchange.set_latency_model(None)
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.MARKET)
+
+        self.assertEqual([order_id, delayed_order_id], [order.order_id for order in self.exchange.queued_orders])
+        self.assertEqual(self.start_timestamp + self.exchange.TRADE_EXECUTION_DELAY,
+                         self.exchange.next_pending_action_timestamp)
+
+        self.clock.backtest_til(self.start_timestamp + self.exchange.TRADE_EXECUTION_DELAY)
+
+        self.assertEqual([order_id], [event.order_id for event in self.fill_logger.event_log])
+        self.assertEqual([delayed_order_id], [order.order_id for order in self.exchange.queued_orders])
+        self.assertEqual(self.start_timestamp + 10 + self.exchange.TRADE_EXECUTION_DELAY,
+                         self.exchange.next_pending_action_timestamp)
@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+from hummingbot.connector.exchange.paper_trade.queue_position import QueuePosition
+
+
+class QueuePositionTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.position = QueuePosition("buy://COINALPHA-HBOT/1", "COINALPHA-HBOT", True, 100.0, 10.0)
+
+    def test_trades_consume_queue_ahead_first(self):
+        self.assertEqual(0.0, self.position.on_trade(4.0))
+        self.assertEqual(6.0, self.position.queue_ahead)
+
+        self.assertEqual(2.0, self.position.on_trade(8.0))
+        self.assertEqual(0.0, self.position.queue_ahead)
+
+        self.assertEqual(3.0, self.position.on_trade(3.0))
+
+    def test_level_decrease_explained_by_trades_does_not_move_queue(self):
+        self.position.on_trade(4.0)
+        self.position.on_level_update(6.0)
+
+        self.assertEqual(6.0, self.position.queue_ahead)
+        self.assertEqual(6.0, self.position.level_volume)
+
+    def test_cancellations_move_queue_proportionally(self):
+        # Half of the level is ahead of the order
+        self.position.queue_ahead = 5.0
+        self.position.on_level_update(6.0)
+
+        self.assertAlmostEqual(3.0, self.position.queue_ahead)
+
+    def test_volume_added_to_level_queues_behind(self):
+        self.position.on_level_update(25.0)
+
+        self.assertEqual(10.0, self.position.queue_ahead)
+        self.assertEqual(25.0, self.position.level_volume)
+
+    def test_queue_ahead_capped_by_level_volume(self):
+        self.position.on_level_update(0.0)
+
+        self.assertEqual(0.0, self.position.queue_ahead)
@@ -1,4 +1,5 @@
 import asyncio
+import contextvars
 import unittest
 from decimal import Decimal
 from typing import Awaitable, Dict
@@ -6,11 +7,21 @@ from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
-from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.client_order_tracker import (
+    ORDER_ACK_LATENCY,
+    ORDER_FIRST_FILL_LATENCY,
+    ClientOrderTracker,
+)
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_latency_span import (
+    CURRENT_ORDER_LATENCY_SPAN,
+    IN_USER_STREAM_CONTEXT,
+    OrderLatencySpan,
+    OrderLatencyStage,
+)
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -611,6 +622,96 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
             order_filled_event.trade_fee, AddedToCostTradeFee(flat_fees=[TokenAmount(self.quote_asset, fee_paid)])
         )
 
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker._perf_counter")
+    def test_order_ack_and_first_fill_latency_metrics(self, perf_counter_mock):
+        perf_counter_mock.side_effect = [10.0, 10.25, 10.75]
+        ORDER_ACK_LATENCY.clear()
+        ORDER_FIRST_FILL_LATENCY.clear()
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order_creation_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_creation_update))
+
+        trade_update_args = dict(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=order.trading_pair,
+            fill_price=Decimal("1.0"),
+            fill_base_amount=Decimal("100"),
+            fill_quote_amount=Decimal("100"),
+            fee=AddedToCostTradeFee(flat_fees=[TokenAmount(token=self.quote_asset, amount=Decimal("0.1"))]),
+            fill_timestamp=1,
+        )
+        self.tracker.process_trade_update(TradeUpdate(trade_id="1", **trade_update_args))
+        # Only the first fill of the order is measured
+        self.tracker.process_trade_update(TradeUpdate(trade_id="2", **trade_update_args))
+
+        ack_latency = ORDER_ACK_LATENCY.labels(self.connector.name)
+        first_fill_latency = ORDER_FIRST_FILL_LATENCY.labels(self.connector.name)
+        self.assertEqual(1, ack_latency.count)
+        self.assertAlmostEqual(0.25, ack_latency.sum)
+        self.assertEqual(1, first_fill_latency.count)
+        self.assertAlmostEqual(0.75, first_fill_latency.sum)
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker._perf_counter")
+    def test_order_latency_span_stages(self, perf_counter_mock):
+        perf_counter_mock.side_effect = [10.0, 10.5]
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        span = OrderLatencySpan(order.client_order_id, self.trading_pair, 9.0)
+
+        def start_tracking_in_span():
+            CURRENT_ORDER_LATENCY_SPAN.set(span)
+            self.tracker.start_tracking_order(order)
+
+        contextvars.copy_context().run(start_tracking_in_span)
+        self.assertIs(span, order.latency_span)
+
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update))
+
+        def process_update_from_user_stream():
+            IN_USER_STREAM_CONTEXT.set(True)
+            return self.tracker.process_order_update(order_update)
+
+        self.async_run_with_timeout(contextvars.copy_context().run(process_update_from_user_stream))
+
+        self.assertEqual(1.0, span.elapsed(OrderLatencyStage.PROCESSED))
+        self.assertEqual(1.5, span.elapsed(OrderLatencyStage.CONFIRMED))
+        self.assertEqual([], self.tracker.latency_recorder.spans)
+
+        # The incomplete spans are recorded when the order stops being tracked
+        self.tracker.stop_tracking_order(order.client_order_id)
+        self.assertEqual([span], self.tracker.latency_recorder.spans)
+
     def test_process_trade_update_does_not_trigger_filled_event_update_status_when_completely_filled(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
@@ -1,15 +1,18 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
 from sqlalchemy import create_engine
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
@@ -23,6 +26,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -67,6 +71,9 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -264,6 +271,214 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+    def test_fill_updates_performance_tracker(self):
+        performance_tracker = PerformanceTracker()
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            performance_tracker=performance_tracker,
+        )
+
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")),
+            exchange_trade_id="TradeId1"
+        )
+
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        self.assertIs(performance_tracker, recorder.performance_tracker)
+        self.assertEqual([(self.display_name, self.trading_pair)], performance_tracker.markets)
+        accumulator = performance_tracker.accumulator(self.display_name, self.trading_pair)
+        self.assertEqual(1, accumulator.num_buys)
+        self.assertEqual(Decimal(1), accumulator.b_vol_base)
+        self.assertEqual(Decimal(-1010), accumulator.b_vol_quote)
+        self.assertEqual(Decimal("10.1"), accumulator.fees[self.quote])
+
+    def test_write_behind_batches_order_records(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()),
+                                           SQLConnectionType.TRADE_FILLS,
+                                           db_path=os.path.join(temp_dir, "test.sqlite"))
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                market_data_collection=MarketDataCollectionConfigMap(
+                    market_data_collection_enabled=False,
+                    market_data_collection_interval=60,
+                    market_data_collection_depth=20,
+                ),
+                db_write_interval=60,
+            )
+            recorder.write_queue.start()
+
+            create_event = BuyOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id="OID1-1642010000000000",
+                creation_timestamp=1640001112.223,
+                exchange_order_id="EOID1",
+            )
+            self.tracking_states = {"OID1-1642010000000000": "created"}
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            fill_event = OrderFilledEvent(
+                timestamp=1642020000,
+                order_id=create_event.order_id,
+                trading_pair=create_event.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=create_event.type,
+                price=Decimal(1010),
+                amount=create_event.amount,
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id="TradeId1"
+            )
+            self.tracking_states = {"OID1-1642010000000000": "filled"}
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+            with manager.get_new_session() as session:
+                self.assertEqual(0, session.query(Order).count())
+            # The order, its status updates and the trade fill. The market states are snapshotted once per interval
+            self.assertEqual(2, recorder.write_queue.pending_writes)
+
+            recorder.stop()
+
+            with manager.get_new_session() as session:
+                order = session.query(Order).one()
+                self.assertEqual(MarketEvent.OrderFilled.name, order.last_status)
+                self.assertEqual(2, len(order.status))
+                self.assertEqual(1, len(order.trade_fills))
+                market_state = session.query(MarketState).one()
+                self.assertEqual({"OID1-1642010000000000": "filled"}, market_state.saved_state)
+            manager.engine.dispose()
+
+    def test_market_states_snapshot_taken_once_per_write_interval(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()),
+                                           SQLConnectionType.TRADE_FILLS,
+                                           db_path=os.path.join(temp_dir, "test.sqlite"))
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                market_data_collection=MarketDataCollectionConfigMap(
+                    market_data_collection_enabled=False,
+                    market_data_collection_interval=60,
+                    market_data_collection_depth=20,
+                ),
+                db_write_interval=0.01,
+            )
+            recorder._trades_csv_exporter = MagicMock()
+            recorder.write_queue.start()
+
+            with patch.object(MarketsRecorderTests, "tracking_states", new_callable=PropertyMock,
+                              create=True) as tracking_states_mock:
+                tracking_states_mock.return_value = {"OID1": "filled"}
+                create_event = BuyOrderCreatedEvent(
+                    timestamp=1642010000,
+                    type=OrderType.LIMIT,
+                    trading_pair=self.trading_pair,
+                    amount=Decimal(1),
+                    price=Decimal(1000),
+                    order_id="OID1",
+                    creation_timestamp=1640001112.223,
+                    exchange_order_id="EOID1",
+                )
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+                fill_event = OrderFilledEvent(
+                    timestamp=1642020000,
+                    order_id=create_event.order_id,
+                    trading_pair=create_event.trading_pair,
+                    trade_type=TradeType.BUY,
+                    order_type=create_event.type,
+                    price=Decimal(1010),
+                    amount=create_event.amount,
+                    trade_fee=AddedToCostTradeFee(),
+                    exchange_trade_id="TradeId1"
+                )
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+                self.assertEqual(0, tracking_states_mock.call_count)
+
+                self.async_run_with_timeout(asyncio.sleep(0.05))
+
+                self.assertEqual(1, tracking_states_mock.call_count)
+
+            recorder.write_queue.stop()
+
+            with manager.get_new_session() as session:
+                market_state = session.query(MarketState).one()
+                self.assertEqual({"OID1": "filled"}, market_state.saved_state)
+            manager.engine.dispose()
+
+    def test_trade_fill_exported_once_when_batch_is_retried(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()),
+                                           SQLConnectionType.TRADE_FILLS,
+                                           db_path=os.path.join(temp_dir, "test.sqlite"))
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                market_data_collection=MarketDataCollectionConfigMap(
+                    market_data_collection_enabled=False,
+                    market_data_collection_interval=60,
+                    market_data_collection_depth=20,
+                ),
+                db_write_interval=60,
+            )
+            recorder._trades_csv_exporter = MagicMock()
+            recorder.write_queue.start()
+
+            def failing_write(session):
+                raise ValueError("Invalid record")
+
+            fill_event = OrderFilledEvent(
+                timestamp=1642020000,
+                order_id="OID1",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal(1010),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id="TradeId1"
+            )
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder.write_queue.submit(failing_write)
+
+            self.assertEqual(0, recorder._trades_csv_exporter.append.call_count)
+
+            with self.assertLogs(recorder.write_queue.logger().name, level="ERROR"):
+                recorder.write_queue.stop()
+
+            recorder._trades_csv_exporter.append.assert_called_once()
+            csv_path, field_names, field_data = recorder._trades_csv_exporter.append.call_args.args
+            self.assertEqual("trades_test_co.csv", os.path.basename(csv_path))
+            self.assertEqual("TradeId1", field_data[field_names.index("exchange_trade_id")])
+            with manager.get_new_session() as session:
+                self.assertEqual(1, session.query(TradeFill).count())
+            manager.engine.dispose()
+
     def test_create_order_and_completed(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -356,3 +571,7 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+        self.assertEqual(1, market_data[0].resolution)
+        bids, asks = MarketData.decode_depth(market_data[0].order_book)
+        self.assertEqual([[3, 1], [2, 1], [1, 1]], bids.tolist())
+        self.assertEqual([[4, 1], [5, 1], [6, 1], [7, 1]], asks.tolist())
@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from hummingbot.connector.order_latency_recorder import (
+    ORDER_LATENCY,
+    OrderLatencyRecorder,
+    write_order_latency_trace,
+)
+from hummingbot.core.data_type.order_latency_span import OrderLatencySpan, OrderLatencyStage
+
+
+class OrderLatencyRecorderTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        ORDER_LATENCY.clear()
+        self.recorder = OrderLatencyRecorder(max_spans=10)
+
+    def create_span(self, client_order_id: str, submitted_time: float, **elapsed_times: float) -> OrderLatencySpan:
+        span = OrderLatencySpan(client_order_id, "COINALPHA-HBOT", submitted_time)
+        for stage_name, elapsed_time in elapsed_times.items():
+            span.mark(OrderLatencyStage[stage_name.upper()], submitted_time + elapsed_time)
+        return span
+
+    def test_span_keeps_first_time_of_each_stage(self):
+        span = self.create_span("OID1", 10.0, throttled=0.5)
+
+        self.assertFalse(span.mark(OrderLatencyStage.THROTTLED, 12.0))
+        self.assertEqual(0.5, span.elapsed(OrderLatencyStage.THROTTLED))
+        self.assertIsNone(span.elapsed(OrderLatencyStage.CONFIRMED))
+        self.assertFalse(span.is_complete)
+
+    def test_percentiles_of_each_stage(self):
+        for index in range(1, 11):
+            span = self.create_span(f"OID{index}", 100.0, throttled=0.001 * index, responded=0.1 * index)
+            self.recorder.record(span, "binance")
+        self.recorder.record(self.create_span("OID11", 100.0, processed=0.2), "binance")
+
+        percentiles = self.recorder.percentiles()
+
+        self.assertNotIn(OrderLatencyStage.CONFIRMED, percentiles)
+        # The recorder keeps the last 10 spans, the span of OID1 was dropped
+        self.assertEqual(10, len(self.recorder.spans))
+        throttled_percentiles = percentiles[OrderLatencyStage.THROTTLED]
+        self.assertEqual([50, 90, 99], list(throttled_percentiles))
+        self.assertEqual([0.006, 0.01, 0.01], [round(value, 6) for value in throttled_percentiles.values()])
+        processed_percentiles = percentiles[OrderLatencyStage.PROCESSED]
+        self.assertEqual([0.2, 0.2, 0.2], [round(value, 6) for value in processed_percentiles.values()])
+        self.assertEqual(11, ORDER_LATENCY.labels("binance", "processed").count
+                         + ORDER_LATENCY.labels("binance", "responded").count)
+
+    def test_span_recorded_once(self):
+        span = self.create_span("OID1", 100.0, throttled=0.01)
+
+        self.recorder.record(span, "binance")
+        self.recorder.record(span, "binance")
+
+        self.assertEqual([span], self.recorder.spans)
+        self.assertEqual(1, ORDER_LATENCY.labels("binance", "throttled").count)
+
+    def test_write_order_latency_trace(self):
+        span = self.create_span("OID1", 100.0, throttled=0.001, responded=0.05, confirmed=0.04, processed=0.06)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "order_latency.json")
+            write_order_latency_trace(file_path, {"binance": [span]})
+            with open(file_path) as trace_file:
+                events = json.load(trace_file)["traceEvents"]
+
+        self.assertEqual({"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "binance"}},
+                         events[0])
+        self.assertEqual(("b", "OID1", 100e6), (events[1]["ph"], events[1]["name"], events[1]["ts"]))
+        # The stages are in the order they were reached
+        self.assertEqual(["submitted", "throttled", "confirmed", "responded", "processed"],
+                         [event["name"] for event in events[2:-1]])
+        self.assertEqual(("e", "OID1", 100.06e6), (events[-1]["ph"], events[-1]["name"], events[-1]["ts"]))
+        self.assertTrue(all(event["id"] == "OID1" for event in events[1:]))
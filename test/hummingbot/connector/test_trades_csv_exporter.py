@@ -0,0 +1,83 @@
+import csv
+import os
+import tempfile
+from unittest import TestCase
+
+from hummingbot.connector.trades_csv_exporter import TradesCSVExporter
+
+
+class TradesCSVExporterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.temp_dir.name, "trades_test_config.csv")
+        self.header = ("exchange_trade_id", "price", "trade_fee", "age")
+        self.exporter = TradesCSVExporter(flush_interval=60)
+
+    def tearDown(self) -> None:
+        self.exporter.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def read_rows(self, csv_path: str):
+        with open(csv_path, newline="") as csv_file:
+            return list(csv.reader(csv_file))
+
+    def test_new_file_gets_header_and_rows(self):
+        self.exporter.append(self.csv_path, self.header, ("T1", 100.5, {"percent": "0.01"}, "n/a"))
+        self.exporter.append(self.csv_path, self.header, ("T2", 101, {"percent": "0.01"}, "00:00:01"))
+
+        self.assertEqual(
+            [list(self.header),
+             ["T1", "100.5", "{'percent': '0.01'}", "n/a"],
+             ["T2", "101", "{'percent': '0.01'}", "00:00:01"]],
+            self.read_rows(self.csv_path))
+
+    def test_existing_file_with_matching_header_is_appended(self):
+        with open(self.csv_path, "w", newline="") as csv_file:
+            csv.writer(csv_file).writerows([self.header, ("T1", 100, "{}", "n/a")])
+
+        self.exporter.append(self.csv_path, self.header, ("T2", 101, "{}", "n/a"))
+
+        self.assertEqual([list(self.header), ["T1", "100", "{}", "n/a"], ["T2", "101", "{}", "n/a"]],
+                         self.read_rows(self.csv_path))
+        self.assertEqual(["trades_test_config.csv"], os.listdir(self.temp_dir.name))
+
+    def test_existing_file_with_different_header_is_moved_aside(self):
+        with open(self.csv_path, "w", newline="") as csv_file:
+            csv.writer(csv_file).writerows([("exchange_trade_id", "price"), ("T1", 100)])
+
+        self.exporter.append(self.csv_path, self.header, ("T2", 101, "{}", "n/a"))
+
+        self.assertEqual([list(self.header), ["T2", "101", "{}", "n/a"]], self.read_rows(self.csv_path))
+        old_files = [name for name in os.listdir(self.temp_dir.name) if name.startswith("trades_test_config_old_")]
+        self.assertEqual(1, len(old_files))
+        self.assertEqual([["exchange_trade_id", "price"], ["T1", "100"]],
+                         self.read_rows(os.path.join(self.temp_dir.name, old_files[0])))
+
+    def test_header_is_checked_once(self):
+        self.exporter.append(self.csv_path, self.header, ("T1", 100, "{}", "n/a"))
+        self.exporter._csv_matches_header = None
+
+        self.exporter.append(self.csv_path, self.header, ("T2", 101, "{}", "n/a"))
+
+        self.assertEqual(3, len(self.read_rows(self.csv_path)))
+
+    def test_rows_are_buffered_until_flush_when_running(self):
+        self.exporter.start()
+        self.exporter.append(self.csv_path, self.header, ("T1", 100, "{}", "n/a"))
+
+        self.assertEqual([], self.read_rows(self.csv_path))
+
+        self.exporter.flush()
+
+        self.assertEqual([list(self.header), ["T1", "100", "{}", "n/a"]], self.read_rows(self.csv_path))
+
+    def test_stop_flushes_and_closes_files(self):
+        self.exporter.start()
+        self.exporter.append(self.csv_path, self.header, ("T1", 100, "{}", "n/a"))
+        self.exporter.stop()
+
+        self.assertFalse(self.exporter.running)
+        self.assertEqual([list(self.header), ["T1", "100", "{}", "n/a"]], self.read_rows(self.csv_path))
@@ -1,4 +1,5 @@
 import asyncio
+import contextvars
 import logging
 import math
 import sys
@@ -12,6 +13,11 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
 from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.data_type.order_latency_span import (
+    CURRENT_ORDER_LATENCY_SPAN,
+    OrderLatencySpan,
+    OrderLatencyStage,
+)
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -214,6 +220,26 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         # We acquire()'d just one rate_limit, task log should have only one entry
         self.assertEqual(1, len(self.throttler._task_logs))
 
+    def test_acquire_marks_order_latency_span_of_current_task(self):
+        rate_limit = self.rate_limits[0]
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=[],
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        span = OrderLatencySpan("OID1", "COINALPHA-HBOT", time.perf_counter())
+
+        async def acquire_in_span():
+            CURRENT_ORDER_LATENCY_SPAN.set(span)
+            await context.acquire()
+
+        self.ev_loop.run_until_complete(acquire_in_span())
+        self.assertGreaterEqual(span.elapsed(OrderLatencyStage.THROTTLED), 0)
+
+        # Requests outside of the creation of an order are not traced
+        contextvars.copy_context().run(lambda: self.ev_loop.run_until_complete(context.acquire()))
+        self.assertIsNone(CURRENT_ORDER_LATENCY_SPAN.get())
+
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
         self.throttler._task_logs.append(
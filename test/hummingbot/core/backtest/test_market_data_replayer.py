@@ -0,0 +1,128 @@
+import math
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.latency_model import PaperTradeLatencyModel
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.backtest.market_data_replayer import MarketDataReplayer
+from hummingbot.core.backtest.market_data_source import OrderBookMessageListSource
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+
+
+class MarketDataReplayerTests(unittest.TestCase):
+    start_timestamp: float = 1640995200.0
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.exchange.set_balance("COINALPHA", Decimal("100"))
+        self.exchange.set_balance("HBOT", Decimal("10000"))
+        self.messages = [
+            OrderBookMessage(
+                OrderBookMessageType.SNAPSHOT,
+                {"trading_pair": self.trading_pair, "update_id": 1, "bids": [[99.0, 10.0]], "asks": [[101.0, 10.0]]},
+                timestamp=self.start_timestamp + 0.5,
+            ),
+            OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": self.trading_pair, "update_id": 2, "bids": [[99.5, 5.0]], "asks": []},
+                timestamp=self.start_timestamp + 30.2,
+            ),
+            OrderBookMessage(
+                OrderBookMessageType.TRADE,
+                {"trading_pair": self.trading_pair, "trade_type": float(TradeType.SELL.value), "trade_id": 1,
+                 "update_id": 3, "price": 98.0, "amount": 3.0},
+                timestamp=self.start_timestamp + 3600.1,
+            ),
+        ]
+        self.replayer = MarketDataReplayer(self.start_timestamp)
+        self.replayer.add_market_data_source(self.exchange, OrderBookMessageListSource(self.messages))
+
+    def test_next_timestamp(self):
+        self.assertEqual(self.start_timestamp + 0.5, self.replayer.next_timestamp)
+
+        self.replayer.process_until(self.start_timestamp + 3600)
+
+        self.assertEqual(self.start_timestamp + 3600.1, self.replayer.next_timestamp)
+
+        self.replayer.process_until(self.start_timestamp + 3601)
+
+        self.assertTrue(math.isnan(self.replayer.next_timestamp))
+
+    def test_process_until_applies_messages_to_order_book(self):
+        processed = self.replayer.process_until(self.start_timestamp + 1)
+
+        self.assertEqual(1, processed)
+        order_book = self.exchange.order_books[self.trading_pair]
+        self.assertEqual(99.0, order_book.get_price(False))
+        self.assertEqual(101.0, order_book.get_price(True))
+
+        self.replayer.process_until(self.start_timestamp + 31)
+
+        self.assertEqual(99.5, order_book.get_price(False))
+        self.assertEqual(2, self.replayer.messages_applied)
+
+    def test_replayed_trades_fill_paper_limit_orders(self):
+        fill_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        self.replayer.process_until(self.start_timestamp + 31)
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+
+        self.replayer.process_until(self.start_timestamp + 3601)
+
+        self.assertEqual(1, len(fill_logger.event_log))
+
+    def test_adding_source_after_start_fails(self):
+        self.replayer.process_until(self.start_timestamp)
+
+        with self.assertRaises(EnvironmentError):
+            self.replayer.add_market_data_source(self.exchange, OrderBookMessageListSource([]))
+
+    def test_backtest_clock_jumps_to_next_event(self):
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 7200)
+        clock.add_iterator(self.exchange)
+        clock.set_market_data_replayer(self.replayer)
+        profiler = clock.enable_tick_profiling()
+
+        clock.backtest()
+
+        # One tick per recorded event, plus the final tick at the end timestamp
+        self.assertEqual(4, profiler.tick_stats.count)
+        self.assertEqual(self.start_timestamp + 7200, clock.current_timestamp)
+        self.assertEqual(3, self.replayer.messages_applied)
+
+    def test_backtest_clock_runs_until_end_of_data(self):
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, float("nan"))
+        clock.add_iterator(self.exchange)
+        clock.set_market_data_replayer(self.replayer)
+
+        clock.backtest()
+
+        self.assertEqual(self.start_timestamp + 3601, clock.current_timestamp)
+
+    def test_backtest_clock_stops_at_delayed_exchange_actions(self):
+        self.exchange.set_latency_model(PaperTradeLatencyModel.from_config({"create": 120}))
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 7200)
+        clock.add_iterator(self.exchange)
+        clock.set_market_data_replayer(self.replayer)
+        clock.backtest_til(self.start_timestamp + 31)
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+
+        self.assertEqual(self.start_timestamp + 151, self.replayer.next_timestamp)
+
+        clock.backtest_til(self.start_timestamp + 3600)
+
+        self.assertEqual(1, len(self.exchange.limit_orders))
+
+    def test_replayer_only_allowed_in_backtest_mode(self):
+        clock = Clock(ClockMode.REALTIME, 1.0)
+
+        with self.assertRaises(EnvironmentError):
+            clock.set_market_data_replayer(self.replayer)
@@ -0,0 +1,111 @@
+import math
+import os
+import tempfile
+import unittest
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_log import (
+    MarketDataLogCodec,
+    MarketDataLogReader,
+    MarketDataLogWriter,
+    decode_chunk,
+    decode_messages,
+    encode_chunk,
+    encode_message,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class MarketDataLogTests(unittest.TestCase):
+    start_timestamp: float = 1640995200.0
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.messages = [
+            OrderBookMessage(
+                OrderBookMessageType.SNAPSHOT,
+                {"trading_pair": self.trading_pair, "update_id": 1,
+                 "bids": [[99.0, 10.0], [98.0, 5.0]], "asks": [[101.0, 10.0]]},
+                timestamp=self.start_timestamp + 1,
+            ),
+            OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": self.trading_pair, "update_id": 2, "bids": [[99.0, 0.0]], "asks": []},
+                timestamp=self.start_timestamp + 2,
+            ),
+            OrderBookMessage(
+                OrderBookMessageType.TRADE,
+                {"trading_pair": self.trading_pair, "trade_type": float(TradeType.SELL.value), "trade_id": 12,
+                 "update_id": 12, "price": 98.0, "amount": 1.5},
+                timestamp=self.start_timestamp + 3,
+            ),
+        ]
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_encode_and_decode_chunk(self):
+        records = []
+        for message in self.messages:
+            encode_message(message, records)
+
+        # snapshot header + 3 levels, diff header + 1 level, 1 trade
+        self.assertEqual(7, len(records))
+
+        for codec in (MarketDataLogCodec.NONE, MarketDataLogCodec.ZLIB):
+            decoded = list(decode_messages(self.trading_pair, decode_chunk(encode_chunk(records, codec))))
+
+            self.assertEqual(3, len(decoded))
+            self.assertEqual(OrderBookMessageType.SNAPSHOT, decoded[0].type)
+            self.assertEqual([[99.0, 10.0], [98.0, 5.0]], decoded[0].content["bids"])
+            self.assertEqual([[101.0, 10.0]], decoded[0].content["asks"])
+            self.assertEqual(1, decoded[0].update_id)
+            self.assertEqual(OrderBookMessageType.DIFF, decoded[1].type)
+            self.assertEqual([[99.0, 0.0]], decoded[1].content["bids"])
+            self.assertEqual(OrderBookMessageType.TRADE, decoded[2].type)
+            self.assertEqual(float(TradeType.SELL.value), decoded[2].content["trade_type"])
+            self.assertEqual(12, decoded[2].trade_id)
+            self.assertEqual(1.5, decoded[2].content["amount"])
+            self.assertEqual(self.start_timestamp + 3, decoded[2].timestamp)
+
+    def test_writer_and_reader_round_trip(self):
+        writer = MarketDataLogWriter(self.temp_dir.name, compression="zlib")
+        writer.start()
+        for message in self.messages:
+            writer.record("binance", message)
+        writer.stop()
+
+        self.assertEqual(7, writer.records_written)
+        log_dir = writer.exchange_log_dir("binance")
+        self.assertTrue(os.path.exists(os.path.join(log_dir, "2022-01-01.hbmd")))
+
+        reader = MarketDataLogReader(log_dir)
+        self.assertEqual(["2022-01-01"], reader.dates())
+        self.assertEqual({self.trading_pair: 0}, reader.trading_pairs("2022-01-01"))
+
+        messages = list(reader.iter_messages(self.trading_pair))
+        self.assertEqual([message.type for message in self.messages], [message.type for message in messages])
+
+        messages = list(reader.iter_messages(self.trading_pair, self.start_timestamp + 2, self.start_timestamp + 2))
+        self.assertEqual(1, len(messages))
+        self.assertEqual(OrderBookMessageType.DIFF, messages[0].type)
+
+        self.assertEqual([], list(reader.iter_messages("OTHER-PAIR")))
+
+    def test_reader_ignores_incomplete_chunks(self):
+        writer = MarketDataLogWriter(self.temp_dir.name, compression="none")
+        writer.start()
+        writer.record("binance", self.messages[0])
+        writer.stop()
+        log_dir = writer.exchange_log_dir("binance")
+        data_path = os.path.join(log_dir, "2022-01-01.hbmd")
+        with open(data_path, "r+b") as data_file:
+            data_file.truncate(os.path.getsize(data_path) - 1)
+
+        reader = MarketDataLogReader(log_dir)
+
+        self.assertEqual([], reader.index("2022-01-01"))
+        self.assertEqual([], list(reader.iter_messages(self.trading_pair, 0, math.nan)))
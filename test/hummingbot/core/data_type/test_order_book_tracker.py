@@ -0,0 +1,67 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, List, Optional
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerMessageRecorderTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        self.tracking_task: Optional[asyncio.Task] = None
+
+        # Simulate start()
+        self.tracker._order_books[self.trading_pair] = OrderBook()
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracker._order_books_initialized.set()
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def track_snapshot(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": 2,
+            "bids": [[99.0, 10.0]],
+            "asks": [[101.0, 5.0]],
+        }, timestamp=time.time())
+        self.tracker._tracking_message_queues[self.trading_pair].put_nowait(snapshot)
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+    def test_snapshot_message_not_built_without_recorders(self):
+        with patch.object(OrderBookTracker, "_snapshot_message_from_order_book") as snapshot_message_mock:
+            self.track_snapshot()
+
+        snapshot_message_mock.assert_not_called()
+        self.assertEqual(2, self.tracker.order_books[self.trading_pair].snapshot_uid)
+
+    def test_restored_snapshot_is_recorded(self):
+        recorded: List[OrderBookMessage] = []
+        self.tracker.add_message_recorder(recorded.append)
+        # The recorder gets the current state of the book when registered
+        self.assertEqual(1, len(recorded))
+
+        self.track_snapshot()
+
+        self.assertEqual(2, len(recorded))
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, recorded[-1].type)
+        self.assertEqual(2, recorded[-1].update_id)
+        self.assertEqual([[99.0, 10.0]], recorded[-1].content["bids"])
+        self.assertEqual([[101.0, 5.0]], recorded[-1].content["asks"])
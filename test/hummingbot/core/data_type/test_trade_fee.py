@@ -267,6 +267,20 @@ class TokenAmountTests(TestCase):
         self.assertEqual(amount, TokenAmount.from_json(amount.to_json()))
 
 
+class TradeFeeSchemaTests(TestCase):
+
+    def test_json_deserialization(self):
+        schema = TradeFeeSchema(
+            percent_fee_token="BNB",
+            maker_percent_fee_decimal=Decimal("0.00075"),
+            taker_percent_fee_decimal=Decimal("0.001"),
+            maker_fixed_fees=[TokenAmount(token="BNB", amount=Decimal("0.1"))],
+            taker_fixed_fees=[TokenAmount(token="USDT", amount=Decimal("1"))],
+        )
+
+        self.assertEqual(schema, TradeFeeSchema.from_json(schema.to_json()))
+
+
 class TradeUpdateTests(TestCase):
 
     def test_json_serialization(self):
@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable, Dict, Optional
+from unittest.mock import patch
+
+from hummingbot.core.rate_oracle.sources.composite_rate_source import (
+    CompositeRateSource,
+    CompositeRateSourceEntry,
+    parse_rate_sources,
+)
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+
+
+class DummyRateSource(RateSourceBase):
+    def __init__(self, name: str, price_dict: Dict[str, Decimal], blocked: bool = False):
+        self._name = name
+        self._price_dict = price_dict
+        self._blocked = blocked
+        self.requested_quote_tokens = []
+
+    @property
+    def name(self):
+        return self._name
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        self.requested_quote_tokens.append(quote_token)
+        if self._blocked:
+            await asyncio.Event().wait()
+        return dict(self._price_dict)
+
+
+class CompositeRateSourceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.primary_source = DummyRateSource("primary", {"BTC-USDT": Decimal("20000")})
+        self.secondary_source = DummyRateSource("secondary", {"BTC-USDT": Decimal("20100"),
+                                                              "ETH-USDT": Decimal("1000")})
+        self.rate_source = CompositeRateSource(
+            sources=[CompositeRateSourceEntry(source=self.primary_source, update_interval=1, ttl=10),
+                     CompositeRateSourceEntry(source=self.secondary_source, update_interval=1, ttl=10)],
+            initial_prices_timeout=0.5,
+        )
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.rate_source.stop_network())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_parse_rate_sources(self):
+        self.assertEqual([("binance", 5), ("kucoin", 10), ("coin_gecko", 60)],
+                         parse_rate_sources("binance:5, kucoin ,coin_gecko:60", default_update_interval=10))
+        with self.assertRaises(ValueError):
+            parse_rate_sources("binance:fast")
+        with self.assertRaises(ValueError):
+            parse_rate_sources("binance:0")
+        with self.assertRaises(ValueError):
+            parse_rate_sources("")
+
+    def test_prices_are_merged_by_priority(self):
+        prices = self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        prices = self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+
+        self.assertEqual({"BTC-USDT": Decimal("20000"), "ETH-USDT": Decimal("1000")}, prices)
+        self.assertEqual(["USDT"], self.primary_source.requested_quote_tokens)
+        self.assertEqual(["USDT"], self.secondary_source.requested_quote_tokens)
+
+    def test_merged_prices_are_cached_until_sources_update(self):
+        self.rate_source._update_source_prices(index=1, prices={"ETH-USDT": Decimal("1000")}, timestamp=100)
+
+        prices = self.rate_source._get_merged_prices(timestamp=101)
+        self.assertIs(prices, self.rate_source._get_merged_prices(timestamp=102))
+
+        self.rate_source._update_source_prices(index=1, prices={"ETH-USDT": Decimal("1100")}, timestamp=103)
+
+        self.assertEqual({"ETH-USDT": Decimal("1100")}, self.rate_source._get_merged_prices(timestamp=104))
+
+    def test_expired_prices_fall_back_to_lower_priority_sources(self):
+        self.rate_source._update_source_prices(index=0, prices={"BTC-USDT": Decimal("20000")}, timestamp=100)
+        self.rate_source._update_source_prices(
+            index=1, prices={"BTC-USDT": Decimal("20100"), "ETH-USDT": Decimal("1000")}, timestamp=105)
+
+        self.assertEqual({"BTC-USDT": Decimal("20000"), "ETH-USDT": Decimal("1000")},
+                         self.rate_source._get_merged_prices(timestamp=109))
+        self.assertEqual({"BTC-USDT": Decimal("20100"), "ETH-USDT": Decimal("1000")},
+                         self.rate_source._get_merged_prices(timestamp=110))
+        self.assertEqual({}, self.rate_source._get_merged_prices(timestamp=115))
+
+    def test_slow_source_does_not_block_prices(self):
+        self.secondary_source._blocked = True
+
+        prices = self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+
+        self.assertEqual({"BTC-USDT": Decimal("20000")}, prices)
+
+    @patch("hummingbot.core.rate_oracle.sources.composite_rate_source.CompositeRateSource.logger")
+    def test_failing_source_is_logged_and_others_are_used(self, logger_mock):
+        async def failing_get_prices(quote_token: Optional[str] = None):
+            raise IOError("Rate limit exceeded")
+
+        self.primary_source.get_prices = failing_get_prices
+
+        prices = self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+
+        self.assertEqual({"BTC-USDT": Decimal("20100"), "ETH-USDT": Decimal("1000")}, prices)
+        logger_mock.return_value.network.assert_called()
+
+    def test_quote_token_change_resets_prices(self):
+        self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+        self.primary_source._price_dict = {"BTC-EUR": Decimal("19000")}
+        self.secondary_source._price_dict = {}
+
+        prices = self.async_run_with_timeout(self.rate_source.get_prices(quote_token="EUR"))
+
+        self.assertEqual({"BTC-EUR": Decimal("19000")}, prices)
+        self.assertEqual(["USDT", "EUR"], self.primary_source.requested_quote_tokens)
@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable, Dict, Optional
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.rate_oracle.sources.order_book_rate_source import OrderBookRateSource
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+
+
+class DummyRateSource(RateSourceBase):
+    def __init__(self, price_dict: Dict[str, Decimal]):
+        self._price_dict = price_dict
+        self.calls = 0
+
+    @property
+    def name(self):
+        return "dummy_rate_source"
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        self.calls += 1
+        return dict(self._price_dict)
+
+
+class OrderBookRateSourceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        btc_book = OrderBook()
+        btc_book.apply_snapshot([OrderBookRow(19990.0, 1.0, 1)], [OrderBookRow(20010.0, 1.0, 1)], 1)
+        empty_book = OrderBook()
+        self.connector = MagicMock()
+        self.connector.order_books = {"BTC-USDT": btc_book, "ETH-USDT": empty_book}
+        self.fallback_source = DummyRateSource({"BTC-USDT": Decimal("19000"), "ETH-USDT": Decimal("1000")})
+        self.rate_source = OrderBookRateSource(connectors_provider=lambda: {"binance": self.connector},
+                                               fallback_source=self.fallback_source,
+                                               fallback_update_interval=60)
+        self.rate_source._time = MagicMock(return_value=1000)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_order_book_prices_are_mid_prices_of_non_empty_books(self):
+        self.assertEqual({"BTC-USDT": Decimal("20000")}, self.rate_source.order_book_prices())
+
+    def test_live_prices_take_precedence_over_fallback_prices(self):
+        prices = self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+
+        self.assertEqual({"BTC-USDT": Decimal("20000"), "ETH-USDT": Decimal("1000")}, prices)
+
+    def test_fallback_prices_are_refreshed_in_background_after_interval(self):
+        self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+        self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+        self.assertEqual(1, self.fallback_source.calls)
+
+        self.fallback_source._price_dict = {"ETH-USDT": Decimal("1100")}
+        self.rate_source._time.return_value = 1060
+        prices = self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+        self.assertEqual(Decimal("1000"), prices["ETH-USDT"])
+
+        self.async_run_with_timeout(asyncio.sleep(0))
+        prices = self.async_run_with_timeout(self.rate_source.get_prices(quote_token="USDT"))
+
+        self.assertEqual(2, self.fallback_source.calls)
+        self.assertEqual({"BTC-USDT": Decimal("20000"), "ETH-USDT": Decimal("1100")}, prices)
+
+    def test_without_fallback_only_order_books_are_used(self):
+        rate_source = OrderBookRateSource(connectors_provider=lambda: {"binance": self.connector})
+
+        prices = self.async_run_with_timeout(rate_source.get_prices(quote_token="USDT"))
+
+        self.assertEqual({"BTC-USDT": Decimal("20000")}, prices)
+
+    def test_default_connectors_provider_is_used_without_provider(self):
+        rate_source = OrderBookRateSource()
+        self.assertEqual({}, rate_source.order_book_prices())
+
+        default_connectors_provider = OrderBookRateSource._default_connectors_provider
+        OrderBookRateSource.set_default_connectors_provider(lambda: {"binance": self.connector})
+        try:
+            self.assertEqual({"BTC-USDT": Decimal("20000")}, rate_source.order_book_prices())
+        finally:
+            OrderBookRateSource.set_default_connectors_provider(default_connectors_provider)
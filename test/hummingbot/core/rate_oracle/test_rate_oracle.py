@@ -4,13 +4,20 @@ from copy import deepcopy
 from decimal import Decimal
 from typing import Awaitable, Dict, Optional
 
-from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.client_config_map import (
+    ClientConfigMap,
+    CompositeRateSourceMode,
+    OrderBookRateSourceMode,
+)
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
+from hummingbot.core.rate_oracle.sources.composite_rate_source import CompositeRateSource
+from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
+from hummingbot.core.rate_oracle.sources.order_book_rate_source import OrderBookRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateTable, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -82,6 +89,47 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_rate_table_finds_multi_hop_rates(self):
+        prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "EUR-GBP": Decimal("0.5"),
+                  "WETH-USDT": Decimal("1000")}
+        rate_table = RateTable(prices)
+
+        self.assertEqual(Decimal("150"), rate_table.rate("HBOT-EUR"))
+        self.assertEqual(Decimal("1") / Decimal("150"), rate_table.rate("EUR-HBOT"))
+        self.assertEqual(Decimal("10"), rate_table.rate("ETH-HBOT"))
+        self.assertEqual(Decimal("1"), rate_table.rate("WETH-ETH"))
+        self.assertIsNone(rate_table.rate("ZBOT-USDT"))
+
+    def test_rate_table_prefers_paths_through_most_connected_tokens(self):
+        prices = {"HBOT-ZBOT": Decimal("2"), "ZBOT-GBP": Decimal("1"),
+                  "HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"),
+                  "BTC-USDT": Decimal("20000"), "ETH-USDT": Decimal("1000")}
+        rate_table = RateTable(prices)
+
+        self.assertEqual([("HBOT-USDT", False), ("USDT-GBP", False)], rate_table.path("HBOT", "GBP"))
+        self.assertEqual(Decimal("75"), rate_table.rate("HBOT-GBP"))
+
+    def test_rate_table_memoizes_rates(self):
+        prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")}
+        rate_table = RateTable(prices)
+        self.assertEqual(Decimal("75"), rate_table.rate("HBOT-GBP"))
+
+        prices["HBOT-USDT"] = Decimal("200")
+
+        self.assertEqual(Decimal("75"), rate_table.rate("HBOT-GBP"))
+        self.assertEqual(Decimal("150"), RateTable(prices, warm_pairs=rate_table.resolved_pairs).rate("HBOT-GBP"))
+
+    def test_get_pair_rate_uses_updated_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"HBOT-USDT": Decimal("100")}
+        self.assertEqual(Decimal("100"), rate_oracle.get_pair_rate("HBOT-USDT"))
+
+        rate_oracle._prices["USDT-GBP"] = Decimal("0.75")
+        self.assertEqual(Decimal("75"), rate_oracle.get_pair_rate("HBOT-GBP"))
+
+        rate_oracle._prices = {"HBOT-USDT": Decimal("200"), "USDT-GBP": Decimal("0.75")}
+        self.assertEqual(Decimal("150"), rate_oracle.get_pair_rate("HBOT-GBP"))
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
@@ -89,6 +137,50 @@ class RateOracleTest(unittest.TestCase):
         config_map.rate_oracle_source = "coin_gecko"
         self.assertEqual(type(rate_oracle.source), CoinGeckoRateSource)
 
+    def test_rate_oracle_single_instance_composite_rate_source_configuration(self):
+        config_map = ClientConfigAdapter(ClientConfigMap())
+        config_map.rate_oracle_source = CompositeRateSourceMode(sources="kucoin:5,coin_gecko:30")
+        rate_oracle = RateOracle.get_instance()
+
+        self.assertEqual(type(rate_oracle.source), CompositeRateSource)
+        self.assertEqual([KucoinRateSource, CoinGeckoRateSource], [type(s) for s in rate_oracle.source.sources])
+        self.assertEqual([5, 30], [entry.update_interval for entry in rate_oracle.source._sources])
+
+    def test_rate_oracle_composite_rate_source_rebuilt_after_settings_change(self):
+        config_map = ClientConfigAdapter(ClientConfigMap())
+        config_map.rate_oracle_source = CompositeRateSourceMode(sources="kucoin:5,coin_gecko:30")
+        rate_oracle = RateOracle.get_instance()
+        rate_source = rate_oracle.source
+
+        config_map.rate_oracle_source.sources = "kucoin:5,coin_gecko:30"
+        self.assertIs(rate_source, rate_oracle.source)
+
+        config_map.rate_oracle_source.price_ttl = 30
+        self.assertIsNot(rate_source, rate_oracle.source)
+        self.assertEqual([30, 30], [entry.ttl for entry in rate_oracle.source.entries])
+
+        config_map.rate_oracle_source.sources = "coin_gecko:60"
+        self.assertEqual([CoinGeckoRateSource], [type(s) for s in rate_oracle.source.sources])
+        self.assertEqual([60], [entry.update_interval for entry in rate_oracle.source.entries])
+
+    def test_rate_oracle_order_book_rate_source_rebuilt_after_fallback_change(self):
+        config_map = ClientConfigAdapter(ClientConfigMap())
+        config_map.rate_oracle_source = OrderBookRateSourceMode(fallback_source="kucoin")
+        rate_oracle = RateOracle.get_instance()
+        rate_source = rate_oracle.source
+
+        self.assertEqual(OrderBookRateSource, type(rate_source))
+        self.assertEqual(KucoinRateSource, type(rate_source.fallback_source))
+
+        config_map.rate_oracle_source.fallback_update_interval = 60
+        self.assertIs(rate_source, rate_oracle.source)
+
+        config_map.rate_oracle_source.fallback_update_interval = 10
+        self.assertEqual(10, rate_oracle.source.fallback_update_interval)
+
+        config_map.rate_oracle_source.fallback_source = "none"
+        self.assertIsNone(rate_oracle.source.fallback_source)
+
     def test_rate_oracle_single_instance_prices_reset_after_global_token_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
 
@@ -124,3 +124,21 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_tick_profiling_disabled_by_default(self):
+        self.assertIsNone(self.clock_backtest.tick_profiler)
+
+    def test_backtest_with_tick_profiling(self):
+        time_iterator: TimeIterator = TimeIterator()
+        self.clock_backtest.add_iterator(time_iterator)
+        profiler = self.clock_backtest.enable_tick_profiling()
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 5 * self.tick_size)
+
+        self.assertIs(profiler, self.clock_backtest.tick_profiler)
+        self.assertEqual(5, profiler.tick_stats.count)
+        self.assertEqual(1, len(profiler.iterator_stats))
+        self.assertEqual(5, profiler.iterator_stats[0].count)
+
+        self.clock_backtest.enable_tick_profiling(False)
+        self.assertIsNone(self.clock_backtest.tick_profiler)
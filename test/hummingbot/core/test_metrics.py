@@ -0,0 +1,121 @@
+import asyncio
+import math
+import unittest
+from typing import Awaitable
+
+import aiohttp
+
+from hummingbot.core.metrics import Histogram, MetricsRegistry
+from hummingbot.core.metrics_server import MetricsHttpServer
+from hummingbot.core.utils import detect_available_port
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_gauge_per_label_values(self):
+        messages = self.registry.counter("messages_total", "Messages", ("connector",))
+        messages.labels("binance").inc()
+        messages.labels("binance").inc(2)
+        messages.labels("kucoin").inc()
+        depth = self.registry.gauge("queue_depth", "Queue depth")
+        depth.labels().set(5)
+        depth.labels().dec()
+
+        self.assertEqual(3, messages.labels("binance").value)
+        self.assertEqual(1, messages.labels("kucoin").value)
+        self.assertEqual(4, depth.labels().value)
+        self.assertIs(messages, self.registry.counter("messages_total", "Messages", ("connector",)))
+
+    def test_registering_metric_again_with_other_type_or_labels_fails(self):
+        self.registry.counter("messages_total", "Messages", ("connector",))
+
+        with self.assertRaises(ValueError):
+            self.registry.gauge("messages_total", "Messages", ("connector",))
+        with self.assertRaises(ValueError):
+            self.registry.counter("messages_total", "Messages", ("connector", "type"))
+        with self.assertRaises(ValueError):
+            self.registry.counter("messages_total", "Messages", ("connector",)).labels("binance", "diff")
+
+    def test_histogram_buckets_and_percentiles(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        self.assertEqual([2, 1, 1], histogram.bucket_counts)
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(2.65, histogram.sum)
+        self.assertEqual(0.1, histogram.percentile(50))
+        self.assertEqual(1.0, histogram.percentile(75))
+        self.assertEqual(math.inf, histogram.percentile(99))
+
+    def test_prometheus_text(self):
+        self.registry.counter("messages_total", "Messages\nreceived", ("connector",)).labels('bin"ance').inc(3)
+        self.registry.histogram("latency_seconds", "Latency", bucket_bounds=(0.1, 1.0)).labels().observe(0.5)
+
+        expected = (
+            '# HELP messages_total Messages\\nreceived\n'
+            '# TYPE messages_total counter\n'
+            'messages_total{connector="bin\\"ance"} 3.0\n'
+            '# HELP latency_seconds Latency\n'
+            '# TYPE latency_seconds histogram\n'
+            'latency_seconds_bucket{le="0.1"} 0\n'
+            'latency_seconds_bucket{le="1.0"} 1\n'
+            'latency_seconds_bucket{le="+Inf"} 1\n'
+            'latency_seconds_sum 0.5\n'
+            'latency_seconds_count 1\n'
+        )
+        self.assertEqual(expected, self.registry.to_prometheus_text())
+
+    def test_to_json(self):
+        self.registry.gauge("queue_depth", "Queue depth", ("trading_pair",)).labels("BTC-USDT").set(2)
+        self.registry.histogram("latency_seconds", "Latency", bucket_bounds=(0.1,)).labels().observe(1)
+
+        metrics = self.registry.to_json()["metrics"]
+
+        self.assertEqual({"type": "gauge", "samples": [{"labels": {"trading_pair": "BTC-USDT"}, "value": 2}]},
+                         metrics["queue_depth"])
+        self.assertEqual({"type": "histogram",
+                          "samples": [{"labels": {}, "count": 1, "sum": 1, "p50": None, "p90": None, "p99": None}]},
+                         metrics["latency_seconds"])
+
+    def test_clear(self):
+        messages = self.registry.counter("messages_total", "Messages")
+        messages.labels().inc()
+
+        self.registry.clear()
+
+        self.assertEqual(0, messages.labels().value)
+
+
+class MetricsHttpServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_metrics_served_in_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        registry.counter("messages_total", "Messages").labels().inc()
+        port = detect_available_port(9108)
+        server = MetricsHttpServer("127.0.0.1", port, registry)
+
+        async def fetch_metrics():
+            async with aiohttp.ClientSession() as client:
+                async with client.get(f"http://127.0.0.1:{port}/metrics") as response:
+                    return response.headers["Content-Type"], await response.text()
+
+        self.async_run_with_timeout(server.start())
+        try:
+            content_type, text = self.async_run_with_timeout(fetch_metrics())
+        finally:
+            self.async_run_with_timeout(server.stop())
+
+        self.assertEqual("text/plain; version=0.0.4; charset=utf-8", content_type)
+        self.assertEqual(registry.to_prometheus_text(), text)
+        self.assertFalse(server.started)
@@ -0,0 +1,100 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+from hummingbot.core.sampling_profiler import SamplingProfiler, asyncio_task_states, measure_event_loop_lag
+
+
+def busy_wait(duration: float):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+def traced_outer(duration: float):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        traced_inner()
+
+
+def traced_inner():
+    return sum(range(100))
+
+
+class SamplingProfilerTest(unittest.TestCase):
+
+    def test_samples_stacks_of_profiled_thread(self):
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        busy_wait(0.1)
+        profiler.stop()
+
+        self.assertFalse(profiler.started)
+        self.assertGreater(profiler.sample_count, 0)
+        busy_stacks = [stack for stack in profiler.collapsed_stacks()
+                       if stack.endswith(f"busy_wait (test_sampling_profiler.py:{busy_wait.__code__.co_firstlineno})")]
+        self.assertEqual(1, len(busy_stacks))
+        self.assertIn("test_samples_stacks_of_profiled_thread", busy_stacks[0])
+        self.assertEqual("busy_wait", profiler.top_frames(limit=1)[0]["frame"].split(" ")[0])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "profile.collapsed")
+            profiler.write_collapsed_stacks(file_path)
+            with open(file_path) as profile_file:
+                lines = profile_file.read().splitlines()
+        stack_counts = dict(line.rsplit(" ", 1) for line in lines)
+        self.assertEqual(profiler.sample_count, sum(int(count) for count in stack_counts.values()))
+        self.assertIn(busy_stacks[0], stack_counts)
+
+    def test_trace_calls_samples_shadow_stack(self):
+        previous_profile_function = sys.getprofile()
+        profiler = SamplingProfiler(interval=0.001, trace_calls=True)
+        profiler.start()
+        traced_outer(0.1)
+        profiler.stop()
+
+        self.assertIs(previous_profile_function, sys.getprofile())
+        stacks = profiler.collapsed_stacks()
+        # The frames running before the profiler started are not traced
+        self.assertTrue(all(stack.startswith("traced_outer") for stack in stacks if "traced_outer" in stack))
+        self.assertTrue(any(stack.split(";")[-1].startswith("traced_inner") for stack in stacks))
+
+    def test_measure_event_loop_lag(self):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.call_later(0.02, busy_wait, 0.1)
+            lag = loop.run_until_complete(measure_event_loop_lag(0.3, interval=0.05))
+        finally:
+            loop.close()
+
+        self.assertGreater(lag["count"], 0)
+        self.assertGreater(lag["max_ms"], 40)
+        self.assertLessEqual(lag["mean_ms"], lag["max_ms"])
+
+    def test_asyncio_task_states(self):
+        loop = asyncio.new_event_loop()
+        try:
+            event = asyncio.Event()
+
+            async def wait_for_event():
+                await event.wait()
+
+            async def run():
+                task = loop.create_task(wait_for_event(), name="waiter")
+                await asyncio.sleep(0)
+                states = asyncio_task_states(loop)
+                event.set()
+                await task
+                return states
+
+            states = loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+        waiter_state = next(state for state in states if state["name"] == "waiter")
+        self.assertEqual("pending", waiter_state["state"])
+        self.assertIn("wait_for_event", waiter_state["coroutine"])
+        self.assertIn("test_sampling_profiler.py", waiter_state["location"])
@@ -0,0 +1,111 @@
+import unittest
+from typing import Any, Dict, List
+
+from hummingbot.core.tick_profiler import TickDurationStats, TickProfiler
+
+
+class DummyIterator:
+    display_name = "dummy"
+
+
+class TickDurationStatsTest(unittest.TestCase):
+
+    def test_record_updates_running_stats(self):
+        stats = TickDurationStats("test", bucket_bounds=(0.001, 0.01, 0.1))
+
+        stats.record(0.0005)
+        stats.record(0.005)
+        stats.record(0.5)
+
+        self.assertEqual(3, stats.count)
+        self.assertAlmostEqual(0.5055, stats.total)
+        self.assertEqual(0.5, stats.max)
+        self.assertEqual(0.5, stats.last)
+        self.assertEqual([1, 1, 0, 1], stats.histogram.bucket_counts)
+
+    def test_percentile(self):
+        stats = TickDurationStats("test", bucket_bounds=(0.001, 0.01, 0.1))
+        for _ in range(98):
+            stats.record(0.0005)
+        stats.record(0.05)
+        stats.record(0.2)
+
+        self.assertEqual(0.001, stats.percentile(50))
+        self.assertEqual(0.1, stats.percentile(99))
+        self.assertEqual(0.2, stats.percentile(100))
+
+    def test_percentile_without_records(self):
+        stats = TickDurationStats("test")
+
+        self.assertEqual(0.0, stats.percentile(99))
+        self.assertEqual(0.0, stats.mean)
+
+    def test_reset(self):
+        stats = TickDurationStats("test", bucket_bounds=(0.001,))
+        stats.record(0.01)
+
+        stats.reset()
+
+        self.assertEqual(0, stats.count)
+        self.assertEqual(0.0, stats.max)
+        self.assertEqual([0, 0], stats.histogram.bucket_counts)
+
+
+class TickProfilerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.profiler = TickProfiler(tick_size=1.0)
+        self.overruns: List[Dict[str, Any]] = []
+        self.profiler.add_overrun_listener(self.overruns.append)
+
+    def test_records_per_iterator(self):
+        iterator = DummyIterator()
+
+        self.profiler.record_iterator(iterator, 0.2)
+        self.profiler.record_iterator(iterator, 0.4)
+        self.profiler.record_tick(1.0, 0.6)
+
+        self.assertEqual(1, len(self.profiler.iterator_stats))
+        stats = self.profiler.iterator_stats[0]
+        self.assertEqual("DummyIterator(dummy)", stats.name)
+        self.assertEqual(2, stats.count)
+        self.assertAlmostEqual(0.3, stats.mean)
+        self.assertEqual(1, self.profiler.tick_stats.count)
+        self.assertEqual(0, self.profiler.overrun_count)
+        self.assertEqual(0, len(self.overruns))
+
+    def test_overrun_detection(self):
+        iterator = DummyIterator()
+        self.profiler.record_iterator(iterator, 1.5)
+
+        self.profiler.record_tick(10.0, 1.6)
+
+        self.assertEqual(1, self.profiler.overrun_count)
+        self.assertEqual(1, len(self.overruns))
+        overrun = self.overruns[0]
+        self.assertEqual(10.0, overrun["timestamp"])
+        self.assertAlmostEqual(1600, overrun["duration_ms"])
+        self.assertEqual("DummyIterator(dummy)", overrun["slowest_iterator"])
+        self.assertEqual(overrun, self.profiler.last_overrun)
+
+    def test_remove_iterator(self):
+        iterator = DummyIterator()
+        self.profiler.record_iterator(iterator, 0.1)
+
+        self.profiler.remove_iterator(iterator)
+
+        self.assertEqual(0, len(self.profiler.iterator_stats))
+
+    def test_to_dict_and_format_status(self):
+        self.profiler.record_iterator(DummyIterator(), 0.1)
+        self.profiler.record_tick(1.0, 0.1)
+
+        stats = self.profiler.to_dict()
+
+        self.assertEqual(1, stats["ticks"])
+        self.assertEqual(0, stats["overruns"])
+        self.assertEqual("DummyIterator(dummy)", stats["iterators"][0]["name"])
+        status = self.profiler.format_status()
+        self.assertIn("Clock tick profile:", status)
+        self.assertIn("DummyIterator(dummy)", status)
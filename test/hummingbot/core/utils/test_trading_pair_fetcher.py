@@ -1,5 +1,7 @@
 import asyncio
 import json
+import os
+import tempfile
 import unittest
 from decimal import Decimal
 from typing import Any, Awaitable, Dict
@@ -62,6 +64,15 @@ class TestTradingPairFetcher(unittest.TestCase):
         def non_trading_connector_instance_with_default_configuration(self, trading_pairs = None):
             return self._connector
 
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.directory.name, "trading_pairs.json")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
     @classmethod
     def tearDownClass(cls) -> None:
         # Need to reset TradingPairFetcher module so next time it gets imported it works as expected
@@ -82,7 +93,8 @@ class TestTradingPairFetcher(unittest.TestCase):
         }
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
-        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        self.async_run_with_timeout(trading_pair_fetcher.fetch_all(client_config_map), 1.0)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
@@ -240,8 +252,8 @@ class TestTradingPairFetcher(unittest.TestCase):
         }
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
-        fetcher = TradingPairFetcher(client_config_map)
-        asyncio.get_event_loop().run_until_complete(fetcher._fetch_task)
+        fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        asyncio.get_event_loop().run_until_complete(fetcher.fetch_all(client_config_map))
         trading_pairs = fetcher.trading_pairs
 
         self.assertEqual(2, len(trading_pairs.keys()))
@@ -255,3 +267,64 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(1, len(perp_pairs))
         self.assertIn("ABC-USD", perp_pairs)
         self.assertNotIn("WETH-USDT", perp_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_trading_pairs_are_fetched_on_request_and_cached(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+
+        self.assertEqual({}, trading_pair_fetcher.trading_pairs)
+
+        trading_pair_fetcher.request_trading_pairs("mock_exchange_1")
+        trading_pair_fetcher.request_trading_pairs("mock_exchange_1")
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_tasks["mock_exchange_1"])
+        trading_pair_fetcher.request_trading_pairs("mock_exchange_1")
+
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.assertEqual(1, connector.all_trading_pairs.call_count)
+
+        cached_fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        cached_fetcher.request_trading_pairs("mock_exchange_1")
+
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"]}, cached_fetcher.trading_pairs)
+        self.assertEqual({}, cached_fetcher._fetch_tasks)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_outdated_trading_pairs_are_fetched_again(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT", "MOCK-USDT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        with open(self.cache_path, "w") as cache_file:
+            json.dump({"mock_exchange_1": {"timestamp": 1000, "trading_pairs": ["MOCK-HBOT"]}}, cache_file)
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path, cache_ttl=60)
+
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+        trading_pair_fetcher.request_trading_pairs("mock_exchange_1")
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_tasks["mock_exchange_1"])
+
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT", "MOCK-USDT"]}, trading_pair_fetcher.trading_pairs)
+        with open(self.cache_path) as cache_file:
+            self.assertEqual(["MOCK-HBOT", "MOCK-USDT"], json.load(cache_file)["mock_exchange_1"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_no_trading_pairs_fetched_when_fetching_disabled(self, mock_connector_settings):
+        connector = AsyncMock()
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()), cache_path=self.cache_path)
+        trading_pair_fetcher.disable_fetching()
+
+        trading_pair_fetcher.request_trading_pairs("mock_exchange_1")
+
+        self.assertEqual({}, trading_pair_fetcher._fetch_tasks)
+        connector.all_trading_pairs.assert_not_called()
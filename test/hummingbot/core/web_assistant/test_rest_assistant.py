@@ -11,7 +11,7 @@ from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
-from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+from hummingbot.core.web_assistant.rest_assistant import REST_REQUEST_LATENCY, RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
@@ -63,6 +63,28 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertTrue(pre_processor_ran)
         self.assertTrue(post_processor_ran)
 
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_call_records_latency_per_endpoint(self, mocked_call):
+        url = "https://www.test.com/url"
+
+        async def return_response(request: RESTRequest):
+            return {}
+
+        mocked_call.side_effect = return_response
+        REST_REQUEST_LATENCY.clear()
+
+        async def call_twice():
+            connection = RESTConnection(aiohttp.ClientSession())
+            assistant = RESTAssistant(connection=connection, throttler=AsyncThrottler(rate_limits=[]))
+            await assistant.call(RESTRequest(method=RESTMethod.GET, url=url, throttler_limit_id="ID"))
+            await assistant.call(RESTRequest(method=RESTMethod.GET, url=url))
+            await connection._client_session.close()
+
+        self.async_run_with_timeout(call_twice())
+
+        self.assertEqual(1, REST_REQUEST_LATENCY.labels("ID").count)
+        self.assertEqual(1, REST_REQUEST_LATENCY.labels("unknown").count)
+
     @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
     def test_rest_assistant_authenticates(self, mocked_call):
         url = "https://www.test.com/url"
@@ -1,14 +1,19 @@
 import asyncio
 import json
 import re
+import tempfile
 import unittest
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles, constants as CONSTANTS
+from hummingbot.data_feed.candles_feed.candle_indicators import RSI
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
 
 
 class TestBinanceSpotCandles(unittest.TestCase):
@@ -317,3 +322,116 @@ class TestBinanceSpotCandles(unittest.TestCase):
     def _create_exception_and_unlock_test_with_event(self, exception):
         self.resume_test_event.set()
         raise exception
+
+    def test_candles_df_is_rebuilt_only_when_candles_change(self):
+        self.data_feed._candles.append([1672981200000, 100, 110, 90, 105, 1, 1, 1, 1, 1])
+        rsi = self.data_feed.add_indicator(RSI(length=1))
+
+        candles_df = self.data_feed.candles_df
+        candles_df["RSI_1"] = 0
+        cached_df = self.data_feed._candles_df
+
+        self.assertEqual(list(CandlesBase.columns), list(self.data_feed.candles_df.columns))
+        self.assertIs(cached_df, self.data_feed._candles_df)
+
+        self.data_feed._candles.append([1672984800000, 105, 120, 100, 115, 1, 1, 1, 1, 1])
+
+        self.assertEqual([105, 115], self.data_feed.candles_df["close"].tolist())
+        self.assertIsNot(cached_df, self.data_feed._candles_df)
+        self.assertEqual(100, rsi.value)
+
+    @staticmethod
+    def candle(timestamp: int):
+        return [timestamp, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+
+    def test_fill_historical_candles_from_cache_only_fetches_missing_candles(self):
+        hour = 3600 * 1000
+        with tempfile.TemporaryDirectory() as directory:
+            self.data_feed.candles_cache = CandlesCache(directory=directory)
+            self.data_feed.candles_cache.save(self.data_feed.name, self.interval,
+                                              np.array([self.candle(i * hour) for i in range(400)], dtype=float))
+            self.data_feed._candles.append(self.candle(410 * hour))
+            fetch_candles_mock = AsyncMock(
+                return_value=np.array([self.candle(i * hour) for i in range(400, 410)], dtype=float))
+            self.data_feed.fetch_candles = fetch_candles_mock
+
+            self.async_run_with_timeout(self.data_feed._fill_historical_candles_from_cache())
+
+            fetch_candles_mock.assert_awaited_once_with(start_time=400 * hour, end_time=409 * hour, limit=500)
+            self.assertTrue(self.data_feed.is_ready)
+            self.assertEqual([i * hour for i in range(261, 411)], self.data_feed.candles_df["timestamp"].tolist())
+
+            self.data_feed._save_candles_to_cache()
+
+            self.assertEqual([i * hour for i in range(410)],
+                             self.data_feed.candles_cache.load(self.data_feed.name, self.interval)[:, 0].tolist())
+
+    def test_fill_historical_candles_from_cache_ignores_incomplete_cache(self):
+        hour = 3600 * 1000
+        with tempfile.TemporaryDirectory() as directory:
+            self.data_feed.candles_cache = CandlesCache(directory=directory)
+            self.data_feed.candles_cache.save(self.data_feed.name, self.interval,
+                                              np.array([self.candle(i * hour) for i in range(400)], dtype=float))
+            self.data_feed._candles.append(self.candle(410 * hour))
+            self.data_feed.fetch_candles = AsyncMock(return_value=np.empty((0, 10)))
+
+            self.async_run_with_timeout(self.data_feed._fill_historical_candles_from_cache())
+
+            self.assertEqual(1, len(self.data_feed._candles))
+            self.assertTrue(self.is_logged(
+                "WARNING",
+                f"The cached candles of {self.data_feed.name} could not be completed up to the current candle, "
+                f"fetching all the historical candles."))
+
+    def test_fill_historical_candles_from_cache_only_uses_candles_after_the_last_gap(self):
+        hour = 3600 * 1000
+        with tempfile.TemporaryDirectory() as directory:
+            self.data_feed.candles_cache = CandlesCache(directory=directory)
+            # The cache merges two buffers, the candles between them are missing
+            self.data_feed.candles_cache.save(self.data_feed.name, self.interval,
+                                              np.array([self.candle(i * hour) for i in range(300)], dtype=float))
+            self.data_feed.candles_cache.save(self.data_feed.name, self.interval,
+                                              np.array([self.candle(i * hour) for i in range(310, 400)], dtype=float))
+            self.data_feed._candles.append(self.candle(400 * hour))
+            fetch_candles_mock = AsyncMock(return_value=np.empty((0, 10)))
+            self.data_feed.fetch_candles = fetch_candles_mock
+
+            self.async_run_with_timeout(self.data_feed._fill_historical_candles_from_cache())
+
+            fetch_candles_mock.assert_not_awaited()
+            self.assertEqual([i * hour for i in range(310, 401)], self.data_feed.candles_df["timestamp"].tolist())
+
+    def test_fill_historical_candles_from_cache_skips_cache_older_than_buffer(self):
+        minute = 60 * 1000
+        self.data_feed = BinanceSpotCandles(trading_pair=self.trading_pair, interval="1m", max_records=1000)
+        with tempfile.TemporaryDirectory() as directory:
+            self.data_feed.candles_cache = CandlesCache(directory=directory)
+            # The cache ends a week before the first candle received
+            week = 7 * 24 * 60
+            self.data_feed.candles_cache.save(self.data_feed.name, "1m",
+                                              np.array([self.candle(i * minute) for i in range(1000)], dtype=float))
+            self.data_feed._candles.append(self.candle((1000 + week) * minute))
+            fetch_candles_mock = AsyncMock(return_value=np.empty((0, 10)))
+            self.data_feed.fetch_candles = fetch_candles_mock
+
+            self.async_run_with_timeout(self.data_feed._fill_historical_candles_from_cache())
+
+            fetch_candles_mock.assert_not_awaited()
+            self.assertEqual(1, len(self.data_feed._candles))
+
+    def test_fill_historical_candles_from_cache_only_fetches_candles_fitting_in_buffer(self):
+        hour = 3600 * 1000
+        with tempfile.TemporaryDirectory() as directory:
+            self.data_feed.candles_cache = CandlesCache(directory=directory)
+            self.data_feed.candles_cache.save(self.data_feed.name, self.interval,
+                                              np.array([self.candle(i * hour) for i in range(400)], dtype=float))
+            # 100 candles are missing after the cache, the buffer holds 150 candles
+            self.data_feed._candles.append(self.candle(500 * hour))
+            fetch_candles_mock = AsyncMock(
+                return_value=np.array([self.candle(i * hour) for i in range(400, 500)], dtype=float))
+            self.data_feed.fetch_candles = fetch_candles_mock
+
+            self.async_run_with_timeout(self.data_feed._fill_historical_candles_from_cache())
+
+            fetch_candles_mock.assert_awaited_once_with(start_time=400 * hour, end_time=499 * hour, limit=500)
+            self.assertEqual([i * hour for i in range(351, 501)], self.data_feed.candles_df["timestamp"].tolist())
@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candle_indicators import EMA, MACD, RSI, BollingerBands
+
+
+class CandleIndicatorsTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.closes = pd.Series(100 + np.cumsum(np.random.default_rng(seed=1).normal(size=200)))
+
+    @staticmethod
+    def ema(values: pd.Series, length: int) -> pd.Series:
+        seeded = values.copy()
+        seeded.iloc[:length - 1] = np.nan
+        seeded.iloc[length - 1] = values.iloc[:length].mean()
+        return seeded.ewm(span=length, adjust=False).mean()
+
+    def assert_follows(self, indicator, expected: pd.Series, field: str = None, warm_up: int = 0):
+        for index, (close, expected_value) in enumerate(zip(self.closes, expected)):
+            indicator.add(close)
+            value = getattr(indicator.value, field) if field else indicator.value
+            if index < warm_up:
+                continue
+            if np.isnan(expected_value):
+                self.assertTrue(np.isnan(value))
+            else:
+                self.assertAlmostEqual(expected_value, value, places=8)
+
+    def test_ema(self):
+        self.assert_follows(EMA(length=10), self.ema(self.closes, 10))
+
+    def test_rsi(self):
+        change = self.closes.diff()
+        average_gain = change.clip(lower=0).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+        average_loss = (-change).clip(lower=0).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+
+        self.assert_follows(RSI(length=14), 100 * average_gain / (average_gain + average_loss))
+
+    def test_rsi_matches_pandas_ta_after_warm_up(self):
+        self.closes = pd.Series(100 + np.cumsum(np.random.default_rng(seed=1).normal(size=600)))
+        # pandas_ta smooths with rma, an adjusted EWM whose difference with the recursive average fades out
+        change = self.closes.diff()
+        average_gain = change.clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+        average_loss = (-change).clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+
+        self.assert_follows(RSI(length=14), 100 * average_gain / (average_gain + average_loss), warm_up=400)
+
+    def test_macd(self):
+        macd = self.ema(self.closes, 12) - self.ema(self.closes, 26)
+        signal = pd.Series(np.nan, index=macd.index)
+        first_valid = macd.first_valid_index()
+        signal.loc[first_valid:] = self.ema(macd.loc[first_valid:], 9)
+
+        self.assert_follows(MACD(fast=12, slow=26, signal=9), macd, field="macd")
+        self.assert_follows(MACD(fast=12, slow=26, signal=9), signal, field="signal")
+        self.assert_follows(MACD(fast=12, slow=26, signal=9), macd - signal, field="histogram")
+
+    def test_bollinger_bands(self):
+        middle = self.closes.rolling(20).mean()
+        deviation = self.closes.rolling(20).std(ddof=0)
+
+        self.assert_follows(BollingerBands(length=20, std=2), middle, field="middle")
+        self.assert_follows(BollingerBands(length=20, std=2), middle + 2 * deviation, field="upper")
+        self.assert_follows(BollingerBands(length=20, std=2), middle - 2 * deviation, field="lower")
+
+    def test_replace_last_only_changes_the_last_candle(self):
+        updated = EMA(length=3)
+        for close in [1, 2, 3, 4]:
+            updated.add(close)
+        updated.replace_last(10)
+        updated.replace_last(5)
+        updated.add(6)
+        expected = EMA(length=3)
+        expected.reset([1, 2, 3, 5, 6])
+
+        self.assertEqual(expected.value, updated.value)
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
+
+
+class CandlesCacheTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = CandlesCache(directory=self.directory.name, max_records=4)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_load_missing_cache(self):
+        self.assertIsNone(self.cache.load("binance_BTC-USDT", "1m"))
+
+    def test_save_and_load(self):
+        candles = np.array([[1, 10], [2, 20]], dtype=float)
+        self.cache.save("binance_BTC-USDT", "1m", candles)
+
+        loaded = self.cache.load("binance_BTC-USDT", "1m")
+
+        self.assertIsInstance(loaded, np.memmap)
+        self.assertTrue(loaded.flags.f_contiguous)
+        self.assertEqual(candles.tolist(), loaded.tolist())
+        self.assertIsNone(self.cache.load("binance_BTC-USDT", "5m"))
+
+    def test_save_merges_with_cached_candles_and_keeps_max_records(self):
+        self.cache.save("binance_BTC-USDT", "1m", np.array([[1, 10], [2, 20], [3, 30]], dtype=float))
+        self.cache.save("binance_BTC-USDT", "1m", np.array([[3, 35], [4, 40], [5, 50]], dtype=float))
+
+        self.assertEqual([[2, 20], [3, 35], [4, 40], [5, 50]],
+                         self.cache.load("binance_BTC-USDT", "1m").tolist())
+
+    def test_unreadable_cache_is_ignored(self):
+        with open(self.cache.path("binance_BTC-USDT", "1m"), "w") as cache_file:
+            cache_file.write("not a cache")
+
+        self.assertIsNone(self.cache.load("binance_BTC-USDT", "1m"))
+        self.cache.save("binance_BTC-USDT", "1m", np.array([[1, 10]], dtype=float))
+        self.assertEqual([[1, 10]], self.cache.load("binance_BTC-USDT", "1m").tolist())
+        self.assertEqual(["binance_BTC-USDT_1m.npy"], os.listdir(self.directory.name))
@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candle_indicators import EMA
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+class CandlesRingBufferTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buffer = CandlesRingBuffer(maxlen=3, num_columns=2)
+
+    def test_append_drops_oldest_candles_when_full(self):
+        for i in range(5):
+            self.buffer.append([i, 10 * i])
+
+        self.assertEqual(3, len(self.buffer))
+        self.assertEqual([[2, 20], [3, 30], [4, 40]], self.buffer.to_array().tolist())
+        self.assertEqual(2, self.buffer[0][0])
+        self.assertEqual(4, self.buffer[-1][0])
+        with self.assertRaises(IndexError):
+            self.buffer[3]
+
+    def test_extendleft_behaves_like_deque(self):
+        self.buffer.append([3, 30])
+        self.buffer.extendleft(np.array([[2, 20], [1, 10]]))
+
+        self.assertEqual([[1, 10], [2, 20], [3, 30]], self.buffer.to_array().tolist())
+
+        self.buffer.extendleft([[0, 0]])
+
+        self.assertEqual([[0, 0], [1, 10], [2, 20]], self.buffer.to_array().tolist())
+
+    def test_update_last_pop_and_clear(self):
+        self.buffer.append([1, 10])
+        self.buffer.append([2, 20])
+        self.buffer.update_last([2, 25])
+
+        self.assertEqual([[1, 10], [2, 25]], [candle.tolist() for candle in self.buffer])
+        self.assertEqual([2, 25], self.buffer.pop().tolist())
+        self.assertEqual(1, len(self.buffer))
+
+        self.buffer.clear()
+
+        self.assertEqual(0, len(self.buffer))
+        self.assertEqual((0, 2), self.buffer.to_array().shape)
+
+    def test_version_changes_with_every_modification(self):
+        versions = [self.buffer.version]
+        self.buffer.append([1, 10])
+        versions.append(self.buffer.version)
+        self.buffer.update_last([1, 11])
+        versions.append(self.buffer.version)
+        self.buffer.extendleft([[0, 0]])
+        versions.append(self.buffer.version)
+
+        self.assertEqual(len(versions), len(set(versions)))
+
+    def test_indicators_follow_candles(self):
+        self.buffer.append([1, 10])
+        ema = EMA(length=2)
+        self.buffer.add_indicator(ema, column=1)
+        self.assertTrue(np.isnan(ema.value))
+
+        self.buffer.append([2, 20])
+        self.assertEqual(15, ema.value)
+
+        self.buffer.update_last([2, 30])
+        self.assertEqual(20, ema.value)
+
+        self.buffer.extendleft([[0, 50]])
+        self.assertEqual(30, ema.value)
+
+        self.buffer.clear()
+        self.assertTrue(np.isnan(ema.value))
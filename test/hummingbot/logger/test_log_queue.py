@@ -0,0 +1,128 @@
+import logging
+import threading
+import unittest
+
+from hummingbot.logger import log_queue
+from hummingbot.logger.log_queue import LogQueueHandler, LogQueueListener
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+        self.messages = []
+        self.threads = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+        self.messages.append(record.getMessage())
+        self.threads.append(threading.current_thread())
+
+
+class LazyMessage:
+    def __init__(self):
+        self.formatted = False
+
+    def __str__(self):
+        self.formatted = True
+        return "lazy"
+
+
+class LogQueueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.logger = logging.getLogger("test_log_queue")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        # Only the handlers of the tests are passed the records
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        self.handler = RecordingHandler()
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self) -> None:
+        log_queue.stop_log_queue()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        super().tearDown()
+
+    def test_records_handled_by_listener_thread_in_order(self):
+        log_queue.queue_loggers(["test_log_queue"])
+        self.assertEqual(1, len(self.logger.handlers))
+        self.assertIsInstance(self.logger.handlers[0], LogQueueHandler)
+
+        for i in range(100):
+            self.logger.info("message %d", i)
+        log_queue.stop_log_queue()
+
+        self.assertEqual([f"message {i}" for i in range(100)], self.handler.messages)
+        self.assertTrue(all(thread is not threading.main_thread() for thread in self.handler.threads))
+        # The caller is found when logging, not in the listener thread
+        self.assertEqual("test_records_handled_by_listener_thread_in_order", self.handler.records[0].funcName)
+
+    def test_messages_formatted_by_listener_thread(self):
+        listener = LogQueueListener()
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(LogQueueHandler(listener, [self.handler]))
+        lazy_message = LazyMessage()
+
+        self.logger.info("message %s", lazy_message)
+
+        self.assertFalse(lazy_message.formatted)
+        listener.start()
+        listener.stop()
+        self.assertTrue(lazy_message.formatted)
+        self.assertEqual(["message lazy"], self.handler.messages)
+
+    def test_handler_levels_respected(self):
+        warning_handler = RecordingHandler(logging.WARNING)
+        self.logger.addHandler(warning_handler)
+        log_queue.queue_loggers(["test_log_queue"])
+
+        self.logger.info("info")
+        self.logger.warning("warning")
+        log_queue.stop_log_queue()
+
+        self.assertEqual(["info", "warning"], self.handler.messages)
+        self.assertEqual(["warning"], warning_handler.messages)
+
+    def test_records_dropped_when_queue_full(self):
+        listener = LogQueueListener(max_size=2)
+        queue_handler = LogQueueHandler(listener, [self.handler])
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(queue_handler)
+
+        for i in range(5):
+            self.logger.info("message %d", i)
+        self.logger.error("error")
+
+        self.assertEqual({"INFO": 3, "ERROR": 1}, dict(queue_handler.dropped_records))
+        listener.start()
+        self.logger.info("after drop")
+        listener.stop()
+
+        self.assertEqual(["message 0", "message 1", "after drop",
+                          "4 log records were dropped, the log queue was full."], self.handler.messages)
+        self.assertEqual(logging.WARNING, self.handler.records[-1].levelno)
+
+    def test_add_and_remove_handler_behind_queue(self):
+        log_queue.queue_loggers(["test_log_queue"])
+        other_handler = RecordingHandler()
+
+        log_queue.add_handler(self.logger, other_handler)
+        self.assertEqual(1, len(self.logger.handlers))
+        self.logger.info("first")
+        log_queue.remove_handler(self.logger, other_handler)
+        self.logger.info("second")
+        log_queue.stop_log_queue()
+
+        self.assertEqual(["first"], other_handler.messages)
+        self.assertEqual(["first", "second"], self.handler.messages)
+
+    def test_add_handler_without_queue(self):
+        other_handler = RecordingHandler()
+
+        log_queue.add_handler(self.logger, other_handler)
+        self.assertIn(other_handler, self.logger.handlers)
+        log_queue.remove_handler(self.logger, other_handler)
+        self.assertNotIn(other_handler, self.logger.handlers)
@@ -1,7 +1,19 @@
+import json
+import os
+import sqlite3
+import tempfile
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.db_migration.transformations import (
+    AddTradeFeeInQuote,
+    ConvertMarketDataToTimeSeries,
+    ConvertPriceAndAmountColumnsToBigint,
+)
+from hummingbot.model.market_data import MarketData
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +53,41 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class ConvertMarketDataToTimeSeriesTests(TestCase):
+    def test_name(self):
+        self.assertEqual("ConvertMarketDataToTimeSeries", ConvertMarketDataToTimeSeries(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20261019, ConvertMarketDataToTimeSeries(self).to_version)
+
+    def test_apply_converts_market_data_rows(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, "test.sqlite")
+            connection = sqlite3.connect(db_path)
+            connection.execute("create table MarketData (timestamp BIGINT not null primary key, exchange TEXT not null, "
+                               "trading_pair TEXT not null, mid_price BIGINT not null, best_bid BIGINT not null, "
+                               "best_ask BIGINT not null, order_book JSON);")
+            connection.execute("create index timestamp on MarketData (exchange, trading_pair);")
+            connection.execute("insert into MarketData values (?, ?, ?, ?, ?, ?, ?)",
+                               (1640001112223 * 1000000, "binance", "BTC-USDT", 100500000, 100000000, 101000000,
+                                json.dumps({"bid": [[100.0, 1.5, 7]], "ask": [[101.0, 2.0, 7], [102.0, 3.0, 7]]})))
+            connection.commit()
+            connection.close()
+            db_handle = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                             db_path=db_path, called_from_migrator=True)
+
+            ConvertMarketDataToTimeSeries(migrator=self, chunk_size=1).apply(db_handle)
+
+            with db_handle.get_new_session() as session:
+                market_data = session.query(MarketData).one()
+                self.assertEqual(("binance", "BTC-USDT", 1640001112223, 0),
+                                 (market_data.exchange, market_data.trading_pair, market_data.timestamp,
+                                  market_data.resolution))
+                self.assertEqual((100.5, 100.0, 101.0),
+                                 (market_data.mid_price, market_data.best_bid, market_data.best_ask))
+                bids, asks = MarketData.decode_depth(market_data.order_book)
+                self.assertEqual([[100.0, 1.5]], bids.tolist())
+                self.assertEqual([[101.0, 2.0], [102.0, 3.0]], asks.tolist())
+            db_handle.engine.dispose()
@@ -0,0 +1,90 @@
+from typing import List
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_data_store import DownsamplingTier, SQLMarketDataStore, parse_downsampling_tiers
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.write_behind_queue import WriteBehindQueue
+
+
+class MarketDataStoreTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                            db_path="")
+        # Not started, the writes are executed synchronously
+        self.write_queue = WriteBehindQueue(self.manager)
+        self.day = 24 * 60 * 60
+        self.now = 1700000000.0 // self.day * self.day
+
+    def tearDown(self) -> None:
+        self.manager.engine.dispose()
+        super().tearDown()
+
+    @staticmethod
+    def snapshot(timestamp: float, trading_pair: str = "BTC-USDT") -> MarketData:
+        return MarketData(exchange="binance",
+                          trading_pair=trading_pair,
+                          timestamp=int(timestamp * 1e3),
+                          resolution=60,
+                          mid_price=100.5,
+                          best_bid=100.0,
+                          best_ask=101.0,
+                          order_book=MarketData.encode_depth([(100.0, 1.0, 1)], [(101.0, 2.0, 1), (102.0, 3.0, 1)]))
+
+    def stored_timestamps(self, trading_pair: str = "BTC-USDT") -> List[tuple]:
+        with self.manager.get_new_session() as session:
+            return [(int(row.timestamp / 1e3 - self.now), row.resolution)
+                    for row in (session.query(MarketData)
+                                .filter(MarketData.trading_pair == trading_pair)
+                                .order_by(MarketData.timestamp))]
+
+    def test_parse_downsampling_tiers(self):
+        self.assertEqual([DownsamplingTier(age=self.day, resolution=300), DownsamplingTier(age=7 * self.day, resolution=3600)],
+                         parse_downsampling_tiers("7d:1h, 1d:5m"))
+        self.assertEqual([DownsamplingTier(age=120, resolution=10)], parse_downsampling_tiers("120:10"))
+        self.assertEqual([], parse_downsampling_tiers(""))
+        with self.assertRaises(ValueError):
+            parse_downsampling_tiers("1d")
+        with self.assertRaises(ValueError):
+            parse_downsampling_tiers("1w:5m")
+        with self.assertRaises(ValueError):
+            parse_downsampling_tiers("1d:1h,7d:5m")
+
+    def test_depth_encoding(self):
+        snapshot = self.snapshot(self.now)
+        bids, asks = MarketData.decode_depth(snapshot.order_book)
+
+        self.assertEqual([[100.0, 1.0]], bids.tolist())
+        self.assertEqual([[101.0, 2.0], [102.0, 3.0]], asks.tolist())
+
+    def test_old_snapshots_are_downsampled(self):
+        store = SQLMarketDataStore(self.write_queue, downsampling_tiers=parse_downsampling_tiers("1d:5m,7d:1h"))
+        # Every minute for 10 minutes, 8 days ago, 2 days ago and now
+        store.add_snapshots([self.snapshot(self.now + offset - age)
+                             for age in (8 * self.day, 2 * self.day, 0) for offset in range(0, 600, 60)])
+        store.add_snapshots([self.snapshot(self.now - 2 * self.day, trading_pair="ETH-USDT")])
+
+        store.apply_retention_policy(self.now)
+
+        self.assertEqual(
+            [(-8 * self.day + 540, 3600)]
+            + [(-2 * self.day + 240, 300), (-2 * self.day + 540, 300)]
+            + [(offset, 60) for offset in range(0, 600, 60)],
+            self.stored_timestamps())
+        self.assertEqual([(-2 * self.day, 300)], self.stored_timestamps("ETH-USDT"))
+
+        # Applying the policy again does not change the downsampled snapshots
+        store.apply_retention_policy(self.now)
+        self.assertEqual(13, len(self.stored_timestamps()))
+
+    def test_expired_snapshots_are_removed(self):
+        store = SQLMarketDataStore(self.write_queue, retention_days=7)
+        store.add_snapshots([self.snapshot(self.now - 8 * self.day), self.snapshot(self.now - 6 * self.day)])
+
+        store.apply_retention_policy(self.now)
+
+        self.assertEqual([(-6 * self.day, 60)], self.stored_timestamps())
@@ -1,5 +1,14 @@
+import json
+from decimal import Decimal
 from unittest import TestCase
 
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
 
@@ -15,6 +24,48 @@ class TradeFillTests(TestCase):
         self.base = "COINALPHA"
         self.quote = "HBOT"
         self.trading_pair = f"{self.base}-{self.quote}"
+        self.db = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                       db_path="")
+
+    def tearDown(self) -> None:
+        self.db.engine.dispose()
+        super().tearDown()
+
+    def add_trades(self, num_trades: int, config_file_path: str = None):
+        with self.db.get_new_session() as session:
+            with session.begin():
+                session.add(Order(id="OID1",
+                                  config_file_path=self.config_file_path,
+                                  strategy=self.strategy_name,
+                                  market=self.display_name,
+                                  symbol=self.trading_pair,
+                                  base_asset=self.base,
+                                  quote_asset=self.quote,
+                                  creation_timestamp=1640001000000,
+                                  order_type="LIMIT",
+                                  amount=Decimal("100"),
+                                  leverage=1,
+                                  price=Decimal("1"),
+                                  last_status="CREATED",
+                                  last_update_timestamp=1640001000000))
+                for i in range(num_trades):
+                    session.add(TradeFill(
+                        config_file_path=config_file_path or self.config_file_path,
+                        strategy=self.strategy_name,
+                        market=self.display_name,
+                        symbol=self.trading_pair,
+                        base_asset=self.base,
+                        quote_asset=self.quote,
+                        timestamp=1640001000000 + 61500 * i,
+                        order_id=f"OID{i % 2 + 1}",
+                        trade_type="BUY" if i % 2 == 0 else "SELL",
+                        order_type="LIMIT",
+                        price=Decimal("1.123456") + i,
+                        amount=Decimal("0.5"),
+                        leverage=1,
+                        trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount(self.quote, Decimal("0.01"))]).to_json(),
+                        exchange_trade_id=f"EID{i}",
+                    ))
 
     def test_attribute_names_for_file_export(self):
         expected_attributes = [
@@ -37,3 +88,44 @@ class TradeFillTests(TestCase):
             "position", ]
 
         self.assertEqual(expected_attributes, TradeFill.attribute_names_for_file_export())
+
+    def test_get_trades_frame(self):
+        self.add_trades(3)
+
+        with self.db.get_new_session() as session:
+            trades = TradeFill.get_trades(session)
+            trades_frame = TradeFill.get_trades_frame(session, start_time=1640001000000)
+
+            self.assertEqual(["EID0", "EID1", "EID2"], list(trades_frame["exchange_trade_id"]))
+            self.assertEqual([float(t.price) for t in trades], list(trades_frame["price"]))
+            self.assertEqual([float(t.amount) for t in trades], list(trades_frame["amount"]))
+            self.assertEqual([t.trade_fee for t in trades], [json.loads(fee) for fee in trades_frame["trade_fee"]])
+            self.assertEqual(1640001000000, trades_frame["order_creation_timestamp"].iloc[0])
+            self.assertTrue(pd.isna(trades_frame["order_creation_timestamp"].iloc[1]))
+
+    def test_get_trades_frame_filters(self):
+        self.add_trades(5)
+
+        with self.db.get_new_session() as session:
+            latest_trades = TradeFill.get_trades_frame(session, number_of_rows=2, chunk_size=1)
+            self.assertEqual(["EID3", "EID4"], list(latest_trades["exchange_trade_id"]))
+
+            later_trades = TradeFill.get_trades_frame(session, start_time=1640001000000 + 61500 * 3)
+            self.assertEqual(["EID3", "EID4"], list(later_trades["exchange_trade_id"]))
+
+            self.assertEqual(0, len(TradeFill.get_trades_frame(session, config_file_path="other_config")))
+            self.assertEqual(5, len(TradeFill.get_trades_frame(session, config_file_path="test")))
+
+    def test_trades_frame_to_pandas(self):
+        self.add_trades(3)
+
+        with self.db.get_new_session() as session:
+            expected = TradeFill.to_pandas(TradeFill.get_trades(session))
+            df = TradeFill.trades_frame_to_pandas(TradeFill.get_trades_frame(session))
+
+        self.assertEqual(list(expected.columns), list(df.columns))
+        self.assertEqual(list(expected.index), list(df.index))
+        self.assertEqual(["00:00:00", "00:00:00", "00:02:03"], list(df["Age"]))
+        for column in ("Timestamp", "Exchange", "Market", "Order_type", "Side", "Leverage", "Position", "Age"):
+            self.assertEqual(list(expected[column]), list(df[column]), msg=column)
+        self.assertEqual([float(price) for price in expected["Price"]], list(df["Price"]))
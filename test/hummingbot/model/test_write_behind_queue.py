@@ -0,0 +1,144 @@
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.write_behind_queue import WriteBehindQueue
+
+
+class WriteBehindQueueTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()),
+                                            SQLConnectionType.TRADE_FILLS,
+                                            db_path=os.path.join(self.temp_dir.name, "test.sqlite"))
+        self.queue = WriteBehindQueue(self.manager, flush_interval=60)
+
+    def tearDown(self) -> None:
+        self.queue.stop()
+        self.manager.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def metadata_write(key: str, value: str):
+        def write(session: Session):
+            record = session.query(Metadata).filter(Metadata.key == key).one_or_none()
+            if record is None:
+                session.add(Metadata(key=key, value=value))
+            else:
+                record.value = value
+        return write
+
+    def stored_metadata(self) -> List[tuple]:
+        with self.manager.get_new_session() as session:
+            return [(record.key, record.value)
+                    for record in session.query(Metadata).filter(Metadata.key.startswith("test_")).order_by(Metadata.key)]
+
+    def test_sqlite_pragmas(self):
+        with self.manager.engine.connect() as connection:
+            self.assertEqual("wal", connection.execute(text("PRAGMA journal_mode")).scalar())
+            self.assertEqual(1, connection.execute(text("PRAGMA synchronous")).scalar())
+
+    def test_writes_are_synchronous_when_not_running(self):
+        self.queue.submit(self.metadata_write("test_1", "a"))
+
+        self.assertEqual([("test_1", "a")], self.stored_metadata())
+        self.assertEqual(0, self.queue.pending_writes)
+
+    def test_writes_are_queued_until_flushed(self):
+        self.queue.start()
+        self.queue.submit(self.metadata_write("test_1", "a"))
+        self.queue.submit(self.metadata_write("test_2", "b"))
+
+        self.assertEqual([], self.stored_metadata())
+        self.assertEqual(2, self.queue.pending_writes)
+
+        self.assertTrue(self.queue.flush(timeout=5))
+
+        self.assertEqual([("test_1", "a"), ("test_2", "b")], self.stored_metadata())
+        self.assertEqual(0, self.queue.pending_writes)
+
+    def test_coalesced_writes_keep_the_latest_per_key(self):
+        written_values = []
+
+        def coalesced_write(value: str):
+            def write(session: Session):
+                written_values.append(value)
+                self.metadata_write("test_state", value)(session)
+            return write
+
+        self.queue.start()
+        self.queue.submit_coalesced("state", coalesced_write("a"))
+        self.queue.submit_coalesced("state", coalesced_write("b"))
+        self.queue.submit_coalesced("other_state", coalesced_write("c"))
+        self.queue.submit_coalesced("state", coalesced_write("d"))
+        self.assertEqual(2, self.queue.pending_writes)
+        self.queue.flush(timeout=5)
+
+        self.assertEqual(["c", "d"], written_values)
+        self.assertEqual([("test_state", "d")], self.stored_metadata())
+
+    def test_stop_writes_queued_records(self):
+        self.queue.start()
+        self.queue.submit(self.metadata_write("test_1", "a"))
+        self.queue.stop()
+
+        self.assertFalse(self.queue.running)
+        self.assertEqual([("test_1", "a")], self.stored_metadata())
+
+    def test_full_batch_is_written_before_the_interval(self):
+        queue = WriteBehindQueue(self.manager, flush_interval=60, max_batch_size=2)
+        queue.start()
+        try:
+            queue.submit(self.metadata_write("test_1", "a"))
+            queue.submit(self.metadata_write("test_2", "b"))
+            # Waits for the full batch without requesting a flush
+            with queue._condition:
+                self.assertTrue(queue._condition.wait_for(lambda: queue._written_batches > 0, 5))
+            self.assertEqual([("test_1", "a"), ("test_2", "b")], self.stored_metadata())
+        finally:
+            queue.stop()
+
+    def test_failed_write_does_not_lose_the_batch(self):
+        def failing_write(session: Session):
+            raise ValueError("Invalid record")
+
+        self.queue.start()
+        self.queue.submit(self.metadata_write("test_1", "a"))
+        self.queue.submit(failing_write)
+        self.queue.submit(self.metadata_write("test_2", "b"))
+        with self.assertLogs(WriteBehindQueue.logger().name, level="ERROR"):
+            self.queue.flush(timeout=5)
+
+        self.assertEqual([("test_1", "a"), ("test_2", "b")], self.stored_metadata())
+
+    def test_commit_callbacks_run_once_for_committed_writes(self):
+        committed = []
+
+        def failing_write(session: Session):
+            raise ValueError("Invalid record")
+
+        self.queue.start()
+        self.queue.submit(self.metadata_write("test_1", "a"), on_commit=lambda: committed.append("test_1"))
+        self.queue.submit(failing_write, on_commit=lambda: committed.append("failing"))
+        self.queue.submit(self.metadata_write("test_2", "b"), on_commit=lambda: committed.append("test_2"))
+        with self.assertLogs(WriteBehindQueue.logger().name, level="ERROR"):
+            self.queue.flush(timeout=5)
+
+        # The failed batch is written again one write at a time, the callbacks only run once the writes are committed
+        self.assertEqual(["test_1", "test_2"], committed)
+
+        self.queue.submit(self.metadata_write("test_3", "c"), on_commit=lambda: committed.append("test_3"))
+        self.queue.flush(timeout=5)
+
+        self.assertEqual(["test_1", "test_2", "test_3"], committed)
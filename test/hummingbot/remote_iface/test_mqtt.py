@@ -1,7 +1,9 @@
 import asyncio
+import logging
+from dataclasses import asdict
 from decimal import Decimal
 from typing import Awaitable
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from async_timeout import timeout
@@ -11,14 +13,21 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import LPType, OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
-from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderExpiredEvent, SellOrderCreatedEvent
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderExpiredEvent,
+    RangePositionUpdateEvent,
+    SellOrderCreatedEvent,
+)
+from hummingbot.core.metrics import MetricsRegistry
 from hummingbot.core.mock_api.mock_mqtt_server import FakeMQTTBroker
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.model.order import Order
 from hummingbot.model.trade_fill import TradeFill
-from hummingbot.remote_iface.mqtt import MQTTGateway, MQTTMarketEventForwarder
+from hummingbot.remote_iface.mqtt import MQTTGateway, MQTTMarketEventForwarder, MsgpackSerializer, msgpack
 
 
 @patch("hummingbot.remote_iface.mqtt.MQTTGateway._INTERVAL_HEALTH_CHECK", 0.0)
@@ -52,6 +61,8 @@ class RemoteIfaceMQTTTests(TestCase):
             'balance/limit',
             'balance/paper',
             'command_shortcuts',
+            'profile',
+            'tick_profile',
         ]
         cls.START_URI = 'hbot/$instance_id/start'
         cls.STOP_URI = 'hbot/$instance_id/stop'
@@ -62,6 +73,8 @@ class RemoteIfaceMQTTTests(TestCase):
         cls.BALANCE_LIMIT_URI = 'hbot/$instance_id/balance/limit'
         cls.BALANCE_PAPER_URI = 'hbot/$instance_id/balance/paper'
         cls.COMMAND_SHORTCUT_URI = 'hbot/$instance_id/command_shortcuts'
+        cls.PROFILE_URI = 'hbot/$instance_id/profile'
+        cls.TICK_PROFILE_URI = 'hbot/$instance_id/tick_profile'
         cls.fake_mqtt_broker = FakeMQTTBroker()
 
     @classmethod
@@ -589,6 +602,51 @@ class RemoteIfaceMQTTTests(TestCase):
         self.ev_loop.run_until_complete(self.wait_for_rcv(topic, msg, msg_key='data'))
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
 
+    @patch("hummingbot.client.command.profile_command.ProfileCommand.profile_bot", new_callable=AsyncMock)
+    def test_mqtt_command_profile(
+        self,
+        profile_bot_mock: AsyncMock
+    ):
+        report = {"samples": 10, "stacks_file": "logs/profile.collapsed"}
+        profile_bot_mock.side_effect = [report, None]
+        self.start_mqtt()
+        topic = self.get_topic_for(self.PROFILE_URI)
+        reply_topic = f"test_reply/hbot/{self.instance_id}/profile"
+
+        self.fake_mqtt_broker.publish_to_subscription(topic, {"duration": 1.0, "async_backend": 0})
+        msg = {'status': 200, 'msg': '', 'data': report}
+        self.ev_loop.run_until_complete(self.wait_for_rcv(reply_topic, msg, msg_key='data'))
+        self.assertTrue(self.is_msg_received(reply_topic, msg, msg_key='data'))
+        profile_bot_mock.assert_called_with(1.0, 5.0, False)
+
+        self.fake_mqtt_broker.publish_to_subscription(topic, {"async_backend": 0})
+        msg = {'status': 400, 'msg': 'The bot could not be profiled, a profile may already be running.', 'data': {}}
+        self.ev_loop.run_until_complete(self.wait_for_rcv(reply_topic, msg, msg_key='data'))
+        self.assertTrue(self.is_msg_received(reply_topic, msg, msg_key='data'))
+
+    def test_mqtt_command_tick_profile(self):
+        self.start_mqtt()
+        topic = self.get_topic_for(self.TICK_PROFILE_URI)
+        reply_topic = f"test_reply/hbot/{self.instance_id}/tick_profile"
+
+        self.fake_mqtt_broker.publish_to_subscription(topic, {})
+        msg = {'status': 400, 'msg': 'Tick profiling is not enabled or no strategy is running.', 'data': {}}
+        self.ev_loop.run_until_complete(self.wait_for_rcv(reply_topic, msg, msg_key='data'))
+        self.assertTrue(self.is_msg_received(reply_topic, msg, msg_key='data'))
+
+        tick_profile = {"tick_size": 1.0, "overrun_count": 2}
+        clock = MagicMock()
+        clock.tick_profiler.to_dict.return_value = tick_profile
+        self.hbapp.clock = clock
+        try:
+            self.fake_mqtt_broker.publish_to_subscription(topic, {"reset": True})
+            msg = {'status': 200, 'msg': '', 'data': tick_profile}
+            self.ev_loop.run_until_complete(self.wait_for_rcv(reply_topic, msg, msg_key='data'))
+            self.assertTrue(self.is_msg_received(reply_topic, msg, msg_key='data'))
+            clock.tick_profiler.reset.assert_called_once()
+        finally:
+            self.hbapp.clock = None
+
     @patch("hummingbot.client.command.import_command.load_strategy_config_map_from_file")
     @patch("hummingbot.client.command.status_command.StatusCommand.status_check_all")
     def test_mqtt_command_import(
@@ -966,6 +1024,93 @@ class RemoteIfaceMQTTTests(TestCase):
         self.ev_loop.run_until_complete(self.wait_for_rcv(events_topic, evt_type, msg_key = 'type'))
         self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
 
+    def enable_batching(self, interval: float = 0.1, max_size: int = 500, max_pending: int = 10000):
+        mqtt_bridge = self.client_config_map.mqtt_bridge
+        self.addCleanup(setattr, mqtt_bridge, "mqtt_batching", mqtt_bridge.mqtt_batching)
+        self.addCleanup(setattr, mqtt_bridge, "mqtt_batch_interval", mqtt_bridge.mqtt_batch_interval)
+        self.addCleanup(setattr, mqtt_bridge, "mqtt_batch_max_size", mqtt_bridge.mqtt_batch_max_size)
+        self.addCleanup(setattr, mqtt_bridge, "mqtt_batch_max_pending", mqtt_bridge.mqtt_batch_max_pending)
+        self.addCleanup(setattr, mqtt_bridge, "mqtt_batch_encoding", mqtt_bridge.mqtt_batch_encoding)
+        mqtt_bridge.mqtt_batching = True
+        mqtt_bridge.mqtt_batch_interval = interval
+        mqtt_bridge.mqtt_batch_max_size = max_size
+        mqtt_bridge.mqtt_batch_max_pending = max_pending
+        mqtt_bridge.mqtt_batch_encoding = "json"
+
+    @patch("hummingbot.remote_iface.mqtt.MQTTGateway.health", new_callable=PropertyMock)
+    def test_mqtt_batched_events_published_in_frames(self, health_mock: PropertyMock):
+        health_mock.return_value = True
+        self.enable_batching()
+        self.start_mqtt()
+        frames_topic = f"hbot/{self.instance_id}/frames"
+
+        self.emit_order_expired_event(self.test_market)
+        self.emit_order_expired_event(self.test_market)
+        self.gateway._market_events._send_mqtt_event(event_tag=999, pubsub=None, event={"unknown": 1})
+        self.assertFalse(self.is_msg_received(frames_topic))
+
+        self.ev_loop.run_until_complete(self.wait_for_rcv(frames_topic))
+        frames = self.fake_mqtt_broker.received_msgs[frames_topic]
+        self.assertEqual(1, len(frames))
+        self.assertEqual(0, frames[0]["seq"])
+        self.assertEqual(0, frames[0]["dropped"])
+        self.assertEqual(["OrderExpired", "OrderExpired", "Unknown"], [event["type"] for event in frames[0]["events"]])
+        self.assertEqual({"unknown": 1}, frames[0]["events"][2]["data"])
+        self.assertFalse(self.is_msg_received(f"hbot/{self.instance_id}/events"))
+
+    @patch("hummingbot.remote_iface.mqtt.MQTTGateway.health", new_callable=PropertyMock)
+    def test_mqtt_batched_frame_published_when_full(self, health_mock: PropertyMock):
+        health_mock.return_value = True
+        self.enable_batching(interval=100, max_size=2)
+        self.start_mqtt()
+        frames_topic = f"hbot/{self.instance_id}/frames"
+
+        self.emit_order_expired_event(self.test_market)
+        self.assertFalse(self.is_msg_received(frames_topic))
+        self.gateway._logh.emit(logging.LogRecord("test_logger", logging.INFO, "", 0, "log message", None, None))
+
+        frames = self.fake_mqtt_broker.received_msgs[frames_topic]
+        self.assertEqual(1, len(frames))
+        self.assertEqual(["OrderExpired"], [event["type"] for event in frames[0]["events"]])
+        self.assertEqual("log message", frames[0]["logs"][0]["msg"])
+        self.assertEqual("INFO", frames[0]["logs"][0]["level_name"])
+        self.assertEqual("test_logger", frames[0]["logs"][0]["logger_name"])
+        self.assertFalse(self.is_msg_received(f"hbot/{self.instance_id}/log"))
+
+    @patch("hummingbot.remote_iface.mqtt.MQTTGateway.health", new_callable=PropertyMock)
+    def test_mqtt_batched_entries_dropped_while_disconnected(self, health_mock: PropertyMock):
+        self.enable_batching(interval=100, max_size=2, max_pending=3)
+        self.start_mqtt()
+        frames_topic = f"hbot/{self.instance_id}/frames"
+        health_mock.return_value = False
+
+        for i in range(5):
+            self.gateway._market_events._send_mqtt_event(event_tag=999, pubsub=None, event={"i": i})
+        self.assertFalse(self.is_msg_received(frames_topic))
+        self.assertEqual(3, self.gateway.frames.pending_count)
+        self.assertEqual(2, self.gateway.frames.dropped)
+
+        health_mock.return_value = True
+        self.gateway.frames.flush()
+
+        frames = self.fake_mqtt_broker.received_msgs[frames_topic]
+        self.assertEqual([0, 1], [frame["seq"] for frame in frames])
+        self.assertEqual([2, 0], [frame["dropped"] for frame in frames])
+        self.assertEqual([{"i": 2}, {"i": 3}, {"i": 4}], [event["data"] for frame in frames for event in frame["events"]])
+
+    def test_mqtt_metrics_published_periodically(self):
+        metrics_config = self.client_config_map.metrics
+        self.addCleanup(setattr, metrics_config, "metrics_mqtt_interval", metrics_config.metrics_mqtt_interval)
+        metrics_config.metrics_mqtt_interval = 0.1
+        MetricsRegistry.get_instance().counter("test_mqtt_messages_total", "Test messages").labels().inc()
+        self.start_mqtt()
+
+        metrics_topic = f"hbot/{self.instance_id}/metrics"
+        self.ev_loop.run_until_complete(self.wait_for_rcv(metrics_topic))
+        metrics = self.fake_mqtt_broker.received_msgs[metrics_topic][0]["metrics"]
+        self.assertEqual({"type": "counter", "samples": [{"labels": {}, "value": 1.0}]},
+                         metrics["test_mqtt_messages_total"])
+
     def test_mqtt_subscribed_topics(self):
         self.start_mqtt()
         self.assertTrue(self.gateway is not None)
@@ -1294,3 +1439,30 @@ class RemoteIfaceMQTTTests(TestCase):
         gw.stop()
         del gw
         self.gateway._hb_app.client_config_map.mqtt_bridge.mqtt_namespace = prev_ns
+
+
+@skipIf(msgpack is None, "msgpack is not installed")
+class MsgpackSerializerTests(TestCase):
+
+    def test_frame_with_enum_event_values_round_trip(self):
+        event_data = asdict(RangePositionUpdateEvent(timestamp=1640001112.223,
+                                                     order_id="OID1",
+                                                     exchange_order_id="EOID1",
+                                                     order_action=LPType.ADD,
+                                                     trading_pair="COINALPHA-HBOT",
+                                                     amount=Decimal("1.5")))
+        event_data.pop("timestamp")
+        frame = {
+            "seq": 0,
+            "timestamp": 1640001112.223,
+            "dropped": 0,
+            "events": [{"timestamp": 1640001112, "type": "RangePositionUpdate", "data": event_data}],
+            "logs": [],
+        }
+
+        decoded = MsgpackSerializer.deserialize(MsgpackSerializer.serialize(frame))
+
+        data = decoded["events"][0]["data"]
+        self.assertEqual(str(LPType.ADD), data["order_action"])
+        self.assertEqual(1.5, data["amount"])
+        self.assertEqual("OID1", data["order_id"])
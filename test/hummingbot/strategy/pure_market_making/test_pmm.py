@@ -2,6 +2,7 @@ import unittest
 from decimal import Decimal
 from test.mock.mock_asset_price_delegate import MockAssetPriceDelegate
 from typing import List, Optional
+from unittest.mock import patch
 
 import pandas as pd
 
@@ -908,6 +909,32 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual("50.0%", status_df.iloc[4, 1])
         self.assertEqual("150.0%", status_df.iloc[4, 2])
 
+    def test_format_status_reuses_unchanged_sections(self):
+        strategy = self.one_level_strategy
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        status = strategy.format_status()
+        formatted_sections = []
+        render = strategy.status_sections.render
+
+        def recording_render(name, render_fn, **kwargs):
+            def recording_render_fn():
+                formatted_sections.append(name)
+                return render_fn()
+            return render(name, recording_render_fn, **kwargs)
+
+        with patch.object(strategy.status_sections, "render", side_effect=recording_render):
+            self.assertEqual(status, strategy.format_status())
+            self.assertEqual([], formatted_sections)
+
+            self.market.set_balance("ETH", 4000)
+            status = strategy.format_status()
+            self.assertEqual(["assets"], formatted_sections)
+
+        strategy.status_sections.mark_dirty()
+        self.assertEqual(status, strategy.format_status())
+        self.assertIn("4000", status)
+
     def test_inventory_cost_price_del(self):
         strategy = self.one_level_strategy
         strategy.inventory_cost_price_delegate = self.inventory_cost_price_del
@@ -0,0 +1,64 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from hummingbot.strategy.status_sections import StatusSections
+
+
+class StatusSectionsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.status_sections = StatusSections()
+        self.render_fn = MagicMock(side_effect=lambda: f"text {self.render_fn.call_count}")
+
+    def test_section_formatted_again_when_inputs_change(self):
+        self.assertEqual("text 1", self.status_sections.render("orders", self.render_fn, inputs=[("OID1", 1)]))
+        self.assertEqual("text 1", self.status_sections.render("orders", self.render_fn, inputs=[("OID1", 1)]))
+        self.assertEqual("text 2", self.status_sections.render("orders", self.render_fn, inputs=[("OID1", 2)]))
+        self.assertEqual(2, self.render_fn.call_count)
+
+    def test_sections_cached_separately(self):
+        self.status_sections.render("assets", self.render_fn, inputs=1)
+        self.status_sections.render("orders", self.render_fn, inputs=1)
+        self.status_sections.render("assets", self.render_fn, inputs=1)
+
+        self.assertEqual(2, self.render_fn.call_count)
+
+    def test_any_price_change_without_tolerance(self):
+        self.status_sections.render("markets", self.render_fn, prices=[Decimal("100"), float("nan")])
+        self.status_sections.render("markets", self.render_fn, prices=[Decimal("100"), float("nan")])
+        self.assertEqual(1, self.render_fn.call_count)
+
+        self.status_sections.render("markets", self.render_fn, prices=[Decimal("100.0001"), float("nan")])
+        self.assertEqual(2, self.render_fn.call_count)
+
+        self.status_sections.render("markets", self.render_fn, prices=[Decimal("100.0001"), Decimal("1")])
+        self.assertEqual(3, self.render_fn.call_count)
+
+    def test_price_changes_within_tolerance_reuse_section(self):
+        self.status_sections.price_tolerance = Decimal("0.01")
+
+        self.status_sections.render("markets", self.render_fn, prices=[Decimal("100")])
+        self.status_sections.render("markets", self.render_fn, prices=[Decimal("100.9")])
+        self.assertEqual(1, self.render_fn.call_count)
+
+        # The prices are compared to the prices of the cached text
+        self.status_sections.render("markets", self.render_fn, prices=[Decimal("101.1")])
+        self.assertEqual(2, self.render_fn.call_count)
+
+        self.status_sections.render("markets", self.render_fn, prices=[Decimal("101.1"), Decimal("1")])
+        self.assertEqual(3, self.render_fn.call_count)
+
+    def test_mark_dirty(self):
+        self.status_sections.render("assets", self.render_fn)
+        self.status_sections.render("orders", self.render_fn)
+
+        self.status_sections.mark_dirty("assets")
+        self.status_sections.render("assets", self.render_fn)
+        self.status_sections.render("orders", self.render_fn)
+        self.assertEqual(3, self.render_fn.call_count)
+
+        self.status_sections.mark_dirty()
+        self.status_sections.render("assets", self.render_fn)
+        self.status_sections.render("orders", self.render_fn)
+        self.assertEqual(5, self.render_fn.call_count)